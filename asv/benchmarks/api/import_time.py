@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Import time of Warp and of the kernel libraries built on top of it.
+
+Importing ``warp.fem``, ``warp.sparse``, and ``warp.optim`` declares several
+hundred ``@wp.func`` functions and ``@wp.kernel`` kernels, most of which a
+given program never launches. The source of a declared function is only
+extracted and parsed once it is first hashed, built, or inspected, so these
+benchmarks track the remaining per-declaration cost. Each sample runs in a
+fresh interpreter, and the libraries are timed with ``warp`` already imported.
+"""
+
+
+class ImportTime:
+    repeat = 10
+
+    def timeraw_import_warp(self):
+        return "import warp"
+
+    def timeraw_import_fem(self):
+        return "import warp.fem", "import warp"
+
+    def timeraw_import_sparse(self):
+        return "import warp.sparse", "import warp"
+
+    def timeraw_import_optim(self):
+        return "import warp.optim", "import warp"
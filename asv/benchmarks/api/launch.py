@@ -169,6 +169,73 @@ class KernelLaunchParameters:
         wp.launch(ks0, dim=1, inputs=[self.s0], device="cuda:0")
 
 
+class CpuKernelLaunchParameters:
+    """Time the Python overhead of small CPU kernel launches.
+
+    The kernels do no work, so the timings are dominated by argument marshalling.
+    """
+
+    number = 1000
+
+    @setup_once
+    def setup(self):
+        wp.init()
+        wp.load_module(device="cpu", block_dim=1)
+
+        n = 1
+        self.a = wp.zeros(n, dtype=float, device="cpu")
+        self.b = wp.zeros(n, dtype=float, device="cpu")
+        self.c = wp.zeros(n, dtype=float, device="cpu")
+        self.x = 17.0
+        self.y = 42.0
+        self.z = 99.0
+        self.u = wp.vec3(1, 2, 3)
+        self.v = wp.vec3(10, 20, 30)
+        self.w = wp.vec3(100, 200, 300)
+
+        sz = Sz()
+        sz.a = self.a
+        sz.b = self.b
+        sz.c = self.c
+        sz.x = self.x
+        sz.y = self.y
+        sz.z = self.z
+        sz.u = self.u
+        sz.v = self.v
+        sz.w = self.w
+        self.sz = sz
+
+        self.cmd = wp.launch(
+            kz,
+            dim=1,
+            inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w],
+            device="cpu",
+            record_cmd=True,
+        )
+        self.launch_list = wp.LaunchList([self.cmd] * 10)
+
+    def time_direct_full(self):
+        wp.launch(
+            kz, dim=1, inputs=[self.a, self.b, self.c, self.x, self.y, self.z, self.u, self.v, self.w], device="cpu"
+        )
+
+    def time_struct_full(self):
+        wp.launch(ksz, dim=1, inputs=[self.sz], device="cpu")
+
+    def time_direct_empty(self):
+        wp.launch(k0, dim=1, inputs=[], device="cpu")
+
+    def time_launch_object(self):
+        self.cmd.launch()
+
+    def time_ten_launch_objects(self):
+        for _ in range(10):
+            self.cmd.launch()
+
+    def time_ten_launch_list(self):
+        self.launch_list.launch()
+
+
 class GraphLaunch:
     repeat = 10
     number = 1000
@@ -100,3 +100,48 @@ class BvhBuild:
     def time_build(self, asset_data, method, asset):
         _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
         wp.synchronize_device(self.device)
+
+
+class BvhBuildCPUThreads:
+    """Scaling of the CPU top-down constructors with the number of host threads."""
+
+    params = (["sah", "median"], [1, 2, 4, 8, 0], ["bear", "rocks"])
+    param_names = ["method", "cpu_threads", "asset"]
+
+    repeat = 20
+    number = 1
+    warmup_time = 0.5
+
+    assets = ["bear", "rocks"]
+
+    def setup_cache(self):
+        from pxr import Usd, UsdGeom
+
+        wp.init()
+
+        # Triangle AABBs computed on the host, cached as numpy arrays
+        asset_data = {}
+        for asset_name in self.assets:
+            asset_stage = Usd.Stage.Open(os.path.join(get_asset_directory(), f"{asset_name}.usd"))
+            mesh_geom = UsdGeom.Mesh(asset_stage.GetPrimAtPath(f"/root/{asset_name}"))
+
+            points_np = np.array(mesh_geom.GetPointsAttr().Get(), dtype=np.float32)
+            indices_np = np.array(mesh_geom.GetFaceVertexIndicesAttr().Get(), dtype=np.int32)
+            tri_points = points_np[indices_np.reshape(-1, 3)]
+
+            asset_data[asset_name] = {
+                "lowers_np": tri_points.min(axis=1),
+                "uppers_np": tri_points.max(axis=1),
+            }
+
+        return asset_data
+
+    def setup(self, asset_data, method, cpu_threads, asset):
+        self.device = wp.get_device("cpu")
+
+        self.lowers = wp.array(asset_data[asset]["lowers_np"], dtype=wp.vec3, device=self.device)
+        self.uppers = wp.array(asset_data[asset]["uppers_np"], dtype=wp.vec3, device=self.device)
+
+    @skip_benchmark_if(USD_AVAILABLE is False)
+    def time_build(self, asset_data, method, cpu_threads, asset):
+        _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method, cpu_threads=cpu_threads)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for lane-batched CPU kernels.
+
+Compares the scalar CPU entry points against the ``cpu_simd_width`` module
+option on an element-wise kernel, launched on a single host thread so that
+only the per-thread throughput is measured.
+"""
+
+import numpy as np
+
+import warp as wp
+
+from .benchmarks_utils import setup_once
+
+CPU_SIMD_WIDTHS = (0, 8, 16)
+
+
+def _create_axpy_kernel(simd_width):
+    @wp.kernel(enable_backward=False, module="unique", module_options={"cpu_simd_width": simd_width})
+    def axpy(a: float, x: wp.array[float], y: wp.array[float], out: wp.array[float]):
+        i = wp.tid()
+        out[i] = a * x[i] + y[i]
+
+    return axpy
+
+
+class AxpyCPU:
+    """Compute ``a * x + y`` over ``float32`` arrays on the CPU."""
+
+    params = (CPU_SIMD_WIDTHS, (1024 * 1024, 4 * 1024 * 1024))
+    param_names = ("simd_width", "num_elements")
+
+    repeat = 10
+    number = 5
+
+    @setup_once
+    def setup(self, simd_width, num_elements):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.kernel = _create_axpy_kernel(simd_width)
+
+        rng = np.random.default_rng(42)
+        self.x = wp.array(rng.random(num_elements, dtype=np.float32), dtype=float, device=self.device)
+        self.y = wp.array(rng.random(num_elements, dtype=np.float32), dtype=float, device=self.device)
+        self.out = wp.empty(num_elements, dtype=float, device=self.device)
+
+        self.cmd = wp.launch(
+            self.kernel,
+            dim=num_elements,
+            inputs=[2.0, self.x, self.y, self.out],
+            device=self.device,
+            cpu_threads=1,
+            record_cmd=True,
+        )
+        # Warmup
+        self.cmd.launch()
+
+    def time_axpy(self, simd_width, num_elements):
+        self.cmd.launch()
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for rebuilding a CPU hash grid every simulation step.
+
+Each timed call rebuilds the grid after a fraction of the points moved to a
+random position, comparing full rebuilds against incremental updates with the
+serial (``cpu_threads=1``) and multi-threaded (``cpu_threads=0``) paths.
+"""
+
+import numpy as np
+
+import warp as wp
+
+from .benchmarks_utils import setup_once
+
+HASH_GRID_THREAD_MODES = {"serial": 1, "parallel": 0}
+
+
+class HashGridBuildCPU:
+    """Rebuild a hash grid of one million points on the CPU."""
+
+    params = (tuple(HASH_GRID_THREAD_MODES), (False, True), (0.0, 0.01, 1.0))
+    param_names = ("mode", "incremental", "moved_fraction")
+
+    repeat = 10
+    number = 1
+
+    @setup_once
+    def setup(self, mode, incremental, moved_fraction):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.cpu_threads = HASH_GRID_THREAD_MODES[mode]
+
+        num_points = 1024 * 1024
+        extent = 100.0
+
+        rng = np.random.default_rng(42)
+        points_np = rng.uniform(0.0, extent, size=(num_points, 3)).astype(np.float32)
+        moved_np = points_np.copy()
+        moved = rng.choice(num_points, size=int(moved_fraction * num_points), replace=False)
+        moved_np[moved] = rng.uniform(0.0, extent, size=(len(moved), 3))
+
+        # alternate between the two point sets so every build sees the same amount of motion
+        self.points = (
+            wp.array(points_np, dtype=wp.vec3, device=self.device),
+            wp.array(moved_np, dtype=wp.vec3, device=self.device),
+        )
+        self.step = 0
+
+        self.grid = wp.HashGrid(128, 128, 128, device=self.device)
+        self.grid.build(self.points[0], 1.0, cpu_threads=self.cpu_threads)
+
+    def time_build(self, mode, incremental, moved_fraction):
+        self.step += 1
+        self.grid.build(self.points[self.step % 2], 1.0, incremental=incremental, cpu_threads=self.cpu_threads)
@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for the host radix sort and segmented sort.
+
+Compares the serial CPU path (``cpu_threads=1``) against the multi-threaded
+path using every hardware thread (``cpu_threads=0``). Each timed call first
+restores the unsorted keys and values, since the sorts operate in place.
+"""
+
+import numpy as np
+
+import warp as wp
+
+from .benchmarks_utils import setup_once
+
+SORT_BENCHMARK_SIZES = (1024 * 1024, 4 * 1024 * 1024)
+SORT_THREAD_MODES = {"serial": 1, "parallel": 0}
+SORT_KEY_TYPES = {
+    "int32": wp.int32,
+    "uint32": wp.uint32,
+    "float32": wp.float32,
+    "int64": wp.int64,
+    "uint64": wp.uint64,
+    "float64": wp.float64,
+}
+
+
+def _random_keys(rng, dtype, count):
+    np_dtype = wp.dtype_to_numpy(dtype)
+    if np.issubdtype(np_dtype, np.floating):
+        return rng.standard_normal(count).astype(np_dtype)
+
+    info = np.iinfo(np_dtype)
+    return rng.integers(info.min, info.max, size=count, dtype=np_dtype, endpoint=True)
+
+
+class RadixSortPairsCPU:
+    """Sort random keys with ``int32`` values on the CPU."""
+
+    params = (tuple(SORT_THREAD_MODES), tuple(SORT_KEY_TYPES), SORT_BENCHMARK_SIZES)
+    param_names = ("mode", "key_type", "num_elements")
+
+    repeat = 10
+    number = 1
+
+    @setup_once
+    def setup(self, mode, key_type, num_elements):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.cpu_threads = SORT_THREAD_MODES[mode]
+        self.num_elements = num_elements
+
+        dtype = SORT_KEY_TYPES[key_type]
+        rng = np.random.default_rng(123)
+        keys_np = _random_keys(rng, dtype, num_elements)
+
+        self.keys_src = wp.array(keys_np, dtype=dtype, device=self.device)
+        self.values_src = wp.array(np.arange(num_elements, dtype=np.int32), dtype=wp.int32, device=self.device)
+        self.keys = wp.empty(2 * num_elements, dtype=dtype, device=self.device)
+        self.values = wp.empty(2 * num_elements, dtype=wp.int32, device=self.device)
+
+    def time_radix_sort_pairs(self, mode, key_type, num_elements):
+        wp.copy(self.keys, self.keys_src, count=self.num_elements)
+        wp.copy(self.values, self.values_src, count=self.num_elements)
+        wp.utils.radix_sort_pairs(self.keys, self.values, self.num_elements, cpu_threads=self.cpu_threads)
+
+
+class SegmentedSortPairsCPU:
+    """Sort random ``float32`` keys within equally sized segments on the CPU."""
+
+    params = (tuple(SORT_THREAD_MODES), (16, 4096), SORT_BENCHMARK_SIZES)
+    param_names = ("mode", "num_segments", "num_elements")
+
+    repeat = 10
+    number = 1
+
+    @setup_once
+    def setup(self, mode, num_segments, num_elements):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.cpu_threads = SORT_THREAD_MODES[mode]
+        self.num_elements = num_elements
+
+        rng = np.random.default_rng(321)
+        keys_np = rng.standard_normal(num_elements).astype(np.float32)
+        segment_bounds = np.linspace(0, num_elements, num_segments + 1).astype(np.int32)
+
+        self.keys_src = wp.array(keys_np, dtype=wp.float32, device=self.device)
+        self.values_src = wp.array(np.arange(num_elements, dtype=np.int32), dtype=wp.int32, device=self.device)
+        self.keys = wp.empty(2 * num_elements, dtype=wp.float32, device=self.device)
+        self.values = wp.empty(2 * num_elements, dtype=wp.int32, device=self.device)
+        self.segment_bounds = wp.array(segment_bounds, dtype=wp.int32, device=self.device)
+
+    def time_segmented_sort_pairs(self, mode, num_segments, num_elements):
+        wp.copy(self.keys, self.keys_src, count=self.num_elements)
+        wp.copy(self.values, self.values_src, count=self.num_elements)
+        wp.utils.segmented_sort_pairs(
+            self.keys, self.values, self.num_elements, self.segment_bounds, cpu_threads=self.cpu_threads
+        )
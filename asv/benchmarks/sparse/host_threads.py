@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""CPU scaling benchmarks for the native host sparse routines.
+
+Compares the serial host path (``wp.config.cpu_max_threads = 1``) against the
+multi-threaded path using every hardware thread (``cpu_max_threads = 0``) for
+triplet compression, matrix-vector and matrix-matrix products.
+"""
+
+import numpy as np
+
+import warp as wp
+import warp.sparse as wps
+
+from ..benchmarks_utils import setup_once
+
+HOST_THREAD_MODES = {"serial": 1, "parallel": 0}
+
+
+class BsrHostThreads:
+    """Random ``3x3`` block matrix with about 16 blocks per row on the CPU."""
+
+    params = (tuple(HOST_THREAD_MODES), (16 * 1024, 64 * 1024))
+    param_names = ("mode", "rows_of_blocks")
+
+    rounds = 1
+    repeat = 5
+    number = 1
+
+    @setup_once
+    def setup(self, mode, rows_of_blocks):
+        wp.init()
+        self.device = wp.get_device("cpu")
+        self.cpu_threads = HOST_THREAD_MODES[mode]
+
+        rng = np.random.default_rng(42)
+        triplet_count = 16 * rows_of_blocks
+        block_type = wp.types.matrix(shape=(3, 3), dtype=wp.float32)
+
+        with wp.ScopedDevice(self.device):
+            # shuffled banded pattern with duplicate triplets, so that the product stays sparse
+            rows = np.arange(triplet_count) // 16
+            cols = np.clip(rows + rng.integers(-8, 8, size=triplet_count), 0, rows_of_blocks - 1)
+            order = rng.permutation(triplet_count)
+            self.rows = wp.array(rows[order], dtype=int)
+            self.cols = wp.array(cols[order], dtype=int)
+            self.vals = wp.array(rng.random(size=(triplet_count, 3, 3), dtype=np.float32), dtype=block_type)
+
+            self.mat = wps.bsr_zeros(rows_of_blocks, rows_of_blocks, block_type)
+            self.prod = wps.bsr_zeros(rows_of_blocks, rows_of_blocks, block_type)
+            self.x = wp.array(rng.random(size=(rows_of_blocks, 3), dtype=np.float32), dtype=wp.vec3)
+            self.y = wp.zeros_like(self.x)
+
+        wp.config.cpu_max_threads = self.cpu_threads
+
+        # Warmup, also loads the fallback kernels
+        wps.bsr_set_from_triplets(self.mat, self.rows, self.cols, self.vals)
+        wps.bsr_mv(self.mat, self.x, self.y)
+        wps.bsr_mm(self.mat, self.mat, self.prod)
+        wp.synchronize_device(self.device)
+
+    def time_from_triplets(self, mode, rows_of_blocks):
+        wp.config.cpu_max_threads = self.cpu_threads
+        wps.bsr_set_from_triplets(self.mat, self.rows, self.cols, self.vals)
+        wp.synchronize_device(self.device)
+
+    def time_mv(self, mode, rows_of_blocks):
+        wp.config.cpu_max_threads = self.cpu_threads
+        wps.bsr_mv(self.mat, self.x, self.y)
+        wp.synchronize_device(self.device)
+
+    def time_mm(self, mode, rows_of_blocks):
+        wp.config.cpu_max_threads = self.cpu_threads
+        wps.bsr_mm(self.mat, self.mat, self.prod)
+        wp.synchronize_device(self.device)
@@ -121,3 +121,59 @@ class BsrMvAlmostDense(BsrMvFemMatrix):
 
     def time_cuda(self):
         self.run()
+
+
+class BsrMmDenseQuadraticTetmeshMatrix:
+    """Compare multiplying a FEM matrix with many vectors at once against one vector at a time."""
+
+    params = (("mv_loop", "non_tiled", "tiled"), (8, 32))
+    param_names = ("variant", "rhs_count")
+
+    rounds = 1
+    repeat = 2
+    number = 10  # Number of measurements to make between a single setup and teardown
+
+    @setup_once
+    def setup(self, variant, rhs_count):
+        wp.init()
+        self.device = wp.get_device("cuda:0")
+
+        res = 24
+        with wp.ScopedDevice(self.device):
+            pos, cells = gen_tetmesh(res=(res, res, res))
+            geo = fem.Tetmesh(cells, pos)
+            space = fem.make_polynomial_space(geo, degree=2, dtype=wp.vec3)
+            u = fem.make_trial(space)
+            v = fem.make_test(space)
+
+            self._mat = fem.integrate(diffusion_form_vector, fields={"u": u, "v": v}, output_dtype=float)
+            self._mat.nnz_sync()
+
+            if variant == "mv_loop":
+                self._vecs = [wp.ones(shape=self._mat.shape[1], dtype=wp.float32) for _ in range(rhs_count)]
+                self._results = [wp.zeros(shape=self._mat.shape[0], dtype=wp.float32) for _ in range(rhs_count)]
+            else:
+                self._vecs = wp.ones(shape=(self._mat.shape[1], rhs_count), dtype=wp.float32)
+                self._results = wp.zeros(shape=(self._mat.shape[0], rhs_count), dtype=wp.float32)
+
+            self._tile_size = 64 if variant == "tiled" else -1
+            self._variant = variant
+
+            self._run_impl()
+
+            with wp.ScopedCapture() as capture:
+                self._run_impl()
+            self._graph = capture.graph
+
+        wp.synchronize_device(self.device)
+
+    def _run_impl(self):
+        if self._variant == "mv_loop":
+            for vec, res in zip(self._vecs, self._results, strict=True):
+                wps.bsr_mv(self._mat, vec, res, alpha=1.0, beta=1.0)
+        else:
+            wps.bsr_mm_dense(self._mat, self._vecs, self._results, alpha=1.0, beta=1.0, tile_size=self._tile_size)
+
+    def time_cuda(self, variant, rhs_count):
+        wp.capture_launch(self._graph)
+        wp.synchronize_device(self.device)
@@ -535,6 +535,7 @@ def main(argv: list[str] | None = None) -> int:
             "native/crt.cpp",
             "native/error.cpp",
             "native/cuda_util.cpp",
+            "native/cpu_timing.cpp",
             "native/mesh.cpp",
             "native/hashgrid.cpp",
             "native/reduce.cpp",
@@ -547,6 +548,7 @@ def main(argv: list[str] | None = None) -> int:
             "native/mathdx.cpp",
             "native/coloring.cpp",
             "native/deterministic.cpp",
+            "native/thread_pool.cpp",
         ]
         warp_cpp_paths = [os.path.join(build_path, cpp) for cpp in cpp_sources]
 
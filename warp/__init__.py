@@ -243,6 +243,7 @@ from warp._src.context import clone as clone
 from warp._src.context import empty as empty
 from warp._src.context import empty_like as empty_like
 from warp._src.context import copy as copy
+from warp._src.context import zero_arrays as zero_arrays
 
 
 # category: Arrays > Indexed Arrays
@@ -291,6 +292,7 @@ from warp._src.context import is_cuda_available as is_cuda_available
 
 from warp._src.build import clear_kernel_cache as clear_kernel_cache
 from warp._src.build import clear_lto_cache as clear_lto_cache
+from warp._src.build import prune_kernel_cache as prune_kernel_cache
 
 from warp._src.context import print_diagnostics as print_diagnostics
 
@@ -323,9 +325,11 @@ from warp._src.builtins import static as static
 from warp._src.context import Kernel as Kernel
 from warp._src.context import Function as Function
 from warp._src.context import Launch as Launch
+from warp._src.context import LaunchList as LaunchList
 from warp._src.context import Module as Module
 
 from warp._src.context import launch as launch
+from warp._src.context import launch_batch as launch_batch
 from warp._src.context import launch_tiled as launch_tiled
 from warp._src.context import get_cuda_kernel_properties as get_cuda_kernel_properties
 from warp._src.context import get_suggested_block_size as get_suggested_block_size
@@ -462,6 +466,7 @@ from warp._src.utils import TimingResult as TimingResult
 from warp._src.utils import timing_begin as timing_begin
 from warp._src.utils import timing_end as timing_end
 from warp._src.utils import timing_print as timing_print
+from warp._src.utils import timing_export_chrome_trace as timing_export_chrome_trace
 
 
 from warp._src.utils import ScopedMemoryTracker as ScopedMemoryTracker
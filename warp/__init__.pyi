@@ -61,6 +61,7 @@ from warp._src.context import clone as clone
 from warp._src.context import empty as empty
 from warp._src.context import empty_like as empty_like
 from warp._src.context import copy as copy
+from warp._src.context import zero_arrays as zero_arrays
 from warp._src.types import indexedarray as indexedarray
 from warp._src.types import indexedarray1d as indexedarray1d
 from warp._src.types import indexedarray2d as indexedarray2d
@@ -91,6 +92,7 @@ from warp._src.context import is_cubql_available as is_cubql_available
 from warp._src.context import is_cuda_available as is_cuda_available
 from warp._src.build import clear_kernel_cache as clear_kernel_cache
 from warp._src.build import clear_lto_cache as clear_lto_cache
+from warp._src.build import prune_kernel_cache as prune_kernel_cache
 from warp._src.context import print_diagnostics as print_diagnostics
 from warp._src.codegen import WarpCodegenAttributeError as WarpCodegenAttributeError
 from warp._src.codegen import WarpCodegenError as WarpCodegenError
@@ -113,8 +115,10 @@ from warp._src.builtins import static as static
 from warp._src.context import Kernel as Kernel
 from warp._src.context import Function as Function
 from warp._src.context import Launch as Launch
+from warp._src.context import LaunchList as LaunchList
 from warp._src.context import Module as Module
 from warp._src.context import launch as launch
+from warp._src.context import launch_batch as launch_batch
 from warp._src.context import launch_tiled as launch_tiled
 from warp._src.context import get_cuda_kernel_properties as get_cuda_kernel_properties
 from warp._src.context import get_suggested_block_size as get_suggested_block_size
@@ -198,6 +202,7 @@ from warp._src.utils import TimingResult as TimingResult
 from warp._src.utils import timing_begin as timing_begin
 from warp._src.utils import timing_end as timing_end
 from warp._src.utils import timing_print as timing_print
+from warp._src.utils import timing_export_chrome_trace as timing_export_chrome_trace
 from warp._src.utils import ScopedMemoryTracker as ScopedMemoryTracker
 from warp._src.context import print_memory_report as print_memory_report
 from warp._src.utils import TIMING_KERNEL as TIMING_KERNEL
@@ -263,6 +268,7 @@ from warp.config import DeterministicMode as DeterministicMode
 from warp._src.math import *
 from warp._src.marching_cubes import MarchingCubes as MarchingCubes
 from warp._src.context import RegisteredGLBuffer as RegisteredGLBuffer
+
 Length = TypeVar("Length", bound=int)
 Rows = TypeVar("Rows", bound=int)
 Cols = TypeVar("Cols", bound=int)
@@ -270,6 +276,7 @@ DType = TypeVar("DType")
 NDim = TypeVar("NDim", bound=int, default=int)
 Shape = TypeVar("Shape")
 Capacity = TypeVar("Capacity", bound=int)
+
 class Vector(Generic[Scalar, Length]): ...
 class Matrix(Generic[Scalar, Rows, Cols]): ...
 class Quaternion(Generic[Float]): ...
@@ -303,7 +310,6 @@ element methods, and :mod:`warp.sparse` for sparse linear algebra.
 
 __version__ = config.version
 
-
 class vec2h:
     @over
     def __init__(self) -> None:
@@ -1726,7 +1732,6 @@ class transformd:
         """Construct a transformation filled with a value."""
         ...
 
-
 # ======================================================================
 # Merged stubs for symbols with both Python API and kernel-scope versions
 # ======================================================================
@@ -2098,13 +2103,17 @@ def transpose(a: Matrix[Scalar, Any, Any]) -> Matrix[Scalar, Any, Any]:
     ...
 
 def inverse(
-    a: Matrix[Float, Literal[2], Literal[2]] | Matrix[Float, Literal[3], Literal[3]] | Matrix[Float, Literal[4], Literal[4]],
+    a: Matrix[Float, Literal[2], Literal[2]]
+    | Matrix[Float, Literal[3], Literal[3]]
+    | Matrix[Float, Literal[4], Literal[4]],
 ) -> Matrix[Float, Any, Any]:
     """Compute the inverse of matrix ``a``."""
     ...
 
 def inverse_approx(
-    a: Matrix[Float, Literal[2], Literal[2]] | Matrix[Float, Literal[3], Literal[3]] | Matrix[Float, Literal[4], Literal[4]],
+    a: Matrix[Float, Literal[2], Literal[2]]
+    | Matrix[Float, Literal[3], Literal[3]]
+    | Matrix[Float, Literal[4], Literal[4]],
 ) -> Matrix[Float, Any, Any]:
     """Compute the inverse of matrix ``a`` using approximate GPU intrinsics.
 
@@ -2112,7 +2121,9 @@ def inverse_approx(
     ...
 
 def determinant(
-    a: Matrix[Float, Literal[2], Literal[2]] | Matrix[Float, Literal[3], Literal[3]] | Matrix[Float, Literal[4], Literal[4]],
+    a: Matrix[Float, Literal[2], Literal[2]]
+    | Matrix[Float, Literal[3], Literal[3]]
+    | Matrix[Float, Literal[4], Literal[4]],
 ) -> Float:
     """Compute the determinant of matrix ``a``."""
     ...
@@ -2959,8 +2970,15 @@ def tile_load_indexed(
 
                 evens = wp.tile_arange(HALF_M, dtype=int, storage="shared") * 2
 
-                t0 = wp.tile_load_indexed(x, indices=evens, shape=(HALF_M, TILE_N), offset=(i*TILE_M, j*TILE_N), axis=0, storage="register")
-                wp.tile_store(y, t0, offset=(i*HALF_M, j*TILE_N))
+                t0 = wp.tile_load_indexed(
+                    x,
+                    indices=evens,
+                    shape=(HALF_M, TILE_N),
+                    offset=(i * TILE_M, j * TILE_N),
+                    axis=0,
+                    storage="register",
+                )
+                wp.tile_store(y, t0, offset=(i * HALF_M, j * TILE_N))
 
             M = TILE_M * 2
             N = TILE_N * 2
@@ -2970,7 +2988,7 @@ def tile_load_indexed(
             x = wp.array(arr, dtype=float)
             y = wp.zeros((M // 2, N), dtype=float)
 
-            wp.launch_tiled(compute, dim=[2,2], inputs=[x], outputs=[y], block_dim=32, device=device)
+            wp.launch_tiled(compute, dim=[2, 2], inputs=[x], outputs=[y], block_dim=32, device=device)
 
             print(x.numpy())
             print(y.numpy())
@@ -3049,11 +3067,11 @@ def tile_store_indexed(
             def compute(x: wp.array2d[float], y: wp.array2d[float]):
                 i, j = wp.tid()
 
-                t = wp.tile_load(x, shape=(TILE_M, TILE_N), offset=(i*TILE_M, j*TILE_N), storage="register")
+                t = wp.tile_load(x, shape=(TILE_M, TILE_N), offset=(i * TILE_M, j * TILE_N), storage="register")
 
                 evens_M = wp.tile_arange(TILE_M, dtype=int, storage="shared") * 2
 
-                wp.tile_store_indexed(y, indices=evens_M, t=t, offset=(i*TWO_M, j*TILE_N), axis=0)
+                wp.tile_store_indexed(y, indices=evens_M, t=t, offset=(i * TWO_M, j * TILE_N), axis=0)
 
             M = TILE_M * 2
             N = TILE_N * 2
@@ -3063,7 +3081,7 @@ def tile_store_indexed(
             x = wp.array(arr, dtype=float, requires_grad=True, device=device)
             y = wp.zeros((M * 2, N), dtype=float, requires_grad=True, device=device)
 
-            wp.launch_tiled(compute, dim=[2,2], inputs=[x], outputs=[y], block_dim=32, device=device)
+            wp.launch_tiled(compute, dim=[2, 2], inputs=[x], outputs=[y], block_dim=32, device=device)
 
             print(x.numpy())
             print(y.numpy())
@@ -3145,11 +3163,11 @@ def tile_atomic_add_indexed(
             def tile_atomic_add_indexed(x: wp.array2d[float], y: wp.array2d[float]):
                 i, j = wp.tid()
 
-                t = wp.tile_load(x, shape=(TILE_M, TILE_N), offset=(i*TILE_M, j*TILE_N), storage="register")
+                t = wp.tile_load(x, shape=(TILE_M, TILE_N), offset=(i * TILE_M, j * TILE_N), storage="register")
 
                 zeros = wp.tile_zeros(TILE_M, dtype=int, storage="shared")
 
-                wp.tile_atomic_add_indexed(y, indices=zeros, t=t, offset=(i, j*TILE_N), axis=0)
+                wp.tile_atomic_add_indexed(y, indices=zeros, t=t, offset=(i, j * TILE_N), axis=0)
 
             M = TILE_M * 2
             N = TILE_N * 2
@@ -3159,7 +3177,7 @@ def tile_atomic_add_indexed(
             x = wp.array(arr, dtype=float, requires_grad=True, device=device)
             y = wp.zeros((2, N), dtype=float, requires_grad=True, device=device)
 
-            wp.launch_tiled(tile_atomic_add_indexed, dim=[2,2], inputs=[x], outputs=[y], block_dim=32, device=device)
+            wp.launch_tiled(tile_atomic_add_indexed, dim=[2, 2], inputs=[x], outputs=[y], block_dim=32, device=device)
 
             print(x.numpy())
             print(y.numpy())
@@ -3276,7 +3294,7 @@ def tile(x: Any, preserve_type: bool) -> Tile[Any, tuple]:
             @wp.kernel
             def compute():
                 i = wp.tid()
-                t = wp.tile(i*2)
+                t = wp.tile(i * 2)
                 print(t)
 
             wp.launch(compute, dim=16, inputs=[], block_dim=16)
@@ -3311,7 +3329,7 @@ def untile(a: Tile[Any, tuple[int, ...]]) -> Any:
                 i = wp.tid()
 
                 # create block-wide tile
-                t = wp.tile(i)*2
+                t = wp.tile(i) * 2
 
                 # convert back to per-thread values
                 s = wp.untile(t)
@@ -3786,7 +3804,6 @@ def tile_sort(keys: Tile[Any, tuple[int]], values: Tile[Any, tuple[int]]) -> Non
                 print(keys)
                 print(values)
 
-
             wp.launch_tiled(compute, dim=[1], inputs=[], block_dim=64)
 
         .. code-block:: text
@@ -3816,7 +3833,6 @@ def tile_min(a: Tile[Scalar, tuple[int, ...]]) -> Tile[Scalar, tuple[Literal[1]]
 
                 print(s)
 
-
             wp.launch_tiled(compute, dim=[1], inputs=[], block_dim=64)
 
         .. code-block:: text
@@ -3845,7 +3861,6 @@ def tile_argmin(a: Tile[Scalar, tuple[int, ...]]) -> Tile[Int, tuple[Literal[1]]
 
                 print(s)
 
-
             wp.launch_tiled(compute, dim=[1], inputs=[], block_dim=64)
 
         .. code-block:: text
@@ -4553,8 +4568,7 @@ def tile_query_valid(query: BvhQueryTiled) -> bool:
         while wp.tile_query_valid(query):
             result_tile = wp.tile_bvh_query_next(query)
             result_idx = wp.untile(result_tile)
-            if result_idx >= 0:
-                ...
+            if result_idx >= 0: ...
 
     Args:
         query: The thread-block BVH query object
@@ -4578,8 +4592,7 @@ def tile_query_valid(query: MeshQueryAABBTiled) -> bool:
         while wp.tile_query_valid(query):
             result_tile = wp.tile_mesh_query_aabb_next(query)
             result_idx = wp.untile(result_tile)
-            if result_idx >= 0:
-                ...
+            if result_idx >= 0: ...
 
     Args:
         query: The thread-block mesh query object
@@ -7194,9 +7207,7 @@ def sample_triangle(state: uint32) -> vec2f:
     .. code-block:: python
 
         @wp.kernel
-        def points_in_triangle(
-            seed: int, a: wp.vec3, b: wp.vec3, c: wp.vec3, out: wp.array[wp.vec3]
-        ):
+        def points_in_triangle(seed: int, a: wp.vec3, b: wp.vec3, c: wp.vec3, out: wp.array[wp.vec3]):
             i = wp.tid()
             rng = wp.rand_init(seed, i)
             bary = wp.sample_triangle(rng)
@@ -7674,21 +7685,21 @@ def where(arr: Array[Any], value_if_true: Any, value_if_false: Any) -> Any:
 def atomic_add(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically adds ``value`` onto ``arr[i]`` and returns the original value of ``arr[i]``.
 
-        This function is automatically invoked when using the syntax ``arr[i] += value``."""
+    This function is automatically invoked when using the syntax ``arr[i] += value``."""
     ...
 
 @over
 def atomic_add(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically adds ``value`` onto ``arr[i,j]`` and returns the original value of ``arr[i,j]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j] += value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j] += value``."""
     ...
 
 @over
 def atomic_add(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Atomically adds ``value`` onto ``arr[i,j,k]`` and returns the original value of ``arr[i,j,k]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k] += value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k] += value``."""
     ...
 
 @over
@@ -7702,28 +7713,28 @@ def atomic_add(
 ) -> Any:
     """Atomically adds ``value`` onto ``arr[i,j,k,l]`` and returns the original value of ``arr[i,j,k,l]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k,l] += value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k,l] += value``."""
     ...
 
 @over
 def atomic_sub(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically subtracts ``value`` onto ``arr[i]`` and returns the original value of ``arr[i]``.
 
-        This function is automatically invoked when using the syntax ``arr[i] -= value``."""
+    This function is automatically invoked when using the syntax ``arr[i] -= value``."""
     ...
 
 @over
 def atomic_sub(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically subtracts ``value`` onto ``arr[i,j]`` and returns the original value of ``arr[i,j]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j] -= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j] -= value``."""
     ...
 
 @over
 def atomic_sub(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Atomically subtracts ``value`` onto ``arr[i,j,k]`` and returns the original value of ``arr[i,j,k]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k] -= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k] -= value``."""
     ...
 
 @over
@@ -7737,28 +7748,28 @@ def atomic_sub(
 ) -> Any:
     """Atomically subtracts ``value`` onto ``arr[i,j,k,l]`` and returns the original value of ``arr[i,j,k,l]``.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k,l] -= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k,l] -= value``."""
     ...
 
 @over
 def atomic_min(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Compute the minimum of ``value`` and ``arr[i]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_min(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Compute the minimum of ``value`` and ``arr[i,j]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_min(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Compute the minimum of ``value`` and ``arr[i,j,k]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7772,28 +7783,28 @@ def atomic_min(
 ) -> Any:
     """Compute the minimum of ``value`` and ``arr[i,j,k,l]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_max(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Compute the maximum of ``value`` and ``arr[i]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_max(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Compute the maximum of ``value`` and ``arr[i,j]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_max(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Compute the maximum of ``value`` and ``arr[i,j,k]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7807,14 +7818,14 @@ def atomic_max(
 ) -> Any:
     """Compute the maximum of ``value`` and ``arr[i,j,k,l]``, atomically update the array, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_cas(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, compare: Any, value: Any) -> Any:
     """Atomically compare and swap ``value`` with ``arr[i]`` if ``arr[i]`` equals ``compare``, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7827,7 +7838,7 @@ def atomic_cas(
 ) -> Any:
     """Atomically compare and swap ``value`` with ``arr[i,j]`` if ``arr[i,j]`` equals ``compare``, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7841,7 +7852,7 @@ def atomic_cas(
 ) -> Any:
     """Atomically compare and swap ``value`` with ``arr[i,j,k]`` if ``arr[i,j,k]`` equals ``compare``, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7856,21 +7867,21 @@ def atomic_cas(
 ) -> Any:
     """Atomically compare and swap ``value`` with ``arr[i,j,k,l]`` if ``arr[i,j,k,l]`` equals ``compare``, and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_exch(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically exchange ``value`` with ``arr[i]`` and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_exch(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically exchange ``value`` with ``arr[i,j]`` and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7883,7 +7894,7 @@ def atomic_exch(
 ) -> Any:
     """Atomically exchange ``value`` with ``arr[i,j,k]`` and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
@@ -7897,28 +7908,28 @@ def atomic_exch(
 ) -> Any:
     """Atomically exchange ``value`` with ``arr[i,j,k,l]`` and return the old value.
 
-        The operation is only atomic on a per-component basis for vectors and matrices."""
+    The operation is only atomic on a per-component basis for vectors and matrices."""
     ...
 
 @over
 def atomic_and(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically performs a bitwise AND between ``value`` and ``arr[i]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i] &= value``."""
+    This function is automatically invoked when using the syntax ``arr[i] &= value``."""
     ...
 
 @over
 def atomic_and(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically performs a bitwise AND between ``value`` and ``arr[i,j]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j] &= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j] &= value``."""
     ...
 
 @over
 def atomic_and(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Atomically performs a bitwise AND between ``value`` and ``arr[i,j,k]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k] &= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k] &= value``."""
     ...
 
 @over
@@ -7932,28 +7943,28 @@ def atomic_and(
 ) -> Any:
     """Atomically performs a bitwise AND between ``value`` and ``arr[i,j,k,l]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k,l] &= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k,l] &= value``."""
     ...
 
 @over
 def atomic_or(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically performs a bitwise OR between ``value`` and ``arr[i]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i] |= value``."""
+    This function is automatically invoked when using the syntax ``arr[i] |= value``."""
     ...
 
 @over
 def atomic_or(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically performs a bitwise OR between ``value`` and ``arr[i,j]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j] |= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j] |= value``."""
     ...
 
 @over
 def atomic_or(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Atomically performs a bitwise OR between ``value`` and ``arr[i,j,k]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k] |= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k] |= value``."""
     ...
 
 @over
@@ -7967,28 +7978,28 @@ def atomic_or(
 ) -> Any:
     """Atomically performs a bitwise OR between ``value`` and ``arr[i,j,k,l]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k,l] |= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k,l] |= value``."""
     ...
 
 @over
 def atomic_xor(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, value: Any) -> Any:
     """Atomically performs a bitwise XOR between ``value`` and ``arr[i]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i] ^= value``."""
+    This function is automatically invoked when using the syntax ``arr[i] ^= value``."""
     ...
 
 @over
 def atomic_xor(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, value: Any) -> Any:
     """Atomically performs a bitwise XOR between ``value`` and ``arr[i,j]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j] ^= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j] ^= value``."""
     ...
 
 @over
 def atomic_xor(arr: Array[Any] | FabricArray[Any] | IndexedFabricArray[Any], i: Int, j: Int, k: Int, value: Any) -> Any:
     """Atomically performs a bitwise XOR between ``value`` and ``arr[i,j,k]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k] ^= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k] ^= value``."""
     ...
 
 @over
@@ -8002,7 +8013,7 @@ def atomic_xor(
 ) -> Any:
     """Atomically performs a bitwise XOR between ``value`` and ``arr[i,j,k,l]``, atomically update the array, and return the old value.
 
-        This function is automatically invoked when using the syntax ``arr[i,j,k,l] ^= value``."""
+    This function is automatically invoked when using the syntax ``arr[i,j,k,l] ^= value``."""
     ...
 
 @over
@@ -8875,7 +8886,13 @@ def tile_upper_solve_inplace(U: Tile[Float, tuple[int, int]], z: Tile[Float, tup
     ...
 
 def len(
-    a: Vector[Scalar, Any] | Quaternion[Float] | Matrix[Scalar, Any, Any] | Transformation[Float] | Array[Any] | Tile[Any, tuple[int, ...]] | tuple,
+    a: Vector[Scalar, Any]
+    | Quaternion[Float]
+    | Matrix[Scalar, Any, Any]
+    | Transformation[Float]
+    | Array[Any]
+    | Tile[Any, tuple[int, ...]]
+    | tuple,
 ) -> int:
     """Query the length of ``a``.
 
@@ -8900,20 +8917,17 @@ def cast(a: Any, dtype: Any) -> Any:
                 f: wp.float16
                 i: wp.int16
 
-
             @wp.kernel
             def compute():
                 x = wp.int32(0x40000000)
                 x_casted = wp.cast(x, wp.float32)
-                wp.expect_eq(x_casted, 2.0) # 0x40000000
+                wp.expect_eq(x_casted, 2.0)  # 0x40000000
 
                 s = MyStruct()
-                s.f = wp.float16(2.0) # 0x4000
-                s.i = wp.int16(4096) # 0x1000
+                s.f = wp.float16(2.0)  # 0x4000
+                s.i = wp.int16(4096)  # 0x1000
                 s_casted = wp.cast(s, wp.int32)
                 wp.expect_eq(s_casted, 0x10004000)
 
-
             wp.launch(compute, dim=1)"""
     ...
-
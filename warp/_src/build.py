@@ -1,13 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
 import builtins
+import contextlib
 import ctypes
 import errno
 import hashlib
 import json
 import ntpath
 import os
+import re
 import shutil
 import threading
 import time
@@ -33,6 +36,34 @@ LTO_CACHE_KEY_LENGTH = 16
 # version-named base directories as already resolved.
 _resolved_kernel_cache_dir: str | None = None
 
+# The kernel cache index records the size and last use time of every module
+# directory so that processes sharing a cache can evict the least recently used
+# modules. It is guarded by a lock directory next to it.
+KERNEL_CACHE_INDEX_NAME = "cache_index.json"
+KERNEL_CACHE_LOCK_NAME = "cache_index.lock"
+
+# The module hash manifest maps fingerprints of a module's declarations to the
+# module hash computed from them, see warp.config.module_hash_manifest. Each
+# module has a file in this directory holding its most recent entries.
+MODULE_HASH_MANIFEST_DIR = "module_hashes"
+MODULE_HASH_MANIFEST_MAX_ENTRIES = 8
+
+# A lock held for longer than this many seconds is assumed to belong to a
+# process that died while holding it and is broken by the next process.
+KERNEL_CACHE_LOCK_STALE_TIMEOUT = 60.0
+
+# Per-process build directories are named after their module directory with a
+# process and thread suffix, see Module._compile().
+_BUILD_DIR_SUFFIX = re.compile(r"_p\d+_t\d+$")
+
+# Module directories used by this process since the index was last updated,
+# mapped to their last use time, and the subset that was (re)built.
+_kernel_cache_accessed: dict[str, float] = {}
+_kernel_cache_built: set[str] = set()
+_kernel_cache_mutex = threading.Lock()
+_kernel_cache_flush_registered = False
+_kernel_cache_index_warned = False
+
 
 # builds cuda source to PTX or CUBIN using NVRTC (output type determined by output_path extension)
 def build_cuda(
@@ -260,6 +291,11 @@ def clear_kernel_cache() -> None:
             # Remove the directory and its contents
             shutil.rmtree(item_path, ignore_errors=True)
 
+    with contextlib.suppress(OSError):
+        os.remove(os.path.join(warp.config.kernel_cache_dir, KERNEL_CACHE_INDEX_NAME))
+
+    shutil.rmtree(os.path.join(warp.config.kernel_cache_dir, MODULE_HASH_MANIFEST_DIR), ignore_errors=True)
+
 
 def clear_lto_cache() -> None:
     """Clear the LTO cache directory of previously generated LTO code.
@@ -308,6 +344,356 @@ def safe_rename(src, dst, attempts=5, delay=0.1):
                     raise e
 
 
+@contextlib.contextmanager
+def _kernel_cache_lock(cache_dir, timeout=10.0):
+    """Hold the lock guarding the kernel cache index against other processes.
+
+    The lock is a directory containing an owner file. A process takes it by moving
+    a private copy onto the lock path with :func:`safe_rename`, which leaves an
+    existing non-empty directory in place, so exactly one process succeeds.
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within ``timeout`` seconds.
+    """
+    lock_dir = os.path.join(cache_dir, KERNEL_CACHE_LOCK_NAME)
+    claim_dir = f"{lock_dir}_p{os.getpid()}_t{threading.get_ident()}"
+
+    os.makedirs(claim_dir, exist_ok=True)
+    try:
+        with open(os.path.join(claim_dir, "owner"), "w") as f:
+            f.write(f"{os.getpid()}\n")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            safe_rename(claim_dir, lock_dir)
+            if not os.path.exists(claim_dir):
+                break
+
+            _break_stale_kernel_cache_lock(lock_dir)
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for the kernel cache lock '{lock_dir}'")
+            time.sleep(0.01)
+    finally:
+        shutil.rmtree(claim_dir, ignore_errors=True)
+
+    try:
+        yield
+    finally:
+        # move the lock out of the way before deleting it so that no other
+        # process can take over a partially deleted lock directory
+        released_dir = f"{lock_dir}_released_p{os.getpid()}_t{threading.get_ident()}"
+        try:
+            os.rename(lock_dir, released_dir)
+        except OSError:
+            pass
+        shutil.rmtree(released_dir, ignore_errors=True)
+
+
+def _break_stale_kernel_cache_lock(lock_dir):
+    try:
+        age = time.time() - os.path.getmtime(lock_dir)
+    except OSError:
+        return
+
+    if age < KERNEL_CACHE_LOCK_STALE_TIMEOUT:
+        return
+
+    # Only one of several processes racing to break the lock can rename it.
+    # The index is advisory, so the small window in which two processes may
+    # both hold the lock can at worst lose an access time update.
+    stale_dir = f"{lock_dir}_stale_p{os.getpid()}_t{threading.get_ident()}"
+    try:
+        os.rename(lock_dir, stale_dir)
+    except OSError:
+        return
+    shutil.rmtree(stale_dir, ignore_errors=True)
+
+
+def _read_kernel_cache_index(cache_dir):
+    path = os.path.join(cache_dir, KERNEL_CACHE_INDEX_NAME)
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+    modules = index.get("modules") if isinstance(index, dict) else None
+    if not isinstance(modules, dict):
+        return {}
+
+    entries = {}
+    for name, entry in modules.items():
+        if not isinstance(entry, dict):
+            continue
+        size = entry.get("size")
+        last_access = entry.get("last_access")
+        if type(size) is not builtins.int or size < 0 or not isinstance(last_access, (builtins.int, builtins.float)):
+            continue
+        entries[name] = {"size": size, "last_access": builtins.float(last_access)}
+
+    return entries
+
+
+def _write_kernel_cache_index(cache_dir, entries):
+    path = os.path.join(cache_dir, KERNEL_CACHE_INDEX_NAME)
+    tmp_path = f"{path}_p{os.getpid()}_t{threading.get_ident()}"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": 1, "modules": entries}, f)
+    os.replace(tmp_path, path)
+
+
+def _module_hash_manifest_path(module_name):
+    # module names are arbitrary strings, so name the file after a digest of the name
+    name_digest = hashlib.sha256(bytes(module_name, "utf-8")).hexdigest()[:16]
+    return os.path.join(warp.config.kernel_cache_dir, MODULE_HASH_MANIFEST_DIR, f"{name_digest}.json")
+
+
+def read_module_hash_manifest(module_name):
+    """Return the module hash manifest entries of ``module_name``, keyed by fingerprint.
+
+    A missing or unreadable manifest has no entries.
+    """
+    try:
+        with open(_module_hash_manifest_path(module_name)) as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+    if not isinstance(manifest, dict) or manifest.get("module") != module_name:
+        return {}
+
+    entries = manifest.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+
+    return {fingerprint: entry for fingerprint, entry in entries.items() if isinstance(entry, dict)}
+
+
+def write_module_hash_manifest_entry(module_name, fingerprint, entry):
+    """Add an entry to the module hash manifest of ``module_name``, keeping only the most recent entries.
+
+    The manifest is only an accelerator, so failing to write it is not an error.
+    """
+    entries = read_module_hash_manifest(module_name)
+    entries.pop(fingerprint, None)
+    entries[fingerprint] = entry
+    entries = dict(list(entries.items())[-MODULE_HASH_MANIFEST_MAX_ENTRIES:])
+
+    path = _module_hash_manifest_path(module_name)
+    tmp_path = f"{path}_p{os.getpid()}_t{threading.get_ident()}"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump({"version": 1, "module": module_name, "entries": entries}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        from warp._src.logger import log_warning  # noqa: PLC0415
+
+        log_warning(f"Could not update the module hash manifest of module '{module_name}': {e}", once=True)
+
+
+def _kernel_cache_module_size(module_dir):
+    size = 0
+    for root, _dirs, files in os.walk(module_dir):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return size
+
+
+def _scan_kernel_cache_modules(cache_dir, entries):
+    """Bring index entries in line with the module directories present in the cache.
+
+    Entries of removed directories are dropped, and directories the index does not know
+    about (e.g. written by an older Warp version) are added with their modification time.
+    """
+    modules = {}
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.startswith("wp_") and not _BUILD_DIR_SUFFIX.search(entry.name) and entry.is_dir():
+                modules[entry.name] = entry
+
+    for name in list(entries):
+        if name not in modules:
+            del entries[name]
+
+    for name, entry in modules.items():
+        if name not in entries:
+            try:
+                last_access = entry.stat().st_mtime
+            except OSError:
+                continue
+            entries[name] = {"size": _kernel_cache_module_size(entry.path), "last_access": last_access}
+
+
+def _evict_kernel_cache_modules(cache_dir, entries, max_size, max_age, keep=()):
+    """Select the least recently used modules to remove until the cache fits the given limits.
+
+    Selected modules are dropped from ``entries`` and their directories are renamed out of the
+    way, so they can be deleted after the index lock is released.
+
+    Returns:
+        The renamed directories to delete.
+    """
+    now = time.time()
+    total_size = sum(entry["size"] for entry in entries.values())
+    evicted = []
+
+    for name in sorted(entries, key=lambda name: entries[name]["last_access"]):
+        entry = entries[name]
+        expired = max_age is not None and now - entry["last_access"] > max_age
+        oversized = max_size is not None and total_size > max_size
+        if not expired and not oversized:
+            break
+        if name in keep:
+            continue
+
+        # the suffix matches that of build directories, which scans skip
+        evicted_dir = os.path.join(cache_dir, f"{name}_evicted_p{os.getpid()}_t{threading.get_ident()}")
+        try:
+            os.rename(os.path.join(cache_dir, name), evicted_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # e.g. files of the module are open on Windows, retry on the next eviction
+            continue
+        else:
+            evicted.append(evicted_dir)
+
+        total_size -= entry["size"]
+        del entries[name]
+
+    return evicted
+
+
+def _update_kernel_cache_index(max_size=None, max_age=None, scan=False):
+    """Write this process's module uses to the kernel cache index, then evict modules.
+
+    Returns:
+        The number of module directories removed.
+    """
+    global _kernel_cache_index_warned
+
+    cache_dir = warp.config.kernel_cache_dir
+    if cache_dir is None:
+        return 0
+
+    with _kernel_cache_mutex:
+        accessed = dict(_kernel_cache_accessed)
+        built = set(_kernel_cache_built)
+        _kernel_cache_accessed.clear()
+        _kernel_cache_built.clear()
+
+    evict = max_size is not None or max_age is not None
+    if not accessed and not evict and not scan:
+        return 0
+
+    try:
+        with _kernel_cache_lock(cache_dir):
+            entries = _read_kernel_cache_index(cache_dir)
+            if evict or scan:
+                _scan_kernel_cache_modules(cache_dir, entries)
+
+            for name, last_access in accessed.items():
+                entry = entries.get(name)
+                if entry is None or name in built:
+                    module_dir = os.path.join(cache_dir, name)
+                    if not os.path.isdir(module_dir):
+                        entries.pop(name, None)
+                        continue
+                    entry = entries[name] = {"size": _kernel_cache_module_size(module_dir), "last_access": 0.0}
+                entry["last_access"] = max(entry["last_access"], last_access)
+
+            evicted = []
+            if evict:
+                evicted = _evict_kernel_cache_modules(cache_dir, entries, max_size, max_age, keep=built)
+
+            _write_kernel_cache_index(cache_dir, entries)
+    except OSError as e:
+        # the cache may be read-only or its lock held by a hung process, the
+        # index is only needed for eviction, so carry on without it
+        if not _kernel_cache_index_warned:
+            from warp._src.logger import log_warning  # noqa: PLC0415
+
+            log_warning(f"Could not update the kernel cache index in '{cache_dir}': {e}")
+            _kernel_cache_index_warned = True
+        return 0
+
+    for evicted_dir in evicted:
+        shutil.rmtree(evicted_dir, ignore_errors=True)
+
+    return len(evicted)
+
+
+def _flush_kernel_cache_index():
+    with contextlib.suppress(Exception):
+        _update_kernel_cache_index()
+
+
+def record_kernel_cache_use(module_name, built):
+    """Record that this process used the kernel cache directory ``module_name``.
+
+    Uses are written to the cache index in batches: when a module is built and
+    :attr:`warp.config.kernel_cache_max_size` is set, which also evicts least recently
+    used modules, and otherwise when the process exits.
+    """
+    global _kernel_cache_flush_registered
+
+    with _kernel_cache_mutex:
+        _kernel_cache_accessed[module_name] = time.time()
+        if built:
+            _kernel_cache_built.add(module_name)
+
+        if not _kernel_cache_flush_registered:
+            atexit.register(_flush_kernel_cache_index)
+            _kernel_cache_flush_registered = True
+
+    if built and warp.config.kernel_cache_max_size is not None:
+        _update_kernel_cache_index(max_size=warp.config.kernel_cache_max_size)
+
+
+def prune_kernel_cache(max_size: int | None = None, max_age: float | None = None) -> int:
+    """Remove the least recently used modules from the kernel cache directory.
+
+    Module directories are removed in order of last use, as recorded in an index shared by every process
+    using the cache, until the total size of the remaining modules is at most ``max_size`` bytes. Modules
+    that have not been used for more than ``max_age`` seconds are removed regardless of size. Updates to the
+    index are guarded by a lock, so this function can be run periodically (e.g. from a cron job) while
+    other processes use the cache.
+
+    Only directories beginning with ``wp_`` are considered.
+    This function only prunes the cache for the current Warp version.
+    LTO artifacts are not affected.
+
+    Args:
+        max_size: Maximum total size of the cached modules in bytes. If ``None``,
+            :attr:`warp.config.kernel_cache_max_size` is used.
+        max_age: Maximum time in seconds since a module was last used, or ``None`` to keep modules of any age.
+
+    Returns:
+        The number of module directories removed.
+    """
+
+    warp._src.context.init()
+
+    is_initialized = warp._src.context.runtime is not None
+    assert is_initialized, "The kernel cache directory is not configured; wp.init() has not been called yet or failed."
+
+    if max_size is None:
+        max_size = warp.config.kernel_cache_max_size
+    if max_size is not None and max_size < 0:
+        raise ValueError(f"max_size must be non-negative, got {max_size}")
+    if max_age is not None and max_age < 0:
+        raise ValueError(f"max_age must be non-negative, got {max_age}")
+
+    return _update_kernel_cache_index(max_size=max_size, max_age=max_age, scan=True)
+
+
 def hash_symbol(symbol):
     ch = hashlib.sha256()
     ch.update(symbol.encode("utf-8"))
@@ -936,7 +936,8 @@ def build_dll_for_arch(
             # C++ hosts even on distros that flip the default to -z now via RELRO.
             opt_undefined = "-Wl,-z,lazy"
             opt_exclude_libs = "-Wl,--exclude-libs,ALL"
-            opt_static_runtime = f"-static-libstdc++ -static-libgcc -Wl,--version-script={native_dir}/warp.map"
+            # -pthread: the host thread pool uses std::thread, which needs libpthread on glibc < 2.34
+            opt_static_runtime = f"-static-libstdc++ -static-libgcc -pthread -Wl,--version-script={native_dir}/warp.map"
 
         sanitize_ld = f" -fsanitize={args.sanitize}" if args.sanitize else ""
 
@@ -39,7 +39,7 @@ options = {}
 _SCALAR_TID_MAX_EXTENT = 2**31
 
 # Extraction products shared across Adjoints of one code object, populated
-# lazily by Adjoint.__init__ (see _SharedFunctionSource).
+# lazily by Adjoint._load_source (see _SharedFunctionSource).
 # id(code object) -> (weakref to the code object, _SharedFunctionSource).
 # Keyed by identity, not equality: equal code objects can have divergent current
 # source text (a stale .pyc reused after an in-process file rewrite), so each new
@@ -1624,6 +1624,14 @@ def _shared_source_for_code(code):
     return None
 
 
+def _code_may_use_static(code: types.CodeType) -> bool:
+    """Return whether ``code`` or one of its nested code objects refers to a name containing ``static``."""
+    for name in itertools.chain(code.co_names, code.co_freevars):
+        if "static" in name:
+            return True
+    return any(isinstance(const, types.CodeType) and _code_may_use_static(const) for const in code.co_consts)
+
+
 def _store_shared_source(code, entry):
     # Concurrent first declarations may both store (dict ops are GIL-atomic); the
     # last one wins and the loser keeps a private, equally valid entry.
@@ -1653,6 +1661,7 @@ class Adjoint:
         custom_reverse_num_input_args=-1,
         transformers: list[ast.NodeTransformer] | None = None,
         source: str | None = None,
+        source_adj: Adjoint | None = None,
     ):
         adj.func = func
 
@@ -1673,42 +1682,33 @@ class Adjoint:
 
         # extract name of source file
         adj.filename = inspect.getsourcefile(func) or "unknown source file"
-        # get source file line number where function starts
-        adj.fun_lineno = 0
-        adj._shared_source = None
-        if source is None:
-            code = getattr(inspect.unwrap(func), "__code__", None)
-            shared = _shared_source_for_code(code) if code is not None and not transformers else None
-            if shared is not None:
-                adj.source, adj.fun_lineno, adj.tree = shared.source, shared.fun_lineno, shared.tree
-                adj._shared_source = shared
-            else:
-                adj.source, adj.fun_lineno, adj.tree = adj.extract_function_source(func)
-                # The substring check conservatively matches the replace_static_expressions
-                # gate below; any wp.static kernel rewrites its tree and must not share it.
-                if code is not None and not transformers and "static" not in adj.source:
-                    adj._shared_source = _SharedFunctionSource(adj.source, adj.fun_lineno, adj.tree)
-                    _store_shared_source(code, adj._shared_source)
-        else:
-            # ensures that indented class methods can be parsed as kernels
-            adj.source = textwrap.dedent(source)
-            adj.tree = ast.parse(adj.source)
-
-        assert adj.source is not None, f"Failed to extract source code for function {func.__name__}"
-
-        # Indicates where the function definition starts (excludes decorators)
-        adj.fun_def_lineno = None
-
-        adj.source_lines = adj.source.splitlines()
 
         if transformers is None:
             transformers = []
 
         adj.transformers = transformers
-        for transformer in transformers:
-            adj.tree = transformer.visit(adj.tree)
 
-        adj.fun_name = adj.tree.body[0].name
+        # The source text and AST are only needed once the function is hashed, built, or
+        # inspected, so they are materialized on first access by ``__getattr__``. The lines of
+        # the source file are captured now, so that a later rewrite of the file on disk cannot
+        # change the source of this declaration.
+        #
+        # ``source_adj`` shares the source of another adjoint of ``func``, like passing its
+        # ``source``, without loading it.
+        if source_adj is not None and source_adj.is_source_loaded():
+            source, source_adj = source_adj.source, None
+        adj._declared_source = source
+        adj._declared_lines = None
+        adj._source_adj = source_adj
+        adj._source_loaded_callbacks = []
+        code = None
+        if source is None and source_adj is None:
+            code = getattr(inspect.unwrap(func), "__code__", None)
+            if code is not None:
+                adj._declared_lines = Adjoint._get_source_file_lines(code)
+
+        # Indicates where the function definition starts (excludes decorators)
+        adj.fun_def_lineno = None
 
         # for keeping track of line number in function code
         adj.lineno = None
@@ -1771,8 +1771,20 @@ class Adjoint:
         # wp.static() expressions resolved at declaration time (replace_static_expressions),
         # keyed by source code string. Used for hashing. Immutable after __init__.
         adj.resolved_static_expressions: dict[str, Any] = {}
-        if "static" in adj.source:
-            adj.replace_static_expressions()
+        # Static expressions must be evaluated against the scope at declaration time, and code
+        # transformers may depend on state that changes after it, so these functions are parsed
+        # eagerly. Every name evaluated by ``wp.static()`` appears in the code object.
+        # An unloaded ``source_adj`` was itself found free of static expressions.
+        if source is not None:
+            parse_now = "static" in source
+        elif source_adj is not None:
+            parse_now = False
+        else:
+            parse_now = code is None or _code_may_use_static(code)
+        if parse_now or transformers:
+            adj._load_source()
+            if "static" in adj.source:
+                adj.replace_static_expressions()
 
         # wp.static() expressions resolved during codegen (emit_Call) for expressions that
         # depend on loop variables; reset at the start of each build(). Used for hashing.
@@ -1790,6 +1802,74 @@ class Adjoint:
         # Reset to None if ``adj.tree`` is ever mutated after the cache is populated.
         adj._reference_nodes = None
 
+    # Attributes derived from the source of the function, see _load_source().
+    _SOURCE_ATTRIBUTES = frozenset(("source", "source_lines", "fun_lineno", "fun_name", "tree", "_shared_source"))
+
+    def __getattr__(adj, name):
+        # only reached for attributes missing from the instance, i.e. the source
+        # attributes of an adjoint whose source has not been loaded yet
+        if name in Adjoint._SOURCE_ATTRIBUTES and "_declared_source" in adj.__dict__:
+            adj._load_source()
+            return adj.__dict__[name]
+        raise AttributeError(f"'{type(adj).__name__}' object has no attribute '{name}'")
+
+    def is_source_loaded(adj) -> bool:
+        return "tree" in adj.__dict__
+
+    def when_source_loaded(adj, callback: Callable[[Adjoint], None]):
+        """Call ``callback(adj)`` once the source of the function is loaded, or now if it already is."""
+        if adj.is_source_loaded():
+            callback(adj)
+        else:
+            adj._source_loaded_callbacks.append(callback)
+
+    @synchronized(_codegen_lock)
+    def _load_source(adj):
+        """Extract and parse the source of the function, and apply the code transformers."""
+        if adj.is_source_loaded():
+            return
+
+        shared = None
+        declared_source = adj._declared_source
+        if declared_source is None and adj._source_adj is not None:
+            declared_source = adj._source_adj.source
+        if declared_source is None:
+            code = getattr(inspect.unwrap(adj.func), "__code__", None)
+            shared = _shared_source_for_code(code) if code is not None and not adj.transformers else None
+            if shared is not None:
+                source, fun_lineno, tree = shared.source, shared.fun_lineno, shared.tree
+            else:
+                source, fun_lineno, tree = Adjoint.extract_function_source(adj.func, adj._declared_lines)
+                # The substring check conservatively matches the replace_static_expressions
+                # gate in __init__; any wp.static kernel rewrites its tree and must not share it.
+                if code is not None and not adj.transformers and "static" not in source:
+                    shared = _SharedFunctionSource(source, fun_lineno, tree)
+                    _store_shared_source(code, shared)
+        else:
+            # ensures that indented class methods can be parsed as kernels
+            source = textwrap.dedent(declared_source)
+            fun_lineno = 0
+            tree = ast.parse(source)
+
+        assert source is not None, f"Failed to extract source code for function {adj.func.__name__}"
+
+        for transformer in adj.transformers:
+            tree = transformer.visit(tree)
+
+        adj.source = source
+        adj.source_lines = source.splitlines()
+        adj.fun_lineno = fun_lineno
+        adj.fun_name = tree.body[0].name
+        adj._shared_source = shared
+        adj._declared_lines = None
+        adj._source_adj = None
+        # set last, marks the source as loaded
+        adj.tree = tree
+
+        callbacks, adj._source_loaded_callbacks = adj._source_loaded_callbacks, []
+        for callback in callbacks:
+            callback(adj)
+
     # allocate extra space for a function call that requires its
     # own shared memory space, we treat shared memory as a stack
     # where each function pushes and pops space off, the extra
@@ -1825,7 +1905,7 @@ class Adjoint:
         return adj.get_own_required_shared() * 2 + adj.max_required_extra_shared_memory_backward
 
     @staticmethod
-    def extract_function_source(func: Callable) -> tuple[str, int, ast.Module]:
+    def extract_function_source(func: Callable, lines: list[str] | None = None) -> tuple[str, int, ast.Module]:
         """Extract a function's source as ``inspect.getsourcelines`` would, but faster.
 
         Uses a ``co_lines()``-based heuristic to find the function's source slice
@@ -1872,13 +1952,17 @@ class Adjoint:
         So: parse + target-function validation success ⟹ correct slice; parse or
         validation failure ⟹ fallback. The slow path is also parsed; if *that*
         fails, the function itself has a syntax error and we let it propagate.
+
+        ``lines`` optionally gives the lines of the source file captured by
+        :meth:`_get_source_file_lines` when the function was declared; they are
+        read from ``linecache`` otherwise.
         """
         try:
             code = inspect.unwrap(func).__code__
         except (AttributeError, ValueError):
             code = None
         if code is not None:
-            fast = Adjoint._try_extract_function_source(code)
+            fast = Adjoint._try_extract_function_source(code, lines)
             if fast is not None:
                 fast_source, fast_lineno = fast
                 dedented = textwrap.dedent(fast_source)
@@ -1913,7 +1997,14 @@ class Adjoint:
         return "".join(source_lines), fun_lineno
 
     @staticmethod
-    def _try_extract_function_source(code: types.CodeType) -> tuple[str, int] | None:
+    def _get_source_file_lines(code: types.CodeType) -> list[str]:
+        """Return the current ``linecache`` lines of the file defining ``code``."""
+        if not (code.co_filename.startswith("<") and code.co_filename.endswith(">")):
+            linecache.checkcache(code.co_filename)
+        return linecache.getlines(code.co_filename)
+
+    @staticmethod
+    def _try_extract_function_source(code: types.CodeType, lines: list[str] | None = None) -> tuple[str, int] | None:
         """Best-effort extraction of a function's source slice via ``co_lines()`` + linecache.
 
         Returns ``None`` when the file isn't in ``linecache``, ``co_firstlineno``
@@ -1924,9 +2015,8 @@ class Adjoint:
         :meth:`extract_function_source` catches every heuristic miss (see that
         method's docstring for the proof).
         """
-        if not (code.co_filename.startswith("<") and code.co_filename.endswith(">")):
-            linecache.checkcache(code.co_filename)
-        lines = linecache.getlines(code.co_filename)
+        if lines is None:
+            lines = Adjoint._get_source_file_lines(code)
         start = code.co_firstlineno - 1
         if not lines or not (0 <= start < len(lines)):
             return None
@@ -2011,6 +2101,14 @@ class Adjoint:
         # Exact launch metadata derived from calls reached by this build.
         adj.uses_scalar_tid = False
 
+        # set when this build reaches CPU atomics or tiles, which are not safe to run from several
+        # host threads; callees are folded in by ModuleBuilder._propagate_serial_cpu_launch
+        adj.requires_serial_cpu_launch = False
+
+        # set when this build emits a dynamic for/while loop, whose trip count may differ between
+        # neighboring tasks; rules out lane-batched CPU entry points, see codegen_module()
+        adj.has_dynamic_loops = False
+
         # wp.ref[T] callees lacking a manual adjoint; rejected post-build, once used_by_backward_kernel is final
         adj.unvalidated_ref_calls = []
 
@@ -2602,6 +2700,15 @@ class Adjoint:
                     adj.add_forward(f"var_{arg} = {constant_str(func.value_type(raw))};")
                     return return_value(arg)
 
+        # CPU atomics are plain read-modify-writes and CPU tile storage is reached through a single
+        # pointer, so kernels using either must run their tasks on one host thread
+        if func.is_builtin():
+            if func.group == "Tile Primitives" or func.key.startswith("atomic_") or func.key.endswith("_tiled"):
+                adj.requires_serial_cpu_launch = True
+        elif func.native_snippet is not None:
+            # native snippets are opaque, assume they may contain atomics
+            adj.requires_serial_cpu_launch = True
+
         # if it is a user-function then build it recursively
         if not func.is_builtin():
             # record the call-graph edge for the post-build propagation passes
@@ -3035,6 +3142,7 @@ class Adjoint:
 
     # define a for-loop
     def begin_for(adj, iter):
+        adj.has_dynamic_loops = True
         cond_block = adj.begin_block("for")
         adj.loop_blocks.append(cond_block)
         adj.add_forward(f"start_{cond_block.label}:;")
@@ -3109,6 +3217,7 @@ class Adjoint:
     def begin_while(adj, cond):
         # evaluate condition in its own block
         # so we can control replay
+        adj.has_dynamic_loops = True
         cond_block = adj.begin_block("while")
         adj.loop_blocks.append(cond_block)
         cond_block.body_forward.append(f"start_{cond_block.label}:;")
@@ -6264,14 +6373,14 @@ class Adjoint:
 
         Both ``Adjoint.get_references`` (module hashing) and ``Module._find_references``
         (dependency tracking) walk the kernel AST to find references. They run at different
-        times (hashing versus registration), so they cannot share the resolution of those
+        times (every hash versus once when the source is loaded), so they cannot share the resolution of those
         nodes, but they can share the traversal: the tree is walked once here and the node
         tuple is reused, each caller resolving from it at its own time.
 
         Sharing the resolution would be wrong in either direction. Resolving at hash time and
         reusing the result for dependency tracking would miss the dependency edges of modules
         that are only reached transitively, so reloading such a module would not unload its
-        dependents. Resolving at registration time and reusing the result for hashing would
+        dependents. Resolving once and reusing the result for hashing would
         make a regular kernel's hash stale if a referenced global or constant is rebound
         before the kernel is first built.
 
@@ -6657,7 +6766,7 @@ cuda_kernel_template_backward_grid_stride = """
 
 cpu_kernel_template_forward = """
 
-void {name}_cpu_kernel_forward(
+{forward_qualifiers}void {name}_cpu_kernel_forward(
     {forward_args},
     wp_args_{name} *_wp_args)
 {{
@@ -6700,6 +6809,77 @@ WP_API void {name}_cpu_forward(
 
 """
 
+cpu_module_template_forward_range = """
+
+extern "C" {{
+
+// Python CPU entry point for a contiguous range of tasks, used by multi-threaded launches
+WP_API void {name}_cpu_forward_range(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(*dim, task_index, _wp_args);
+    }}
+}}
+
+}} // extern C
+
+"""
+
+cpu_module_template_forward_lanes = """
+
+// bodies the vectorizer cannot handle (e.g. aggregate loads) quietly stay scalar, the warning is
+// reported where the loop is inlined
+#pragma clang diagnostic push
+#pragma clang diagnostic ignored "-Wpass-failed"
+
+// runs tasks [task_begin, task_end) in blocks of {simd_width} consecutive task indices, one per vector lane
+static void {name}_cpu_forward_lanes(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+    const wp::launch_bounds_t<{launch_ndim}> bounds = *dim;
+
+    // tasks are independent by construction, so memory accesses of neighboring lanes may be reordered
+#pragma clang loop vectorize(assume_safety) vectorize_width({simd_width}) interleave(disable)
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(bounds, task_index, _wp_args);
+    }}
+}}
+
+extern "C" {{
+
+// Python CPU entry points
+WP_API void {name}_cpu_forward(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args)
+{{
+    {name}_cpu_forward_lanes(dim, _wp_args, 0, dim->size);
+}}
+
+// Python CPU entry point for a contiguous range of tasks, used by multi-threaded launches
+WP_API void {name}_cpu_forward_range(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+    {name}_cpu_forward_lanes(dim, _wp_args, task_begin, task_end);
+}}
+
+}} // extern C
+
+#pragma clang diagnostic pop
+
+"""
+
 cpu_module_template_backward = """
 
 extern "C" {{
@@ -7398,6 +7578,26 @@ def resolve_grid_stride(kernel_options: dict, default_grid_stride: builtins.bool
     return builtins.bool(default_grid_stride if explicit is None else explicit)
 
 
+def get_cpu_simd_width(kernel, options):
+    """Return the number of lanes the CPU forward entry points of ``kernel`` are batched over.
+
+    Returns 1 unless the ``cpu_simd_width`` option requests batching and the kernel is a simple
+    element-wise kernel: no atomics, tiles, or native snippets (see ``requires_serial_cpu_launch``)
+    and no dynamic loops, whose trip counts may diverge between neighboring tasks.
+    """
+    width = options.get("cpu_simd_width", 0)
+    if not isinstance(width, int) or width < 0 or (width & (width - 1)) != 0:
+        raise ValueError(f"cpu_simd_width must be 0 or a power of two, got {width!r}")
+    if width <= 1:
+        return 1
+
+    adj = kernel.adj
+    if adj.requires_serial_cpu_launch or adj.has_dynamic_loops:
+        return 1
+
+    return width
+
+
 def codegen_kernel(kernel, device, options):
     # Update the module's options with the ones defined on the kernel, if any.
     options = options | kernel.options
@@ -7462,6 +7662,11 @@ def codegen_kernel(kernel, device, options):
         if cluster_dim != 1:
             cluster_dims_str = f"WP_CLUSTER_DIMS({cluster_dim}, 1, 1) "
 
+    # lane-batched entry points need the body inlined into their loop to vectorize it
+    forward_qualifiers = ""
+    if device == "cpu" and get_cpu_simd_width(kernel, options) > 1:
+        forward_qualifiers = "static inline __attribute__((always_inline)) "
+
     # build forward signature
     forward_args = [f"wp::launch_bounds_t<{adj.kernel_dim}> dim"]
     if device == "cpu":
@@ -7479,6 +7684,7 @@ def codegen_kernel(kernel, device, options):
         {
             "forward_args": indent(forward_args),
             "forward_body": forward_body,
+            "forward_qualifiers": forward_qualifiers,
             "line_directive": func_line_directive,
             "launch_bounds_str": launch_bounds_str,
             "cluster_dims_str": cluster_dims_str,
@@ -7531,7 +7737,16 @@ def codegen_module(kernel, device, options):
         "launch_ndim": kernel.adj.kernel_dim,
     }
 
-    template += cpu_module_template_forward
+    simd_width = get_cpu_simd_width(kernel, options)
+    if simd_width > 1:
+        template_fmt_args["simd_width"] = simd_width
+        template += cpu_module_template_forward_lanes
+    else:
+        template += cpu_module_template_forward
+
+        # kernels free of atomics and tiles can split a launch across host threads
+        if not kernel.adj.requires_serial_cpu_launch:
+            template += cpu_module_template_forward_range
 
     if options["enable_backward"]:
         template += cpu_module_template_backward
@@ -11,6 +11,7 @@ import numpy as np
 
 import warp as wp
 from warp._src.types import type_repr
+from warp._src.utils import array_scan
 
 
 class GraphColoringAlgorithm(enum.IntEnum):
@@ -22,6 +23,13 @@ class GraphColoringAlgorithm(enum.IntEnum):
     GREEDY = 1
     """Degree-ordered greedy coloring algorithm."""
 
+    JONES_PLASSMANN = 2
+    """Parallel Jones-Plassmann coloring with random node priorities.
+
+    Runs as Warp kernels on the device of the input arrays, which do not need to reside on the CPU.
+    Typically uses a few more colors than :attr:`MCS`.
+    """
+
 
 def graph_coloring_assign(
     edges: wp.array,
@@ -38,9 +46,10 @@ def graph_coloring_assign(
     Args:
         edges: A 2D array of shape ``(edge_count, 2)`` containing edge pairs, where each
             row ``[i, j]`` represents an undirected edge between nodes ``i`` and ``j``.
-            Must be a CPU array with ``int32`` dtype.
+            Must be an ``int32`` array, on the CPU unless ``algorithm`` is
+            :attr:`GraphColoringAlgorithm.JONES_PLASSMANN`.
         node_colors: A 1D array of shape ``(node_count,)`` that will be filled with the
-            computed color assignments. Must be a CPU array with ``int32`` dtype.
+            computed color assignments. Must be an ``int32`` array on the same device as ``edges``.
             The array size determines the number of nodes in the graph.
         algorithm: The coloring algorithm to use.
 
@@ -48,10 +57,18 @@ def graph_coloring_assign(
         The number of colors used in the coloring.
 
     See Also:
-        :func:`graph_coloring_balance`.
+        :func:`graph_coloring_balance`, :func:`graph_coloring_repair`.
     """
     from warp._src.context import runtime  # noqa: PLC0415
 
+    if algorithm == GraphColoringAlgorithm.JONES_PLASSMANN:
+        _validate_device_coloring_arrays(edges, node_colors)
+        if node_colors.shape[0] == 0:
+            raise RuntimeError("Cannot color an empty graph")
+
+        node_colors.fill_(-1)
+        return _jones_plassmann_coloring(edges, node_colors, nodes=None)
+
     # Validate device
     if not edges.device.is_cpu:
         raise RuntimeError("edges array must be on the CPU")
@@ -162,6 +179,307 @@ def graph_coloring_balance(
     )
 
 
+def graph_coloring_repair(
+    edges: wp.array,
+    node_colors: wp.array,
+    edited_edges: wp.array | None = None,
+) -> int:
+    """Repair an existing coloring after edges or nodes have been added to the graph.
+
+    Only the nodes that are uncolored or that conflict with a neighbor through one of
+    ``edited_edges`` are recolored, using parallel Jones-Plassmann rounds that run as Warp
+    kernels on the device of the input arrays. All other nodes keep their current color, so
+    that color groups remain stable across topology edits. Removing edges never invalidates
+    a coloring, so only added edges need to be passed as ``edited_edges``.
+
+    Args:
+        edges: A 2D array of shape ``(edge_count, 2)`` containing the edge pairs of the edited graph.
+            Must be an ``int32`` array.
+        node_colors: A 1D array of shape ``(node_count,)`` containing the current color assignments,
+            with negative values for nodes that have not been colored yet. Will be modified in-place.
+            Must be an ``int32`` array on the same device as ``edges``.
+        edited_edges: A 2D array of shape ``(edited_edge_count, 2)`` containing the edges that have been
+            added since ``node_colors`` was computed. If ``None``, all ``edges`` are checked for conflicts.
+
+    Returns:
+        The number of colors used in the repaired coloring.
+
+    Example:
+
+        .. code-block:: python
+
+            import warp as wp
+
+            edges = wp.array([[0, 1], [1, 2]], dtype=wp.int32)
+            colors = wp.empty(3, dtype=wp.int32)
+            wp.utils.graph_coloring_assign(edges, colors, wp.utils.GraphColoringAlgorithm.JONES_PLASSMANN)
+
+            added = wp.array([[2, 0]], dtype=wp.int32)
+            edges = wp.array([[0, 1], [1, 2], [2, 0]], dtype=wp.int32)
+            color_count = wp.utils.graph_coloring_repair(edges, colors, edited_edges=added)
+
+    See Also:
+        :func:`graph_coloring_assign`.
+    """
+    _validate_device_coloring_arrays(edges, node_colors)
+    if edited_edges is None:
+        edited_edges = edges
+    else:
+        _validate_device_coloring_arrays(edited_edges, node_colors, edges_name="edited_edges")
+
+    node_count = node_colors.shape[0]
+    if node_count == 0:
+        return 0
+
+    device = node_colors.device
+
+    # flag uncolored nodes and the lowest-priority endpoint of conflicting edges,
+    # from the colors before any node gets uncolored so that flags do not depend on thread ordering
+    dirty = wp.zeros(node_count + 1, dtype=int, device=device)
+    wp.launch(_flag_uncolored_nodes, dim=node_count, inputs=[node_colors], outputs=[dirty], device=device)
+    wp.launch(
+        _flag_conflicting_edges,
+        dim=edited_edges.shape[0],
+        inputs=[edited_edges, node_colors],
+        outputs=[dirty],
+        device=device,
+    )
+
+    # compact the flagged nodes
+    dirty_offsets = wp.empty_like(dirty)
+    array_scan(dirty, dirty_offsets, inclusive=False)
+    dirty_count = int(dirty_offsets[node_count : node_count + 1].numpy()[0])
+
+    if dirty_count > 0:
+        nodes = wp.empty(dirty_count, dtype=int, device=device)
+        wp.launch(
+            _compact_dirty_nodes,
+            dim=node_count,
+            inputs=[dirty, dirty_offsets],
+            outputs=[node_colors, nodes],
+            device=device,
+        )
+        return _jones_plassmann_coloring(edges, node_colors, nodes=nodes)
+
+    return _color_count(node_colors)
+
+
+def _validate_device_coloring_arrays(edges: wp.array, node_colors: wp.array, edges_name: str = "edges"):
+    if edges.dtype != wp.int32:
+        raise RuntimeError(f"{edges_name} array must have dtype int32, got {type_repr(edges.dtype)}")
+    if node_colors.dtype != wp.int32:
+        raise RuntimeError(f"node_colors array must have dtype int32, got {type_repr(node_colors.dtype)}")
+
+    if edges.ndim != 2:
+        raise RuntimeError(f"{edges_name} array must be 2-dimensional, got {edges.ndim} dimensions")
+    if edges.shape[1] != 2:
+        raise RuntimeError(f"{edges_name} array must have shape (edge_count, 2), got shape {edges.shape}")
+    if node_colors.ndim != 1:
+        raise RuntimeError(f"node_colors array must be 1-dimensional, got {node_colors.ndim} dimensions")
+
+    if edges.device != node_colors.device:
+        raise RuntimeError(
+            f"{edges_name} and node_colors arrays must be on the same device, "
+            f"got '{edges.device}' and '{node_colors.device}'"
+        )
+    if not edges.is_contiguous or not node_colors.is_contiguous:
+        raise RuntimeError(f"{edges_name} and node_colors arrays must be contiguous")
+
+
+def _jones_plassmann_coloring(edges: wp.array, node_colors: wp.array, nodes: wp.array | None) -> int:
+    """Color the nodes with negative colors in Jones-Plassmann rounds, keeping other colors fixed.
+
+    ``nodes`` optionally restricts the rounds to a subset of nodes that contains all uncolored ones.
+    """
+    device = node_colors.device
+    node_count = node_colors.shape[0]
+    edge_count = edges.shape[0]
+
+    # CSR adjacency, self-loops are skipped so the total neighbor count is bounded by twice the edge count
+    adjacency_offsets = wp.zeros(node_count + 1, dtype=int, device=device)
+    adjacency = wp.empty(max(2 * edge_count, 1), dtype=int, device=device)
+    wp.launch(_count_node_degrees, dim=edge_count, inputs=[edges], outputs=[adjacency_offsets], device=device)
+    array_scan(adjacency_offsets, adjacency_offsets, inclusive=False)
+
+    fill_counts = wp.zeros(node_count, dtype=int, device=device)
+    wp.launch(
+        _fill_node_adjacency,
+        dim=edge_count,
+        inputs=[edges, adjacency_offsets],
+        outputs=[fill_counts, adjacency],
+        device=device,
+    )
+
+    all_nodes = nodes is None
+    round_dim = node_count if all_nodes else nodes.shape[0]
+
+    # each round colors at least the uncolored node of highest priority, usually many more
+    uncolored_count = wp.empty(1, dtype=int, device=device)
+    while True:
+        uncolored_count.zero_()
+        wp.launch(
+            _jones_plassmann_round,
+            dim=round_dim,
+            inputs=[all_nodes, nodes, adjacency_offsets, adjacency],
+            outputs=[node_colors, uncolored_count],
+            device=device,
+        )
+        if uncolored_count.numpy()[0] == 0:
+            break
+
+    return _color_count(node_colors)
+
+
+def _color_count(node_colors: wp.array) -> int:
+    max_color = wp.full(1, -1, dtype=int, device=node_colors.device)
+    wp.launch(
+        _max_node_color, dim=node_colors.shape[0], inputs=[node_colors], outputs=[max_color], device=node_colors.device
+    )
+    return int(max_color.numpy()[0]) + 1
+
+
+_COLORING_PRIORITY_SEED = wp.constant(0x2545F491)
+
+
+@wp.func
+def _coloring_priority_greater(node: int, other: int):
+    """Whether ``node`` has a strictly higher Jones-Plassmann priority than ``other``.
+
+    Priorities are pseudo-random hashes of the node indices, with ties broken by index.
+    """
+    h = wp.rand_init(_COLORING_PRIORITY_SEED, node)
+    h_other = wp.rand_init(_COLORING_PRIORITY_SEED, other)
+    return h > h_other or (h == h_other and node > other)
+
+
+@wp.kernel
+def _count_node_degrees(edges: wp.array2d(dtype=wp.int32), degrees: wp.array(dtype=int)):
+    e = wp.tid()
+    i = int(edges[e, 0])
+    j = int(edges[e, 1])
+    if i != j:
+        wp.atomic_add(degrees, i, 1)
+        wp.atomic_add(degrees, j, 1)
+
+
+@wp.kernel
+def _fill_node_adjacency(
+    edges: wp.array2d(dtype=wp.int32),
+    adjacency_offsets: wp.array(dtype=int),
+    fill_counts: wp.array(dtype=int),
+    adjacency: wp.array(dtype=int),
+):
+    e = wp.tid()
+    i = int(edges[e, 0])
+    j = int(edges[e, 1])
+    if i != j:
+        adjacency[adjacency_offsets[i] + wp.atomic_add(fill_counts, i, 1)] = j
+        adjacency[adjacency_offsets[j] + wp.atomic_add(fill_counts, j, 1)] = i
+
+
+@wp.func
+def _smallest_free_color(
+    beg: int,
+    end: int,
+    adjacency: wp.array(dtype=int),
+    node_colors: wp.array(dtype=wp.int32),
+):
+    """Return the smallest color not used by any colored neighbor, scanning colors in windows of 64."""
+    base = int(0)
+    color = int(-1)
+    while color < 0:
+        used = wp.uint64(0)
+        for k in range(beg, end):
+            c = int(node_colors[adjacency[k]]) - base
+            if c >= 0 and c < 64:
+                used = used | (wp.uint64(1) << wp.uint64(c))
+
+        bit = int(0)
+        while bit < 64 and ((used >> wp.uint64(bit)) & wp.uint64(1)) != wp.uint64(0):
+            bit += 1
+        if bit < 64:
+            color = base + bit
+        base += 64
+
+    return color
+
+
+@wp.kernel
+def _jones_plassmann_round(
+    all_nodes: bool,
+    nodes: wp.array(dtype=int),
+    adjacency_offsets: wp.array(dtype=int),
+    adjacency: wp.array(dtype=int),
+    node_colors: wp.array(dtype=wp.int32),
+    uncolored_count: wp.array(dtype=int),
+):
+    node = wp.tid()
+    if not all_nodes:
+        node = nodes[node]
+
+    if node_colors[node] >= 0:
+        return
+
+    beg = adjacency_offsets[node]
+    end = adjacency_offsets[node + 1]
+
+    # a node is colored once all its neighbors of higher priority are; those may be colored
+    # concurrently within this round, in which case they are either seen as uncolored or with
+    # their final color, so the result does not depend on thread ordering
+    ready = bool(True)
+    for k in range(beg, end):
+        other = adjacency[k]
+        if node_colors[other] < 0 and _coloring_priority_greater(other, node):
+            ready = False
+            break
+
+    if ready:
+        node_colors[node] = wp.int32(_smallest_free_color(beg, end, adjacency, node_colors))
+    else:
+        wp.atomic_add(uncolored_count, 0, 1)
+
+
+@wp.kernel
+def _flag_uncolored_nodes(node_colors: wp.array(dtype=wp.int32), dirty: wp.array(dtype=int)):
+    node = wp.tid()
+    if node_colors[node] < 0:
+        dirty[node] = 1
+
+
+@wp.kernel
+def _flag_conflicting_edges(
+    edges: wp.array2d(dtype=wp.int32),
+    node_colors: wp.array(dtype=wp.int32),
+    dirty: wp.array(dtype=int),
+):
+    e = wp.tid()
+    i = int(edges[e, 0])
+    j = int(edges[e, 1])
+    if i != j and node_colors[i] >= 0 and node_colors[i] == node_colors[j]:
+        if _coloring_priority_greater(i, j):
+            dirty[j] = 1
+        else:
+            dirty[i] = 1
+
+
+@wp.kernel
+def _compact_dirty_nodes(
+    dirty: wp.array(dtype=int),
+    dirty_offsets: wp.array(dtype=int),
+    node_colors: wp.array(dtype=wp.int32),
+    nodes: wp.array(dtype=int),
+):
+    node = wp.tid()
+    if dirty[node] != 0:
+        nodes[dirty_offsets[node]] = node
+        node_colors[node] = -1
+
+
+@wp.kernel
+def _max_node_color(node_colors: wp.array(dtype=wp.int32), max_color: wp.array(dtype=int)):
+    wp.atomic_max(max_color, 0, int(node_colors[wp.tid()]))
+
+
 @wp.kernel
 def count_color_group_sizes(
     node_colors: wp.array(dtype=int),
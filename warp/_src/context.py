@@ -15,6 +15,8 @@ import inspect
 import io
 import itertools
 import json
+import marshal
+import multiprocessing
 import operator
 import os
 import platform
@@ -27,9 +29,12 @@ import threading
 import types
 import weakref
 from collections.abc import Callable, Iterable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from copy import copy as shallowcopy
 from pathlib import Path
+from struct import Struct as PackedStruct
+from struct import error as PackedStructError
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -162,6 +167,22 @@ class timing_result_t(ctypes.Structure):
     )
 
 
+class cpu_timing_result_t(ctypes.Structure):
+    """CPU timing struct for fetching values from C++."""
+
+    _fields_ = (
+        ("name", ctypes.c_char_p),
+        ("func", ctypes.c_void_p),
+        ("flag", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("shape", ctypes.c_int * 4),
+        ("thread_id", ctypes.c_uint64),
+        ("start", ctypes.c_double),
+        ("elapsed", ctypes.c_double),
+        ("dispatch", ctypes.c_double),
+    )
+
+
 class det_scatter_buf_t(ctypes.Structure):
     _fields_ = [
         ("keys", ctypes.c_void_p),
@@ -609,7 +630,7 @@ class Function:
                             overload_annotations[k] = default_type
 
                 ovl = shallowcopy(f)
-                ovl.adj = warp._src.codegen.Adjoint(f.func, overload_annotations, source=f.adj.source)
+                ovl.adj = warp._src.codegen.Adjoint(f.func, overload_annotations, source_adj=f.adj)
                 ovl.input_types = overload_annotations
                 ovl.value_func = None
                 ovl.generic_parent = f
@@ -934,10 +955,15 @@ class KernelHooks:
         det_launch_meta: DeterministicMeta | None = None,
         forward_smem_shortfall: str | None = None,
         backward_smem_shortfall: str | None = None,
+        forward_range=None,
     ):
         self.forward = forward
         self.backward = backward
 
+        # CPU entry point running a sub-range of tasks, or None when the kernel must run
+        # serially (atomics, tiles) and multi-threaded launches fall back to ``forward``
+        self.forward_range = forward_range
+
         self.forward_smem_bytes = forward_smem_bytes
         self.backward_smem_bytes = backward_smem_bytes
 
@@ -957,6 +983,10 @@ class KernelHooks:
         # codegen scratch and may describe a different variant.
         self.det_launch_meta = det_launch_meta
 
+        # Packed CPU launch plans keyed by the Python types of the forward arguments,
+        # or None for signatures that always take the regular launch path.
+        self.cpu_launch_plans: dict[tuple[type, ...], _CpuLaunchPlan | None] = {}
+
 
 # Hardware upper bound for the non-portable cluster range (9-16), valid on
 # Hopper and Blackwell. The usable maximum for a given kernel and device is
@@ -1175,7 +1205,7 @@ class Kernel:
 
         # instantiate this kernel with the given argument types
         ovl = shallowcopy(self)
-        ovl.adj = warp._src.codegen.Adjoint(self.func, overload_annotations, source=self.adj.source)
+        ovl.adj = warp._src.codegen.Adjoint(self.func, overload_annotations, source_adj=self.adj)
         ovl.is_generic = False
         ovl.overloads = {}
         ovl.sig = sig
@@ -2621,9 +2651,12 @@ class ModuleHasher:
             ch.update(kernel_hash)
 
         # configuration parameters
+        options_hash = hashlib.sha256()
         for opt in sorted(options.keys()):
             s = f"{opt}:{options[opt]}"
             ch.update(bytes(s, "utf-8"))
+            options_hash.update(bytes(s, "utf-8"))
+        self.options_hash = options_hash.digest()
 
         # Note: cuda_output defaults to None in the options dict and is not
         # resolved before hashing, so modules with different cuda_output
@@ -2806,7 +2839,8 @@ class ModuleHasher:
 
         return ch.digest()
 
-    def get_constant_bytes(self, value) -> bytes:
+    @staticmethod
+    def get_constant_bytes(value) -> bytes:
         if isinstance(value, int):
             # this also handles builtins.bool
             return bytes(ctypes.c_int(value))
@@ -2833,9 +2867,378 @@ class ModuleHasher:
     def get_unique_kernels(self):
         return self.unique_kernels.values()
 
+    def get_kernel_unit_hash(self, kernel: Kernel) -> bytes:
+        """Return the hash identifying a kernel compiled on its own with this hasher's options."""
+        ch = hashlib.sha256()
+        ch.update(kernel.hash)
+        ch.update(self.options_hash)
+        return ch.digest()
+
+
+# sentinel for attributes missing from a namespace followed by ModuleFingerprint
+_MISSING = object()
+
+
+class _ModuleFingerprintError(Exception):
+    """Raised when a module depends on objects that cannot be fingerprinted."""
+
+
+class ModuleFingerprint:
+    """Cheap fingerprint of the inputs of a module hash, see :attr:`warp.config.module_hash_manifest`.
+
+    Unlike :class:`ModuleHasher`, the fingerprint does not parse the kernels. It covers their declared
+    source, options, and overload signatures, the source of the user functions reachable from their code,
+    the values bound to the global and closure names used by that code, the resolved module options, and
+    the Warp version.
+
+    Attributes:
+        digest: Hex digest of the fingerprint, or ``None`` if the module depends on objects that cannot
+            be fingerprinted.
+        kernels: The hashed kernels of the module, i.e. its non-generic kernels and the overloads of its
+            generic kernels, in a deterministic order.
+        modules: The other modules defining the functions and structs reached by the fingerprint.
+    """
+
+    # limits on the nesting depth and size of the Python containers followed by the fingerprint
+    MAX_DEPTH = 8
+    MAX_ITEMS = 4096
+    MAX_ARRAY_BYTES = 1 << 20
+
+    def __init__(self, module: Module, options: dict):
+        self.kernels: list[Kernel] = []
+        self.modules: set[Module] = set()
+        self.digest: str | None = None
+
+        self._module = module
+        self._ch = hashlib.sha256()
+        # ids of the functions, adjoints, and namespaces already fingerprinted, which all outlive the fingerprint
+        self._visited = set()
+
+        try:
+            self._add_module(module, options)
+        except _ModuleFingerprintError as e:
+            log_debug(f"[ModuleFingerprint] Module {module.name} cannot be fingerprinted: {e}")
+        else:
+            self.digest = self._ch.hexdigest()
+
+    def _update(self, *parts) -> None:
+        for part in parts:
+            self._ch.update(part if isinstance(part, bytes) else bytes(str(part), "utf-8"))
+            self._ch.update(b"\0")
+
+    def _add_module(self, module: Module, options: dict) -> None:
+        self._update("module", warp.config.version, module.name)
+        for opt in sorted(options.keys()):
+            self._update(f"{opt}:{options[opt]}")
+
+        def kernel_location(kernel):
+            code = getattr(inspect.unwrap(kernel.func), "__code__", None)
+            if code is None:
+                raise _ModuleFingerprintError(f"kernel {kernel.key} has no code object")
+            return (kernel.key, code.co_filename, code.co_firstlineno)
+
+        kernels = sorted(module._get_live_kernels(), key=kernel_location)
+        if len({kernel_location(kernel) for kernel in kernels}) != len(kernels):
+            # kernels declared repeatedly by the same code can't be told apart across processes
+            raise _ModuleFingerprintError("several live kernels share a key and a declaration")
+
+        for kernel in kernels:
+            self._update("kernel", kernel.key)
+            for opt in sorted(kernel.options):
+                self._update(f"{opt}:{kernel.options[opt]}")
+            self._update("return", ModuleHasher._hash_kernel_return_annotation(kernel))
+            self._add_adjoint(kernel.adj)
+
+            if kernel.is_generic:
+                for sig in sorted(kernel.overloads.keys()):
+                    ovl = kernel.overloads[sig]
+                    self._update("overload", sig)
+                    self._add_arg_types(ovl.adj)
+                    self.kernels.append(ovl)
+            else:
+                self.kernels.append(kernel)
+
+    def _add_adjoint(self, adj: warp._src.codegen.Adjoint) -> None:
+        if id(adj) in self._visited:
+            return
+        self._visited.add(id(adj))
+
+        if adj.transformers:
+            raise _ModuleFingerprintError(f"function {adj.func.__qualname__} uses code transformers")
+
+        self._add_adjoint_source(adj)
+        self._add_arg_types(adj)
+
+        for expr, value in adj.resolved_static_expressions.items():
+            self._update("static", expr)
+            self._add_value(value, (), 0)
+
+        func = inspect.unwrap(adj.func)
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            self._add_code_references(func, code)
+
+    def _add_adjoint_source(self, adj: warp._src.codegen.Adjoint) -> None:
+        # Use the source the function was declared with, without parsing it: the source of an
+        # adjoint that is already loaded, an explicit source, or the slice of the source file
+        # lines captured when the function was declared.
+        if adj.is_source_loaded():
+            source = adj.source
+        elif adj._declared_source is not None:
+            source = textwrap.dedent(adj._declared_source)
+        elif adj._source_adj is not None:
+            self._add_adjoint_source(adj._source_adj)
+            return
+        else:
+            code = getattr(inspect.unwrap(adj.func), "__code__", None)
+            extracted = None
+            if code is not None and adj._declared_lines:
+                extracted = warp._src.codegen.Adjoint._try_extract_function_source(code, adj._declared_lines)
+            if extracted is None:
+                raise _ModuleFingerprintError(f"the source of function {adj.func.__qualname__} is not available")
+            source = textwrap.dedent(extracted[0])
+
+        self._update("source", source)
+
+    def _add_arg_types(self, adj: warp._src.codegen.Adjoint) -> None:
+        for arg, arg_type in adj.arg_types.items():
+            self._update("arg", arg)
+            self._add_type(arg_type)
+
+    def _add_type(self, t) -> None:
+        try:
+            self._update(warp._src.types.get_type_code(t))
+        except TypeError:
+            self._update(repr(t))
+
+        if isinstance(t, warp._src.codegen.Struct):
+            self._add_struct(t)
+        elif warp._src.types.is_array(t) and isinstance(t.dtype, warp._src.codegen.Struct):
+            self._add_struct(t.dtype)
+
+    def _add_struct(self, struct: warp._src.codegen.Struct) -> None:
+        self._update("struct", struct.hash)
+        if struct.module is not None and struct.module is not self._module:
+            self.modules.add(struct.module)
+
+    def _add_function(self, func: Function) -> None:
+        if func.is_builtin():
+            self._update("builtin", func.key)
+            return
+
+        self._update("function", func.key)
+        if id(func) in self._visited:
+            return
+        self._visited.add(id(func))
+
+        if func.module is not None and func.module is not self._module:
+            self.modules.add(func.module)
+
+        # all concrete and generic overloads, as hashed by ModuleHasher.hash_function()
+        overloads: dict[str, Function] = func.user_overloads | func.user_templates
+        for sig in sorted(overloads.keys()):
+            ovl = overloads[sig]
+            if ovl.generic_parent is not None:
+                continue
+
+            self._update("overload", sig)
+            self._add_adjoint(ovl.adj)
+
+            if ovl.custom_grad_func:
+                self._add_adjoint(ovl.custom_grad_func.adj)
+            if ovl.custom_replay_func:
+                self._add_adjoint(ovl.custom_replay_func.adj)
+            self._update(ovl.replay_snippet, ovl.native_snippet, ovl.adj_native_snippet)
+
+    def _add_code_references(self, func, code: types.CodeType) -> None:
+        # the names used by the code and by the code nested in it (e.g. comprehensions)
+        names = {}
+        pending = [code]
+        while pending:
+            c = pending.pop()
+            names.update(dict.fromkeys(c.co_names))
+            pending.extend(const for const in c.co_consts if isinstance(const, types.CodeType))
+        names = tuple(names)
+
+        # names missing from the globals are builtins, which can't change across processes
+        func_globals = getattr(func, "__globals__", {})
+        for name in names:
+            if name in func_globals:
+                self._update("global", name)
+                self._add_value(func_globals[name], names, 0)
+
+        for name, cell in zip(code.co_freevars, getattr(func, "__closure__", None) or (), strict=True):
+            self._update("closure", name)
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                self._update("<empty>")
+                continue
+            self._add_value(value, names, 0)
+
+        for value in getattr(func, "__defaults__", None) or ():
+            self._add_value(value, names, 0)
+        for name, value in sorted((getattr(func, "__kwdefaults__", None) or {}).items()):
+            self._update("default", name)
+            self._add_value(value, names, 0)
+
+    def _add_value(self, value, names: tuple[str, ...], depth: int) -> None:
+        if depth > self.MAX_DEPTH:
+            raise _ModuleFingerprintError("Python objects are nested too deeply")
+
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes, enum.Enum)):
+            self._update(type(value).__qualname__, repr(value))
+        elif isinstance(value, Function):
+            self._add_function(value)
+        elif isinstance(value, Kernel):
+            self._update("kernel", value.key)
+            self._add_adjoint(value.adj)
+        elif isinstance(value, warp._src.codegen.Struct):
+            self._add_struct(value)
+        elif warp._src.types.is_value(value) or warp._src.types.is_struct(value):
+            try:
+                self._update(type(value).__qualname__, ModuleHasher.get_constant_bytes(value))
+            except TypeError as e:
+                raise _ModuleFingerprintError(str(e)) from e
+        elif warp._src.types.is_array(value) or isinstance(value, (warp._src.types.tile, warp._src.types.tuple_t)):
+            self._add_type(value)
+        elif isinstance(value, (types.FunctionType, types.MethodType)):
+            func = inspect.unwrap(value.__func__ if isinstance(value, types.MethodType) else value)
+            self._update("python", func.__module__, func.__qualname__)
+            if id(func) in self._visited:
+                return
+            self._visited.add(id(func))
+            # Python functions are only ever run, e.g. by wp.static() expressions, so their bytecode
+            # identifies them
+            self._update(marshal.dumps(func.__code__))
+            self._add_code_references(func, func.__code__)
+        elif isinstance(value, types.BuiltinFunctionType):
+            self._update("builtin_function", getattr(value, "__module__", None), value.__qualname__)
+        elif isinstance(value, (tuple, list, set, frozenset, dict)):
+            if len(value) > self.MAX_ITEMS:
+                raise _ModuleFingerprintError(f"a {type(value).__name__} has too many items")
+            self._update(type(value).__qualname__, len(value))
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    self._add_value(k, names, depth + 1)
+                    self._add_value(v, names, depth + 1)
+            elif isinstance(value, (set, frozenset)):
+                for item_digest in sorted(self._value_digest(item, names, depth + 1) for item in value):
+                    self._update(item_digest)
+            else:
+                for item in value:
+                    self._add_value(item, names, depth + 1)
+        elif isinstance(value, np.ndarray):
+            if value.dtype.hasobject or value.nbytes > self.MAX_ARRAY_BYTES:
+                raise _ModuleFingerprintError("a NumPy array is too large or holds Python objects")
+            self._update("ndarray", value.dtype.str, value.shape, np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, (np.generic, np.dtype)):
+            self._update(type(value).__qualname__, repr(value))
+        elif isinstance(value, type):
+            try:
+                self._update("type", warp._src.types.get_type_code(value))
+                return
+            except TypeError:
+                pass
+            self._update("class", value.__module__, value.__qualname__)
+            self._add_namespace(value, names, depth)
+        elif isinstance(value, types.ModuleType):
+            self._update("module", value.__name__)
+            self._add_namespace(value, names, depth)
+        elif hasattr(value, "__dict__"):
+            self._update("object", type(value).__module__, type(value).__qualname__)
+            self._add_namespace(value, names, depth)
+        else:
+            raise _ModuleFingerprintError(f"values of type {type(value).__qualname__} are not supported")
+
+    def _value_digest(self, value, names: tuple[str, ...], depth: int) -> bytes:
+        # fingerprint an item of an unordered container on its own, so that the items can be sorted
+        ch, self._ch = self._ch, hashlib.sha256()
+        try:
+            self._add_value(value, names, depth)
+            return self._ch.digest()
+        finally:
+            self._ch = ch
+
+    def _add_namespace(self, namespace, names: tuple[str, ...], depth: int) -> None:
+        # Follow the attributes of modules, classes, and objects named in the code, since the
+        # code can only reach attributes by name.
+        if id(namespace) in self._visited:
+            return
+        self._visited.add(id(namespace))
+
+        for name in names:
+            attr = inspect.getattr_static(namespace, name, _MISSING)
+            if attr is _MISSING:
+                continue
+
+            self._update("attr", name)
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            elif isinstance(attr, property):
+                attr = attr.fget
+            elif isinstance(
+                attr,
+                (
+                    types.GetSetDescriptorType,
+                    types.MemberDescriptorType,
+                    types.MethodDescriptorType,
+                    types.WrapperDescriptorType,
+                    types.ClassMethodDescriptorType,
+                ),
+            ):
+                # attributes of native types
+                self._update(type(attr).__qualname__)
+                continue
+
+            self._add_value(attr, names, depth + 1)
+
+
+class RecordedModuleHasher(ModuleHasher):
+    """Module hasher restoring the hashes recorded in the module hash manifest.
+
+    Used in place of a :class:`ModuleHasher` when the fingerprint of a module matches an entry of the
+    manifest, see :attr:`warp.config.module_hash_manifest`. Sets the same kernel state as hashing the
+    kernels would, without parsing them.
+    """
+
+    def __init__(self, fingerprint: ModuleFingerprint, record: dict, options: dict):
+        kernel_records = record["kernels"]
+        if len(kernel_records) != len(fingerprint.kernels):
+            raise ValueError("The manifest entry does not match the kernels of the module")
+
+        self.fingerprint = fingerprint
+        self.function_hashes = {}
+        self.functions_in_progress = set()
+        self.unique_kernels = {}
+
+        default_grid_stride = options.get("default_grid_stride", False)
+        for kernel, (kernel_hash, kernel_dim) in zip(fingerprint.kernels, kernel_records, strict=True):
+            if type(kernel_dim) is not int or not 1 <= kernel_dim <= LAUNCH_MAX_DIMS:
+                raise ValueError(f"Invalid kernel dimension {kernel_dim!r} in the manifest entry")
+            kernel.hash = bytes.fromhex(kernel_hash)
+            kernel.grid_stride = warp._src.codegen.resolve_grid_stride(kernel.options, default_grid_stride)
+            # set by Adjoint.get_references() when hashing
+            kernel.adj.kernel_dim = kernel_dim
+            kernel.adj.scalar_tid_extent_limit_candidate = warp._src.codegen._SCALAR_TID_MAX_EXTENT
+            self.unique_kernels[kernel.hash] = kernel
+
+        self.unique_kernels = dict(sorted(self.unique_kernels.items()))
+        self.options_hash = bytes.fromhex(record["options_hash"])
+        self.hash = bytes.fromhex(record["module_hash"])
+
+    @staticmethod
+    def make_record(fingerprint: ModuleFingerprint, hasher: ModuleHasher) -> dict:
+        """Return the manifest entry restoring the hashes computed by ``hasher``."""
+        return {
+            "module_hash": hasher.get_hash().hex(),
+            "options_hash": hasher.options_hash.hex(),
+            "kernels": [[kernel.hash.hex(), kernel.adj.kernel_dim] for kernel in fingerprint.kernels],
+        }
+
 
 class ModuleBuilder:
-    def __init__(self, module, options, hasher=None):
+    def __init__(self, module, options, hasher=None, kernels=None):
         self.functions = {}
         self.structs = {}
         self.options = options
@@ -2846,11 +3249,13 @@ class ModuleBuilder:
         self.ltoirs_decl = {}  # map from lto symbol to lto forward declaration
         self.shared_memory_bytes = {}  # map from lto symbol to shared memory requirements
 
-        if hasher is None:
-            hasher = ModuleHasher(module._get_live_kernels(), options)
+        if kernels is None:
+            if hasher is None:
+                hasher = ModuleHasher(module._get_live_kernels(), options)
+            kernels = hasher.get_unique_kernels()
 
-        # build all unique kernels
-        self.kernels = hasher.get_unique_kernels()
+        # build all unique kernels, or only the given subset when compiling kernels separately
+        self.kernels = kernels
         for kernel in self.kernels:
             self.build_kernel(kernel)
 
@@ -2864,6 +3269,9 @@ class ModuleBuilder:
         # propagate callee replay/reverse shared-memory needs into backward-kernel sizing
         self._propagate_backward_shared_memory()
 
+        # propagate callee atomics/tiles/loops that rule out multi-threaded or lane-batched CPU launches
+        self._propagate_serial_cpu_launch()
+
     def build_struct_recursive(self, struct: warp._src.codegen.Struct):
         structs = []
 
@@ -3037,6 +3445,17 @@ class ModuleBuilder:
             adj.max_required_extra_shared_memory_backward = required
             folded.add(adj)
 
+    def _propagate_serial_cpu_launch(self):
+        # one pass in callees-before-callers order reaches the fixpoint, see _propagate_backward_shared_memory
+        for obj in (*self.functions, *self.kernels):
+            adj = obj.adj
+            if not adj.requires_serial_cpu_launch:
+                adj.requires_serial_cpu_launch = any(
+                    callee.adj.requires_serial_cpu_launch for callee in adj.called_user_functions
+                )
+            if not adj.has_dynamic_loops:
+                adj.has_dynamic_loops = any(callee.adj.has_dynamic_loops for callee in adj.called_user_functions)
+
     def build_meta(self):
         meta = {}
 
@@ -3044,6 +3463,9 @@ class ModuleBuilder:
             name = kernel.get_mangled_name()
             options = self.options | kernel.options
 
+            # whether codegen emitted the task-range entry point used by multi-threaded CPU launches
+            meta[name + "_cpu_forward_range"] = not kernel.adj.requires_serial_cpu_launch
+
             meta[name + "_cuda_kernel_forward_smem_bytes"] = kernel.adj.get_total_required_shared()
             if options["enable_backward"]:
                 backward_smem_bytes = kernel.adj.get_total_required_shared_backward()
@@ -3368,8 +3790,90 @@ class ModuleExec:
             else:
                 backward = None
 
-            hooks = KernelHooks(forward, backward, det_launch_meta=self.det_launch_meta_map.get(name))
+            # modules cached before the range entry point existed have no metadata for it
+            forward_range = None
+            if self.meta.get(name + "_cpu_forward_range", False):
+                forward_range = (
+                    runtime.llvm.wp_lookup(self.handle.encode("utf-8"), (name + "_cpu_forward_range").encode("utf-8"))
+                    or None
+                )
+
+            hooks = KernelHooks(
+                forward,
+                backward,
+                det_launch_meta=self.det_launch_meta_map.get(name),
+                forward_range=forward_range,
+            )
+
+            # CPU activity timing identifies kernels by entry point
+            if forward:
+                runtime.cpu_kernel_names[ctypes.cast(forward, ctypes.c_void_p).value] = f"forward kernel {name}"
+            if backward:
+                runtime.cpu_kernel_names[ctypes.cast(backward, ctypes.c_void_p).value] = f"backward kernel {name}"
+
+        self.kernel_hooks[name] = hooks
+        return hooks
+
+
+class KernelUnitsExec(ModuleExec):
+    """Executable module variant whose kernels are compiled and loaded one by one.
+
+    Used when the ``"kernel_granular_cache"`` module option is enabled. Each unique
+    kernel is built into its own cache entry and loaded as a separate
+    :class:`ModuleExec` the first time its hooks are requested, so adding a kernel
+    or an overload to a module only compiles that kernel. Units that are still part
+    of the module are carried over from the executable this one replaces.
+    """
+
+    def __init__(
+        self,
+        module: Module,
+        module_hash: bytes,
+        device: Device,
+        block_dim: int,
+        compile_arch: int | None = None,
+        previous: ModuleExec | None = None,
+    ):
+        super().__init__(None, module_hash, device, {}, block_dim, compile_arch)
+        self.module = module
+        self.units = {}  # (unit identifier: ModuleExec)
+        self._units_lock = threading.Lock()
+
+        if isinstance(previous, KernelUnitsExec):
+            current_units = {
+                module._get_cache_identifier(block_dim, kernel)
+                for kernel in module.hashers[block_dim].get_unique_kernels()
+            }
+            self.units = {name: unit for name, unit in previous.units.items() if name in current_units}
+
+    def _get_unit(self, kernel) -> ModuleExec:
+        with self._units_lock:
+            unit_name = self.module._get_cache_identifier(self.block_dim, kernel)
+            unit = self.units.get(unit_name)
+            if unit is None:
+                unit = self.module._load_kernel_unit(kernel, self.device, self.block_dim)
+                self.units[unit_name] = unit
+            return unit
+
+    def load_all(self) -> None:
+        """Compile and load the units of every kernel in the module."""
+        for kernel in list(self.module.hashers[self.block_dim].get_unique_kernels()):
+            self._get_unit(kernel)
+
+    def _get_forward_cuda_kernel(self, kernel):
+        return self._get_unit(kernel)._get_forward_cuda_kernel(kernel)
+
+    def get_kernel_hooks(self, kernel) -> KernelHooks:
+        name = kernel._mangled_name
+        if name is None:
+            name = kernel.get_mangled_name()
+
+        hooks = self.kernel_hooks.get(name)
+        if hooks is not None:
+            return hooks
 
+        # the unit owns the loaded code, keeping it in self.units keeps the hooks valid
+        hooks = self._get_unit(kernel).get_kernel_hooks(kernel)
         self.kernel_hooks[name] = hooks
         return hooks
 
@@ -3442,6 +3946,9 @@ class Module:
         # (device context, block_dim) variants whose build failed, mapped to the error that failed it
         self.failed_builds = {}
 
+        # same for kernels compiled on their own, keyed by (device context, block_dim, unit identifier)
+        self.failed_kernel_units = {}
+
         # hash data, including the module hash. Module may store multiple hashes (one per block_dim used)
         self.hashers = {}
         self.resolved_options = {}
@@ -3480,6 +3987,8 @@ class Module:
             "deterministic": warp.config.deterministic,
             "deterministic_max_records": warp.config.deterministic_max_records,
             "default_grid_stride": None,  # None means inherit warp.config.default_grid_stride
+            "cpu_simd_width": 0,  # 0 or 1 disables lane-batched CPU entry points
+            "kernel_granular_cache": None,  # None means inherit warp.config.kernel_granular_cache
         }
 
         # Module dependencies are determined by scanning each function
@@ -3552,6 +4061,8 @@ class Module:
 
         if options["default_grid_stride"] is None:
             options["default_grid_stride"] = config.default_grid_stride
+        if options["kernel_granular_cache"] is None:
+            options["kernel_granular_cache"] = config.kernel_granular_cache
 
         # Fold in global config flags that affect compilation
         options["verify_fp"] = config.verify_fp
@@ -3592,7 +4103,7 @@ class Module:
             self.has_unresolved_static_expressions = True
 
         if not self.defer_reference_scan:
-            self._find_references(kernel.adj)
+            kernel.adj.when_source_loaded(self._find_references)
 
         # for a reload of module on next launch
         self.mark_modified()
@@ -3655,7 +4166,7 @@ class Module:
         if func.adj.has_unresolved_static_expressions:
             self.has_unresolved_static_expressions = True
 
-        self._find_references(func.adj)
+        func.adj.when_source_loaded(self._find_references)
 
         # for a reload of module on next launch
         self.mark_modified()
@@ -3765,6 +4276,11 @@ class Module:
         if block_dim is None:
             block_dim = self.options["block_dim"]
 
+        # A hash restored from the module hash manifest stands for the resolved wp.static()
+        # expressions too, they are resolved once the module is generated.
+        if isinstance(self.hashers.get(block_dim), RecordedModuleHasher):
+            return self.hashers[block_dim].get_hash()
+
         # Both branches below mutate shared ``@wp.func`` adjoint state
         # (``ModuleBuilder`` runs ``adj.build`` to resolve deferred
         # ``wp.static`` expressions; ``ModuleHasher`` reads the
@@ -3789,6 +4305,91 @@ class Module:
 
         return self.hashers[block_dim].get_hash()
 
+    @synchronized(_codegen_lock)
+    def _load_recorded_hash(self, device: Device, block_dim: int) -> None:
+        """Restore the hash of a module variant from the module hash manifest, see :attr:`warp.config.module_hash_manifest`.
+
+        The recorded hash is only used if the kernel cache holds the binary it identifies. Otherwise,
+        the module is hashed and the hash is recorded in the manifest. A hash restored when loading the
+        module on another device is checked against the cache of ``device`` too, so that the cache paths
+        of a binary that needs to be built are resolved from the hash of the module.
+        """
+        hasher = self.hashers.get(block_dim)
+        if isinstance(hasher, RecordedModuleHasher):
+            if (device.context, block_dim) not in self.execs and not self._has_cached_binary(device, block_dim):
+                self._discard_recorded_hash(block_dim)
+            return
+
+        if hasher is not None or self.options["strip_hash"]:
+            return
+
+        options = self.resolve_options(warp.config, block_dim=block_dim)
+        if options["kernel_granular_cache"] or options.get("verify_autograd_array_access", False):
+            return
+
+        fingerprint = ModuleFingerprint(self, options)
+        if fingerprint.digest is None:
+            return
+
+        record = warp._src.build.read_module_hash_manifest(self.name).get(fingerprint.digest)
+        if record is not None:
+            try:
+                hasher = RecordedModuleHasher(fingerprint, record, options)
+            except (KeyError, TypeError, ValueError) as e:
+                log_debug(f"[Module.load] Ignoring invalid module hash manifest entry of {self.name}: {e}")
+            else:
+                self.hashers[block_dim] = hasher
+                self.resolved_options[block_dim] = options
+
+                if self._has_cached_binary(device, block_dim):
+                    # the dependencies are otherwise only found when the kernels are parsed
+                    for ref in fingerprint.modules:
+                        self.references.add(ref)
+                        ref.dependents.add(self)
+                    return
+
+                del self.hashers[block_dim]
+
+        self.get_module_hash(block_dim)
+        warp._src.build.write_module_hash_manifest_entry(
+            self.name, fingerprint.digest, RecordedModuleHasher.make_record(fingerprint, self.hashers[block_dim])
+        )
+
+    def _has_cached_binary(self, device: Device, block_dim: int) -> bool:
+        """Whether the kernel cache holds the binary and metadata of a module variant for ``device``."""
+        module_dir, output_name, _ = self._get_cache_target(device, block_dim)
+        return os.path.exists(os.path.join(module_dir, output_name)) and os.path.exists(
+            os.path.join(module_dir, self._get_meta_name(block_dim))
+        )
+
+    def _discard_recorded_hash(self, block_dim: int) -> None:
+        """Replace a hash restored from the module hash manifest by the hash of the module.
+
+        Called before the cache paths of a module variant that needs to be built are resolved,
+        since generating its code requires the kernels to be hashed. If the recorded hash was
+        stale, the manifest entry is updated.
+        """
+        with _codegen_lock:
+            hasher = self.hashers.get(block_dim)
+            if not isinstance(hasher, RecordedModuleHasher):
+                return
+
+            del self.hashers[block_dim]
+            module_hash = self.get_module_hash(block_dim)
+            if module_hash == hasher.get_hash():
+                return
+
+            warp._src.build.write_module_hash_manifest_entry(
+                self.name,
+                hasher.fingerprint.digest,
+                RecordedModuleHasher.make_record(hasher.fingerprint, self.hashers[block_dim]),
+            )
+
+        log_warning(
+            f"Module '{self.name}' does not match the hash recorded for it in the module hash manifest, it depends on "
+            f"state that its fingerprint does not cover. The manifest entry has been updated."
+        )
+
     def _cache_kernel_scalar_tid_extent_limit(self, kernel: Kernel, block_dim: int) -> None:
         """Cache exact scalar ``wp.tid()`` metadata from the kernel's latest build."""
         limit = warp._src.codegen._SCALAR_TID_MAX_EXTENT if kernel.adj.uses_scalar_tid else None
@@ -3816,24 +4417,27 @@ class Module:
         return self._scalar_tid_extent_limits[cache_key]
 
     def _snapshot_deterministic_metadata(
-        self, block_dim: int, options: dict, rebuild: bool
+        self, block_dim: int, options: dict, rebuild: bool, kernels: list[Kernel] | None = None
     ) -> dict[str, DeterministicMeta]:
         """Capture per-kernel launch metadata for the module variant being loaded, keyed by mangled name.
 
         ``rebuild`` is False after a fresh compile, which already built the
         adjoints with these options; ``output_arch=None`` avoids firing tile LTO.
+        ``kernels`` restricts the snapshot to a subset of the unique kernels.
         """
         if options.get("deterministic") == warp.config.DeterministicMode.NOT_GUARANTEED:
             return {}
 
-        hasher = self.hashers.get(block_dim)
-        if hasher is None:
-            return {}
+        if kernels is None:
+            hasher = self.hashers.get(block_dim)
+            if hasher is None:
+                return {}
+            kernels = hasher.get_unique_kernels()
 
         builder_options = options | {"output_arch": None}
         snapshot = {}
         with _codegen_lock:
-            for kernel in hasher.get_unique_kernels():
+            for kernel in kernels:
                 if rebuild:
                     kernel.adj.build(None, builder_options)
                 snapshot[kernel.get_mangled_name()] = kernel.adj.det_meta
@@ -3842,6 +4446,18 @@ class Module:
     def _use_ptx(self, device) -> bool:
         return device.get_cuda_output_format(self.options.get("cuda_output")) == "ptx"
 
+    def _get_cache_target(
+        self, device: Device, block_dim: int, kernel: Kernel | None = None
+    ) -> tuple[str, str, int | None]:
+        """Return the kernel cache directory, output file name, and compile arch of a module variant.
+
+        If ``kernel`` is given, return those of the separately compiled unit holding only that kernel.
+        """
+        module_dir = os.path.join(warp.config.kernel_cache_dir, self._get_cache_identifier(block_dim, kernel))
+        output_name = self._get_compile_output_name(device, block_dim=block_dim, kernel=kernel)
+        output_arch = self._get_compile_arch(device)
+        return module_dir, output_name, output_arch
+
     def get_module_identifier(self, block_dim: int | None = None) -> str:
         """Get an abbreviated module name to use for directories and files in the cache.
 
@@ -3856,6 +4472,19 @@ class Module:
 
         return module_name_short
 
+    def _get_cache_identifier(self, block_dim: int | None = None, kernel: Kernel | None = None) -> str:
+        """Get the cache name of a module variant, or of the unit holding only ``kernel`` in that variant."""
+        if kernel is None:
+            return self.get_module_identifier(block_dim)
+
+        if block_dim is None:
+            block_dim = self.options["block_dim"]
+
+        # make sure the kernel hash and the variant options are up to date
+        self.get_module_hash(block_dim)
+        unit_hash = self.hashers[block_dim].get_kernel_unit_hash(kernel)
+        return f"wp_{self.name}_{unit_hash.hex()[:7]}"
+
     def _get_compile_arch(self, device: Device | None = None) -> int | None:
         if device is None:
             device = runtime.get_device()
@@ -3869,6 +4498,7 @@ class Module:
         arch_suffix: str = "",
         use_ptx: bool | None = None,
         block_dim: int | None = None,
+        kernel: Kernel | None = None,
     ) -> str:
         """Get the filename to use for the compiled module binary.
 
@@ -3881,8 +4511,10 @@ class Module:
         the host CPU's ISA features (e.g. ``wp___main___0340cd1.cpu1a2b3c4d.o``).
         This distinguishes incompatible CPU objects without affecting the shared
         module directory and its CUDA caches.
+
+        If ``kernel`` is given, the name is that of the unit compiled for this kernel alone.
         """
-        module_name_short = self.get_module_identifier(block_dim=block_dim)
+        module_name_short = self._get_cache_identifier(block_dim, kernel)
 
         if device and device.is_cpu:
             resolved_flags = _resolve_cpu_compiler_flags(
@@ -3926,12 +4558,12 @@ class Module:
 
         return output_name
 
-    def _get_meta_name(self, block_dim: int | None = None) -> str:
+    def _get_meta_name(self, block_dim: int | None = None, kernel: Kernel | None = None) -> str:
         """Get the filename to use for the module metadata file.
 
         This is only the filename. It should be used to form a path.
         """
-        return f"{self.get_module_identifier(block_dim=block_dim)}.meta"
+        return f"{self._get_cache_identifier(block_dim, kernel)}.meta"
 
     @staticmethod
     def _write_meta(output_meta_path: str | os.PathLike, meta: dict) -> None:
@@ -3939,15 +4571,29 @@ class Module:
         with open(output_meta_path, "w") as meta_file:
             json.dump(meta, meta_file, sort_keys=True)
 
-    def _record_build_failure(self, device, is_cpu: bool, active_block_dim: int, error: Exception) -> None:
-        """Record the error that failed this module's build for a device variant."""
+    def _record_build_failure(
+        self, device, is_cpu: bool, active_block_dim: int, error: Exception, kernel: Kernel | None = None
+    ) -> None:
+        """Record the error that failed this module's build for a device variant.
+
+        A kernel compiled on its own only fails its own unit, the other kernels of the module can still build.
+        """
         if is_cpu:
-            self.failed_builds[(None, active_block_dim)] = error
+            key = (None, active_block_dim)
         elif device:
-            self.failed_builds[(device.context, active_block_dim)] = error
+            key = (device.context, active_block_dim)
+        else:
+            return
+
+        if kernel is None:
+            self.failed_builds[key] = error
+        else:
+            self.failed_kernel_units[(*key, self._get_cache_identifier(active_block_dim, kernel))] = error
 
     @synchronized(_codegen_lock)
-    def _run_codegen(self, options: dict, is_cpu: bool) -> tuple[str, str, dict, list, list]:
+    def _run_codegen(
+        self, options: dict, is_cpu: bool, kernel: Kernel | None = None
+    ) -> tuple[str, str, dict, list, list]:
         """Run the Python-side codegen window.
 
         Returns ``(source, ext, meta, ltoirs, fatbins)``: the emitted C++/CUDA
@@ -3959,11 +4605,14 @@ class Module:
         shared ``@wp.func``'s Adjoint state. The expensive NVRTC / NVCC /
         Clang invocation runs after this returns, so N modules still compile
         in parallel -- only the cheap codegen window serialises.
+
+        If ``kernel`` is given, only that kernel and its dependencies are generated.
         """
         builder = ModuleBuilder(
             self,
             options,
             hasher=self.hashers.get(options["block_dim"], None),
+            kernels=None if kernel is None else [kernel],
         )
         if is_cpu:
             ext = "cpp"
@@ -3983,6 +4632,7 @@ class Module:
         output_arch: int | None = None,
         use_ptx: bool | None = None,
         options: dict | None = None,
+        kernel: Kernel | None = None,
     ) -> bool:
         """Compile this module for a specific device.
 
@@ -3998,6 +4648,8 @@ class Module:
                 auto-determined from the device and architecture.
             options: Resolved module options dict. If ``None``, resolved from
                 current config.
+            kernel: If given, compile only this kernel into its own cache entry,
+                see :attr:`warp.config.kernel_granular_cache`.
 
         Returns:
             ``True`` if compilation was performed, ``False`` if a cached
@@ -4056,13 +4708,18 @@ class Module:
         else:
             arch_suffix = ""
 
+        # generating code needs the kernels to be hashed, and output names derive from the hash
+        if kernel is None and output_name is None:
+            self._discard_recorded_hash(active_block_dim)
+
         if output_name is None:
             output_name = self._get_compile_output_name(
-                device, output_arch, arch_suffix, use_ptx, block_dim=active_block_dim
+                device, output_arch, arch_suffix, use_ptx, block_dim=active_block_dim, kernel=kernel
             )
 
         # Resolve output directory early so we can check for cached binaries
-        module_name_short = self.get_module_identifier(block_dim=active_block_dim)
+        module_name_short = self._get_cache_identifier(active_block_dim, kernel)
+        meta_name = self._get_meta_name(block_dim=active_block_dim, kernel=kernel)
 
         if output_dir is None:
             output_dir = os.path.join(warp.config.kernel_cache_dir, f"{module_name_short}")
@@ -4075,10 +4732,14 @@ class Module:
             warp.config.cache_kernels
             and not options.get("verify_autograd_array_access", False)
             and os.path.exists(os.path.join(output_dir, output_name))
-            and os.path.exists(os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim)))
+            and os.path.exists(os.path.join(output_dir, meta_name))
         ):
             return False
 
+        # callers providing the output name resolve the recorded hash beforehand, see _load_recorded_hash()
+        if kernel is None:
+            self._discard_recorded_hash(active_block_dim)
+
         # Python codegen window -- runs serialised under ``_codegen_lock``
         # inside ``_run_codegen``. Snapshots all builder state needed by
         # the native compile below, so the native step (the dominant cost)
@@ -4090,12 +4751,12 @@ class Module:
         # failing kernel and continuing would leave the module claiming
         # kernels its binary does not contain.
         try:
-            source_str, source_code_ext, meta, ltoir_values, fatbin_values = self._run_codegen(options, is_cpu)
+            source_str, source_code_ext, meta, ltoir_values, fatbin_values = self._run_codegen(options, is_cpu, kernel)
         except Exception as e:
-            self._record_build_failure(device, is_cpu, active_block_dim, e)
+            self._record_build_failure(device, is_cpu, active_block_dim, e, kernel)
             raise
 
-        meta_path = os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim))
+        meta_path = os.path.join(output_dir, meta_name)
 
         build_dir = os.path.normpath(output_dir) + f"_p{os.getpid()}_t{threading.get_ident()}"
 
@@ -4121,7 +4782,7 @@ class Module:
             try:
                 _check_and_raise_long_path_error(e)
             except Exception as reported:
-                self._record_build_failure(device, is_cpu, active_block_dim, reported)
+                self._record_build_failure(device, is_cpu, active_block_dim, reported, kernel)
                 raise
 
         output_path = os.path.join(build_dir, output_name)
@@ -4181,17 +4842,17 @@ class Module:
                 try:
                     _check_and_raise_long_path_error(e)
                 except Exception as reported:
-                    self._record_build_failure(device, is_cpu, active_block_dim, reported)
+                    self._record_build_failure(device, is_cpu, active_block_dim, reported, kernel)
                     raise
 
-            self._record_build_failure(device, is_cpu, active_block_dim, e)
+            self._record_build_failure(device, is_cpu, active_block_dim, e, kernel)
 
             raise (e)
 
         # ------------------------------------------------------------
         # write meta data (already produced by ``_run_codegen`` above)
 
-        output_meta_path = os.path.join(build_dir, self._get_meta_name(block_dim=active_block_dim))
+        output_meta_path = os.path.join(build_dir, meta_name)
 
         self._write_meta(output_meta_path, meta)
 
@@ -4258,6 +4919,9 @@ class Module:
         # launch's block_dim=1 override cannot retarget later CUDA preloads.
         active_block_dim = block_dim if block_dim is not None else self.options["block_dim"]
 
+        if warp.config.module_hash_manifest and warp.config.cache_kernels and binary_path is None:
+            self._load_recorded_hash(device, active_block_dim)
+
         # check if executable module is already loaded and not stale
         exec = self.execs.get((device.context, active_block_dim))
         if exec is not None:
@@ -4279,6 +4943,14 @@ class Module:
         module_hash = self.get_module_hash(active_block_dim)
         options = self.resolved_options[active_block_dim]
 
+        if binary_path is None and options["kernel_granular_cache"] and not self.options["strip_hash"]:
+            # kernels are compiled and loaded on their first launch, see KernelUnitsExec
+            module_exec = KernelUnitsExec(
+                self, module_hash, device, active_block_dim, self._get_compile_arch(device), previous=exec
+            )
+            self.execs[(device.context, active_block_dim)] = module_exec
+            return module_exec
+
         # use a unique module path using the module short hash
         module_name_short = self.get_module_identifier(active_block_dim)
 
@@ -4318,10 +4990,7 @@ class Module:
                 else:
                     module_load_timer.extra_msg = " (cached)"
             else:
-                output_name = self._get_compile_output_name(device, block_dim=active_block_dim)
-                output_arch = self._get_compile_arch(device)
-
-                module_dir = os.path.join(warp.config.kernel_cache_dir, module_name_short)
+                module_dir, output_name, output_arch = self._get_cache_target(device, active_block_dim)
                 meta_path = os.path.join(module_dir, self._get_meta_name(block_dim=active_block_dim))
                 binary_path = os.path.join(module_dir, output_name)
 
@@ -4332,6 +5001,7 @@ class Module:
                     raise e
 
                 module_load_timer.extra_msg = " (compiled)" if compiled else " (cached)"
+                warp._src.build.record_kernel_cache_use(module_name_short, compiled)
 
             det_launch_meta_map = self._snapshot_deterministic_metadata(active_block_dim, options, rebuild=not compiled)
 
@@ -4375,6 +5045,65 @@ class Module:
 
         return module_exec
 
+    def _load_kernel_unit(self, kernel: Kernel, device: Device, block_dim: int) -> ModuleExec:
+        """Compile, if needed, and load the unit holding only ``kernel`` for a module variant."""
+        unit_name = self._get_cache_identifier(block_dim, kernel)
+
+        build_error = self.failed_kernel_units.get((device.context, block_dim, unit_name))
+        if build_error is not None:
+            _raise_recorded_build_error(build_error)
+
+        options = self.resolved_options[block_dim]
+        unit_hash = self.hashers[block_dim].get_kernel_unit_hash(kernel)
+        unit_diagnostics = f"device='{device}', block_dim={block_dim}, unit_hash={unit_hash.hex()[:7]}"
+
+        with warp.ScopedTimer(
+            f"Module {self.name} kernel {kernel.key} {unit_hash.hex()[:7]} load on device '{device}'",
+            active=not warp.config.quiet and warp.config.log_level <= warp.LOG_INFO,
+        ) as unit_load_timer:
+            module_dir, output_name, output_arch = self._get_cache_target(device, block_dim, kernel)
+            meta_path = os.path.join(module_dir, self._get_meta_name(block_dim=block_dim, kernel=kernel))
+            binary_path = os.path.join(module_dir, output_name)
+
+            try:
+                compiled = self._compile(device, module_dir, output_name, output_arch, options=options, kernel=kernel)
+            except Exception:
+                unit_load_timer.extra_msg = " (error)"
+                raise
+
+            unit_load_timer.extra_msg = " (compiled)" if compiled else " (cached)"
+            warp._src.build.record_kernel_cache_use(unit_name, compiled)
+
+            det_launch_meta_map = self._snapshot_deterministic_metadata(
+                block_dim, options, rebuild=not compiled, kernels=[kernel]
+            )
+
+            if os.path.exists(meta_path):
+                with open(meta_path) as meta_file:
+                    meta = json.load(meta_file)
+            else:
+                raise FileNotFoundError(f"Kernel metadata file {meta_path} was not found in the cache")
+
+            if device.is_cpu:
+                id = self.increment_id()
+                unit_handle = f"wp_{self.name}_{id}"
+                if (
+                    runtime.llvm.wp_load_obj(
+                        binary_path.encode("utf-8"),
+                        unit_handle.encode("utf-8"),
+                        warp.config.legacy_cpu_linker,
+                    )
+                    != 0
+                ):
+                    raise Exception(f"Failed to load CPU kernel '{kernel.key}' ({unit_diagnostics})")
+            else:
+                unit_handle = warp._src.build.load_cuda(binary_path, device)
+                if unit_handle is None:
+                    unit_load_timer.extra_msg = " (error)"
+                    raise Exception(f"Failed to load CUDA kernel '{kernel.key}' ({unit_diagnostics})")
+
+        return ModuleExec(unit_handle, unit_hash, device, meta, block_dim, output_arch, det_launch_meta_map)
+
     def unload(self):
         # force rehashing on next load
         self.mark_modified()
@@ -4402,6 +5131,7 @@ class Module:
 
         # clear build failures
         self.failed_builds = {}
+        self.failed_kernel_units = {}
 
     # lookup kernel entry points based on name, called after compilation / module load
     def get_kernel_hooks(self, kernel, device: Device) -> KernelHooks:
@@ -6006,6 +6736,22 @@ class Runtime:
                 ctypes.c_void_p,
             ]
             self.core.wp_memset_device.restype = ctypes.c_bool
+            self.core.wp_memset_batch_host.argtypes = [
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_size_t),
+                ctypes.c_size_t,
+                ctypes.c_int,
+            ]
+            self.core.wp_memset_batch_host.restype = ctypes.c_bool
+            self.core.wp_memset_batch_device.argtypes = [
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_size_t),
+                ctypes.c_size_t,
+                ctypes.c_int,
+                ctypes.c_void_p,
+            ]
+            self.core.wp_memset_batch_device.restype = ctypes.c_bool
 
             self.core.wp_memtile_host.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t]
             self.core.wp_memtile_host.restype = None
@@ -6109,8 +6855,33 @@ class Runtime:
                 ctypes.c_void_p,  # args
                 ctypes.c_void_p,  # adj_args
                 ctypes.POINTER(APICLaunchInfo),  # apic_info
+                ctypes.c_void_p,  # range_func
+                ctypes.c_int,  # kernel_dim
+                ctypes.c_int,  # num_threads
             ]
             self.core.wp_cpu_launch_kernel.restype = None
+            self.core.wp_cpu_launch_packed.argtypes = [
+                ctypes.c_void_p,  # func
+                ctypes.c_void_p,  # range_func
+                ctypes.c_void_p,  # bounds
+                ctypes.c_void_p,  # args
+                ctypes.c_void_p,  # patch_srcs
+                ctypes.c_void_p,  # patch_offsets
+                ctypes.c_void_p,  # patch_sizes
+                ctypes.c_int,  # num_patches
+                ctypes.c_int,  # kernel_dim
+                ctypes.c_int,  # num_threads
+            ]
+            self.core.wp_cpu_launch_packed.restype = None
+            self.core.wp_cpu_launch_batch.argtypes = [ctypes.POINTER(_CpuLaunchRecord), ctypes.c_int]
+            self.core.wp_cpu_launch_batch.restype = None
+            self.core.wp_cuda_launch_batch.argtypes = [
+                ctypes.c_void_p,  # context
+                ctypes.POINTER(_CudaLaunchRecord),  # launches
+                ctypes.c_int,  # count
+                ctypes.c_void_p,  # stream
+            ]
+            self.core.wp_cuda_launch_batch.restype = ctypes.c_int
             self.core.wp_apic_register_cpu_kernel.argtypes = [
                 ctypes.c_void_p,
                 ctypes.c_char_p,  # kernel_key
@@ -6383,6 +7154,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_int_host.restype = None
             self.core.wp_radix_sort_pairs_int_device.argtypes = [
@@ -6402,6 +7174,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_uint_host.restype = None
             self.core.wp_radix_sort_pairs_uint_device.argtypes = [
@@ -6421,6 +7194,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_float_host.restype = None
             self.core.wp_radix_sort_pairs_float_device.argtypes = [
@@ -6440,6 +7214,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_double_host.restype = None
             self.core.wp_radix_sort_pairs_double_device.argtypes = [
@@ -6459,6 +7234,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_int64_host.restype = None
             self.core.wp_radix_sort_pairs_int64_device.argtypes = [
@@ -6478,6 +7254,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_int,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_radix_sort_pairs_uint64_host.restype = None
             self.core.wp_radix_sort_pairs_uint64_device.argtypes = [
@@ -6497,6 +7274,7 @@ class Runtime:
                 ctypes.c_uint64,
                 ctypes.c_uint64,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_segmented_sort_pairs_int_host.restype = None
             self.core.wp_segmented_sort_pairs_int_device.argtypes = [
@@ -6516,6 +7294,7 @@ class Runtime:
                 ctypes.c_uint64,
                 ctypes.c_uint64,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
             self.core.wp_segmented_sort_pairs_float_host.restype = None
             self.core.wp_segmented_sort_pairs_float_device.argtypes = [
@@ -6601,6 +7380,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_void_p,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
 
             self.core.wp_bvh_create_device.restype = ctypes.c_uint64
@@ -6618,7 +7398,7 @@ class Runtime:
             self.core.wp_bvh_destroy_device.argtypes = [ctypes.c_uint64]
 
             self.core.wp_bvh_refit_host.argtypes = [ctypes.c_uint64]
-            self.core.wp_bvh_rebuild_host.argtypes = [ctypes.c_uint64, ctypes.c_int]
+            self.core.wp_bvh_rebuild_host.argtypes = [ctypes.c_uint64, ctypes.c_int, ctypes.c_int]
             self.core.wp_bvh_refit_device.argtypes = [ctypes.c_uint64]
             self.core.wp_bvh_rebuild_device.argtypes = [ctypes.c_uint64]
 
@@ -6633,6 +7413,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_void_p,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
 
             self.core.wp_mesh_create_device.restype = ctypes.c_uint64
@@ -6675,6 +7456,8 @@ class Runtime:
                 ctypes.c_double,
                 ctypes.c_void_p,
                 ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_bool,
             ]
             self.core.wp_hash_grid_reserve_host.argtypes = [
                 ctypes.c_uint64,
@@ -7058,7 +7841,10 @@ class Runtime:
                 ctypes.c_void_p,  # bsr_nnz_event
             ]
 
-            self.core.wp_bsr_matrix_from_triplets_host.argtypes = bsr_matrix_from_triplets_argtypes
+            self.core.wp_bsr_matrix_from_triplets_host.argtypes = [
+                *bsr_matrix_from_triplets_argtypes,
+                ctypes.c_int,  # num_threads
+            ]
             self.core.wp_bsr_matrix_from_triplets_device.argtypes = bsr_matrix_from_triplets_argtypes
 
             bsr_transpose_argtypes = [
@@ -7094,9 +7880,70 @@ class Runtime:
                 ctypes.POINTER(ctypes.c_int),  # bsr_nnz
                 ctypes.c_void_p,  # bsr_nnz_event
             ]
-            self.core.wp_bsr_compress_inplace_host.argtypes = bsr_compress_inplace_argtypes
+            self.core.wp_bsr_compress_inplace_host.argtypes = [
+                *bsr_compress_inplace_argtypes,
+                ctypes.c_int,  # num_threads
+            ]
             self.core.wp_bsr_compress_inplace_device.argtypes = bsr_compress_inplace_argtypes
 
+            self.core.wp_bsr_mv_host.argtypes = [
+                ctypes.c_int,  # scalar type code
+                ctypes.c_int,  # row_count
+                ctypes.c_int,  # block_rows
+                ctypes.c_int,  # block_cols
+                ctypes.POINTER(ctypes.c_int),  # bsr_offsets
+                ctypes.POINTER(ctypes.c_int),  # bsr_row_counts
+                ctypes.POINTER(ctypes.c_int),  # bsr_columns
+                ctypes.c_void_p,  # bsr_values
+                ctypes.c_double,  # alpha
+                ctypes.c_void_p,  # x
+                ctypes.c_double,  # beta
+                ctypes.c_void_p,  # y
+                ctypes.c_int,  # num_threads
+            ]
+            self.core.wp_bsr_mv_host.restype = None
+
+            self.core.wp_bsr_mm_dense_host.argtypes = [
+                ctypes.c_int,  # scalar type code
+                ctypes.c_int,  # row_count
+                ctypes.c_int,  # block_rows
+                ctypes.c_int,  # block_cols
+                ctypes.POINTER(ctypes.c_int),  # bsr_offsets
+                ctypes.POINTER(ctypes.c_int),  # bsr_row_counts
+                ctypes.POINTER(ctypes.c_int),  # bsr_columns
+                ctypes.c_void_p,  # bsr_values
+                ctypes.c_double,  # alpha
+                ctypes.c_void_p,  # x
+                ctypes.c_double,  # beta
+                ctypes.c_void_p,  # y
+                ctypes.c_int,  # rhs_count
+                ctypes.c_int,  # num_threads
+            ]
+            self.core.wp_bsr_mm_dense_host.restype = None
+
+            self.core.wp_bsr_mm_values_host.argtypes = [
+                ctypes.c_int,  # scalar type code
+                ctypes.c_int,  # block_rows
+                ctypes.c_int,  # block_depth
+                ctypes.c_int,  # block_cols
+                ctypes.c_double,  # alpha
+                ctypes.POINTER(ctypes.c_int),  # x_offsets
+                ctypes.POINTER(ctypes.c_int),  # x_row_counts
+                ctypes.POINTER(ctypes.c_int),  # x_columns
+                ctypes.c_void_p,  # x_values
+                ctypes.POINTER(ctypes.c_int),  # y_offsets
+                ctypes.POINTER(ctypes.c_int),  # y_row_counts
+                ctypes.POINTER(ctypes.c_int),  # y_columns
+                ctypes.c_void_p,  # y_values
+                ctypes.c_int,  # z_row_count
+                ctypes.POINTER(ctypes.c_int),  # z_offsets
+                ctypes.POINTER(ctypes.c_int),  # z_row_counts
+                ctypes.POINTER(ctypes.c_int),  # z_columns
+                ctypes.c_void_p,  # z_values
+                ctypes.c_int,  # num_threads
+            ]
+            self.core.wp_bsr_mm_values_host.restype = None
+
             self.core.wp_is_cuda_enabled.argtypes = None
             self.core.wp_is_cuda_enabled.restype = ctypes.c_int
             self.core.wp_is_cuda_compatibility_enabled.argtypes = None
@@ -7611,6 +8458,15 @@ class Runtime:
             self.core.wp_cuda_timing_end.argtypes = [ctypes.POINTER(timing_result_t), ctypes.c_int]
             self.core.wp_cuda_timing_end.restype = None
 
+            self.core.wp_cpu_timing_begin.argtypes = [ctypes.c_int]
+            self.core.wp_cpu_timing_begin.restype = None
+            self.core.wp_cpu_timing_get_result_count.argtypes = []
+            self.core.wp_cpu_timing_get_result_count.restype = int
+            self.core.wp_cpu_timing_end.argtypes = [ctypes.POINTER(cpu_timing_result_t), ctypes.c_int]
+            self.core.wp_cpu_timing_end.restype = None
+            self.core.wp_cpu_timing_mark_dispatch.argtypes = []
+            self.core.wp_cpu_timing_mark_dispatch.restype = None
+
             self.core.wp_graph_coloring.argtypes = [
                 ctypes.c_int,
                 warp._src.types.array_t,
@@ -7773,6 +8629,12 @@ class Runtime:
         # global tape
         self.tape = None
 
+        # number of active CPU activity timing sessions, see warp.timing_begin()
+        self.cpu_timing_depth = 0
+
+        # activity names of CPU kernel entry points, keyed by address
+        self.cpu_kernel_names: dict[int, str] = {}
+
         # print device and version information
         if not warp.config.quiet and warp.config.log_level <= warp.LOG_INFO:
             greeting = []
@@ -10142,8 +11004,71 @@ def _build_cpu_args_structs(kernel, hooks, params, adjoint):
     return args, adj_args
 
 
+def _resolve_cpu_threads(cpu_threads: int | None) -> int:
+    """Resolve a per-launch CPU thread count, falling back to :attr:`warp.config.cpu_max_threads`.
+
+    Returns ``0`` to request every hardware thread, matching the native convention.
+    """
+    if cpu_threads is None:
+        cpu_threads = warp.config.cpu_max_threads
+
+    if cpu_threads is None:
+        return 0
+
+    if cpu_threads < 0:
+        raise ValueError(f"The number of CPU threads must be non-negative, got {cpu_threads}")
+
+    return int(cpu_threads)
+
+
+def _invoke_forward(kernel, hooks, params: Sequence[Any], args, cpu_threads: int):
+    if cpu_threads != 1 and hooks.forward_range is not None:
+        # split the launch across the native host thread pool
+        runtime.core.wp_cpu_launch_kernel(
+            ctypes.cast(hooks.forward, ctypes.c_void_p),
+            ctypes.byref(params[0]),
+            ctypes.byref(args),
+            None,
+            None,
+            hooks.forward_range,
+            kernel.adj.kernel_dim,
+            cpu_threads,
+        )
+    elif runtime.cpu_timing_depth:
+        # go through the native launcher so that the launch is timed
+        runtime.core.wp_cpu_launch_kernel(
+            ctypes.cast(hooks.forward, ctypes.c_void_p),
+            ctypes.byref(params[0]),
+            ctypes.byref(args),
+            None,
+            None,
+            None,
+            kernel.adj.kernel_dim,
+            1,
+        )
+    else:
+        hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+
+
+def _invoke_backward(kernel, hooks, params: Sequence[Any], args, adj_args):
+    if runtime.cpu_timing_depth:
+        # go through the native launcher so that the launch is timed
+        runtime.core.wp_cpu_launch_kernel(
+            ctypes.cast(hooks.backward, ctypes.c_void_p),
+            ctypes.byref(params[0]),
+            ctypes.byref(args),
+            ctypes.byref(adj_args),
+            None,
+            None,
+            kernel.adj.kernel_dim,
+            1,
+        )
+    else:
+        hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+
+
 # invoke a CPU kernel by passing the parameters as a ctypes structure
-def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
+def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool, cpu_threads: int = 1):
     # Build cache key from parameter types
     param_types = tuple(type(p) for p in params[1:])  # skip launch bounds
     cache_key = (param_types, adjoint)
@@ -10161,12 +11086,12 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
             setattr(args, field[0], params[1 + i])
 
         if not adjoint:
-            hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+            _invoke_forward(kernel, hooks, params, args, cpu_threads)
         else:
             adj_args = AdjArgsStruct()
             for i, field in enumerate(adj_fields):
                 setattr(adj_args, field[0], params[1 + len(fields) + i])
-            hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+            _invoke_backward(kernel, hooks, params, args, adj_args)
         return
 
     # Slow path: build struct types and cache them
@@ -10185,7 +11110,7 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
 
     if not adjoint:
         kernel._invoke_cache[cache_key] = (ArgsStruct, fields)
-        hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+        _invoke_forward(kernel, hooks, params, args, cpu_threads)
 
     # for adjoint kernels the adjoint arguments are passed through a second struct
     else:
@@ -10204,7 +11129,175 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
             setattr(adj_args, name, params[1 + len(fields) + i])
 
         kernel._invoke_cache[cache_key] = (ArgsStruct, AdjArgsStruct, fields, adj_fields)
-        hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+        _invoke_backward(kernel, hooks, params, args, adj_args)
+
+
+# Argument kinds of a packed CPU launch plan
+_CPU_ARG_SCALAR = 0  # Python scalar written into the buffer in place
+_CPU_ARG_ARRAY = 1  # Warp array whose cached descriptor is patched in
+_CPU_ARG_VALUE = 2  # ctypes value (vector, matrix, ...) patched in as-is
+_CPU_ARG_PACKED = 3  # any other value, converted by pack_arg() and patched in
+
+# Launch bounds cached per plan before the cache is reset
+_CPU_LAUNCH_PLAN_MAX_BOUNDS = 64
+
+
+class _CpuLaunchPlan:
+    """Precompiled argument marshalling for forward CPU launches of one kernel signature.
+
+    The plan owns reusable argument buffers laid out like the kernel's
+    ``ArgsStruct``. Scalars are written into a buffer by offset, and array and
+    composite arguments are passed as pointer patches that
+    ``wp_cpu_launch_packed`` copies into the buffer in native code, so a launch
+    builds no ctypes structures and makes a single native call.
+    """
+
+    def __init__(self, kernel: Kernel, hooks: KernelHooks, fwd_args: Sequence[Any], device: Device):
+        packed = [
+            pack_arg(kernel, arg.type, arg.label, value, device)
+            for arg, value in zip(kernel.adj.args, fwd_args, strict=True)
+        ]
+        fields = [(arg.label, type(value)) for arg, value in zip(kernel.adj.args, packed, strict=True)]
+        self.ArgsStruct = type("ArgsStruct", (ctypes.Structure,), {"_fields_": fields})
+
+        ops = []
+        packed_ops = []
+        patch_offsets = []
+        patch_sizes = []
+        for i, (arg, value, field) in enumerate(zip(kernel.adj.args, fwd_args, fields, strict=True)):
+            field_type = field[1]
+            offset = getattr(self.ArgsStruct, arg.label).offset
+            arg_type = arg.type
+
+            if (
+                type(value) in (bool, int, float)
+                and arg_type in warp._src.types.scalar_and_bool_types
+                and arg_type not in (warp._src.types.float16, warp._src.types.bfloat16)
+            ):
+                ops.append((_CPU_ARG_SCALAR, i, PackedStruct(field_type._type_), offset))
+                continue
+
+            if warp._src.types.is_array(arg_type) and type(value) is warp._src.types.concrete_array_type(arg_type):
+                ops.append((_CPU_ARG_ARRAY, i, arg_type, len(patch_offsets)))
+            elif value is packed[i]:
+                ops.append((_CPU_ARG_VALUE, i, None, len(patch_offsets)))
+            else:
+                packed_ops.append((_CPU_ARG_PACKED, i, (arg, field_type), len(patch_offsets)))
+            patch_offsets.append(offset)
+            patch_sizes.append(ctypes.sizeof(field_type))
+
+        self.ops = tuple(ops + packed_ops)
+        self.num_patches = len(patch_offsets)
+        self.patch_offsets = (ctypes.c_uint32 * self.num_patches)(*patch_offsets)
+        self.patch_sizes = (ctypes.c_uint32 * self.num_patches)(*patch_sizes)
+        self.patch_offsets_ptr = ctypes.addressof(self.patch_offsets)
+        self.patch_sizes_ptr = ctypes.addressof(self.patch_sizes)
+
+        self.forward = ctypes.cast(hooks.forward, ctypes.c_void_p).value
+        self.forward_range = (
+            ctypes.cast(hooks.forward_range, ctypes.c_void_p).value if hooks.forward_range is not None else None
+        )
+        self.kernel_dim = kernel.adj.kernel_dim
+
+        # free (args buffer, patch sources) pairs; popped and pushed back around each
+        # launch so that concurrent launches from other threads never share a buffer
+        self.buffers = []
+        self.bounds = {}
+
+    def launch(self, kernel: Kernel, device: Device, dim: tuple[int, ...], fwd_args: Sequence[Any], cpu_threads: int):
+        """Launch the kernel, returning ``False`` if the arguments need the regular launch path."""
+        bounds = self.bounds.get(dim)
+        if bounds is None:
+            scalar_tid_extent_limit = _resolve_kernel_scalar_tid_extent_limit(kernel, dim, 1)
+            bounds = _build_launch_bounds_from_tuple(dim, self.kernel_dim, scalar_tid_extent_limit)
+            if len(self.bounds) >= _CPU_LAUNCH_PLAN_MAX_BOUNDS:
+                self.bounds.clear()
+            self.bounds[dim] = bounds
+
+        if self.buffers:
+            args, patch_srcs = self.buffers.pop()
+        else:
+            args = self.ArgsStruct()
+            patch_srcs = (ctypes.c_void_p * self.num_patches)()
+
+        try:
+            # descriptors built on demand (e.g. for indexed arrays) must outlive the native call
+            keep_alive = []
+            for kind, i, info, slot in self.ops:
+                value = fwd_args[i]
+                if kind == _CPU_ARG_SCALAR:
+                    info.pack_into(args, slot, value)
+                elif kind == _CPU_ARG_ARRAY:
+                    if value.ndim != info.ndim or (
+                        value.dtype is not info.dtype and not warp._src.types.types_equal(value.dtype, info.dtype)
+                    ):
+                        return False
+                    desc = value.__ctype__()
+                    keep_alive.append(desc)
+                    patch_srcs[slot] = ctypes.addressof(desc)
+                elif kind == _CPU_ARG_VALUE:
+                    patch_srcs[slot] = ctypes.addressof(value)
+                else:
+                    arg, field_type = info
+                    packed = pack_arg(kernel, arg.type, arg.label, value, device)
+                    if type(packed) is not field_type:
+                        return False
+                    keep_alive.append(packed)
+                    patch_srcs[slot] = ctypes.addressof(packed)
+
+            runtime.core.wp_cpu_launch_packed(
+                self.forward,
+                self.forward_range,
+                ctypes.addressof(bounds),
+                ctypes.addressof(args),
+                ctypes.addressof(patch_srcs),
+                self.patch_offsets_ptr,
+                self.patch_sizes_ptr,
+                self.num_patches,
+                self.kernel_dim,
+                cpu_threads,
+            )
+            return True
+
+        except (PackedStructError, OverflowError, TypeError):
+            # out-of-range or mistyped scalars, let pack_arg() convert or report them
+            return False
+
+        finally:
+            self.buffers.append((args, patch_srcs))
+
+
+def _launch_cpu_packed(
+    kernel: Kernel,
+    hooks: KernelHooks,
+    device: Device,
+    dim: tuple[int, ...],
+    fwd_args: Sequence[Any],
+    cpu_threads: int | None,
+) -> bool:
+    """Launch a forward CPU kernel through its packed argument plan.
+
+    Returns ``False`` without launching when the arguments must go through
+    ``pack_arg()`` and ``invoke()``, e.g. to report a type mismatch.
+    """
+    if hooks.forward is None or warp.config.launch_array_access_mode != warp.config.LaunchArrayAccessMode.RELAXED:
+        return False
+
+    key = tuple(map(type, fwd_args))
+    try:
+        plan = hooks.cpu_launch_plans[key]
+    except KeyError:
+        try:
+            plan = _CpuLaunchPlan(kernel, hooks, fwd_args, device)
+        except Exception:
+            # invalid arguments, the regular launch path reports the error
+            plan = None
+        hooks.cpu_launch_plans[key] = plan
+
+    if plan is None:
+        return False
+
+    return plan.launch(kernel, device, dim, fwd_args, _resolve_cpu_threads(cpu_threads))
 
 
 def _build_cuda_kernel_params(params: Sequence[Any]):
@@ -10256,6 +11349,7 @@ class Launch:
         adjoint: bool = False,
         fwd_args: list[Any] | None = None,
         adj_args: list[Any] | None = None,
+        cpu_threads: int | None = None,
     ):
         # retain the module executable so it doesn't get unloaded
         self.module_exec = kernel.module.load(device, block_dim)
@@ -10336,6 +11430,9 @@ class Launch:
         self.grid_stride: bool = kernel.grid_stride
         """Whether the kernel uses a grid-stride loop (vs the lean 3D launch). Selects the grid shape."""
 
+        self.cpu_threads: int | None = cpu_threads
+        """The number of host threads for CPU launches, ``None`` uses :attr:`warp.config.cpu_max_threads`."""
+
         # Original (unpacked) kernel arguments, retained so that replaying this
         # launch under an active APIC CPU capture can record an
         # APIC_OP_KERNEL_LAUNCH op (build_launch_info needs the warp.array
@@ -10345,6 +11442,9 @@ class Launch:
         self.fwd_args = fwd_args
         self.adj_args = adj_args
 
+        # bumped whenever the bounds or params change so that a LaunchList repacks this launch
+        self._version = 0
+
     def set_dim(self, dim: int | list[int] | tuple[int, ...]):
         """Set the launch dimensions.
 
@@ -10386,6 +11486,7 @@ class Launch:
 
         # launch bounds always at index 0
         self.params[0] = self.bounds
+        self._version += 1
 
         # for CUDA kernels we need to update the address to each arg
         if self.params_addr:
@@ -10409,6 +11510,7 @@ class Launch:
             params_index = index + 1
 
         self.params[params_index] = carg
+        self._version += 1
 
         # for CUDA kernels we need to update the address to each arg
         if self.params_addr:
@@ -10455,6 +11557,8 @@ class Launch:
         else:
             self.params[params_index].__init__(value)
 
+        self._version += 1
+
         # Keep fwd_args in sync so _apic_record_cpu() does not see a stale warp
         # array from a prior set_param_at_index() call. For non-array parameters
         # this is a no-op with respect to APIC (the relocation walker ignores
@@ -10547,6 +11651,9 @@ class Launch:
             ctypes.byref(args_struct) if args_struct is not None else None,
             ctypes.byref(adj_args_struct) if adj_args_struct is not None else None,
             ctypes.byref(apic_info),
+            None,
+            0,
+            1,
         )
 
     def launch(self, stream: Stream | None = None) -> None:
@@ -10570,7 +11677,9 @@ class Launch:
                     )
                 self._apic_record_cpu()
             else:
-                invoke(self.kernel, self.hooks, self.params, self.adjoint)
+                if runtime.cpu_timing_depth:
+                    runtime.core.wp_cpu_timing_mark_dispatch()
+                invoke(self.kernel, self.hooks, self.params, self.adjoint, _resolve_cpu_threads(self.cpu_threads))
         else:
             if stream is None:
                 stream = self.device.stream
@@ -10635,6 +11744,217 @@ class Launch:
                     _raise_cuda_launch_error(self.kernel, self.device, self.hooks, False)
 
 
+class _CpuLaunchRecord(ctypes.Structure):
+    """Mirror of the native ``CPULaunchRecord`` consumed by ``wp_cpu_launch_batch()``."""
+
+    _fields_ = (
+        ("func", ctypes.c_void_p),
+        ("range_func", ctypes.c_void_p),
+        ("bounds", ctypes.c_void_p),
+        ("args", ctypes.c_void_p),
+        ("adj_args", ctypes.c_void_p),
+        ("kernel_dim", ctypes.c_int),
+        ("num_threads", ctypes.c_int),
+    )
+
+
+class _CudaLaunchRecord(ctypes.Structure):
+    """Mirror of the native ``CUDALaunchRecord`` consumed by ``wp_cuda_launch_batch()``."""
+
+    _fields_ = (
+        ("kernel", ctypes.c_void_p),
+        ("args", ctypes.c_void_p),
+        ("dim", ctypes.c_uint64),
+        ("max_blocks", ctypes.c_int),
+        ("block_dim", ctypes.c_int),
+        ("grid_stride", ctypes.c_int),
+        ("cluster_dim", ctypes.c_int),
+        ("shared_memory_bytes", ctypes.c_int),
+    )
+
+
+class LaunchList:
+    """A sequence of recorded launches submitted to the device with a single native call.
+
+    The launches are :class:`Launch` objects recorded with ``wp.launch(..., record_cmd=True)``
+    for the same device. Their arguments are validated and packed once, when the list is first
+    submitted, and repacked only for launches whose dimensions or parameters were changed
+    since, e.g. through :meth:`Launch.set_dim` or :meth:`Launch.set_param_by_name`. Each call to
+    :meth:`launch` then executes every launch in order with one call into the native runtime,
+    which gives graph-like dispatch cost while the individual launches stay editable.
+
+    On CUDA devices the launches are issued back to back onto the stream. On the CPU they are
+    executed in order on the calling thread, each one split across host threads according to
+    its ``cpu_threads`` setting.
+
+    Like :class:`Launch` objects, the launches are not recorded onto the :class:`Tape`. While a
+    CUDA graph or APIC capture is active, the launches are submitted one at a time through
+    :meth:`Launch.launch` so that the capture records them.
+
+    Args:
+        launches: The recorded launches, in submission order.
+
+    Raises:
+        ValueError: If the launches target different devices.
+    """
+
+    def __init__(self, launches: Iterable[Launch] = ()):
+        self._launches: list[Launch] = []
+        self._device: Device | None = None
+
+        # packed native records and the Launch versions and ctypes objects they point to
+        self._records = None
+        self._packed_versions: list[int] = []
+        self._packed_args: list[Any] = []
+        self._cpu_threads_default: int | None = None
+
+        for launch in launches:
+            self.append(launch)
+
+    @property
+    def device(self) -> Device | None:
+        """The device the launches run on, ``None`` for an empty list."""
+        return self._device
+
+    def __len__(self) -> int:
+        return len(self._launches)
+
+    def __getitem__(self, index: int) -> Launch:
+        return self._launches[index]
+
+    def __iter__(self):
+        return iter(self._launches)
+
+    def append(self, launch: Launch):
+        """Append a recorded launch to the end of the list.
+
+        Raises:
+            TypeError: If ``launch`` is not a :class:`Launch` object.
+            ValueError: If ``launch`` targets a different device than the launches already in the list.
+        """
+        if not isinstance(launch, Launch):
+            raise TypeError(
+                f"LaunchList expects Launch objects recorded with wp.launch(..., record_cmd=True), got {type(launch)}"
+            )
+
+        if self._device is None:
+            self._device = launch.device
+        elif launch.device != self._device:
+            raise ValueError(
+                f"All launches in a LaunchList must target the same device, got '{launch.device}' "
+                f"after launches on '{self._device}'"
+            )
+
+        self._launches.append(launch)
+        self._records = None
+
+    def _pack(self):
+        count = len(self._launches)
+        if self._records is None:
+            record_type = _CpuLaunchRecord if self._device.is_cpu else _CudaLaunchRecord
+            self._records = (record_type * count)()
+            self._packed_versions = [-1] * count
+            self._packed_args = [None] * count
+
+        if self._device.is_cpu:
+            cpu_threads_default = _resolve_cpu_threads(None)
+            if cpu_threads_default != self._cpu_threads_default:
+                # launches without an explicit thread count follow warp.config.cpu_max_threads
+                self._cpu_threads_default = cpu_threads_default
+                self._packed_versions = [-1] * count
+
+        for i, launch in enumerate(self._launches):
+            if self._packed_versions[i] == launch._version:
+                continue
+
+            record = self._records[i]
+            hooks = launch.hooks
+            if self._device.is_cpu:
+                args, adj_args = _build_cpu_args_structs(launch.kernel, hooks, launch.params, launch.adjoint)
+                record.func = ctypes.cast(hooks.backward if launch.adjoint else hooks.forward, ctypes.c_void_p).value
+                record.range_func = (
+                    ctypes.cast(hooks.forward_range, ctypes.c_void_p).value
+                    if not launch.adjoint and hooks.forward_range is not None
+                    else None
+                )
+                record.bounds = ctypes.addressof(launch.bounds)
+                record.args = ctypes.addressof(args)
+                record.adj_args = ctypes.addressof(adj_args) if adj_args is not None else None
+                record.kernel_dim = launch.kernel.adj.kernel_dim
+                record.num_threads = _resolve_cpu_threads(launch.cpu_threads)
+                self._packed_args[i] = (launch.bounds, args, adj_args)
+            else:
+                record.kernel = hooks.backward if launch.adjoint else hooks.forward
+                record.args = ctypes.addressof(launch.params_addr)
+                record.dim = launch.bounds.size
+                record.max_blocks = launch.max_blocks
+                record.block_dim = launch.block_dim
+                record.grid_stride = int(launch.grid_stride)
+                record.cluster_dim = launch.cluster_dim
+                record.shared_memory_bytes = hooks.backward_smem_bytes if launch.adjoint else hooks.forward_smem_bytes
+                self._packed_args[i] = launch.params_addr
+
+            self._packed_versions[i] = launch._version
+
+    def launch(self, stream: Stream | None = None) -> None:
+        """Submit every launch of the list in order.
+
+        Args:
+            stream: The stream to launch on, ignored for CPU launches. If ``None``, the
+                device's current stream is used.
+        """
+        if not self._launches:
+            return
+
+        device = self._device
+        capturing = _get_apic_capture_for_device(device) is not None
+        if device.is_cuda:
+            if stream is None:
+                stream = device.stream
+            capturing = capturing or (
+                len(runtime.captures) > 0 and runtime.core.wp_cuda_stream_is_capturing(stream.cuda_stream)
+            )
+
+        if capturing:
+            # let each launch register itself with the active capture
+            for launch in self._launches:
+                launch.launch(stream)
+            return
+
+        self._pack()
+
+        if device.is_cpu:
+            if runtime.cpu_timing_depth:
+                runtime.core.wp_cpu_timing_mark_dispatch()
+            runtime.core.wp_cpu_launch_batch(self._records, len(self._launches))
+        else:
+            failed = runtime.core.wp_cuda_launch_batch(
+                device.context, self._records, len(self._launches), stream.cuda_stream
+            )
+            if failed:
+                launch = self._launches[failed - 1]
+                _raise_cuda_launch_error(launch.kernel, device, launch.hooks, launch.adjoint)
+
+
+def launch_batch(launches: LaunchList | Iterable[Launch], stream: Stream | None = None) -> None:
+    """Submit a sequence of recorded launches with a single native call.
+
+    This is a shorthand for ``wp.LaunchList(launches).launch(stream)``. Passing a
+    :class:`LaunchList` that is kept across calls avoids validating and packing the launches
+    again on every submission.
+
+    Args:
+        launches: A :class:`LaunchList` or an iterable of :class:`Launch` objects recorded with
+            ``wp.launch(..., record_cmd=True)`` for the same device.
+        stream: The stream to launch on, ignored for CPU launches. If ``None``, the device's
+            current stream is used.
+    """
+    if not isinstance(launches, LaunchList):
+        launches = LaunchList(launches)
+
+    launches.launch(stream)
+
+
 def _cuda_grid_blocks(total_dim_size: int, block_dim: int) -> int:
     """Number of thread blocks a launch of ``total_dim_size`` threads needs at ``block_dim``.
 
@@ -10793,6 +12113,7 @@ def launch(
     record_cmd: bool = False,
     max_blocks: int = 0,
     block_dim: int = 256,
+    cpu_threads: int | None = None,
 ):
     """Launch a Warp kernel on the target device
 
@@ -10832,6 +12153,9 @@ def launch(
           ``@wp.kernel(grid_stride=False)`` and ``max_blocks > 0`` raises
           a ``RuntimeError``.
         block_dim: The number of threads per block (always 1 for "cpu" devices).
+        cpu_threads: The number of host threads used to execute a launch on a "cpu" device,
+          ``0`` uses every hardware thread. If ``None``, :attr:`warp.config.cpu_max_threads` is used.
+          Forward launches of kernels that use atomics or tiles always run on a single thread.
     """
 
     init()
@@ -10844,6 +12168,8 @@ def launch(
 
     if device == "cpu":
         block_dim = 1
+        if runtime.cpu_timing_depth:
+            runtime.core.wp_cpu_timing_mark_dispatch()
     elif block_dim <= 0:
         block_dim = 256
 
@@ -10901,6 +12227,24 @@ def launch(
                     f"@wp.kernel(grid_stride=True) to launch dimensions this large."
                 )
 
+        # forward CPU launches skip per-argument packing when the arguments fit a packed plan
+        if device.is_cpu and not adjoint and not record_cmd and _get_apic_capture_for_device(device) is None:
+            hooks = module_exec.get_kernel_hooks(kernel)
+            if _launch_cpu_packed(kernel, hooks, device, dim, fwd_args, cpu_threads):
+                if runtime.tape and record_tape:
+                    _record_launch_on_tape(
+                        kernel,
+                        dim,
+                        max_blocks,
+                        inputs,
+                        outputs,
+                        device,
+                        block_dim,
+                        fwd_args,
+                        inspect.currentframe().f_back,
+                    )
+                return
+
         scalar_tid_extent_limit = _resolve_kernel_scalar_tid_extent_limit(kernel, dim, block_dim)
         bounds = _build_launch_bounds_from_tuple(dim, kernel.adj.kernel_dim, scalar_tid_extent_limit)
 
@@ -11001,6 +12345,7 @@ def launch(
                     adjoint=adjoint,
                     fwd_args=fwd_args,
                     adj_args=adj_args,
+                    cpu_threads=cpu_threads,
                 )
                 return launch
 
@@ -11043,9 +12388,12 @@ def launch(
                     ctypes.byref(args_struct) if args_struct is not None else None,
                     ctypes.byref(adj_args_struct) if adj_args_struct is not None else None,
                     ctypes.byref(apic_info),
+                    None,
+                    0,
+                    1,
                 )
             else:
-                invoke(kernel, hooks, params, adjoint)
+                invoke(kernel, hooks, params, adjoint, _resolve_cpu_threads(cpu_threads))
 
         else:
             kernel_args = [ctypes.c_void_p(ctypes.addressof(x)) for x in params]
@@ -11180,16 +12528,19 @@ def launch(
 
     # record on tape if one is active
     if runtime.tape and record_tape:
-        # record file, lineno, func as metadata
-        frame = inspect.currentframe().f_back
-        caller = {"file": frame.f_code.co_filename, "lineno": frame.f_lineno, "func": frame.f_code.co_name}
-        runtime.tape.record_launch(
-            kernel, dim, max_blocks, inputs, outputs, device, block_dim, metadata={"caller": caller}
+        _record_launch_on_tape(
+            kernel, dim, max_blocks, inputs, outputs, device, block_dim, fwd_args, inspect.currentframe().f_back
         )
 
-        # detect illegal inter-kernel read/write access patterns if verification flag is set
-        if warp.config.verify_autograd_array_access:
-            runtime.tape._check_kernel_array_access(kernel, fwd_args)
+
+def _record_launch_on_tape(kernel, dim, max_blocks, inputs, outputs, device, block_dim, fwd_args, frame):
+    # record file, lineno, func of the launching frame as metadata
+    caller = {"file": frame.f_code.co_filename, "lineno": frame.f_lineno, "func": frame.f_code.co_name}
+    runtime.tape.record_launch(kernel, dim, max_blocks, inputs, outputs, device, block_dim, metadata={"caller": caller})
+
+    # detect illegal inter-kernel read/write access patterns if verification flag is set
+    if warp.config.verify_autograd_array_access:
+        runtime.tape._check_kernel_array_access(kernel, fwd_args)
 
 
 def launch_tiled(*args, **kwargs):
@@ -11602,6 +12953,7 @@ def force_load(
     modules: list[Module] | None = None,
     block_dim: int | None = None,
     max_workers: int | None = None,
+    use_processes: bool | None = None,
 ):
     """Force user-defined kernels to be compiled and loaded (low-level API).
 
@@ -11623,6 +12975,12 @@ def force_load(
         block_dim: The number of threads per block (always 1 for ``"cpu"`` devices).
         max_workers: The maximum number of parallel threads to use for loading modules. ``0`` means serial loading.
             If ``None``, ```warp.config.load_module_max_workers`` determines the default.
+        use_processes: Whether to compile modules that are missing from the kernel cache in a pool of
+            ``max_workers`` worker processes before loading them. Code generation holds the global
+            interpreter lock, so separate processes scale better than threads when many modules need
+            to be built. The parent process then only loads the cached binaries. Requires the ``fork``
+            start method and is ignored with a warning on platforms without it.
+            If ``None``, :attr:`warp.config.load_module_use_processes` determines the default.
     """
     if is_cuda_driver_initialized():
         # save original context to avoid side effects
@@ -11660,24 +13018,134 @@ def force_load(
         loaded = [dim for (ctx, dim) in loaded_variants[m] if ctx == d.context]
         return loaded or [None]
 
+    if use_processes is None:
+        use_processes = warp.config.load_module_use_processes
+
+    if use_processes and max_workers > 1:
+        tasks = [(m, d, dim) for d in devices for m in modules for dim in _load_block_dims(m, d)]
+        _compile_modules_in_processes(tasks, max_workers)
+
+    def _force_load_variant(m: Module, d: Device, dim: int | None):
+        module_exec = m.load(d, block_dim=dim)
+        # kernels compiled separately are otherwise only built on their first launch
+        if isinstance(module_exec, KernelUnitsExec):
+            module_exec.load_all()
+
     if max_workers <= 1 or (len(devices) * len(modules)) == 1:
         # serial loading; avoid the overhead of using a thread pool
         for d in devices:
             for m in modules:
                 for dim in _load_block_dims(m, d):
-                    m.load(d, block_dim=dim)
+                    _force_load_variant(m, d, dim)
     else:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             for d in devices:
                 for m in modules:
                     for dim in _load_block_dims(m, d):
-                        executor.submit(m.load, d, block_dim=dim)
+                        executor.submit(_force_load_variant, m, d, dim)
 
     if is_cuda_available():
         # restore original context to avoid side effects
         runtime.core.wp_cuda_context_set_current(saved_context)
 
 
+# Compile jobs inherited by forked worker processes, see _compile_modules_in_processes().
+_process_compile_jobs: list[tuple[Module, Device, str, str, int | None, dict]] = []
+
+
+def _compile_module_job(index: int) -> str | None:
+    """Build one module variant into the kernel cache from a forked worker process.
+
+    Returns the name of the cache directory that was written, or ``None`` if the
+    module was already cached or failed to build. Build errors are only logged at
+    debug level here; the parent process compiles the module again when loading it
+    and raises the error there.
+    """
+    module, device, module_dir, output_name, output_arch, options = _process_compile_jobs[index]
+    try:
+        if module._compile(device, module_dir, output_name, output_arch, options=options):
+            return os.path.basename(module_dir)
+    except Exception as e:
+        log_debug(f"Compiling module {module.name} in a worker process failed: {e}")
+    return None
+
+
+def _compile_modules_in_processes(tasks: list[tuple[Module, Device, int | None]], max_workers: int):
+    """Build the uncached module variants of ``tasks`` into the kernel cache using worker processes.
+
+    Hashes, options, and cache paths are resolved in the parent so that the
+    workers only run code generation and the native compiler, and never touch the
+    CUDA driver or the native thread pool of the forked process. The workers are
+    forked while holding the code generation lock, so that no other thread of the
+    parent can hold it in the workers.
+    """
+    global _process_compile_jobs
+
+    try:
+        mp_context = multiprocessing.get_context("fork")
+    except ValueError:
+        log_warning(
+            "Compiling modules in worker processes requires the 'fork' start method, "
+            "which is unavailable on this platform; falling back to threads",
+            once=True,
+        )
+        return
+
+    jobs = []
+    for m, d, dim in tasks:
+        active_block_dim = dim if dim is not None else m.options["block_dim"]
+        if warp.config.module_hash_manifest and warp.config.cache_kernels:
+            m._load_recorded_hash(d, active_block_dim)
+        module_hash = m.get_module_hash(active_block_dim)
+
+        exec = m.execs.get((d.context, active_block_dim))
+        if exec is not None and (m.options["strip_hash"] or exec.module_hash == module_hash):
+            continue
+        if m.failed_builds.get((d.context, active_block_dim)) is not None:
+            continue
+
+        options = m.resolved_options[active_block_dim]
+        if options.get("verify_autograd_array_access", False):
+            # always rebuilt by Module.load(), so building it here would be wasted work
+            continue
+        if options["kernel_granular_cache"] and not m.options["strip_hash"]:
+            # kernels compiled separately are built by KernelUnitsExec.load_all()
+            continue
+
+        module_dir, output_name, output_arch = m._get_cache_target(d, active_block_dim)
+        meta_path = os.path.join(module_dir, m._get_meta_name(block_dim=active_block_dim))
+        if (
+            warp.config.cache_kernels
+            and os.path.exists(os.path.join(module_dir, output_name))
+            and os.path.exists(meta_path)
+        ):
+            continue
+
+        jobs.append((m, d, module_dir, output_name, output_arch, options))
+
+    if len(jobs) < 2:
+        # nothing to gain from worker processes
+        return
+
+    _process_compile_jobs = jobs
+    try:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs)), mp_context=mp_context) as executor:
+            # With the fork start method, all workers are started by the first submission,
+            # and map() submits every job before returning.
+            with _codegen_lock:
+                results = executor.map(_compile_module_job, range(len(jobs)))
+            built = list(results)
+    except BrokenProcessPool as e:
+        log_warning(f"Compiling modules in worker processes failed ({e}); falling back to the current process")
+        return
+    finally:
+        _process_compile_jobs = []
+
+    for module_name_short in built:
+        if module_name_short is not None:
+            warp._src.build.record_kernel_cache_use(module_name_short, True)
+
+
 def _get_caller_module_name(stack_level: int = 1) -> str:
     """Return the fully qualified module name of the caller.
 
@@ -11752,6 +13220,7 @@ def load_module(
     recursive: bool = False,
     block_dim: int | None = None,
     max_workers: int | None = None,
+    use_processes: bool | None = None,
 ):
     """Force a user-defined module to be compiled and loaded.
 
@@ -11781,6 +13250,9 @@ def load_module(
         block_dim: The number of threads per block (always 1 for ``"cpu"`` devices).
         max_workers: The maximum number of parallel threads to use for loading modules. ``0`` means serial loading.
             If ``None``, ```warp.config.load_module_max_workers`` determines the default.
+        use_processes: Whether to compile uncached modules in ``max_workers`` worker processes
+            instead of threads. See :func:`force_load` for details.
+            If ``None``, :attr:`warp.config.load_module_use_processes` determines the default.
 
     Raises:
         RuntimeError: If the specified module does not contain any Warp kernels, functions,
@@ -11823,7 +13295,9 @@ def load_module(
             "or has not been imported yet."
         )
 
-    force_load(device=device, modules=modules, block_dim=block_dim, max_workers=max_workers)
+    force_load(
+        device=device, modules=modules, block_dim=block_dim, max_workers=max_workers, use_processes=use_processes
+    )
 
 
 def _resolve_module(module: Module | types.ModuleType | str) -> Module:
@@ -12118,6 +13592,7 @@ def set_module_options(options: dict[str, Any], module: Any = None):
     * **compile_time_trace**: Enable compile-time tracing, defaults to the value of ``warp.config.compile_time_trace``.
     * **strip_hash**: Omit the content hash from compiled kernel file names, defaults to ``False``.
     * **default_grid_stride**: Whether kernels in this module that do not set ``grid_stride`` explicitly compile with a grid-stride loop. When ``None`` (the default), defers to ``warp.config.default_grid_stride`` (which defaults to grid-stride); set ``False`` to opt the module's kernels into the lean launch. A per-kernel ``@wp.kernel(grid_stride=...)`` always takes precedence.
+    * **kernel_granular_cache**: Compile, cache, and load each kernel of the module separately on its first launch instead of rebuilding the whole module when one kernel changes. When ``None`` (the default), defers to ``warp.config.kernel_granular_cache``.
 
     Args:
 
@@ -13409,6 +14884,56 @@ def _copy_caller_location() -> tuple[str, int] | tuple[None, None]:
     return frame.f_code.co_filename, frame.f_lineno
 
 
+def zero_arrays(arrays: Iterable[Array]):
+    """Zero out the entries of several arrays at once.
+
+    The contiguous arrays on each device are set to zero with a single native call, which on CUDA
+    devices sets up to 192 arrays per kernel launch on the device's current stream. This avoids the
+    overhead of calling :meth:`array.zero_` on many small arrays, e.g. the gradients recorded on a
+    :class:`Tape`. Other arrays, e.g. non-contiguous views, are zeroed with :meth:`array.zero_`.
+
+    Args:
+        arrays: The arrays to zero out. ``None`` entries are ignored.
+    """
+    init()
+
+    batches = {}
+    for a in arrays:
+        if a is None:
+            continue
+
+        if not isinstance(a, warp.array) or not a.is_contiguous:
+            a.zero_()
+            continue
+
+        a._apic_ensure_tracked()
+        size = a.size * warp._src.types.type_size_in_bytes(a.dtype)
+        if size > 0:
+            _, ptrs, sizes = batches.setdefault(a.device.alias, (a.device, [], []))
+            ptrs.append(a.ptr)
+            sizes.append(size)
+        a.mark_init()
+
+    for device, ptrs, sizes in batches.values():
+        count = len(ptrs)
+        if count == 1:
+            device.memset(ptrs[0], 0, sizes[0])
+            continue
+
+        dest_array = (ctypes.c_void_p * count)(*ptrs)
+        size_array = (ctypes.c_size_t * count)(*sizes)
+        if device.is_cpu:
+            result = runtime.core.wp_memset_batch_host(dest_array, size_array, count, 0)
+        else:
+            # WP_CURRENT_STREAM sentinel, see Device.memset
+            result = runtime.core.wp_memset_batch_device(
+                device.context, dest_array, size_array, count, 0, ctypes.c_void_p(0xFFFFFFFFFFFFFFFF)
+            )
+
+        if not result:
+            raise RuntimeError(f"Failed to zero {count} arrays on device '{device}': {runtime.get_error_string()}")
+
+
 def copy(
     dest: warp.array,
     src: warp.array,
@@ -2,20 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import ast
-import bisect
 import hashlib
 import pickle
 import re
 import weakref
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, NamedTuple, Optional
 
 import warp as wp
 from warp._src.codegen import Struct, StructInstance, get_annotations
+from warp._src.context import Allocator, _validate_allocator
 from warp._src.fem.operator import Integrand
 from warp._src.fem.types import Domain, Field
 from warp._src.logger import log_warning
-from warp._src.types import get_type_code, type_repr, type_scalar_type, type_size, type_size_in_bytes, type_to_warp
+from warp._src.types import get_type_code, type_repr, type_size_in_bytes, type_to_warp
 
 _kernel_cache = {}
 _struct_cache = {}
@@ -437,10 +438,38 @@ class TemporaryStore:
     or can be set globally as the default store using :func:`set_default_temporary_store`.
 
     By default, there is no default temporary store, so that temporary allocations are not persisted.
+
+    Allocations are rounded up to size classes, with four classes per power of two, and buffers of a given size class
+    are shared by temporaries of all data types on the same device.
+
+    Args:
+        max_bytes: Maximum number of bytes held by the store, counting both borrowed and idle buffers.
+            When exceeded, idle buffers are freed in least-recently-used order. Borrowed temporaries are never freed,
+            so the limit may be temporarily exceeded while they are in use. If ``None``, idle buffers are never freed.
+        allocator: Allocator to use for allocations on CUDA devices, for instance the one passed to
+            :class:`warp.ScopedAllocator`. If ``None``, the device's allocator at the time of the allocation is used.
     """
 
     _default_store: ClassVar[Optional["TemporaryStore"]] = None
 
+    _MIN_SIZE_CLASS: ClassVar[int] = 256
+
+    class Stats(NamedTuple):
+        """Allocation statistics of a :class:`TemporaryStore`, as returned by :meth:`TemporaryStore.get_stats`."""
+
+        hits: int
+        """Number of borrows served from an idle buffer"""
+        misses: int
+        """Number of borrows that required a new allocation"""
+        evictions: int
+        """Number of idle buffers freed to stay below the ``max_bytes`` limit"""
+        bytes_held: int
+        """Number of bytes currently allocated by the store, including borrowed temporaries"""
+        bytes_idle: int
+        """Number of bytes held in idle buffers, available for reuse"""
+        peak_bytes_held: int
+        """Highest value reached by ``bytes_held``"""
+
     class Pool:
         class Deleter:
             def __init__(self, pool: "TemporaryStore.Pool"):
@@ -456,20 +485,17 @@ class TemporaryStore:
                 if pool is not None:
                     pool.detach(temporary)
 
-        def __init__(self, dtype, device, pinned: bool):
-            self.dtype = dtype
+        def __init__(self, store: "TemporaryStore", key, device, pinned: bool):
+            self.key = key
             self.device = device
             self.pinned = pinned
 
-            self._pool: list[int] = []  # Currently available buffers for borrowing, ordered by size
-            self._pool_capacities: list[int] = []  # Sizes of available arrays for borrowing, ascending
+            self._store = weakref.ref(store)
+            self._free: dict[int, list[int]] = {}  # size class -> buffers available for borrowing
             self._allocs: dict[int, tuple[int, object]] = {}  # ptr -> (capacity, deallocate)
 
-            self._dtype_size = type_size_in_bytes(dtype)
             self._deleter = TemporaryStore.Pool.Deleter(self)
 
-            # self._held_temporaries = set()  # Temporaries that are prevented from going out of scope
-
         def borrow(self, shape, dtype, requires_grad: bool):
             if requires_grad:
                 grad = self.borrow(shape=shape, dtype=dtype, requires_grad=False)
@@ -478,7 +504,7 @@ class TemporaryStore:
             else:
                 grad = None
 
-            capacity = self._dtype_size
+            capacity = type_size_in_bytes(dtype)
             if isinstance(shape, int):
                 capacity *= shape
             else:
@@ -489,21 +515,19 @@ class TemporaryStore:
                 ptr = 0
                 deleter = None
             else:
-                index = bisect.bisect_left(
-                    a=self._pool_capacities,
-                    x=capacity,
-                )
-                if index < len(self._pool):
-                    # Big enough array found, remove from pool
-                    ptr = self._pool.pop(index)
-                    capacity = self._pool_capacities.pop(index)
+                capacity = TemporaryStore._size_class(capacity)
+                store = self._store()
+
+                free = self._free.get(capacity)
+                if free:
+                    # Idle buffer of the same size class found, remove from pool
+                    ptr = free.pop()
+                    store._on_hit(self, ptr)
                 else:
-                    # No big enough array found, allocate new one
-                    if len(self._pool) > 0:
-                        grow_factor = 1.5
-                        capacity = max(int(self._pool_capacities[-1] * grow_factor), capacity)
+                    # Make room for the new allocation before performing it
+                    store._on_miss(capacity)
 
-                    allocator = self.device.get_allocator(pinned=self.pinned)
+                    allocator = store._get_allocator(self.device, self.pinned)
                     with self.device.context_guard:
                         ptr = allocator.allocate(capacity)
                     self._allocs[ptr] = (capacity, allocator.deallocate)
@@ -524,17 +548,27 @@ class TemporaryStore:
         def redeem(self, ptr: int):
             capacity, _ = self._allocs[ptr]
             # Insert back array into available pool
-            index = bisect.bisect_left(
-                a=self._pool_capacities,
-                x=capacity,
-            )
-            self._pool.insert(index, ptr)
-            self._pool_capacities.insert(index, capacity)
+            self._free.setdefault(capacity, []).append(ptr)
+
+            store = self._store()
+            if store is not None:
+                store._on_redeem(self, ptr, capacity)
+
+        def free(self, ptr: int):
+            """Deallocate an idle buffer."""
+            capacity, deallocate = self._allocs.pop(ptr)
+            self._free[capacity].remove(ptr)
+            with self.device.context_guard:
+                deallocate(ptr, capacity)
 
         def detach(self, array: Temporary):
-            _, deallocate = self._allocs.pop(array.ptr)
+            capacity, deallocate = self._allocs.pop(array.ptr)
             array.deleter = deallocate
 
+            store = self._store()
+            if store is not None:
+                store._bytes_held -= capacity
+
         def __del__(self):
             for ptr, (capacity, deallocate) in self._allocs.items():
                 try:
@@ -544,12 +578,42 @@ class TemporaryStore:
                     # Suppress TypeError and AttributeError when callables become None during shutdown
                     pass
 
-    def __init__(self):
+    def __init__(self, max_bytes: int | None = None, allocator: Allocator | None = None):
+        _validate_allocator(allocator)
+        self.max_bytes = max_bytes
+        self.allocator = allocator
         self.clear()
 
     def clear(self):
-        """Clear all cached temporary pools."""
+        """Clear all cached temporary pools and reset the statistics."""
         self._temporaries = {}
+        self._idle: OrderedDict[tuple[Any, int], int] = OrderedDict()  # (pool key, ptr) -> capacity, LRU first
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bytes_held = 0
+        self._bytes_idle = 0
+        self._peak_bytes_held = 0
+
+    def get_stats(self) -> "TemporaryStore.Stats":
+        """Return the allocation statistics of the store."""
+        return TemporaryStore.Stats(
+            self._hits, self._misses, self._evictions, self._bytes_held, self._bytes_idle, self._peak_bytes_held
+        )
+
+    def trim(self, max_bytes: int = 0):
+        """Free idle buffers in least-recently-used order until the store holds at most ``max_bytes`` bytes.
+
+        Borrowed temporaries are not affected, so that the store may still hold more than ``max_bytes`` bytes.
+        With the default value, all idle buffers are freed.
+        """
+        while self._bytes_held > max_bytes and self._idle:
+            (pool_key, ptr), capacity = self._idle.popitem(last=False)
+            self._temporaries[pool_key].free(ptr)
+            self._bytes_held -= capacity
+            self._bytes_idle -= capacity
+            self._evictions += 1
 
     def borrow(self, shape, dtype, pinned: bool = False, device=None, requires_grad: bool = False) -> Temporary:
         """Borrow a temporary array from the pool.
@@ -564,16 +628,12 @@ class TemporaryStore:
         dtype = type_to_warp(dtype)
         device = wp.get_device(device)
 
-        type_length = type_size(dtype)
-        key = (dtype._type_, type_length, pinned, device.ordinal)
+        key = (pinned, device.ordinal)
 
         try:
             pool = self._temporaries[key]
         except KeyError:
-            value_type = (
-                cached_vec_type(length=type_length, dtype=type_scalar_type(dtype)) if type_length > 1 else dtype
-            )
-            pool = TemporaryStore.Pool(value_type, device, pinned=pinned)
+            pool = TemporaryStore.Pool(self, key, device, pinned=pinned)
             self._temporaries[key] = pool
 
         res = TemporaryStore.add_temporary_convenience_methods(
@@ -581,6 +641,38 @@ class TemporaryStore:
         )
         return res
 
+    @staticmethod
+    def _size_class(size: int) -> int:
+        """Round ``size`` up to the next size class, with four classes per power of two."""
+        if size <= TemporaryStore._MIN_SIZE_CLASS:
+            return TemporaryStore._MIN_SIZE_CLASS
+        step = 1 << ((size - 1).bit_length() - 3)
+        return (size + step - 1) // step * step
+
+    def _get_allocator(self, device, pinned: bool):
+        if self.allocator is not None and device.is_cuda:
+            return self.allocator
+        return device.get_allocator(pinned=pinned)
+
+    def _on_hit(self, pool: "TemporaryStore.Pool", ptr: int):
+        capacity = self._idle.pop((pool.key, ptr))
+        self._bytes_idle -= capacity
+        self._hits += 1
+
+    def _on_miss(self, capacity: int):
+        self._misses += 1
+        if self.max_bytes is not None:
+            self.trim(max(self.max_bytes - capacity, 0))
+
+        self._bytes_held += capacity
+        self._peak_bytes_held = max(self._peak_bytes_held, self._bytes_held)
+
+    def _on_redeem(self, pool: "TemporaryStore.Pool", ptr: int, capacity: int):
+        self._idle[(pool.key, ptr)] = capacity
+        self._bytes_idle += capacity
+        if self.max_bytes is not None:
+            self.trim(self.max_bytes)
+
     @staticmethod
     def add_temporary_convenience_methods(temporary: wp.array) -> Temporary:
         """Attach ``release`` and ``detach`` convenience methods to a temporary."""
@@ -4,6 +4,7 @@
 import ast
 import inspect
 import textwrap
+import weakref
 from collections.abc import Callable
 from typing import Any, NamedTuple
 
@@ -50,10 +51,18 @@ from warp._src.fem.types import (
 from warp._src.fem.utils import type_zero_element
 from warp._src.logger import log_warning
 from warp._src.types import is_array, type_length, type_repr, type_scalar_type, type_size, type_to_warp
-from warp._src.utils import array_cast, array_scan
-from warp.sparse import BsrMatrix, bsr_axpy, bsr_compress, bsr_set_from_triplets, bsr_set_zero, bsr_zeros
+from warp._src.utils import array_cast, array_scan, radix_sort_pairs
+from warp.sparse import (
+    BsrMatrix,
+    bsr_axpy,
+    bsr_block_index,
+    bsr_compress,
+    bsr_set_from_triplets,
+    bsr_set_zero,
+    bsr_zeros,
+)
 
-__all__ = ["integrate", "interpolate"]
+__all__ = ["SparsityPatternCache", "integrate", "interpolate"]
 
 _BSR_CAPACITY_AUTO = "auto"
 _BSR_CAPACITY_REUSE = "reuse"
@@ -107,6 +116,95 @@ def _require_bsr_capacity(bsr: BsrMatrix, nnz: int, operation: str):
         )
 
 
+class SparsityPatternCache:
+    """Sparsity pattern of a bilinear form, recorded by :func:`integrate` for reuse by later assemblies.
+
+    When passed to :func:`integrate` as ``bsr_options["pattern_cache"]``, the first assembly builds the output matrix
+    from triplets as usual, then records, for each triplet, the matrix block it contributes to.
+    Later assemblies of the same integrand over the same domain, test and trial spaces, and into the same output
+    matrix, sum the triplet values directly into the existing ``values`` of the output matrix, without sorting
+    or compressing triplets. Any other assembly records a new pattern, replacing the previous one.
+
+    Numerical zeros are never pruned from the recorded pattern, so that it stays valid when values change.
+    The topology of the output matrix must not be modified between assemblies, and :meth:`clear` must be called
+    if the domain or the function spaces are modified in place.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Forget the recorded pattern, so that the next assembly records a new one."""
+        self._refs = ()
+        self._key = None
+        self._block_offsets = None
+        self._triplet_indices = None
+
+    @property
+    def is_recorded(self) -> bool:
+        """Whether a pattern has been recorded."""
+        return self._key is not None
+
+    @staticmethod
+    def _full_key(objects: tuple, triplet_count: int, bsr: BsrMatrix) -> tuple[tuple, tuple]:
+        return (*objects, bsr, bsr.offsets, bsr.columns), (triplet_count, bsr.nnz)
+
+    def _matches(self, objects: tuple, triplet_count: int, bsr: BsrMatrix) -> bool:
+        objects, key = self._full_key(objects, triplet_count, bsr)
+        if key != self._key:
+            return False
+        return all(
+            (ref is None and obj is None) or (ref is not None and ref() is obj)
+            for ref, obj in zip(self._refs, objects, strict=True)
+        )
+
+    def _record(self, objects: tuple, rows: wp.array, columns: wp.array, bsr: BsrMatrix):
+        self.clear()
+
+        device = bsr.device
+        triplet_count = rows.shape[0]
+        block_count = bsr.nnz_sync()
+
+        # Sort triplet indices by destination block, invalid triplets last
+        triplet_blocks = wp.empty(shape=(2 * triplet_count,), dtype=int, device=device)
+        triplet_indices = wp.empty(shape=(2 * triplet_count,), dtype=int, device=device)
+        wp.launch(
+            _find_pattern_triplet_blocks,
+            dim=triplet_count,
+            device=device,
+            inputs=[bsr.nrow, bsr.ncol, block_count, rows, columns, bsr.offsets, bsr.columns],
+            outputs=[triplet_blocks, triplet_indices],
+        )
+        radix_sort_pairs(triplet_blocks, triplet_indices, triplet_count, end_bit=max(block_count.bit_length(), 1))
+
+        block_offsets = wp.empty(shape=(block_count + 1,), dtype=int, device=device)
+        wp.launch(
+            _find_pattern_block_offsets,
+            dim=block_count + 1,
+            device=device,
+            inputs=[triplet_count, triplet_blocks],
+            outputs=[block_offsets],
+        )
+
+        objects, self._key = self._full_key(objects, triplet_count, bsr)
+        self._refs = tuple(None if obj is None else weakref.ref(obj) for obj in objects)
+        self._block_offsets = block_offsets
+        self._triplet_indices = triplet_indices[:triplet_count]
+
+    def _assemble(self, triplet_values: wp.array, bsr: BsrMatrix):
+        block_count = self._block_offsets.shape[0] - 1
+        if block_count == 0:
+            return
+
+        wp.launch(
+            _gather_pattern_block_values,
+            dim=(block_count, *bsr.block_shape),
+            device=bsr.device,
+            inputs=[self._block_offsets, self._triplet_indices, triplet_values],
+            outputs=[bsr.scalar_values],
+        )
+
+
 def _resolve_path(func, node):
     """
     Resolves variable and path from ast node/attribute (adapted from warp._src.codegen)
@@ -1401,6 +1499,69 @@ def _count_integrate_bsr_rows_from_sorted_rows(
     row_counts[row] = row_end - row_beg
 
 
+@wp.kernel(enable_backward=False)
+def _find_pattern_triplet_blocks(
+    row_count: int,
+    col_count: int,
+    block_count: int,
+    rows: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    bsr_offsets: wp.array(dtype=int),
+    bsr_columns: wp.array(dtype=int),
+    triplet_blocks: wp.array(dtype=int),
+    triplet_indices: wp.array(dtype=int),
+):
+    triplet = wp.tid()
+
+    row = rows[triplet]
+    col = columns[triplet]
+
+    block = -1
+    if row >= 0 and row < row_count and col >= 0 and col < col_count:
+        block = bsr_block_index(row, col, bsr_offsets, bsr_columns)
+
+    # sort triplets that do not contribute to any block last
+    triplet_blocks[triplet] = wp.where(block == -1, block_count, block)
+    triplet_indices[triplet] = triplet
+
+
+@wp.kernel(enable_backward=False)
+def _find_pattern_block_offsets(
+    triplet_count: int,
+    sorted_triplet_blocks: wp.array(dtype=int),
+    block_offsets: wp.array(dtype=int),
+):
+    block = wp.tid()
+
+    if triplet_count == 0:
+        block_offsets[block] = 0
+        return
+
+    # wp.lower_bound() clamps to arr_end - 1; bump the result to triplet_count when
+    # the value is larger than all elements.
+    beg = wp.lower_bound(sorted_triplet_blocks, 0, triplet_count, block)
+    block_offsets[block] = wp.where(sorted_triplet_blocks[beg] < block, triplet_count, beg)
+
+
+@wp.kernel
+def _gather_pattern_block_values(
+    block_offsets: wp.array(dtype=int),
+    triplet_indices: wp.array(dtype=int),
+    triplet_values: wp.array3d(dtype=Any),
+    bsr_values: wp.array3d(dtype=Any),
+):
+    block, i, j = wp.tid()
+
+    beg = block_offsets[block]
+    end = block_offsets[block + 1]
+
+    val = triplet_values[triplet_indices[beg], i, j]
+    for k in range(beg + 1, end):
+        val += triplet_values[triplet_indices[k], i, j]
+
+    bsr_values[block, i, j] = val
+
+
 def _launch_integrate_kernel(
     integrand: Integrand,
     kernel: wp.Kernel,
@@ -1644,6 +1805,9 @@ def _launch_integrate_kernel(
         if output.block_shape != getattr(block_type, "_shape_", (1, 1)):
             raise RuntimeError(f"Output matrix blocks must have shape {getattr(block_type, '_shape_', (1, 1))}")
 
+    bsr_options = dict(bsr_options or {})
+    pattern_cache = bsr_options.pop("pattern_cache", None)
+
     sparse_bsr_options, capacity_policy, construction_policy = _normalize_fem_bsr_options(bsr_options)
     topology = sparse_bsr_options.get("topology", "compact")
     padded_bsr = topology == "padded"
@@ -1657,6 +1821,25 @@ def _launch_integrate_kernel(
     output_values_require_grad = isinstance(output, BsrMatrix) and output.values.requires_grad
     row_compress_bsr = construction_policy in (_BSR_CONSTRUCTION_ROW_COMPRESS, _BSR_CONSTRUCTION_AUTO)
 
+    reuse_pattern = False
+    if pattern_cache is not None:
+        if add_to_output or output is None:
+            raise RuntimeError(
+                "fem.integrate() with bsr_options['pattern_cache'] requires an output matrix and does not support add=True"
+            )
+        if topology != "compact" or construction_policy == _BSR_CONSTRUCTION_ROW_COMPRESS:
+            raise RuntimeError(
+                "fem.integrate() with bsr_options['pattern_cache'] requires compact topology and triplet construction"
+            )
+
+        # The pattern is recorded from triplets and must not depend on values
+        row_compress_bsr = False
+        sparse_bsr_options["prune_numerical_zeros"] = False
+
+        # Triplet indices depend on the integrand, domain and spaces, but not on quadrature points
+        pattern_objects = (kernel, domain, test.space_restriction, trial.space, trial.space_partition)
+        reuse_pattern = pattern_cache._matches(pattern_objects, nnz, output)
+
     # If we're doing row-local compression or padded assembly,
     # we need to pre-compute per-row capacity.
     bsr_result = None if add_to_output else output
@@ -1849,12 +2032,19 @@ def _launch_integrate_kernel(
 
     if row_compress_bsr:
         bsr_compress(bsr_result, inplace=not output_values_require_grad, **sparse_bsr_options)
+    elif reuse_pattern:
+        pattern_cache._assemble(triplet_values, bsr_result)
+        triplet_rows.release()
+        triplet_values.release()
+        triplet_cols.release()
     else:
         if capacity_policy == _BSR_CAPACITY_REUSE and topology == "compact":
             _require_bsr_capacity(bsr_result, nnz, "fem.integrate()")
         bsr_set_from_triplets(
             bsr_result, rows=triplet_rows, columns=triplet_cols, values=triplet_values, **sparse_bsr_options
         )
+        if pattern_cache is not None:
+            pattern_cache._record(pattern_objects, triplet_rows, triplet_cols, bsr_result)
         triplet_rows.release()
         triplet_values.release()
         triplet_cols.release()
@@ -1941,6 +2131,9 @@ def integrate(
           :func:`warp.sparse.bsr_compress()`. For row compression, :func:`warp.sparse.bsr_compress()`
           uses ``inplace=False`` when ``output.values.requires_grad`` is true; non-differentiable outputs use
           in-place compression for the lowest memory overhead.
+          For bilinear forms assembled repeatedly into the same ``output``, ``pattern_cache`` accepts a
+          :class:`SparsityPatternCache` that records the sparsity pattern on the first assembly and lets later
+          assemblies write values in place, without sorting or compressing triplets.
     """
     if fields is None:
         fields = {}
@@ -1,69 +1,115 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+
 import warp as wp
+from warp._src.optim.multi_tensor import (
+    MultiTensorTables,
+    increment_step_counter,
+    multi_tensor_locate,
+    scalar_view,
+    step_counter,
+)
+from warp._src.types import float_types, type_is_matrix, type_is_vector, type_scalar_type
+
+
+@functools.cache
+def _make_adam_multi_tensor_kernel(param_type: type, moment_type: type):
+    @wp.kernel(module="unique")
+    def adam_multi_tensor_step_kernel(
+        offsets: wp.array(dtype=int),
+        param_ptrs: wp.array(dtype=wp.uint64),
+        grad_ptrs: wp.array(dtype=wp.uint64),
+        m_ptrs: wp.array(dtype=wp.uint64),
+        v_ptrs: wp.array(dtype=wp.uint64),
+        step: wp.array(dtype=int),
+        lr: moment_type,
+        beta1: moment_type,
+        beta2: moment_type,
+        eps: moment_type,
+    ):
+        k, n, i = multi_tensor_locate(offsets, wp.tid())
+        params = wp.array(ptr=param_ptrs[k], shape=(n,), dtype=param_type)
+        g = wp.array(ptr=grad_ptrs[k], shape=(n,), dtype=param_type)
+        m = wp.array(ptr=m_ptrs[k], shape=(n,), dtype=moment_type)
+        v = wp.array(ptr=v_ptrs[k], shape=(n,), dtype=moment_type)
+
+        one = moment_type(1.0)
+        t = moment_type(step[0] + 1)
+
+        gi = moment_type(g[i])
+        mi = beta1 * m[i] + (one - beta1) * gi
+        vi = beta2 * v[i] + (one - beta2) * gi * gi
+        m[i] = mi
+        v[i] = vi
+
+        mhat = mi / (one - wp.pow(beta1, t))
+        vhat = vi / (one - wp.pow(beta2, t))
+        update = lr * mhat / (wp.sqrt(vhat) + eps)
+        params[i] = param_type(moment_type(params[i]) - update)
+
+    return adam_multi_tensor_step_kernel
+
+
+@functools.cache
+def _make_adam_strided_kernel(param_type: type, moment_type: type):
+    # operates on the views returned by scalar_view(), for non-contiguous parameters
+    @wp.kernel(module="unique")
+    def adam_strided_step_kernel(
+        g: wp.array4d(dtype=param_type),
+        m: wp.array4d(dtype=moment_type),
+        v: wp.array4d(dtype=moment_type),
+        step: wp.array(dtype=int),
+        lr: moment_type,
+        beta1: moment_type,
+        beta2: moment_type,
+        eps: moment_type,
+        params: wp.array4d(dtype=param_type),
+    ):
+        i, j, k, c = wp.tid()
 
+        one = moment_type(1.0)
+        t = moment_type(step[0] + 1)
 
-@wp.kernel
-def adam_step_kernel_vec3(
-    g: wp.array(dtype=wp.vec3),
-    m: wp.array(dtype=wp.vec3),
-    v: wp.array(dtype=wp.vec3),
-    lr: float,
-    beta1: float,
-    beta2: float,
-    t: float,
-    eps: float,
-    params: wp.array(dtype=wp.vec3),
-):
-    i = wp.tid()
-    m[i] = beta1 * m[i] + (1.0 - beta1) * g[i]
-    v[i] = beta2 * v[i] + (1.0 - beta2) * wp.cw_mul(g[i], g[i])
-    mhat = m[i] / (1.0 - wp.pow(beta1, (t + 1.0)))
-    vhat = v[i] / (1.0 - wp.pow(beta2, (t + 1.0)))
-    sqrt_vhat = wp.vec3(wp.sqrt(vhat[0]), wp.sqrt(vhat[1]), wp.sqrt(vhat[2]))
-    eps_vec3 = wp.vec3(eps, eps, eps)
-    params[i] = params[i] - lr * wp.cw_div(mhat, (sqrt_vhat + eps_vec3))
-
-
-@wp.kernel
-def adam_step_kernel_float(
-    g: wp.array(dtype=float),
-    m: wp.array(dtype=float),
-    v: wp.array(dtype=float),
-    lr: float,
-    beta1: float,
-    beta2: float,
-    t: float,
-    eps: float,
-    params: wp.array(dtype=float),
-):
-    i = wp.tid()
-    m[i] = beta1 * m[i] + (1.0 - beta1) * g[i]
-    v[i] = beta2 * v[i] + (1.0 - beta2) * g[i] * g[i]
-    mhat = m[i] / (1.0 - wp.pow(beta1, (t + 1.0)))
-    vhat = v[i] / (1.0 - wp.pow(beta2, (t + 1.0)))
-    params[i] = params[i] - lr * mhat / (wp.sqrt(vhat) + eps)
-
-
-@wp.kernel
-def adam_step_kernel_half(
-    g: wp.array(dtype=wp.float16),
-    m: wp.array(dtype=float),
-    v: wp.array(dtype=float),
-    lr: float,
-    beta1: float,
-    beta2: float,
-    t: float,
-    eps: float,
-    params: wp.array(dtype=wp.float16),
-):
-    i = wp.tid()
-    m[i] = beta1 * m[i] + (1.0 - beta1) * float(g[i])
-    v[i] = beta2 * v[i] + (1.0 - beta2) * float(g[i]) * float(g[i])
-    mhat = m[i] / (1.0 - wp.pow(beta1, (t + 1.0)))
-    vhat = v[i] / (1.0 - wp.pow(beta2, (t + 1.0)))
-    params[i] = params[i] - wp.float16(lr * mhat / (wp.sqrt(vhat) + eps))
+        gi = moment_type(g[i, j, k, c])
+        mi = beta1 * m[i, j, k, c] + (one - beta1) * gi
+        vi = beta2 * v[i, j, k, c] + (one - beta2) * gi * gi
+        m[i, j, k, c] = mi
+        v[i, j, k, c] = vi
+
+        mhat = mi / (one - wp.pow(beta1, t))
+        vhat = vi / (one - wp.pow(beta2, t))
+        update = lr * mhat / (wp.sqrt(vhat) + eps)
+        params[i, j, k, c] = param_type(moment_type(params[i, j, k, c]) - update)
+
+    return adam_strided_step_kernel
+
+
+def _launch_adam_strided_step(g, m, v, step, lr, beta1, beta2, eps, params):
+    scalar_type = type_scalar_type(params.dtype)
+    params_view = scalar_view(params)
+    wp.launch(
+        _make_adam_strided_kernel(scalar_type, _moment_dtype(scalar_type)),
+        dim=params_view.shape,
+        inputs=[scalar_view(g), scalar_view(m), scalar_view(v), step, lr, beta1, beta2, eps, params_view],
+        device=params.device,
+    )
+
+
+def _moment_dtype(dtype: type) -> type:
+    scalar_type = type_scalar_type(dtype)
+    if scalar_type not in float_types:
+        raise RuntimeError(f"Unsupported dtype for Warp Adam optimizer: {dtype}")
+
+    # we always use fp32 for moments, even if params are fp16
+    if scalar_type != wp.float16:
+        return dtype
+    if type_is_vector(dtype):
+        return wp.types.vector(length=dtype._length_, dtype=wp.float32)
+    if type_is_matrix(dtype):
+        return wp.types.matrix(shape=dtype._shape_, dtype=wp.float32)
+    return wp.float32
 
 
 class Adam:
@@ -83,19 +129,29 @@ class Adam:
 
     Args:
         params: List of :class:`warp.array` objects to optimize. Can be ``None``
-            and set later via :meth:`set_params`. Supported dtypes are
-            :class:`warp.float16`, :class:`warp.float32`, and :class:`warp.vec3`.
+            and set later via :meth:`set_params`. All floating-point scalar, vector,
+            and matrix dtypes are supported. Moments of half-precision parameters are
+            stored in single precision.
         lr: Learning rate (step size).
         betas: Coefficients for computing running averages of gradient and its
             square. Tuple of two floats ``(beta1, beta2)`` where ``beta1`` is the
             exponential decay rate for the first moment and ``beta2`` is the decay
             rate for the second moment.
         eps: Small constant added to denominator for numerical stability.
+
+    Each call to :meth:`step` updates all contiguous parameter arrays sharing a device and a
+    scalar type with a single kernel launch, and keeps the step count in device memory, so that
+    steps can be captured in a CUDA graph. Address tables for the parameter, gradient, and moment
+    arrays are uploaded to the device whenever one of these arrays is replaced, so an initial step
+    should be taken outside of the capture. Non-contiguous parameter arrays, of up to three dimensions,
+    are updated with one launch each.
     """
 
     def __init__(self, params=None, lr=0.001, betas=(0.9, 0.999), eps=1e-08):
         self.m = []  # first moment
         self.v = []  # second moment
+        self._tables = MultiTensorTables()
+        self._step_counters = {}
         self.set_params(params)
         self.lr = lr
         self.beta1 = betas[0]
@@ -103,6 +159,22 @@ class Adam:
         self.eps = eps
         self.t = 0
 
+    @property
+    def t(self) -> int:
+        """Number of steps taken since the last reset.
+
+        This is the host-side count of calls to :meth:`step`; replays of captured steps only
+        advance the device-side count used by the update kernels. Setting it also sets the
+        device-side count.
+        """
+        return self._t
+
+    @t.setter
+    def t(self, value: int):
+        self._t = int(value)
+        for counter in self._step_counters.values():
+            counter.fill_(self._t)
+
     def set_params(self, params):
         """Set parameters to optimize and allocate moment buffers.
 
@@ -117,15 +189,7 @@ class Adam:
                 self.v = [None] * len(params)  # reset second moment
             for i in range(len(params)):
                 param = params[i]
-
-                if param.dtype == wp.vec3:
-                    dtype = wp.vec3
-                elif param.dtype == wp.float32:
-                    dtype = wp.float32
-                elif param.dtype == wp.float16:
-                    dtype = wp.float32  # we always use fp32 for moments, even if params are fp16
-                else:
-                    raise RuntimeError(f"Unsupported dtype for Warp Adam optimizer: {param.dtype}")
+                dtype = _moment_dtype(param.dtype)
 
                 # Moments are always fp32 even for fp16 params, so compare against ``dtype`` (the moment
                 # buffer dtype), not ``param.dtype``, otherwise the buffers are re-zeroed on every call.
@@ -140,11 +204,8 @@ class Adam:
 
     def reset_internal_state(self):
         """Reset moment buffers and timestep to zero."""
-        for m_i in self.m:
-            m_i.zero_()
-        for v_i in self.v:
-            v_i.zero_()
-        self.t = 0
+        wp.zero_arrays(self.m + self.v + list(self._step_counters.values()))
+        self._t = 0
 
     def step(self, grad):
         """Apply one Adam step using the provided gradients.
@@ -153,11 +214,43 @@ class Adam:
             grad: List of gradient arrays matching ``params``.
         """
         assert self.params is not None
-        for i in range(len(self.params)):
-            Adam.step_detail(
-                grad[i], self.m[i], self.v[i], self.lr, self.beta1, self.beta2, self.t, self.eps, self.params[i]
+        groups, fallback = self._tables.update(self.params, grad, m=self.m, v=self.v)
+
+        devices = {}
+        for group in groups:
+            step = step_counter(self._step_counters, group.device, self._t)
+            devices[group.device.alias] = step
+            kernel = _make_adam_multi_tensor_kernel(group.scalar_type, _moment_dtype(group.scalar_type))
+            wp.launch(
+                kernel,
+                dim=group.size,
+                inputs=[
+                    group.offsets,
+                    group.tables["params"],
+                    group.tables["grads"],
+                    group.tables["m"],
+                    group.tables["v"],
+                    step,
+                    self.lr,
+                    self.beta1,
+                    self.beta2,
+                    self.eps,
+                ],
+                device=group.device,
             )
-        self.t = self.t + 1
+
+        # non-contiguous parameters are updated one at a time
+        for i in fallback:
+            param = self.params[i]
+            step = step_counter(self._step_counters, param.device, self._t)
+            devices[param.device.alias] = step
+            _launch_adam_strided_step(
+                grad[i], self.m[i], self.v[i], step, self.lr, self.beta1, self.beta2, self.eps, param
+            )
+
+        for step in devices.values():
+            wp.launch(increment_step_counter, dim=1, inputs=[step], device=step.device)
+        self._t += 1
 
     @staticmethod
     def step_detail(g, m, v, lr, beta1, beta2, t, eps, params):
@@ -176,27 +269,5 @@ class Adam:
         """
         assert params.dtype == g.dtype
         assert params.shape == g.shape
-        kernel_inputs = [g, m, v, lr, beta1, beta2, t, eps, params]
-        if params.dtype == wp._src.types.float32:
-            wp.launch(
-                kernel=adam_step_kernel_float,
-                dim=len(params),
-                inputs=kernel_inputs,
-                device=params.device,
-            )
-        elif params.dtype == wp._src.types.float16:
-            wp.launch(
-                kernel=adam_step_kernel_half,
-                dim=len(params),
-                inputs=kernel_inputs,
-                device=params.device,
-            )
-        elif params.dtype == wp._src.types.vec3:
-            wp.launch(
-                kernel=adam_step_kernel_vec3,
-                dim=len(params),
-                inputs=kernel_inputs,
-                device=params.device,
-            )
-        else:
-            raise RuntimeError("Params data type not supported in Adam step kernels.")
+        step = wp.full(1, int(t), dtype=int, device=params.device)
+        _launch_adam_strided_step(g, m, v, step, lr, beta1, beta2, eps, params)
@@ -7,6 +7,8 @@ import operator
 from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+
 import warp as wp
 import warp.sparse as sparse
 from warp._src.types import type_is_matrix, type_is_vector, type_length, type_scalar_type
@@ -233,7 +235,7 @@ def aslinearoperator(
     raise ValueError(f"Unable to create LinearOperator from {A}")
 
 
-def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
+def preconditioner(A: _Matrix, ptype: str = "diag", **kwargs) -> LinearOperator:
     """Construct and return a preconditioner for an input matrix.
 
     Args:
@@ -243,12 +245,37 @@ def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
          - ``"diag"``: Diagonal (a.k.a. Jacobi) preconditioner
          - ``"diag_abs"``: Similar to Jacobi, but using the absolute value of diagonal coefficients
          - ``"id"``: Identity (null) preconditioner
+         - ``"ilu0"``: Block incomplete LU factorization with zero fill-in, ILU(0)
+         - ``"ic0"``: Block incomplete Cholesky factorization with zero fill-in, IC(0), in ``L D L^T`` form.
+           Only the lower triangle of ``A`` is read, and ``A`` is assumed to be symmetric.
+         - ``"amg"``: Smoothed-aggregation algebraic multigrid V-cycle with damped block-Jacobi smoothing
+        kwargs: Additional options for the ``"amg"`` preconditioner:
+
+         - ``strength_threshold``: Relative magnitude above which an off-diagonal block is considered
+           a strong connection during aggregation (default ``0.08``)
+         - ``max_levels``: Maximum number of levels in the multigrid hierarchy (default ``10``)
+         - ``coarse_size``: Number of block rows below which coarsening stops and the coarsest level
+           is solved directly (default ``64``). If coarsening stops on a larger level, e.g. because it has
+           no strong connections or ``max_levels`` is reached, that level is smoothed with Jacobi sweeps instead.
+         - ``smoothing_steps``: Number of pre- and post-smoothing Jacobi sweeps per level (default ``1``)
+
+    The ``"ilu0"``, ``"ic0"`` and ``"amg"`` preconditioners require ``A`` to be a
+    :class:`warp.sparse.BsrMatrix` with square blocks and non-zero diagonal blocks, and are built from the values
+    of ``A`` at the time of the call. Their setup synchronizes with the host, but applying them only
+    launches a fixed sequence of kernels, so that they can be used within CUDA graph captures of the iterative solvers.
+
+    The incomplete factorizations group the rows of the triangular factors into levels of mutually
+    independent rows, and perform each triangular solve with one launch per level.
     """
 
     if ptype == "id":
         return None
     if ptype in ("diag", "diag_abs"):
-        return _make_jacobi_preconditioner(A, use_abs=ptype == "diag_abs")
+        return _make_jacobi_preconditioner(A, use_abs=ptype == "diag_abs", **kwargs)
+    if ptype in ("ilu0", "ic0"):
+        return _make_incomplete_factorization_preconditioner(A, symmetric=ptype == "ic0", **kwargs)
+    if ptype == "amg":
+        return _make_amg_preconditioner(A, **kwargs)
 
     raise ValueError(f"Unsupported preconditioner type '{ptype}'")
 
@@ -280,6 +307,344 @@ def _make_jacobi_preconditioner(A: _Matrix, use_abs: bool) -> LinearOperator:
     return aslinearoperator(inv_diag)
 
 
+def _make_incomplete_factorization_preconditioner(A: _Matrix, symmetric: bool) -> LinearOperator:
+    if not isinstance(A, sparse.BsrMatrix):
+        raise ValueError("Incomplete factorization preconditioners require a BsrMatrix")
+    if A.nrow != A.ncol or A.block_shape[0] != A.block_shape[1]:
+        raise ValueError("Incomplete factorization preconditioners require a square matrix with square blocks")
+
+    device = A.device
+
+    # Factorize in a compact copy of A, with sorted columns and no row padding
+    factor = sparse.bsr_copy(A)
+    nrow = factor.nrow
+
+    diag_index = wp.empty(nrow, dtype=int, device=device)
+    wp.launch(
+        _bsr_find_diagonal_blocks,
+        dim=nrow,
+        device=device,
+        inputs=[factor.offsets, factor.columns, diag_index],
+    )
+    if nrow > 0 and int(diag_index.numpy().min()) < 0:
+        raise ValueError("Incomplete factorization preconditioners require structurally non-zero diagonal blocks")
+
+    inv_diag = wp.empty(nrow, dtype=factor.dtype, device=device)
+
+    # Rows within a level only depend on rows from previous levels,
+    # so that both the factorization and the triangular solves can proceed one level at a time
+    lower_levels = _level_schedule(factor, upper=False)
+    if symmetric:
+        for rows in lower_levels:
+            wp.launch(
+                _ic0_factor_rows,
+                dim=rows.shape,
+                device=device,
+                inputs=[rows, factor.offsets, factor.columns, diag_index, factor.values, inv_diag],
+            )
+
+        # Backward substitution uses U = D L^T, obtained by scaling the rows of the transposed factor
+        upper = sparse.bsr_transposed(factor)
+        wp.launch(
+            _scale_block_rows,
+            dim=upper.nnz,
+            device=device,
+            inputs=[upper.offsets, upper.columns, sparse.bsr_get_diag(factor), upper.values],
+        )
+        upper_levels = _level_schedule(upper, upper=True)
+    else:
+        for rows in lower_levels:
+            wp.launch(
+                _ilu0_factor_rows,
+                dim=rows.shape,
+                device=device,
+                inputs=[rows, factor.offsets, factor.columns, diag_index, factor.values, inv_diag],
+            )
+
+        upper = factor
+        upper_levels = _level_schedule(factor, upper=True)
+
+    work = wp.empty(nrow, dtype=_block_vector_type(factor), device=device)
+
+    def matvec(x, y, z, alpha, beta):
+        scalar_type = factor.scalar_type
+        alpha = scalar_type(alpha)
+        beta = scalar_type(beta)
+
+        # Forward substitution with the unit lower factor
+        for rows in lower_levels:
+            wp.launch(
+                _ilu_lower_solve_rows,
+                dim=rows.shape,
+                device=device,
+                inputs=[rows, factor.offsets, factor.columns, factor.values, x, work],
+            )
+        # Backward substitution with the upper factor, scaling and accumulating into z
+        for rows in upper_levels:
+            wp.launch(
+                _ilu_upper_solve_rows,
+                dim=rows.shape,
+                device=device,
+                inputs=[rows, upper.offsets, upper.columns, upper.values, inv_diag, work, y, z, alpha, beta],
+            )
+
+    return LinearOperator(A.shape, A.dtype, device, matvec=matvec)
+
+
+def _block_vector_type(A: sparse.BsrMatrix):
+    if type_is_matrix(A.dtype):
+        return wp.types.vector(length=A.block_shape[0], dtype=A.scalar_type)
+    return A.scalar_type
+
+
+def _level_schedule(A: sparse.BsrMatrix, upper: bool) -> list[wp.array]:
+    """Group the rows of a triangular solve with the strictly lower (or upper) part of ``A`` into levels
+    of mutually independent rows, and return the row indices of each level as views of a single device array."""
+
+    if A.nrow == 0:
+        return []
+
+    # the sweep is sequential, run it on host copies of the topology
+    levels = wp.empty(A.nrow, dtype=int, device="cpu")
+    wp.launch(
+        _compute_row_levels,
+        dim=1,
+        device="cpu",
+        inputs=[A.offsets.to("cpu"), A.columns.to("cpu"), A.nrow, 1 if upper else 0, levels],
+    )
+
+    levels_np = levels.numpy()
+    order = wp.array(np.argsort(levels_np, kind="stable").astype(np.int32), dtype=int, device=A.device)
+    level_ends = np.cumsum(np.bincount(levels_np)).tolist()
+
+    return [order[beg:end] for beg, end in zip([0, *level_ends[:-1]], level_ends, strict=True)]
+
+
+class _AmgLevel:
+    def __init__(self, A: sparse.BsrMatrix, inv_diag: wp.array, weight: float):
+        self.A = A
+        self.inv_diag = inv_diag
+        self.weight = weight
+        self.P = None
+        self.R = None
+
+        vec_type = _block_vector_type(A)
+        self.x = wp.empty(A.nrow, dtype=vec_type, device=A.device)
+        self.b = wp.empty_like(self.x)
+        self.r = wp.empty_like(self.x)
+
+
+def _make_amg_preconditioner(
+    A: _Matrix,
+    strength_threshold: float = 0.08,
+    max_levels: int = 10,
+    coarse_size: int = 64,
+    smoothing_steps: int = 1,
+) -> LinearOperator:
+    if not isinstance(A, sparse.BsrMatrix):
+        raise ValueError("Algebraic multigrid preconditioner requires a BsrMatrix")
+    if A.nrow != A.ncol or A.block_shape[0] != A.block_shape[1]:
+        raise ValueError("Algebraic multigrid preconditioner requires a square matrix with square blocks")
+
+    device = A.device
+    scalar_type = A.scalar_type
+
+    levels = []
+    A_l = sparse.bsr_copy(A)
+    while True:
+        inv_diag = wp.empty(A_l.nrow, dtype=A_l.dtype, device=device)
+        wp.launch(
+            _invert_diagonal_blocks,
+            dim=A_l.nrow,
+            device=device,
+            inputs=[sparse.bsr_get_diag(A_l), inv_diag],
+        )
+
+        # Damping factor for both Jacobi smoothing and prolongator smoothing
+        weight = 4.0 / (3.0 * _estimate_jacobi_spectral_radius(A_l, inv_diag))
+        level = _AmgLevel(A_l, inv_diag, weight)
+        levels.append(level)
+
+        if A_l.nrow <= coarse_size or len(levels) == max_levels:
+            break
+
+        aggregates, aggregate_count = _amg_aggregate(A_l, strength_threshold)
+        if aggregate_count == A_l.nrow:
+            break
+
+        # Smoothed prolongator P = (I - w D^-1 A) P_tent
+        P_tent = _amg_tentative_prolongator(A_l, aggregates, aggregate_count)
+        Dinv_A = sparse.bsr_copy(A_l)
+        wp.launch(
+            _scale_block_rows,
+            dim=Dinv_A.nnz,
+            device=device,
+            inputs=[Dinv_A.offsets, Dinv_A.columns, inv_diag, Dinv_A.values],
+        )
+        P = sparse.bsr_mm(Dinv_A, P_tent, sparse.bsr_copy(P_tent), alpha=-weight, beta=1.0)
+        R = sparse.bsr_zeros(P.ncol, P.nrow, block_type=P.dtype, device=device)
+        sparse.bsr_set_transpose(dest=R, src=P)
+
+        level.P = P
+        level.R = R
+
+        # Galerkin coarse operator R A P
+        A_l = sparse.bsr_mm(R, sparse.bsr_mm(A_l, P))
+
+    # Direct solve on the coarsest level, with a pseudo-inverse to accommodate singular operators.
+    # Coarsening may stop early on levels without strong connections or after max_levels,
+    # in which case the coarsest level is too large to be densified and is only smoothed
+    coarsest = levels[-1]
+    coarse_solve = None
+    if coarsest.A.nrow <= coarse_size:
+        coarse_inverse = wp.array(
+            np.linalg.pinv(_bsr_to_dense(coarsest.A)),
+            dtype=scalar_type,
+            device=device,
+        )
+        coarse_solve = aslinearoperator(coarse_inverse).matvec
+
+    def jacobi_sweep(level: _AmgLevel, b: wp.array):
+        level.r.assign(b)
+        sparse.bsr_mv(level.A, level.x, level.r, alpha=-1.0, beta=1.0)
+        wp.launch(
+            _jacobi_update,
+            dim=level.x.shape,
+            device=device,
+            inputs=[level.inv_diag, level.r, level.x, scalar_type(level.weight)],
+        )
+
+    def v_cycle(depth: int, b: wp.array):
+        level = levels[depth]
+        if depth == len(levels) - 1:
+            if coarse_solve is not None:
+                x = _as_scalar_array(level.x)
+                coarse_solve(_as_scalar_array(b), x, x, 1.0, 0.0)
+            else:
+                level.x.zero_()
+                for _ in range(2 * smoothing_steps):
+                    jacobi_sweep(level, b)
+            return
+
+        level.x.zero_()
+        for _ in range(smoothing_steps):
+            jacobi_sweep(level, b)
+
+        coarse = levels[depth + 1]
+        level.r.assign(b)
+        sparse.bsr_mv(level.A, level.x, level.r, alpha=-1.0, beta=1.0)
+        sparse.bsr_mv(level.R, level.r, coarse.b, alpha=1.0, beta=0.0)
+        v_cycle(depth + 1, coarse.b)
+        sparse.bsr_mv(level.P, coarse.x, level.x, alpha=1.0, beta=1.0)
+
+        for _ in range(smoothing_steps):
+            jacobi_sweep(level, b)
+
+    def matvec(x, y, z, alpha, beta):
+        v_cycle(0, x)
+        wp.launch(
+            _axpby_kernel,
+            dim=z.shape,
+            device=device,
+            inputs=[levels[0].x, y, z, scalar_type(alpha), scalar_type(beta)],
+        )
+
+    return LinearOperator(A.shape, A.dtype, device, matvec=matvec)
+
+
+def _estimate_jacobi_spectral_radius(A: sparse.BsrMatrix, inv_diag: wp.array, iterations: int = 15) -> float:
+    """Estimate the spectral radius of ``D^-1 A`` using power iterations."""
+
+    if A.nrow == 0:
+        return 1.0
+
+    rng = np.random.default_rng(0)
+    vec_type = _block_vector_type(A)
+    v = wp.array(
+        rng.uniform(low=0.5, high=1.0, size=(A.nrow, *A.block_shape[:1]) if type_is_matrix(A.dtype) else A.nrow),
+        dtype=vec_type,
+        device=A.device,
+    )
+    Av = wp.empty_like(v)
+    w = wp.empty_like(v)
+
+    rho = 1.0
+    for _ in range(iterations):
+        sparse.bsr_mv(A, v, Av, alpha=1.0, beta=0.0)
+        w.zero_()
+        wp.launch(_jacobi_update, dim=w.shape, device=A.device, inputs=[inv_diag, Av, w, A.scalar_type(1.0)])
+
+        v_np = v.numpy()
+        w_np = w.numpy()
+        v_norm = np.linalg.norm(v_np)
+        w_norm = np.linalg.norm(w_np)
+        if w_norm == 0.0 or v_norm == 0.0:
+            break
+        rho = w_norm / v_norm
+        v.assign(w_np / w_norm)
+
+    return max(float(rho), float(np.finfo(np.float32).eps))
+
+
+def _amg_aggregate(A: sparse.BsrMatrix, strength_threshold: float) -> tuple[wp.array, int]:
+    device = A.device
+
+    diag_norms = wp.empty(A.nrow, dtype=A.scalar_type, device=device)
+    wp.launch(_block_norms, dim=A.nrow, device=device, inputs=[sparse.bsr_get_diag(A), diag_norms])
+
+    strong = wp.empty(A.nnz, dtype=int, device=device)
+    wp.launch(
+        _amg_strength_of_connection,
+        dim=A.nnz,
+        device=device,
+        inputs=[A.offsets, A.columns, A.values, diag_norms, A.scalar_type(strength_threshold), strong],
+    )
+
+    # greedy aggregation is sequential, run it on host copies of the strength-of-connection graph
+    aggregates = wp.empty(A.nrow, dtype=int, device="cpu")
+    aggregate_count = wp.empty(1, dtype=int, device="cpu")
+    wp.launch(
+        _amg_aggregate_kernel,
+        dim=1,
+        device="cpu",
+        inputs=[A.offsets.to("cpu"), A.columns.to("cpu"), strong.to("cpu"), aggregates, aggregate_count],
+    )
+
+    return aggregates.to(device), int(aggregate_count.numpy()[0])
+
+
+def _amg_tentative_prolongator(A: sparse.BsrMatrix, aggregates: wp.array, aggregate_count: int) -> sparse.BsrMatrix:
+    """Piecewise-constant prolongator, with one identity block per row, normalized over each aggregate."""
+
+    aggregates_np = aggregates.numpy()
+    scale = 1.0 / np.sqrt(np.bincount(aggregates_np, minlength=aggregate_count))[aggregates_np]
+    if type_is_matrix(A.dtype):
+        values = scale[:, np.newaxis, np.newaxis] * np.eye(A.block_shape[0])
+    else:
+        values = scale
+
+    return sparse.bsr_from_triplets(
+        A.nrow,
+        aggregate_count,
+        rows=wp.array(np.arange(A.nrow, dtype=np.int32), dtype=int, device=A.device),
+        columns=aggregates,
+        values=wp.array(values, dtype=A.dtype, device=A.device),
+    )
+
+
+def _bsr_to_dense(A: sparse.BsrMatrix) -> np.ndarray:
+    block_rows, block_cols = A.block_shape
+    offsets = A.offsets.numpy()
+    nnz = offsets[A.nrow]
+    rows = np.repeat(np.arange(A.nrow), np.diff(offsets[: A.nrow + 1]))
+    columns = A.columns.numpy()[:nnz]
+    values = A.scalar_values.numpy()[:nnz]
+
+    dense = np.zeros((A.nrow, block_rows, A.ncol, block_cols), dtype=values.dtype)
+    np.add.at(dense, (rows, slice(None), columns, slice(None)), values)
+    return dense.reshape(A.shape)
+
+
 def _as_scalar_array(x: wp.array):
     scalar_type = type_scalar_type(x.dtype)
     if scalar_type == x.dtype:
@@ -2329,6 +2694,370 @@ def _extract_inverse_diagonal_dense(
     inv_diag[i] = _inverse_diag_coefficient(dense_matrix[i, i], use_abs != 0)
 
 
+@wp.func
+def _invert_block(block: wp.Scalar):
+    zero = type(block)(0.0)
+    one = type(block)(1.0)
+    return wp.where(block == zero, one, one / block)
+
+
+@wp.func
+def _invert_block(block: wp.types.matrix((Any, Any), wp.Scalar)):
+    # Gauss-Jordan elimination with partial pivoting; zero pivots are skipped
+    a = block
+    inv = type(block)()
+    n = int(type(block[0]).length)
+    zero = type(block[0, 0])(0.0)
+    one = type(block[0, 0])(1.0)
+    for k in range(n):
+        inv[k, k] = one
+
+    for k in range(n):
+        pivot_row = k
+        pivot_abs = wp.abs(a[k, k])
+        for i in range(k + 1, n):
+            if wp.abs(a[i, k]) > pivot_abs:
+                pivot_row = i
+                pivot_abs = wp.abs(a[i, k])
+
+        if pivot_row != k:
+            tmp = a[k]
+            a[k] = a[pivot_row]
+            a[pivot_row] = tmp
+            tmp = inv[k]
+            inv[k] = inv[pivot_row]
+            inv[pivot_row] = tmp
+
+        pivot = a[k, k]
+        if pivot != zero:
+            scale = one / pivot
+            a[k] = a[k] * scale
+            inv[k] = inv[k] * scale
+            for i in range(n):
+                if i != k:
+                    f = a[i, k]
+                    a[i] = a[i] - f * a[k]
+                    inv[i] = inv[i] - f * inv[k]
+
+    return inv
+
+
+@wp.func
+def _transpose_block(block: wp.Scalar):
+    return block
+
+
+@wp.func
+def _transpose_block(block: wp.types.matrix((Any, Any), wp.Scalar)):
+    return wp.transpose(block)
+
+
+@wp.func
+def _block_norm(block: wp.Scalar):
+    return wp.abs(block)
+
+
+@wp.func
+def _block_norm(block: wp.types.matrix((Any, Any), wp.Scalar)):
+    return wp.sqrt(wp.ddot(block, block))
+
+
+@wp.func
+def _row_lower_bound(columns: wp.array(dtype=int), beg: int, end: int, col: int):
+    # Index of the first block in [beg, end) with a column not less than col, or end if there is none
+    if beg == end:
+        return end
+    block = wp.lower_bound(columns, beg, end, col)
+    return wp.where(columns[block] < col, end, block)
+
+
+@wp.kernel(module="unique")
+def _invert_diagonal_blocks(
+    diag: wp.array(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+):
+    i = wp.tid()
+    inv_diag[i] = _invert_block(diag[i])
+
+
+@wp.kernel(module="unique")
+def _block_norms(
+    blocks: wp.array(dtype=Any),
+    norms: wp.array(dtype=Any),
+):
+    i = wp.tid()
+    norms[i] = _block_norm(blocks[i])
+
+
+@wp.kernel(module="unique")
+def _bsr_find_diagonal_blocks(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    diag_index: wp.array(dtype=int),
+):
+    row = wp.tid()
+    beg = offsets[row]
+    end = offsets[row + 1]
+    block = _row_lower_bound(columns, beg, end, row)
+    diag_index[row] = -1
+    if block < end:
+        if columns[block] == row:
+            diag_index[row] = block
+
+
+@wp.kernel(module="unique")
+def _compute_row_levels(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    row_count: int,
+    upper: int,
+    levels: wp.array(dtype=int),
+):
+    # Sequential sweep: the level of a row is one more than the highest level of the rows it depends on
+    for n in range(row_count):
+        row = wp.where(upper != 0, row_count - 1 - n, n)
+        level = int(0)
+        for block in range(offsets[row], offsets[row + 1]):
+            col = columns[block]
+            if wp.where(upper != 0, col > row, col < row):
+                level = wp.max(level, levels[col] + 1)
+        levels[row] = level
+
+
+@wp.kernel(module="unique")
+def _ilu0_factor_rows(
+    rows: wp.array(dtype=int),
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    diag_index: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+):
+    i = rows[wp.tid()]
+    row_end = offsets[i + 1]
+    diag = diag_index[i]
+
+    for p in range(offsets[i], diag):
+        k = columns[p]
+        l_ik = values[p] * inv_diag[k]
+        values[p] = l_ik
+
+        # a_ij -= l_ik u_kj for j > k, merging the sorted columns of rows i and k
+        q = p + 1
+        r = diag_index[k] + 1
+        k_end = offsets[k + 1]
+        while q < row_end and r < k_end:
+            col_q = columns[q]
+            col_r = columns[r]
+            if col_q == col_r:
+                values[q] = values[q] - l_ik * values[r]
+                q += 1
+                r += 1
+            elif col_q < col_r:
+                q += 1
+            else:
+                r += 1
+
+    inv_diag[i] = _invert_block(values[diag])
+
+
+@wp.kernel(module="unique")
+def _ic0_factor_rows(
+    rows: wp.array(dtype=int),
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    diag_index: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+):
+    # Incomplete L D L^T factorization, reading and writing only the lower triangle.
+    # The eliminated value w_ik = l_ik d_k is used to update a_ij -= w_ik l_jk^T for k < j <= i.
+    i = rows[wp.tid()]
+    diag = diag_index[i]
+
+    for p in range(offsets[i], diag):
+        k = columns[p]
+        w_ik = values[p]
+        l_ik = w_ik * inv_diag[k]
+
+        for q in range(p + 1, diag):
+            j = columns[q]
+            j_diag = diag_index[j]
+            s = _row_lower_bound(columns, offsets[j], j_diag, k)
+            if s < j_diag:
+                if columns[s] == k:
+                    values[q] = values[q] - w_ik * _transpose_block(values[s])
+
+        values[diag] = values[diag] - w_ik * _transpose_block(l_ik)
+        values[p] = l_ik
+
+    inv_diag[i] = _invert_block(values[diag])
+
+
+@wp.kernel(module="unique")
+def _scale_block_rows(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    row_scale: wp.array(dtype=Any),
+    values: wp.array(dtype=Any),
+):
+    block = wp.tid()
+    row = wp.lower_bound(offsets, 0, row_scale.shape[0] + 1, block + 1) - 1
+    values[block] = row_scale[row] * values[block]
+
+
+@wp.kernel(module="unique")
+def _ilu_lower_solve_rows(
+    rows: wp.array(dtype=int),
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    x: wp.array(dtype=Any),
+    y: wp.array(dtype=Any),
+):
+    i = rows[wp.tid()]
+    beg = offsets[i]
+    end = _row_lower_bound(columns, beg, offsets[i + 1], i)
+
+    s = x[i]
+    for block in range(beg, end):
+        s -= values[block] * y[columns[block]]
+    y[i] = s
+
+
+@wp.kernel(module="unique")
+def _ilu_upper_solve_rows(
+    rows: wp.array(dtype=int),
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+    work: wp.array(dtype=Any),
+    y: wp.array(dtype=Any),
+    z: wp.array(dtype=Any),
+    alpha: Any,
+    beta: Any,
+):
+    i = rows[wp.tid()]
+    end = offsets[i + 1]
+    beg = _row_lower_bound(columns, offsets[i], end, i + 1)
+
+    s = work[i]
+    for block in range(beg, end):
+        s -= values[block] * work[columns[block]]
+    s = inv_diag[i] * s
+    work[i] = s
+
+    zero = type(alpha)(0)
+    res = alpha * s
+    if beta != zero:
+        res += beta * y[i]
+    z[i] = res
+
+
+@wp.kernel(module="unique")
+def _jacobi_update(
+    inv_diag: wp.array(dtype=Any),
+    r: wp.array(dtype=Any),
+    x: wp.array(dtype=Any),
+    weight: Any,
+):
+    i = wp.tid()
+    x[i] += weight * (inv_diag[i] * r[i])
+
+
+@wp.kernel(module="unique")
+def _axpby_kernel(
+    x: wp.array(dtype=Any),
+    y: wp.array(dtype=Any),
+    z: wp.array(dtype=Any),
+    alpha: Any,
+    beta: Any,
+):
+    i = wp.tid()
+    zero = type(alpha)(0)
+    s = alpha * x[i]
+    if beta != zero:
+        s += beta * y[i]
+    z[i] = s
+
+
+@wp.kernel(module="unique")
+def _amg_strength_of_connection(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    diag_norms: wp.array(dtype=Any),
+    threshold: Any,
+    strong: wp.array(dtype=int),
+):
+    block = wp.tid()
+    row = wp.lower_bound(offsets, 0, diag_norms.shape[0] + 1, block + 1) - 1
+    col = columns[block]
+
+    # |a_ij| >= theta sqrt(|a_ii| |a_jj|)
+    strong[block] = 0
+    if col != row:
+        if _block_norm(values[block]) >= threshold * wp.sqrt(diag_norms[row] * diag_norms[col]):
+            strong[block] = 1
+
+
+@wp.kernel(module="unique")
+def _amg_aggregate_kernel(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    strong: wp.array(dtype=int),
+    aggregates: wp.array(dtype=int),
+    aggregate_count: wp.array(dtype=int),
+):
+    # Sequential greedy aggregation over the strength-of-connection graph
+    row_count = aggregates.shape[0]
+    for i in range(row_count):
+        aggregates[i] = -1
+
+    count = int(0)
+
+    # Pass 1: rows whose strong neighborhood is entirely free become aggregate roots
+    for i in range(row_count):
+        if aggregates[i] < 0:
+            free = bool(True)
+            has_neighbors = bool(False)
+            for block in range(offsets[i], offsets[i + 1]):
+                if strong[block] != 0:
+                    has_neighbors = True
+                    if aggregates[columns[block]] >= 0:
+                        free = False
+            if free and has_neighbors:
+                aggregates[i] = count
+                for block in range(offsets[i], offsets[i + 1]):
+                    if strong[block] != 0:
+                        aggregates[columns[block]] = count
+                count += 1
+
+    # Pass 2: attach remaining rows to a neighboring aggregate from pass 1, marked with negative indices
+    for i in range(row_count):
+        if aggregates[i] == -1:
+            for block in range(offsets[i], offsets[i + 1]):
+                if strong[block] != 0 and aggregates[i] == -1:
+                    neighbor_aggregate = aggregates[columns[block]]
+                    if neighbor_aggregate >= 0:
+                        aggregates[i] = -2 - neighbor_aggregate
+    for i in range(row_count):
+        if aggregates[i] < -1:
+            aggregates[i] = -2 - aggregates[i]
+
+    # Pass 3: left-over rows form new aggregates with their free strong neighbors
+    for i in range(row_count):
+        if aggregates[i] < 0:
+            aggregates[i] = count
+            for block in range(offsets[i], offsets[i + 1]):
+                if strong[block] != 0 and aggregates[columns[block]] < 0:
+                    aggregates[columns[block]] = count
+            count += 1
+
+    aggregate_count[0] = count
+
+
 @wp.kernel
 def _cg_kernel_1(
     tol: wp.array(dtype=Any),
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for updating many parameter arrays with a single kernel launch.
+
+Parameter arrays sharing a device and a scalar type are gathered into a group. Each group
+stores device-side tables with the base address of every array of the group, along with the
+offsets of the arrays in a virtual flattened range of scalar coefficients. Fused optimizer
+kernels launch one thread per scalar coefficient of a group, locate the owning array with a
+binary search over the offsets, and access it through an array view constructed from its
+address. Vector and matrix arrays are treated as arrays of their scalar coefficients, so that
+all floating-point dtypes are handled by the same kernels.
+"""
+
+import warp as wp
+from warp._src.types import type_scalar_type, type_size, type_size_in_bytes
+
+
+class MultiTensorGroup:
+    """Contiguous arrays of a given device and scalar type updated by a single launch.
+
+    Attributes:
+        device: Device of the arrays.
+        scalar_type: Scalar type of the grouping arrays.
+        indices: Indices of the grouped arrays in the optimizer parameter list.
+        offsets: Device array of size ``len(indices) + 1`` with the first flattened scalar index of each array.
+        size: Total number of scalar coefficients in the group.
+        tables: Device arrays of base addresses, by array list name.
+    """
+
+    def __init__(self, device: wp.Device, scalar_type: type, indices: list[int], sizes: list[int]):
+        self.device = device
+        self.scalar_type = scalar_type
+        self.indices = indices
+        self.size = sum(sizes)
+
+        offsets = [0]
+        for size in sizes:
+            offsets.append(offsets[-1] + size)
+        self.offsets = wp.array(offsets, dtype=int, device=device)
+        self.tables = {}
+        self.table_keys = {}
+
+
+class MultiTensorTables:
+    """Groups arrays for fused updates, and keeps the address tables of each group up to date.
+
+    Address tables are uploaded to the device when the grouped arrays are first seen and
+    whenever one of them is replaced, and are reused as-is otherwise. Steps that are captured
+    in a CUDA graph should therefore only be recorded once all the tables are up to date,
+    e.g. after an initial step outside of the capture.
+    """
+
+    def __init__(self):
+        self._groups = []
+        self._fallback = []
+        self._group_key = None
+
+    def update(
+        self, params: list[wp.array], grads: list[wp.array], **state: list[wp.array]
+    ) -> tuple[list[MultiTensorGroup], list[int]]:
+        """Return the fused groups for ``params`` and the indices of the parameters that cannot be fused.
+
+        Args:
+            params: Parameter arrays, defining the groups.
+            grads: Gradient arrays, which must match the dtype and shape of the parameters.
+            state: Additional lists of optimizer-owned arrays matching ``params`` one-to-one, e.g. moments,
+              for which address tables should be maintained.
+        """
+
+        group_key = tuple((p.ptr, p.size, p.dtype, p.device.alias, p.is_contiguous) for p in params)
+        if group_key != self._group_key:
+            self._build_groups(params)
+            self._group_key = group_key
+
+        for name, array_list in (("params", params), ("grads", grads), *state.items()):
+            for group in self._groups:
+                key = tuple(array_list[i].ptr for i in group.indices)
+                if group.table_keys.get(name) != key:
+                    if name == "grads":
+                        for i in group.indices:
+                            _check_gradient(grads[i], params[i])
+                    group.tables[name] = wp.array(key, dtype=wp.uint64, device=group.device)
+                    group.table_keys[name] = key
+
+        return self._groups, self._fallback
+
+    def _build_groups(self, params: list[wp.array]):
+        grouped = {}
+        self._fallback = []
+        for i, p in enumerate(params):
+            if p.size == 0:
+                continue
+            if not p.is_contiguous:
+                self._fallback.append(i)
+                continue
+
+            scalar_type = type_scalar_type(p.dtype)
+            _, indices, sizes = grouped.setdefault((p.device.alias, scalar_type), (p.device, [], []))
+            indices.append(i)
+            sizes.append(p.size * type_size(p.dtype))
+
+        self._groups = [
+            MultiTensorGroup(device, scalar_type, indices, sizes)
+            for (_, scalar_type), (device, indices, sizes) in grouped.items()
+        ]
+
+
+def _check_gradient(grad: wp.array, param: wp.array):
+    if grad.dtype != param.dtype or grad.shape != param.shape or grad.device != param.device:
+        raise ValueError(
+            f"Gradient array of dtype {grad.dtype} and shape {grad.shape} on device '{grad.device}' does not match "
+            f"parameter array of dtype {param.dtype} and shape {param.shape} on device '{param.device}'"
+        )
+    if not grad.is_contiguous:
+        raise ValueError("Gradient arrays must be contiguous")
+
+
+def scalar_view(a: wp.array) -> wp.array:
+    """Return a 4D view of the scalar coefficients of ``a``, which may be non-contiguous.
+
+    Leading dimensions are padded with size-one dimensions and the last dimension
+    indexes the coefficients of each element, so that a single kernel handles
+    scalar, vector, and matrix arrays of up to three dimensions.
+    """
+    if a.ndim > 3:
+        raise ValueError(f"Non-contiguous arrays of {a.ndim} dimensions are not supported by optimizers")
+
+    scalar_type = type_scalar_type(a.dtype)
+    pad = 3 - a.ndim
+    return wp.array(
+        ptr=a.ptr,
+        dtype=scalar_type,
+        shape=(1,) * pad + a.shape + (type_size(a.dtype),),
+        strides=(0,) * pad + a.strides + (type_size_in_bytes(scalar_type),),
+        device=a.device,
+    )
+
+
+def step_counter(counters: dict[str, wp.array], device: wp.Device, initial_value: int = 0) -> wp.array:
+    """Return the device-side step counter of an optimizer for ``device``, allocating it if necessary."""
+    counter = counters.get(device.alias)
+    if counter is None:
+        counter = wp.full(1, initial_value, dtype=int, device=device)
+        counters[device.alias] = counter
+    return counter
+
+
+@wp.kernel
+def increment_step_counter(step: wp.array(dtype=int)):
+    step[0] += 1
+
+
+@wp.func
+def multi_tensor_locate(offsets: wp.array(dtype=int), i: int):
+    """Return the index of the array owning the flattened scalar index ``i``, its size, and the local index."""
+    k = wp.lower_bound(offsets, 0, offsets.shape[0], i + 1) - 1
+    beg = offsets[k]
+    return k, offsets[k + 1] - beg, i - beg
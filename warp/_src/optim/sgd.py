@@ -1,9 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 from typing import Any
 
 import warp as wp
+from warp._src.optim.multi_tensor import (
+    MultiTensorTables,
+    increment_step_counter,
+    multi_tensor_locate,
+    step_counter,
+)
 
 
 @wp.kernel
@@ -36,6 +43,50 @@ def sgd_step_kernel(
     params[i] = params[i] - lr * gt
 
 
+@functools.cache
+def _make_sgd_multi_tensor_kernel(param_type: type):
+    # half-precision parameters are updated in single precision
+    compute_type = wp.float32 if param_type == wp.float16 else param_type
+
+    @wp.kernel(module="unique")
+    def sgd_multi_tensor_step_kernel(
+        offsets: wp.array(dtype=int),
+        param_ptrs: wp.array(dtype=wp.uint64),
+        grad_ptrs: wp.array(dtype=wp.uint64),
+        b_ptrs: wp.array(dtype=wp.uint64),
+        step: wp.array(dtype=int),
+        lr: float,
+        momentum: float,
+        damping: float,
+        weight_decay: float,
+        nesterov: int,
+    ):
+        k, n, i = multi_tensor_locate(offsets, wp.tid())
+        params = wp.array(ptr=param_ptrs[k], shape=(n,), dtype=param_type)
+        g = wp.array(ptr=grad_ptrs[k], shape=(n,), dtype=param_type)
+
+        p = compute_type(params[i])
+        gt = compute_type(g[i])
+        if weight_decay != 0.0:
+            gt += compute_type(weight_decay) * p
+        if momentum != 0.0:
+            b = wp.array(ptr=b_ptrs[k], shape=(n,), dtype=param_type)
+            mu = compute_type(momentum)
+            bt = compute_type(b[i])
+            if step[0] > 0:
+                bt = mu * bt + compute_type(1.0 - damping) * gt
+            else:
+                bt = gt
+            if nesterov == 1:
+                gt += mu * bt
+            else:
+                gt = bt
+            b[i] = param_type(bt)
+        params[i] = param_type(p - compute_type(lr) * gt)
+
+    return sgd_multi_tensor_step_kernel
+
+
 class SGD:
     """Stochastic Gradient Descent (SGD) optimizer with optional momentum.
 
@@ -47,17 +98,26 @@ class SGD:
 
     Args:
         params: List of :class:`warp.array` objects to optimize. Can be ``None``
-            and set later via :meth:`set_params`.
+            and set later via :meth:`set_params`. All floating-point scalar, vector,
+            and matrix dtypes are supported.
         lr: Learning rate (step size).
         momentum: Momentum factor for accelerating SGD in relevant directions.
         dampening: Dampening factor applied to the momentum.
         weight_decay: Weight decay coefficient (L2 regularization).
         nesterov: Whether to use Nesterov momentum. Requires ``momentum > 0``
             and ``dampening = 0``.
+
+    Each call to :meth:`step` updates all contiguous parameter arrays sharing a device and a
+    scalar type with a single kernel launch, and keeps the step count in device memory, so that
+    steps can be captured in a CUDA graph. Address tables for the parameter, gradient, and momentum
+    arrays are uploaded to the device whenever one of these arrays is replaced, so an initial step
+    should be taken outside of the capture.
     """
 
     def __init__(self, params=None, lr=0.001, momentum=0.0, dampening=0.0, weight_decay=0.0, nesterov=False):
         self.b = []  # momentum buffer
+        self._tables = MultiTensorTables()
+        self._step_counters = {}
         self.set_params(params)
         self.lr = lr
         self.momentum = momentum
@@ -66,6 +126,22 @@ class SGD:
         self.nesterov = nesterov
         self.t = 0
 
+    @property
+    def t(self) -> int:
+        """Number of steps taken since the last reset.
+
+        This is the host-side count of calls to :meth:`step`; replays of captured steps only
+        advance the device-side count used by the update kernels. Setting it also sets the
+        device-side count.
+        """
+        return self._t
+
+    @t.setter
+    def t(self, value: int):
+        self._t = int(value)
+        for counter in self._step_counters.values():
+            counter.fill_(self._t)
+
     def set_params(self, params):
         """Set parameters to optimize and allocate momentum buffers.
 
@@ -88,9 +164,8 @@ class SGD:
 
     def reset_internal_state(self):
         """Reset momentum buffers and timestep to zero."""
-        for b_i in self.b:
-            b_i.zero_()
-        self.t = 0
+        wp.zero_arrays(self.b + list(self._step_counters.values()))
+        self._t = 0
 
     def step(self, grad):
         """Apply one SGD step using the provided gradients.
@@ -99,7 +174,33 @@ class SGD:
             grad: List of gradient arrays matching ``params``.
         """
         assert self.params is not None
-        for i in range(len(self.params)):
+        groups, fallback = self._tables.update(self.params, grad, b=self.b)
+
+        devices = {}
+        for group in groups:
+            step = step_counter(self._step_counters, group.device, self._t)
+            devices[group.device.alias] = step
+            wp.launch(
+                _make_sgd_multi_tensor_kernel(group.scalar_type),
+                dim=group.size,
+                inputs=[
+                    group.offsets,
+                    group.tables["params"],
+                    group.tables["grads"],
+                    group.tables["b"],
+                    step,
+                    self.lr,
+                    self.momentum,
+                    self.dampening,
+                    self.weight_decay,
+                    int(self.nesterov),
+                ],
+                device=group.device,
+            )
+
+        # non-contiguous parameters are updated one at a time
+        for i in fallback:
+            param = self.params[i]
             SGD.step_detail(
                 grad[i],
                 self.b[i],
@@ -108,10 +209,14 @@ class SGD:
                 self.dampening,
                 self.weight_decay,
                 self.nesterov,
-                self.t,
-                self.params[i],
+                self._t,
+                param,
             )
-        self.t = self.t + 1
+            devices[param.device.alias] = step_counter(self._step_counters, param.device, self._t)
+
+        for step in devices.values():
+            wp.launch(increment_step_counter, dim=1, inputs=[step], device=step.device)
+        self._t += 1
 
     @staticmethod
     def step_detail(g, b, lr, momentum, dampening, weight_decay, nesterov, t, params):
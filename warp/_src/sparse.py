@@ -46,6 +46,7 @@ __all__ = [
     "bsr_identity",
     "bsr_matrix_t",
     "bsr_mm",
+    "bsr_mm_dense",
     "bsr_mm_work_arrays",
     "bsr_mv",
     "bsr_row_index",
@@ -842,6 +843,30 @@ def _optional_ctypes_event(event: wp.Event | None):
     return None if event is None else event.cuda_event
 
 
+def _host_thread_args(device) -> tuple[int, ...]:
+    # trailing thread count taken by the native host sparse entry points, see wp.config.cpu_max_threads
+    if not device.is_cpu:
+        return ()
+
+    from warp._src.context import _resolve_cpu_threads  # noqa: PLC0415
+
+    return (_resolve_cpu_threads(None),)
+
+
+def _use_native_host_product(device, scalar_type, *arrays) -> bool:
+    # the native host products read plain contiguous float32/float64 storage and are invisible to APIC capture,
+    # which records the equivalent kernel launches instead
+    if not device.is_cpu or scalar_type not in _bsr_scalar_type_codes:
+        return False
+
+    if any(arr is not None and not arr.is_contiguous for arr in arrays):
+        return False
+
+    from warp._src.context import _get_apic_capture_for_device  # noqa: PLC0415
+
+    return _get_apic_capture_for_device(device) is None
+
+
 def _bsr_status_message(status: int) -> str:
     if status == _BSR_STATUS_SUCCESS:
         return "success"
@@ -890,6 +915,7 @@ def _bsr_try_native_compress_inplace(src: BsrMatrix, prune_numerical_zeros: bool
             True,  # compress_values
             _optional_ctypes_pointer(nnz_buf, ctype=ctypes.c_int32),
             _optional_ctypes_event(nnz_event),
+            *_host_thread_args(src.device),
         )
 
     return None
@@ -951,6 +977,7 @@ def _bsr_try_native_compress_indices_inplace(
             False,  # compress_values
             _optional_ctypes_pointer(nnz_buf, ctype=ctypes.c_int32),
             _optional_ctypes_event(nnz_event),
+            *_host_thread_args(src.device),
         )
 
     return None
@@ -1039,6 +1066,7 @@ def _bsr_set_from_triplets_native(
             ctypes.cast(dest_columns.ptr, ctypes.POINTER(ctypes.c_int32)),
             _optional_ctypes_pointer(nnz_buf, ctype=ctypes.c_int32),
             _optional_ctypes_event(nnz_event),
+            *_host_thread_args(device),
         )
 
 
@@ -3072,6 +3100,15 @@ def _bsr_scale_3d_kernel(
     values[row, br, bc] = alpha * values[row, br, bc]
 
 
+@wp.kernel(module="unique")
+def _bsr_scale_2d_kernel(
+    alpha: Any,
+    values: wp.array2d(dtype=Any),
+):
+    row, col = wp.tid()
+    values[row, col] = alpha * values[row, col]
+
+
 def bsr_scale(x: BsrMatrixOrExpression, alpha: Scalar) -> BsrMatrix:
     """Perform the operation ``x := alpha * x`` on BSR matrix ``x`` and return ``x``."""
 
@@ -4125,6 +4162,36 @@ def _bsr_mm_compute_values_dispatch(
         )
         return
 
+    if (
+        x.scalar_type == z.scalar_type
+        and y.scalar_type == z.scalar_type
+        and _use_native_host_product(device, z.scalar_type, x_values, y_values, z.values)
+    ):
+        from warp._src.context import runtime  # noqa: PLC0415
+
+        runtime.core.wp_bsr_mm_values_host(
+            _bsr_scalar_type_codes[z.scalar_type],
+            z.block_shape[0],
+            x.block_shape[1],
+            z.block_shape[1],
+            alpha.value,
+            ctypes.cast(x_offsets.ptr, ctypes.POINTER(ctypes.c_int32)),
+            _optional_ctypes_pointer(x_row_counts, ctype=ctypes.c_int32),
+            ctypes.cast(x_columns.ptr, ctypes.POINTER(ctypes.c_int32)),
+            ctypes.c_void_p(x_values.ptr),
+            ctypes.cast(y_offsets.ptr, ctypes.POINTER(ctypes.c_int32)),
+            _optional_ctypes_pointer(y_row_counts, ctype=ctypes.c_int32),
+            ctypes.cast(y_columns.ptr, ctypes.POINTER(ctypes.c_int32)),
+            ctypes.c_void_p(y_values.ptr),
+            z.nrow,
+            ctypes.cast(z.offsets.ptr, ctypes.POINTER(ctypes.c_int32)),
+            _optional_ctypes_pointer(z.row_counts, ctype=ctypes.c_int32),
+            ctypes.cast(z.columns.ptr, ctypes.POINTER(ctypes.c_int32)),
+            ctypes.c_void_p(z.values.ptr),
+            *_host_thread_args(device),
+        )
+        return
+
     if (type_is_matrix(x.values.dtype) or type_is_matrix(y.values.dtype)) and not (type_is_matrix(z.values.dtype)):
         # Result block type is scalar, but operands are matrices
         # Cast result to (1x1) matrix to perform multiplication
@@ -4855,6 +4922,24 @@ def bsr_mv(
                 dim=(A.nnz, block_shape[0]),
                 inputs=[alpha, A.nrow, A.offsets, A.row_counts, A.columns, A.scalar_values, x_view, y_view],
             )
+    elif not use_tiles and _use_native_host_product(device, A.scalar_type, A.values, x_view, y_view):
+        from warp._src.context import runtime  # noqa: PLC0415
+
+        runtime.core.wp_bsr_mv_host(
+            _bsr_scalar_type_codes[A.scalar_type],
+            nrow,
+            block_shape[0],
+            block_shape[1],
+            ctypes.cast(A.offsets.ptr, ctypes.POINTER(ctypes.c_int32)),
+            _optional_ctypes_pointer(A.row_counts, ctype=ctypes.c_int32),
+            ctypes.cast(A.columns.ptr, ctypes.POINTER(ctypes.c_int32)),
+            ctypes.c_void_p(A.values.ptr),
+            alpha.value,
+            ctypes.c_void_p(x_view.ptr),
+            beta.value,
+            ctypes.c_void_p(y_view.ptr),
+            *_host_thread_args(device),
+        )
     elif use_tiles:
         wp.launch(
             kernel=make_bsr_mv_tiled_kernel(tile_size),
@@ -4872,3 +4957,316 @@ def bsr_mv(
         )
 
     return y
+
+
+# maximum number of right-hand-side columns accumulated by each thread of the sparse-dense products
+_BSR_MM_DENSE_MAX_RHS_CHUNK = 8
+
+
+def _bsr_mm_dense_rhs_chunk(rhs_count: int) -> int:
+    # round up to a power of two to limit the number of kernel variants
+    return min(_BSR_MM_DENSE_MAX_RHS_CHUNK, 1 << max(rhs_count - 1, 0).bit_length())
+
+
+@cache
+def make_bsr_mm_dense_kernel(block_cols: int, rhs_chunk: int, scalar_type: type):
+    acc_type = wp.types.vector(length=rhs_chunk, dtype=scalar_type)
+
+    @wp.kernel(enable_backward=False, module="unique")
+    def bsr_mm_dense_kernel(
+        alpha: Any,
+        A_offsets: wp.array(dtype=int),
+        A_row_counts: wp.array(dtype=int),
+        A_columns: wp.array(dtype=int),
+        A_values: wp.array3d(dtype=Any),
+        x: wp.array2d(dtype=Any),
+        beta: Any,
+        y: wp.array2d(dtype=Any),
+    ):
+        row, subrow, chunk = wp.tid()
+
+        block_rows = A_values.shape[1]
+
+        yi = row * block_rows + subrow
+        j_beg = chunk * rhs_chunk
+        rhs_count = wp.min(rhs_chunk, y.shape[1] - j_beg)
+
+        scalar_zero = scalar_type(0)
+        v = acc_type()
+
+        if alpha != scalar_zero:
+            # each matrix coefficient is read once for all the columns of the chunk
+            beg = A_offsets[row]
+            end = _bsr_row_end(A_offsets, A_row_counts, row)
+            for block in range(beg, end):
+                xs = A_columns[block] * block_cols
+                for col in range(wp.static(block_cols)):
+                    a = A_values[block, subrow, col]
+                    for j in range(wp.static(rhs_chunk)):
+                        if j < rhs_count:
+                            v[j] += a * x[xs + col, j_beg + j]
+            v *= alpha
+
+        for j in range(wp.static(rhs_chunk)):
+            if j < rhs_count:
+                if beta != scalar_zero:
+                    v[j] += beta * y[yi, j_beg + j]
+                y[yi, j_beg + j] = v[j]
+
+    return bsr_mm_dense_kernel
+
+
+@cache
+def make_bsr_mm_dense_tiled_kernel(tile_size: int, rhs_chunk: int, scalar_type: type):
+    acc_type = wp.types.vector(length=rhs_chunk, dtype=scalar_type)
+
+    @wp.kernel(enable_backward=False, module="unique")
+    def bsr_mm_dense_tiled_kernel(
+        alpha: Any,
+        A_offsets: wp.array(dtype=int),
+        A_row_counts: wp.array(dtype=int),
+        A_columns: wp.array(dtype=int),
+        A_values: wp.array3d(dtype=Any),
+        x: wp.array2d(dtype=Any),
+        beta: Any,
+        y: wp.array2d(dtype=Any),
+    ):
+        row, subrow, chunk, lane = wp.tid()
+
+        scalar_zero = scalar_type(0)
+        block_rows = A_values.shape[1]
+        block_cols = A_values.shape[2]
+
+        yi = row * block_rows + subrow
+        j_beg = chunk * rhs_chunk
+        rhs_count = wp.min(rhs_chunk, y.shape[1] - j_beg)
+
+        lane_sum = acc_type()
+
+        if alpha != scalar_zero:
+            block_beg = A_offsets[row]
+            col_count = _bsr_row_count(A_offsets, A_row_counts, row) * block_cols
+
+            for col in range(lane, col_count, tile_size):
+                block = col // block_cols
+                block_col = col - block * block_cols
+                block += block_beg
+
+                xi = A_columns[block] * block_cols + block_col
+                a = A_values[block, subrow, block_col]
+                for j in range(wp.static(rhs_chunk)):
+                    if j < rhs_count:
+                        lane_sum[j] += a * x[xi, j_beg + j]
+
+        subrow_sum = wp.tile_sum(wp.tile(lane_sum, preserve_type=True))[0]
+
+        for j in range(lane, rhs_count, tile_size):
+            v = alpha * subrow_sum[j]
+            if beta != scalar_zero:
+                v += beta * y[yi, j_beg + j]
+            y[yi, j_beg + j] = v
+
+    return bsr_mm_dense_tiled_kernel
+
+
+@cache
+def make_bsr_mm_dense_transpose_kernel(block_rows: int, rhs_chunk: int, scalar_type: type):
+    acc_type = wp.types.vector(length=rhs_chunk, dtype=scalar_type)
+
+    @wp.kernel(enable_backward=False, module="unique")
+    def bsr_mm_dense_transpose_kernel(
+        alpha: Any,
+        A_row_count: int,
+        A_offsets: wp.array(dtype=int),
+        A_row_counts: wp.array(dtype=int),
+        A_columns: wp.array(dtype=int),
+        A_values: wp.array3d(dtype=Any),
+        x: wp.array2d(dtype=Any),
+        y: wp.array2d(dtype=Any),
+    ):
+        block, subcol, chunk = wp.tid()
+
+        row = bsr_row_index(A_offsets, A_row_count, block, A_row_counts)
+        if row == -1:
+            return
+
+        block_cols = A_values.shape[2]
+        j_beg = chunk * rhs_chunk
+        rhs_count = wp.min(rhs_chunk, y.shape[1] - j_beg)
+
+        col_sum = acc_type()
+        for subrow in range(wp.static(block_rows)):
+            a = A_values[block, subrow, subcol]
+            xi = row * block_rows + subrow
+            for j in range(wp.static(rhs_chunk)):
+                if j < rhs_count:
+                    col_sum[j] += a * x[xi, j_beg + j]
+
+        yi = A_columns[block] * block_cols + subcol
+        for j in range(wp.static(rhs_chunk)):
+            if j < rhs_count:
+                wp.atomic_add(y, yi, j_beg + j, alpha * col_sum[j])
+
+    return bsr_mm_dense_transpose_kernel
+
+
+def bsr_mm_dense(
+    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]],
+    x: Array[Scalar],
+    y: Array[Scalar] | None = None,
+    alpha: Scalar = 1.0,
+    beta: Scalar = 0.0,
+    transpose: bool = False,
+    work_buffer: Array[Scalar] | None = None,
+    tile_size: int = 0,
+) -> Array[Scalar]:
+    """Perform the sparse-dense matrix product ``y := alpha * A * x + beta * y`` and return ``y``.
+
+    This is equivalent to calling :func:`bsr_mv` for each column of ``x``, but reads the
+    sparse matrix topology and values once for several columns at a time, which is
+    considerably faster when multiplying the same matrix with many vectors.
+
+    The ``x`` and ``y`` arrays are allowed to alias.
+
+    Args:
+        A: Read-only, left matrix operand of the matrix product.
+        x: Read-only, right dense operand of the matrix product. Must be a 2D array of shape ``(A.shape[1], k)``
+          with the scalar type of ``A``, or ``(A.shape[0], k)`` if ``transpose`` is ``True``.
+        y: Mutable affine operand and result array of shape ``(A.shape[0], k)``, or ``(A.shape[1], k)`` if ``transpose``
+          is ``True``. If ``y`` is not provided, it will be allocated and treated as zero.
+        alpha: Uniform scaling factor for ``x``. If zero, ``x`` will not be read and may be left uninitialized.
+        beta: Uniform scaling factor for ``y``. If zero, ``y`` will not be read and may be left uninitialized.
+        transpose: If ``True``, use the transpose of the matrix ``A``. In this case the result is **non-deterministic**.
+        work_buffer: Temporary storage is required if and only if ``x`` and ``y`` are the same array.
+          If provided, the ``work_buffer`` array will be used for this purpose,
+          otherwise a temporary allocation will be performed.
+        tile_size: If a positive integer, use tiles of this size to compute the matrix product on CUDA devices.
+          If negative, disable tile-based computation. Defaults to ``0``, which determines whether to
+          use tiles using an heuristic based on the matrix shape and number of non-zeros.
+
+    See Also:
+        :func:`bsr_mv`.
+    """
+
+    A, A_scale = _extract_matrix_and_scale(A)
+    alpha *= A_scale
+
+    if transpose:
+        block_shape = A.block_shape[1], A.block_shape[0]
+        nrow, ncol = A.shape[1], A.shape[0]
+    else:
+        block_shape = A.block_shape
+        nrow, ncol = A.shape
+
+    if x.ndim != 2:
+        raise ValueError(f"'x' must be a 2D array, got {x.ndim} dimensions")
+
+    rhs_count = x.shape[1]
+
+    if y is None:
+        # If no output array is provided, allocate one for convenience
+        y = wp.empty(shape=(nrow, rhs_count), device=A.values.device, dtype=A.scalar_type)
+        beta = 0.0
+
+    alpha = A.scalar_type(alpha)
+    beta = A.scalar_type(beta)
+
+    device = A.values.device
+    if A.values.device != x.device or A.values.device != y.device:
+        raise ValueError(
+            f"A, x, and y must reside on the same device, got {A.values.device}, {x.device} and {y.device}"
+        )
+
+    if x.dtype != A.scalar_type or y.dtype != A.scalar_type:
+        raise ValueError(
+            f"x and y must have the scalar type of A, {type_repr(A.scalar_type)}, "
+            f"got {type_repr(x.dtype)} and {type_repr(y.dtype)}"
+        )
+    if x.shape[0] != ncol:
+        raise ValueError(f"Incompatible 'x' array for bsr_mm_dense, expected {ncol} rows, got {x.shape[0]}")
+    if y.shape != (nrow, rhs_count):
+        raise ValueError(f"Incompatible 'y' array for bsr_mm_dense, expected shape {(nrow, rhs_count)}, got {y.shape}")
+
+    if rhs_count == 0 or nrow == 0:
+        return y
+
+    if x.ptr == y.ptr:
+        # Aliasing case, need temporary storage
+        if work_buffer is None:
+            work_buffer = wp.empty_like(y)
+        elif work_buffer.shape != y.shape:
+            raise ValueError(f"Work buffer must have the shape of y, {y.shape}, got {work_buffer.shape}")
+        elif work_buffer.dtype != y.dtype:
+            raise ValueError(
+                f"Work buffer must have same data type as y, {type_repr(y.dtype)} vs {type_repr(work_buffer.dtype)}"
+            )
+
+        # Save old y values before overwriting array
+        wp.copy(dest=work_buffer, src=y)
+        x = work_buffer
+
+    rhs_chunk = _bsr_mm_dense_rhs_chunk(rhs_count)
+    chunk_count = (rhs_count + rhs_chunk - 1) // rhs_chunk
+
+    # heuristic to use tiled version for long rows, tiles are only used on CUDA devices
+    if not device.is_cuda or tile_size < 0:
+        use_tiles = False
+    elif tile_size > 0:
+        use_tiles = True
+    else:
+        tile_size = 64
+        use_tiles = A.nnz * A.block_size > 2 * tile_size * A.shape[0]
+
+    if transpose:
+        if beta.value == 0.0:
+            y.zero_()
+        elif beta.value != 1.0:
+            wp.launch(
+                kernel=_bsr_scale_2d_kernel,
+                device=y.device,
+                dim=y.shape,
+                inputs=[beta, y],
+            )
+        if alpha.value != 0.0:
+            wp.launch(
+                kernel=make_bsr_mm_dense_transpose_kernel(block_shape[1], rhs_chunk, A.scalar_type),
+                device=device,
+                dim=(A.nnz, block_shape[0], chunk_count),
+                inputs=[alpha, A.nrow, A.offsets, A.row_counts, A.columns, A.scalar_values, x, y],
+            )
+    elif not use_tiles and _use_native_host_product(device, A.scalar_type, A.values, x, y):
+        from warp._src.context import runtime  # noqa: PLC0415
+
+        runtime.core.wp_bsr_mm_dense_host(
+            _bsr_scalar_type_codes[A.scalar_type],
+            A.nrow,
+            block_shape[0],
+            block_shape[1],
+            ctypes.cast(A.offsets.ptr, ctypes.POINTER(ctypes.c_int32)),
+            _optional_ctypes_pointer(A.row_counts, ctype=ctypes.c_int32),
+            ctypes.cast(A.columns.ptr, ctypes.POINTER(ctypes.c_int32)),
+            ctypes.c_void_p(A.values.ptr),
+            alpha.value,
+            ctypes.c_void_p(x.ptr),
+            beta.value,
+            ctypes.c_void_p(y.ptr),
+            rhs_count,
+            *_host_thread_args(device),
+        )
+    elif use_tiles:
+        wp.launch(
+            kernel=make_bsr_mm_dense_tiled_kernel(tile_size, rhs_chunk, A.scalar_type),
+            device=device,
+            dim=(A.nrow, block_shape[0], chunk_count, tile_size),
+            block_dim=tile_size,
+            inputs=[alpha, A.offsets, A.row_counts, A.columns, A.scalar_values, x, beta, y],
+        )
+    else:
+        wp.launch(
+            kernel=make_bsr_mm_dense_kernel(block_shape[1], rhs_chunk, A.scalar_type),
+            device=device,
+            dim=(A.nrow, block_shape[0], chunk_count),
+            inputs=[alpha, A.offsets, A.row_counts, A.columns, A.scalar_values, x, beta, y],
+        )
+
+    return y
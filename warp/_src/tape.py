@@ -3,7 +3,11 @@
 
 from __future__ import annotations
 
+import math
+import weakref
 from collections import defaultdict, namedtuple
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 import warp as wp
 from warp._src.logger import log_warning
@@ -39,6 +43,20 @@ class Tape:
 
     """
 
+    class CheckpointStats(NamedTuple):
+        """Memory and recomputation statistics of the checkpointed segments of a :class:`Tape`."""
+
+        segments: int
+        """Number of checkpointed segments recorded on the tape."""
+        boundary_arrays: int
+        """Number of distinct arrays kept alive by the segments, i.e. their arguments, results, and input copies."""
+        boundary_bytes: int
+        """Total size in bytes of the arrays kept alive by the segments, excluding their gradients."""
+        forward_launches: int
+        """Number of kernel launches run inside the segments during the forward pass."""
+        recomputed_launches: int
+        """Number of kernel launches run again to recompute the segments during the last backward pass."""
+
     def __init__(self):
         self.gradients = {}
         self.launches = []
@@ -46,6 +64,14 @@ class Tape:
 
         self.loss = None
 
+        # arrays of the functions recorded with record_func(), by launch index
+        self._func_arrays = {}
+        # (cache key, launches) of the last schedule computed by _get_backward_schedule()
+        self._backward_schedule = None
+        # adjoint launches reused by backward() after compile_backward()
+        self._backward_plan_enabled = False
+        self._backward_plan = None
+
     def __enter__(self):
         wp._src.context.init()
 
@@ -67,7 +93,9 @@ class Tape:
     #
     #  adj_tensor = tape.gradients[tensor]
     #
-    def backward(self, loss: wp.array | None = None, grads: dict[wp.array, wp.array] | None = None):
+    def backward(
+        self, loss: wp.array | None = None, grads: dict[wp.array, wp.array] | None = None, prune: bool = False
+    ):
         """Evaluate the backward pass of the recorded operations on the tape.
 
         A single-element array ``loss`` or a dictionary of arrays ``grads``
@@ -84,6 +112,7 @@ class Tape:
         Args:
             loss: A single-element array that holds the loss function value whose gradient is to be computed
             grads: A dictionary of arrays that map from Warp arrays to their incoming gradients
+            prune: Whether to skip the recorded launches that cannot propagate the gradients of ``loss`` or ``grads``.
 
         Note:
             When ``wp.config.verify_autograd_array_access`` is enabled, the read flags of the
@@ -92,6 +121,15 @@ class Tape:
             per array, so writes are then also no longer flagged against another tape that read
             the same arrays and has not yet run its own backward pass, or against a second
             ``backward()`` call on this tape.
+
+        Note:
+            If ``prune`` is ``True`` and ``loss`` or ``grads`` is given, the recorded launches whose adjoints cannot
+            propagate their gradients, e.g. launches that only compute other outputs or that have no arrays with
+            gradients, are skipped. Gradients assigned manually to other arrays beforehand are then not propagated,
+            so pass them in ``grads`` as well. Functions recorded with :meth:`record_func` without any arrays are
+            always run. The pruned schedule is reused by later calls with the same
+            incoming gradients until new operations are recorded or the tape is reset, so gradient arrays
+            should not be added to or replaced on recorded arrays in the meantime.
         """
         # if scalar loss is specified then initialize
         # a 'seed' array for it, with gradient of one
@@ -118,60 +156,96 @@ class Tape:
                     # ensure we can capture this backward pass in a CUDA graph
                     a.grad.assign(g)
 
-        # run launches backwards
-        for launch in reversed(self.launches):
-            if callable(launch):
-                launch()
+        seeds = None
+        if prune and (loss or grads):
+            seeds = [loss] if loss else []
+            if grads:
+                seeds.extend(grads.keys())
 
-            else:
-                # kernel option takes precedence over module option
-                enable_backward = launch[0].options.get("enable_backward")
-                if enable_backward is False:
-                    msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
-                    log_warning(msg)
-                elif enable_backward is None:
-                    enable_backward = launch[0].module.options.get("enable_backward")
-                    if enable_backward is False:
-                        msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
-                        log_warning(msg)
-
-                kernel = launch[0]
-                dim = launch[1]
-                max_blocks = launch[2]
-                inputs = launch[3]
-                outputs = launch[4]
-                device = launch[5]
-                block_dim = launch[6]
-
-                adj_inputs = []
-                adj_outputs = []
-
-                # lookup adjoint inputs
-                for a in inputs:
-                    adj_inputs.append(self.get_adjoint(a))
-
-                # lookup adjoint outputs, todo: only allocate outputs if necessary
-                for a in outputs:
-                    adj_outputs.append(self.get_adjoint(a))
-
-                if enable_backward:
-                    wp.launch(
-                        kernel=kernel,
-                        dim=dim,
-                        inputs=inputs,
-                        outputs=outputs,
-                        adj_inputs=adj_inputs,
-                        adj_outputs=adj_outputs,
-                        device=device,
-                        adjoint=True,
-                        max_blocks=max_blocks,
-                        block_dim=block_dim,
-                    )
+        # run launches backwards
+        schedule = self._get_backward_schedule(seeds)
+        if self._backward_plan_enabled:
+            plan = self._backward_plan
+            if plan is None or not plan.matches(schedule):
+                plan = self._backward_plan = _BackwardPlan(self, schedule)
+            plan.launch(self, schedule)
+        else:
+            for launch in schedule:
+                if callable(launch):
+                    launch()
+                else:
+                    self._launch_backward(launch)
 
         # reads are consumed; see the Note in the docstring
         if wp.config.verify_autograd_array_access:
             self._reset_array_read_flags()
 
+    def _launch_backward(self, launch: list, record_cmd: bool = False) -> wp.Launch | None:
+        """Launch the adjoint of a recorded kernel launch, or return it as a :class:`warp.Launch` if ``record_cmd``."""
+        # kernel option takes precedence over module option
+        enable_backward = launch[0].options.get("enable_backward")
+        if enable_backward is False:
+            msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is configured with the option 'enable_backward=False'."
+            log_warning(msg)
+        elif enable_backward is None:
+            enable_backward = launch[0].module.options.get("enable_backward")
+            if enable_backward is False:
+                msg = f"Running the tape backwards may produce incorrect gradients because recorded kernel {launch[0].key} is defined in a module with the option 'enable_backward=False' set."
+                log_warning(msg)
+
+        kernel = launch[0]
+        dim = launch[1]
+        max_blocks = launch[2]
+        inputs = launch[3]
+        outputs = launch[4]
+        device = launch[5]
+        block_dim = launch[6]
+
+        adj_inputs = []
+        adj_outputs = []
+
+        # lookup adjoint inputs
+        for a in inputs:
+            adj_inputs.append(self.get_adjoint(a))
+
+        # lookup adjoint outputs, todo: only allocate outputs if necessary
+        for a in outputs:
+            adj_outputs.append(self.get_adjoint(a))
+
+        if not enable_backward:
+            return None
+
+        return wp.launch(
+            kernel=kernel,
+            dim=dim,
+            inputs=inputs,
+            outputs=outputs,
+            adj_inputs=adj_inputs,
+            adj_outputs=adj_outputs,
+            device=device,
+            adjoint=True,
+            max_blocks=max_blocks,
+            block_dim=block_dim,
+            record_cmd=record_cmd,
+        )
+
+    def compile_backward(self):
+        """Reuse prebuilt adjoint launches in the following calls to :meth:`backward`.
+
+        The next call to :meth:`backward` records the adjoint of every kernel launch it runs as a
+        :class:`warp.Launch` with packed parameters, and submits consecutive launches on the same
+        device with a single :class:`warp.LaunchList` call. Later calls reuse these launches as long
+        as the tape holds the same sequence of kernels, launch dimensions, and devices, also after
+        :meth:`reset` when the same forward pass is recorded again, e.g. in a training loop. Only the
+        parameters whose arrays or values changed since the previous call are packed again, which
+        removes most of the Python overhead of the backward pass. When the recorded launches differ,
+        the adjoint launches are rebuilt.
+
+        Arguments are compared by identity, so values that are modified in place, such as
+        :func:`warp.struct` instances whose fields are reassigned, should be replaced by new objects.
+        """
+        self._backward_plan_enabled = True
+
     # record a kernel launch on the tape
     def record_launch(self, kernel, dim, max_blocks, inputs, outputs, device, block_dim=0, metadata=None):
         if metadata is None:
@@ -184,9 +258,10 @@ class Tape:
 
         Args:
             backward (Callable): A callable Python object (can be any function) that will be executed in the backward pass.
-            arrays (list): A list of arrays that are used by the backward function. The tape keeps track of these to be able to zero their gradients in Tape.zero()
+            arrays (list): A list of arrays that are used by the backward function. The tape keeps track of these to be able to zero their gradients in Tape.zero() and to skip the function in Tape.backward(prune=True) if none of their gradients are needed
         """
         self.launches.append(backward)
+        self._func_arrays[len(self.launches) - 1] = arrays
 
         for a in arrays:
             if isinstance(a, wp.array) and a.grad:
@@ -196,6 +271,103 @@ class Tape:
                     f"Array {a} is not of type wp.array or is missing a gradient array. Set array parameter requires_grad=True during instantiation."
                 )
 
+    def checkpoint(self, function: Callable[..., Any], *args, copy_inputs: bool = False) -> Any:
+        """Run ``function(*args)`` as a checkpointed segment of the tape.
+
+        The kernel launches run by ``function`` are not kept on the tape, so the intermediate arrays
+        it allocates are released once it returns. Only the boundary state of the segment, ``args``
+        and the value returned by ``function``, is kept alive. During :meth:`backward`, ``function``
+        is run again with the same arguments to recompute the intermediate values, and the gradients
+        of the arrays it returned are propagated through the recomputed launches into the gradients
+        of the arrays in ``args``. Each segment is therefore evaluated twice in exchange for memory.
+
+        The recomputation expects the arrays in ``args`` to hold the same values during the backward
+        pass as when the segment was recorded, and ``function`` to be deterministic. If the arrays are
+        overwritten later in the forward pass, e.g. when state buffers are reused across steps, pass
+        ``copy_inputs=True`` to keep a copy of them that is restored before the recomputation.
+
+        See :meth:`checkpoint_steps` for checkpointing a loop of steps.
+
+        Args:
+            function: The function to run. It can launch kernels and call other Warp functions that
+                are recorded on tapes. Gradients are propagated through the arrays it returns, directly
+                or in sequences and dictionaries.
+            *args: The arguments passed to ``function``.
+            copy_inputs: Whether to copy the arrays in ``args`` and restore them before recomputing
+                the segment.
+
+        Returns:
+            The value returned by ``function``.
+        """
+        segment = _CheckpointSegment(self, function, args, copy_inputs)
+        result = segment.record()
+        self.launches.append(segment)
+        return result
+
+    def checkpoint_steps(
+        self,
+        step: Callable[[Any, int], Any],
+        state: Any,
+        num_steps: int,
+        segment_length: int | None = None,
+        copy_inputs: bool = False,
+    ) -> Any:
+        """Run ``state = step(state, i)`` for ``i`` in ``range(num_steps)`` in checkpointed segments.
+
+        Consecutive steps are grouped into segments of ``segment_length`` steps, each recorded with
+        :meth:`checkpoint`. Only the states at the segment boundaries are kept alive, and the states
+        of one segment at a time are recomputed during :meth:`backward`. The default segment length
+        of ``ceil(sqrt(num_steps))`` keeps the number of live states in ``O(sqrt(num_steps))`` if
+        ``step`` allocates a new state, at the cost of running every step twice.
+
+        Args:
+            step: The function computing the state after a step from the state before it and the
+                index of the step.
+            state: The initial state.
+            num_steps: The number of steps to run.
+            segment_length: The number of steps per segment. Longer segments keep fewer boundary
+                states alive but recompute more intermediate states at once during the backward pass.
+            copy_inputs: Whether to copy the arrays of the state at each segment boundary,
+                see :meth:`checkpoint`.
+
+        Returns:
+            The state after the last step.
+        """
+        if segment_length is None:
+            segment_length = max(1, math.isqrt(max(num_steps - 1, 0)) + 1)
+        elif segment_length < 1:
+            raise ValueError(f"segment_length must be positive, got {segment_length}")
+
+        def run_segment(state, start, stop):
+            for i in range(start, stop):
+                state = step(state, i)
+            return state
+
+        for start in range(0, num_steps, segment_length):
+            stop = min(start + segment_length, num_steps)
+            state = self.checkpoint(run_segment, state, start, stop, copy_inputs=copy_inputs)
+
+        return state
+
+    def get_checkpoint_stats(self) -> Tape.CheckpointStats:
+        """Return the memory and recomputation statistics of the segments recorded by :meth:`checkpoint`."""
+        segments = [launch for launch in self.launches if isinstance(launch, _CheckpointSegment)]
+
+        boundary = {}
+        for segment in segments:
+            for a in segment.get_boundary_arrays():
+                boundary[id(a)] = a
+
+        boundary_bytes = sum(a.size * wp._src.types.type_size_in_bytes(a.dtype) for a in boundary.values())
+
+        return Tape.CheckpointStats(
+            segments=len(segments),
+            boundary_arrays=len(boundary),
+            boundary_bytes=boundary_bytes,
+            forward_launches=sum(segment.forward_launches for segment in segments),
+            recomputed_launches=sum(segment.recomputed_launches for segment in segments),
+        )
+
     def record_scope_begin(self, scope_name, metadata=None):
         """
         Begin a scope on the tape to group operations together. Scopes are only used in the visualization functions.
@@ -244,6 +416,72 @@ class Tape:
                 if adj.args[i].is_read:
                     arg.mark_read()
 
+    def _get_backward_schedule(self, seeds: list | None) -> list:
+        """Return the recorded launches to run backward, in reverse order.
+
+        Walks the launches backward from the gradients of ``seeds`` and keeps the launches that use
+        a live gradient, i.e. a gradient that can be nonzero when their adjoint runs, or whose gradients
+        are unknown. Every launch is kept if ``seeds`` is ``None``. The other gradients used by these launches become live in turn. Arrays are matched
+        by the allocation of their gradients, so that views share the gradients of their parents.
+        """
+        seed_keys = None
+        if seeds is not None:
+            seed_keys = set()
+            for a in seeds:
+                if not _collect_gradient_keys(a, seed_keys):
+                    seed_keys = None
+                    break
+
+        cache_key = (id(self.launches), len(self.launches), None if seed_keys is None else frozenset(seed_keys))
+        if self._backward_schedule is not None and self._backward_schedule[0] == cache_key:
+            return self._backward_schedule[1]
+
+        if seed_keys is None:
+            schedule = self.launches[::-1]
+        else:
+            live = seed_keys
+            schedule = []
+            for i in range(len(self.launches) - 1, -1, -1):
+                launch = self.launches[i]
+                keys = self._get_gradient_keys(i, launch)
+                if keys is None:
+                    # unknown dependencies, any earlier gradient may be needed
+                    schedule.append(launch)
+                    live = None
+                elif live is None:
+                    if keys:
+                        schedule.append(launch)
+                elif not live.isdisjoint(keys):
+                    schedule.append(launch)
+                    live.update(keys)
+
+        self._backward_schedule = (cache_key, schedule)
+        return schedule
+
+    def _get_gradient_keys(self, index: int, launch) -> set | None:
+        """Return the keys of the gradients used by the adjoint of a recorded launch, or ``None`` if unknown.
+
+        The read and write flags of kernel arguments are only tracked when verifying array accesses
+        and do not cover every access, e.g. of tiles, so every argument is assumed to be both read
+        and written.
+        """
+        if isinstance(launch, _CheckpointSegment):
+            values = [launch.args, launch.outputs, [ref() for ref in launch.external.values()]]
+        elif callable(launch):
+            values = self._func_arrays.get(index)
+        else:
+            values = [launch[3], launch[4]]
+
+        keys = set()
+        if not _collect_gradient_keys(values, keys):
+            return None
+
+        if not keys and callable(launch) and not isinstance(launch, _CheckpointSegment):
+            # functions recorded without arrays requiring gradients may have any side effect
+            return None
+
+        return keys
+
     # returns the adjoint of a kernel parameter
     def get_adjoint(self, a):
         """Return the adjoint container for a kernel argument.
@@ -303,12 +541,17 @@ class Tape:
             self._reset_array_read_flags()
         self.launches = []
         self.scopes = []
+        self._func_arrays = {}
+        self._backward_schedule = None
+        if self._backward_plan is not None:
+            self._backward_plan.release()
         self.zero()
 
     def zero(self):
         """
         Zero out all gradients recorded on the tape.
         """
+        grads = []
         for a, g in self.gradients.items():
             if wp._src.types.is_struct(a):
                 for name in g._cls.vars:
@@ -316,9 +559,12 @@ class Tape:
                         wp._src.types.matches_array_class(g._cls.vars[name].type, wp.array)
                         and g._cls.vars[name].requires_grad
                     ):
-                        getattr(g, name).zero_()
+                        grads.append(getattr(g, name))
             else:
-                g.zero_()
+                grads.append(g)
+
+        # zero the gradients with one native call per device
+        wp.zero_arrays(grads)
 
     def _reset_array_read_flags(self):
         """Reset the read flags of all arrays recorded on the tape, including view parents."""
@@ -422,6 +668,297 @@ class Tape:
         )
 
 
+def _collect_differentiable(value, out: list) -> list:
+    """Append the arrays and struct instances in ``value`` and its nested sequences and dictionaries to ``out``."""
+    if wp._src.types.is_array(value) or wp._src.types.is_struct(value):
+        out.append(value)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _collect_differentiable(v, out)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collect_differentiable(v, out)
+    return out
+
+
+def _collect_tape_arrays(tape: Tape, out: list) -> list:
+    """Append the arrays and struct instances referenced by the launches recorded on ``tape`` to ``out``."""
+    out.extend(tape.gradients.keys())
+    for launch in tape.launches:
+        if isinstance(launch, _CheckpointSegment):
+            out.extend(ref() for ref in launch.external.values() if ref() is not None)
+            _collect_differentiable(launch.args, out)
+        elif not callable(launch):
+            _collect_differentiable(launch[3], out)
+            _collect_differentiable(launch[4], out)
+    return out
+
+
+def _collect_gradient_keys(value, out: set) -> bool:
+    """Add keys identifying the gradient allocations of the arrays in ``value`` to ``out``.
+
+    Returns ``False`` if ``value`` holds a gradient whose allocation cannot be identified.
+    """
+    if isinstance(value, wp.array):
+        grad = value.grad
+        if grad is not None:
+            while isinstance(grad._ref, wp.array):
+                grad = grad._ref
+            out.add(grad.ptr)
+    elif isinstance(value, wp.indexedarray):
+        return _collect_gradient_keys(value.data, out)
+    elif wp._src.types.is_array(value):
+        return getattr(value, "grad", None) is None
+    elif wp._src.types.is_struct(value):
+        for name in value._cls.vars:
+            if not _collect_gradient_keys(getattr(value, name), out):
+                return False
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            if not _collect_gradient_keys(v, out):
+                return False
+    elif isinstance(value, dict):
+        return _collect_gradient_keys(list(value.values()), out)
+    return True
+
+
+def _count_kernel_launches(tape: Tape) -> int:
+    count = 0
+    for launch in tape.launches:
+        if isinstance(launch, _CheckpointSegment):
+            count += launch.forward_launches
+        elif not callable(launch):
+            count += 1
+    return count
+
+
+class _CheckpointSegment:
+    """A function recorded by :meth:`Tape.checkpoint`, recomputed when the tape is run backward."""
+
+    def __init__(self, tape: Tape, function: Callable[..., Any], args: tuple, copy_inputs: bool):
+        self.tape = tape
+        self.function = function
+        self.args = args
+        self.inputs = _collect_differentiable(args, [])
+        self.input_copies = []  # (array, copy) pairs restored before the recomputation
+        self.outputs = []
+        self.external = {}  # weak references to the arrays used by the segment that it did not allocate
+        self.forward_launches = 0
+        self.recomputed_launches = 0
+
+        self.copy_inputs = copy_inputs
+
+    def _run(self) -> tuple[Any, Tape]:
+        # record the launches of the segment on a tape of its own
+        runtime = wp._src.context.runtime
+        outer_tape = runtime.tape
+        segment_tape = Tape()
+        runtime.tape = segment_tape
+        try:
+            result = self.function(*self.args)
+        finally:
+            runtime.tape = outer_tape
+
+        return result, segment_tape
+
+    def record(self) -> Any:
+        """Run the forward pass of the segment and keep its boundary state."""
+        wp._src.context.init()
+
+        if self.copy_inputs:
+            runtime = wp._src.context.runtime
+            outer_tape = runtime.tape
+            runtime.tape = None
+            try:
+                self.input_copies = [
+                    (a, wp.clone(a, requires_grad=False)) for a in self.inputs if wp._src.types.is_array(a)
+                ]
+            finally:
+                runtime.tape = outer_tape
+
+        result, segment_tape = self._run()
+        self.outputs = _collect_differentiable(result, [])
+        self.forward_launches = _count_kernel_launches(segment_tape)
+
+        # the intermediate arrays are recreated by the recomputation, while the arrays that outlive
+        # the segment tape, e.g. captured by the function, keep their identity
+        for a in _collect_tape_arrays(segment_tape, []):
+            self.external[id(a)] = weakref.ref(a)
+
+        # the segment tape and the intermediate arrays it references are released here
+        return result
+
+    def get_boundary_arrays(self) -> list:
+        arrays = [a for a in self.inputs + self.outputs if wp._src.types.is_array(a)]
+        arrays.extend(copy for _, copy in self.input_copies)
+        return arrays
+
+    def __call__(self):
+        """Recompute the segment and propagate the gradients of its results into the gradients of its arguments."""
+        if self.input_copies:
+            runtime = wp._src.context.runtime
+            outer_tape = runtime.tape
+            runtime.tape = None
+            try:
+                for a, copy in self.input_copies:
+                    wp.copy(a, copy)
+            finally:
+                runtime.tape = outer_tape
+
+        result, segment_tape = self._run()
+        self.recomputed_launches = _count_kernel_launches(segment_tape)
+
+        outputs = _collect_differentiable(result, [])
+        if len(outputs) != len(self.outputs):
+            raise RuntimeError(
+                f"Checkpointed function {getattr(self.function, '__qualname__', self.function)} returned "
+                f"{len(outputs)} arrays or structs when recomputed, but {len(self.outputs)} when recorded"
+            )
+
+        # seed the recomputed results with the gradients of the recorded ones
+        grads = {}
+        for recomputed, recorded in zip(outputs, self.outputs, strict=True):
+            if recomputed is recorded or not wp._src.types.is_array(recorded) or recorded.grad is None:
+                continue
+            grads[recomputed] = recorded.grad
+
+        segment_tape.backward(grads=grads)
+
+        # track the gradients of the arrays that outlive the segment so that Tape.zero() clears them
+        inputs = {id(a) for a in self.inputs}
+        for a, grad in segment_tape.gradients.items():
+            ref = self.external.get(id(a))
+            if id(a) in inputs or (ref is not None and ref() is a):
+                self.tape.gradients[a] = grad
+
+
+def _get_launch_signature(launch: list) -> tuple:
+    kernel, dim, max_blocks, inputs, outputs, device, block_dim = launch[:7]
+    arg_types = None
+    if kernel.is_generic:
+        arg_types = kernel.infer_argument_types([*inputs, *outputs])
+    return (kernel, dim, max_blocks, device, block_dim, len(inputs) + len(outputs), arg_types)
+
+
+def _weak_or_value(value):
+    if wp._src.types.is_array(value) or wp._src.types.is_struct(value):
+        return weakref.ref(value)
+    return value
+
+
+class _BackwardPlan:
+    """Adjoint launches of a backward schedule, built by :meth:`Tape.compile_backward`.
+
+    Kernel launches are recorded as :class:`warp.Launch` objects and grouped into
+    :class:`warp.LaunchList` steps; functions recorded on the tape run in between.
+    """
+
+    def __init__(self, tape: Tape, schedule: list):
+        self.signatures = []
+        # per schedule entry: [Launch, weak references or values of its forward and adjoint arguments] or None
+        self.commands = []
+        # callables are referenced by their index in the schedule, as they change between recordings
+        self.steps = []
+
+        batch = None
+        for i, launch in enumerate(schedule):
+            if callable(launch):
+                self.signatures.append(None)
+                self.commands.append(None)
+                self.steps.append(i)
+                batch = None
+                continue
+
+            self.signatures.append(_get_launch_signature(launch))
+            cmd = tape._launch_backward(launch, record_cmd=True)
+            if cmd is None:
+                self.commands.append(None)
+                continue
+
+            self.commands.append(
+                (cmd, [_weak_or_value(a) for a in cmd.fwd_args], [_weak_or_value(a) for a in cmd.adj_args])
+            )
+
+            if type(cmd) is not wp.Launch:
+                # e.g. deterministic launches, which run through their own launcher
+                self.steps.append(cmd)
+                batch = None
+            elif batch is not None and batch.device == cmd.device:
+                batch.append(cmd)
+            else:
+                batch = wp.LaunchList([cmd])
+                self.steps.append(batch)
+
+        self.fresh = True
+
+    def matches(self, schedule: list) -> bool:
+        if len(schedule) != len(self.signatures):
+            return False
+
+        for launch, signature in zip(schedule, self.signatures, strict=True):
+            if callable(launch):
+                if signature is not None:
+                    return False
+            elif signature is None or _get_launch_signature(launch) != signature:
+                return False
+
+        return True
+
+    def _update(self, tape: Tape, schedule: list):
+        """Repack the parameters whose arguments changed since the last launch."""
+        for launch, command in zip(schedule, self.commands, strict=True):
+            if command is None:
+                if not callable(launch):
+                    # keep tracking the gradients of skipped launches so that Tape.zero() clears them
+                    for value in (*launch[3], *launch[4]):
+                        tape.get_adjoint(value)
+                continue
+
+            cmd, fwd_refs, adj_refs = command
+            for i, value in enumerate((*launch[3], *launch[4])):
+                adj_value = tape.get_adjoint(value)
+
+                fwd_ref = fwd_refs[i]
+                adj_ref = adj_refs[i]
+                fwd_changed = (fwd_ref() if isinstance(fwd_ref, weakref.ref) else fwd_ref) is not value
+                adj_changed = (adj_ref() if isinstance(adj_ref, weakref.ref) else adj_ref) is not adj_value
+
+                # the forward parameters of arrays also hold the pointer to their gradient
+                if fwd_changed or adj_changed:
+                    cmd.set_param_at_index(i, value)
+                    fwd_refs[i] = _weak_or_value(value)
+                else:
+                    cmd.fwd_args[i] = value
+
+                if adj_changed:
+                    cmd.set_param_at_index(i, adj_value, adjoint=True)
+                    adj_refs[i] = _weak_or_value(adj_value)
+                else:
+                    cmd.adj_args[i] = adj_value
+
+    def launch(self, tape: Tape, schedule: list):
+        """Run the adjoint launches of ``schedule``, which must match the schedule the plan was built from."""
+        if self.fresh:
+            # the parameters were packed from this schedule when building the plan
+            self.fresh = False
+        else:
+            self._update(tape, schedule)
+
+        for step in self.steps:
+            if isinstance(step, int):
+                schedule[step]()
+            else:
+                step.launch()
+
+    def release(self):
+        """Drop the references to the arguments of the launches, so that :meth:`Tape.reset` frees them."""
+        for command in self.commands:
+            if command is not None:
+                cmd = command[0]
+                cmd.fwd_args[:] = [None] * len(cmd.fwd_args)
+                cmd.adj_args[:] = [None] * len(cmd.adj_args)
+
+
 class TapeVisitor:
     def emit_array_node(self, arr: wp.array, label: str, active_scope_stack: list[str], indent_level: int):
         pass
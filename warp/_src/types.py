@@ -8,8 +8,12 @@ import ctypes
 import enum
 import functools
 import inspect
+import io
 import math
+import mmap
 import operator
+import os
+import stat
 import struct
 import sys
 import types
@@ -5650,6 +5654,7 @@ class Bvh:
         constructor: BvhConstructor | str | None = None,
         groups: array | None = None,
         leaf_size: int = 1,
+        cpu_threads: int | None = None,
     ):
         """Class representing a bounding volume hierarchy.
 
@@ -5671,6 +5676,9 @@ class Bvh:
               use case. For intersection queries (e.g., AABB query), a small value like 1 (the default) is generally
               recommended for optimal performance. For closest point queries, a larger value like 4 or 8 can be more
               performant. This is an intrinsic parameter which does not impact the return value of the query method.
+            cpu_threads: Maximum number of host threads used by the ``"sah"`` and ``"median"`` constructors
+              to build a CPU tree. ``0`` uses every hardware thread. If ``None``,
+              :attr:`warp.config.cpu_max_threads` is used. The tree is identical for any thread count.
 
         Note:
             **Explanation of BVH constructors:**
@@ -5793,6 +5801,7 @@ class Bvh:
                 constructor,
                 get_data(groups),
                 leaf_size,
+                warp._src.context._resolve_cpu_threads(cpu_threads),
             )
         else:
             self.id = self.runtime.core.wp_bvh_create_device(
@@ -5841,7 +5850,7 @@ class Bvh:
             self.runtime.core.wp_bvh_refit_device(self.id)
             self.runtime.verify_cuda_device(self.device)
 
-    def rebuild(self, constructor: str | None = None):
+    def rebuild(self, constructor: str | None = None, cpu_threads: int | None = None):
         """Rebuild the BVH hierarchy **in place** from the current ``lowers``/``uppers`` arrays.
 
         This method does not allocate new memory; it reuses the existing BVH buffers.
@@ -5861,6 +5870,9 @@ class Bvh:
                 warning. On CUDA, in-place rebuild supports ``"lbvh"`` only; other values fall
                 back to ``"lbvh"`` with a warning. In-place rebuild does not support switching to
                 or from ``"cubql"``; create a new BVH instead.
+            cpu_threads (int | None): Maximum number of host threads used to rebuild a CPU tree with
+                ``"sah"`` or ``"median"``. ``0`` uses every hardware thread. If ``None``,
+                :attr:`warp.config.cpu_max_threads` is used. Ignored for CUDA trees.
 
         Notes:
             - The native CUDA LBVH rebuild path is CUDA graph-capture safe: previously captured graphs
@@ -5892,7 +5904,7 @@ class Bvh:
                 raise ValueError("Cannot rebuild a non-cuBQL BVH with constructor='cubql'; create a new BVH instead")
 
             if self.device.is_cpu:
-                self.runtime.core.wp_bvh_rebuild_host(self.id, constructor)
+                self.runtime.core.wp_bvh_rebuild_host(self.id, constructor, 1)
             else:
                 self.runtime.core.wp_bvh_rebuild_device(self.id)
                 self.runtime.verify_cuda_device(self.device)
@@ -5907,7 +5919,9 @@ class Bvh:
                     "LBVH constructor is not available for a CPU tree. Falling back to SAH constructor.", stacklevel=2
                 )
                 constructor = BvhConstructor.SAH
-            self.runtime.core.wp_bvh_rebuild_host(self.id, constructor)
+            self.runtime.core.wp_bvh_rebuild_host(
+                self.id, constructor, warp._src.context._resolve_cpu_threads(cpu_threads)
+            )
             self._constructor = constructor
         else:
             if constructor != BvhConstructor.LBVH:
@@ -5945,6 +5959,7 @@ class Mesh:
         bvh_constructor: BvhConstructor | str | None = None,
         bvh_leaf_size: int | None = None,
         groups: array | None = None,
+        cpu_threads: int | None = None,
     ):
         """Class representing a triangle mesh.
 
@@ -5970,6 +5985,8 @@ class Mesh:
               value based on the ``bvh_constructor`` will be used.
             groups: Optional array of triangle group indices of data type :class:`warp.int32`.
               Should be a 1D array with shape ``(num_tris)``.
+            cpu_threads: Maximum number of host threads used to build the BVH of a CPU mesh
+              (see the docstring of :class:`Bvh` for more details).
         """
         if points.device != indices.device:
             raise RuntimeError("Mesh points and indices must live on the same device")
@@ -6042,6 +6059,7 @@ class Mesh:
                 bvh_constructor,
                 ctypes.c_void_p(groups.ptr) if groups else ctypes.c_void_p(0),
                 bvh_leaf_size,
+                warp._src.context._resolve_cpu_threads(cpu_threads),
             )
         else:
             self.id = self.runtime.core.wp_mesh_create_device(
@@ -6560,46 +6578,225 @@ class Volume:
 
         return array(ptr=info.ptr, dtype=dtype, shape=value_count, device=self.device)
 
-    @classmethod
-    def load_from_nvdb(cls, file_or_buffer, device=None) -> Volume:
-        """Create a :class:`Volume` object from a serialized NanoVDB file or in-memory buffer.
+    class FileGridInfo(NamedTuple):
+        """Metadata of a grid stored in a NanoVDB file, as returned by :meth:`Volume.get_nvdb_grids`"""
 
-        Returns:
-            A :class:`Volume` object.
+        name: str
+        """Grid name"""
+        grid_index: int
+        """Index of this grid in the file"""
+        size_in_bytes: int
+        """Size of this grid's data once loaded, in bytes"""
+        file_size: int
+        """Size of this grid's data in the file, in bytes"""
+        voxel_count: int
+        """Number of active voxels in the grid"""
+        codec: str
+        """Compression codec of the grid's data, one of ``"none"``, ``"zip"``, or ``"blosc"``"""
+
+    _NVDB_CODECS: ClassVar[tuple[str, ...]] = ("none", "zip", "blosc")
+    _NVDB_FILE_HEADER_SIZE: ClassVar[int] = 16
+    _NVDB_FILE_METADATA_SIZE: ClassVar[int] = 176
+    # NanoVDB grids must be 32-byte aligned in memory
+    _NVDB_DATA_ALIGNMENT: ClassVar[int] = 32
+
+    @staticmethod
+    def _map_nvdb(file_or_buffer) -> tuple[np.ndarray, builtins.bool]:
+        """Return the contents of a NanoVDB file or buffer as a byte array, without reading files into memory.
+
+        Regular files are memory-mapped copy-on-write, so that volumes aliasing the mapping may be written to
+        without modifying the file. Other streams, such as decompressing file objects or pipes, are read.
+        The second returned value tells whether the contents are memory-mapped.
         """
+
+        if isinstance(file_or_buffer, (str, os.PathLike)):
+            with open(file_or_buffer, "rb") as f:
+                return Volume._map_nvdb(f)
+
+        # only raw and buffered file objects read the bytes of their file descriptor
+        if isinstance(file_or_buffer, (io.FileIO, io.BufferedReader)):
+            try:
+                fileno = file_or_buffer.fileno()
+                offset = file_or_buffer.tell()
+                file_stat = os.fstat(fileno)
+            except OSError:
+                file_stat = None
+
+            if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+                if file_stat.st_size <= offset:
+                    raise RuntimeError("NanoVDB signature not found")
+
+                # the mapping holds its own reference to the file and stays valid once the file is closed
+                mapping = mmap.mmap(fileno, 0, access=mmap.ACCESS_COPY)
+                return np.frombuffer(mapping, dtype=np.uint8)[offset:], True
+
         try:
             data = file_or_buffer.read()
         except AttributeError:
+            # bytes-like object
             data = file_or_buffer
+        return np.frombuffer(data, dtype=np.uint8), False
+
+    @staticmethod
+    def _parse_nvdb(data: np.ndarray) -> tuple[list[Volume.FileGridInfo], list[list[tuple[int, int, int]]]]:
+        """Parse the header of a NanoVDB file.
+
+        Returns:
+            The metadata of each grid in the file, and for each grid the list of ``(offset, size, uncompressed_size)``
+            chunks holding its data in ``data``. Uncompressed grids are made of a single chunk.
+        """
+
+        if len(data) < Volume._NVDB_FILE_HEADER_SIZE:
+            raise RuntimeError("NanoVDB signature not found")
 
-        magic, version, grid_count, codec = struct.unpack("<QIHH", data[0:16])
+        magic, version, grid_count, codec = struct.unpack_from("<QIHH", data, 0)
         if magic not in (0x304244566F6E614E, 0x324244566F6E614E):  # NanoVDB0 or NanoVDB2 in hex, little-endian
             raise RuntimeError("NanoVDB signature not found")
         if version >> 21 != 32:  # checking major version
             raise RuntimeError("Unsupported NanoVDB version")
+        if codec >= len(Volume._NVDB_CODECS):
+            raise RuntimeError(f"Unsupported codec code: {codec}")
+
+        grid_infos = []
+        offset = Volume._NVDB_FILE_HEADER_SIZE
+        for grid_index in range(grid_count):
+            grid_size, file_size, _name_key, voxel_count = struct.unpack_from("<QQQQ", data, offset)
+            name_size = struct.unpack_from("<I", data, offset + 136)[0]
+            offset += Volume._NVDB_FILE_METADATA_SIZE
+
+            name = bytes(data[offset : offset + name_size]).split(b"\x00", 1)[0].decode("utf-8", errors="replace")
+            offset += name_size
+
+            grid_infos.append(
+                Volume.FileGridInfo(name, grid_index, grid_size, file_size, voxel_count, Volume._NVDB_CODECS[codec])
+            )
+
+        grid_chunks = []
+        for info in grid_infos:
+            chunks = []
+            remaining = info.size_in_bytes
+            while remaining > 0:
+                if codec == 0:
+                    chunk_size = remaining
+                else:
+                    chunk_size = struct.unpack_from("<Q", data, offset)[0]
+                    offset += 8
+
+                if codec == 2:
+                    # large grids are split into several blosc chunks, each recording its uncompressed size
+                    uncompressed_size = struct.unpack_from("<I", data, offset + 4)[0]
+                else:
+                    uncompressed_size = remaining
+
+                if offset + chunk_size > len(data) or not 0 < uncompressed_size <= remaining:
+                    raise RuntimeError(f"NanoVDB grid '{info.name}' is truncated or corrupted")
+
+                chunks.append((offset, chunk_size, uncompressed_size))
+                offset += chunk_size
+                remaining -= uncompressed_size
+
+            grid_chunks.append(chunks)
+
+        return grid_infos, grid_chunks
+
+    @classmethod
+    def get_nvdb_grids(cls, file_or_buffer) -> list[Volume.FileGridInfo]:
+        """Return the metadata of the grids stored in a serialized NanoVDB file or in-memory buffer.
+
+        Only the file header is read; the grid data is neither loaded nor decompressed.
+
+        Args:
+            file_or_buffer: Path of a NanoVDB file, file object opened in binary mode, or bytes-like object.
+
+        Returns:
+            A list of :class:`Volume.FileGridInfo`, one per grid in the file.
+        """
+
+        data, _ = cls._map_nvdb(file_or_buffer)
+        grid_infos, _ = cls._parse_nvdb(data)
+        return grid_infos
+
+    @classmethod
+    def load_from_nvdb(cls, file_or_buffer, device=None, grid: int | str | None = None) -> Volume:
+        """Create a :class:`Volume` object from a serialized NanoVDB file or in-memory buffer.
+
+        Regular files are memory-mapped rather than read into memory. Uncompressed grids loaded on the CPU alias
+        the mapped file, without any copy, while other grids are copied or decompressed straight into
+        the volume's buffer, decompressing chunks in parallel.
+
+        Args:
+            file_or_buffer: Path of a NanoVDB file, file object opened in binary mode, or bytes-like object.
+            device: Device of the returned :class:`Volume`. If not provided, the current Warp device is assumed.
+            grid: Name or index of the grid to load, see :meth:`get_nvdb_grids`.
+              If not provided, all the grids are loaded and the first one is returned;
+              the other ones can be accessed using :meth:`load_next_grid`.
+
+        Returns:
+            A :class:`Volume` object.
+        """
+
+        device = warp.get_device(device)
+
+        data, is_mapped = cls._map_nvdb(file_or_buffer)
+        grid_infos, grid_chunks = cls._parse_nvdb(data)
+
+        if not grid_infos:
+            raise RuntimeError("NanoVDB file does not contain any grid")
+
+        if grid is None:
+            selected = range(len(grid_infos))
+        else:
+            if isinstance(grid, str):
+                grid_index = next((info.grid_index for info in grid_infos if info.name == grid), None)
+                if grid_index is None:
+                    raise ValueError(f"NanoVDB file does not contain a grid named '{grid}'")
+            else:
+                grid_index = grid
+                if not -len(grid_infos) <= grid_index < len(grid_infos):
+                    raise ValueError(f"Grid index {grid_index} is out of range for {len(grid_infos)} grids")
+            selected = (range(len(grid_infos))[grid_index],)
+
+        chunks = [chunk for grid_index in selected for chunk in grid_chunks[grid_index]]
+        size = sum(grid_infos[grid_index].size_in_bytes for grid_index in selected)
+
+        if grid_infos[0].codec == "none":
+            # grids are stored contiguously
+            start = chunks[0][0]
+            grid_data = data[start : start + size]
+            cls._check_nvdb_grid_magic(grid_data)
+
+            if device.is_cpu and is_mapped and grid_data.ctypes.data % cls._NVDB_DATA_ALIGNMENT == 0:
+                data_array = array(ptr=grid_data.ctypes.data, dtype=uint8, shape=size, device=device)
+                volume = cls(data_array, copy=False)
+                # keep the mapping alive for as long as the volume aliases it
+                volume._grid_data = grid_data
+                return volume
+
+            data_array = array(grid_data, dtype=uint8, device=device)
+        else:
+            data_array = warp.empty(size, dtype=uint8, device="cpu")
+            grid_data = data_array.numpy()
+            cls._decompress_nvdb(data, chunks, grid_infos[0].codec, grid_data)
+            cls._check_nvdb_grid_magic(grid_data)
+
+            if not device.is_cpu:
+                data_array = data_array.to(device)
+
+        volume = cls(data_array, copy=False)
+        volume._grid_data = data_array
+        return volume
+
+    @staticmethod
+    def _check_nvdb_grid_magic(grid_data: np.ndarray):
+        magic = struct.unpack_from("<Q", grid_data, 0)[0]
+        if magic not in (0x304244566F6E614E, 0x314244566F6E614E):  # NanoVDB0 or NanoVDB1 in hex, little-endian
+            raise RuntimeError("NanoVDB signature not found on grid!")
+
+    @staticmethod
+    def _decompress_nvdb(data: np.ndarray, chunks: list[tuple[int, int, int]], codec: str, dest: np.ndarray):
+        """Decompress ``chunks`` of ``data`` into consecutive ranges of ``dest``, in parallel when possible."""
 
-        # Skip over segment metadata, store total payload size
-        grid_data_offset = 16  # sizeof(FileHeader)
-        tot_file_size = 0
-        for _ in range(grid_count):
-            grid_file_size = struct.unpack("<Q", data[grid_data_offset + 8 : grid_data_offset + 16])[0]
-            tot_file_size += grid_file_size
-
-            grid_name_size = struct.unpack("<I", data[grid_data_offset + 136 : grid_data_offset + 140])[0]
-            grid_data_offset += 176 + grid_name_size  # sizeof(FileMetadata) + grid name
-
-        file_end = grid_data_offset + tot_file_size
-
-        if codec == 0:  # no compression
-            grid_data = data[grid_data_offset:file_end]
-        elif codec == 1:  # zip compression
-            grid_data = bytearray()
-            while grid_data_offset < file_end:
-                chunk_size = struct.unpack("<Q", data[grid_data_offset : grid_data_offset + 8])[0]
-                grid_data_offset += 8
-                grid_data += zlib.decompress(data[grid_data_offset : grid_data_offset + chunk_size])
-                grid_data_offset += chunk_size
-        elif codec == 2:  # blosc compression
+        if codec == "blosc":
             try:
                 import blosc  # noqa: PLC0415
             except ImportError as err:
@@ -6607,21 +6804,35 @@ class Volume:
                     f"NanoVDB buffer is compressed using blosc, but Python module could not be imported: {err}"
                 ) from err
 
-            grid_data = bytearray()
-            while grid_data_offset < file_end:
-                chunk_size = struct.unpack("<Q", data[grid_data_offset : grid_data_offset + 8])[0]
-                grid_data_offset += 8
-                grid_data += blosc.decompress(data[grid_data_offset : grid_data_offset + chunk_size])
-                grid_data_offset += chunk_size
-        else:
-            raise RuntimeError(f"Unsupported codec code: {codec}")
+        dest_offsets = np.cumsum([0] + [chunk[2] for chunk in chunks])
 
-        magic = struct.unpack("<Q", grid_data[0:8])[0]
-        if magic not in (0x304244566F6E614E, 0x314244566F6E614E):  # NanoVDB0 or NanoVDB1 in hex, little-endian
-            raise RuntimeError("NanoVDB signature not found on grid!")
+        def decompress_chunk(chunk_index):
+            offset, chunk_size, uncompressed_size = chunks[chunk_index]
+            src = data[offset : offset + chunk_size]
+            dest_offset = dest_offsets[chunk_index]
 
-        data_array = array(np.frombuffer(grid_data, dtype=np.byte), device=device)
-        return cls(data_array)
+            if codec == "blosc":
+                # decode straight into the destination buffer
+                decoded_size = blosc.decompress_ptr(src, dest[dest_offset:].ctypes.data)
+            else:
+                decoded = zlib.decompress(src)
+                decoded_size = len(decoded)
+                if decoded_size == uncompressed_size:
+                    dest[dest_offset : dest_offset + decoded_size] = np.frombuffer(decoded, dtype=np.uint8)
+
+            if decoded_size != uncompressed_size:
+                raise RuntimeError("Size of decompressed NanoVDB grid data does not match the file metadata")
+
+        if len(chunks) == 1:
+            decompress_chunk(0)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        # zlib and blosc release the GIL while decompressing
+        with ThreadPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 1)) as executor:
+            for _ in executor.map(decompress_chunk, range(len(chunks))):
+                pass
 
     def save_to_nvdb(self, path, codec: Literal["none", "zip", "blosc"] = "none"):
         """Serialize the :class:`Volume` into a NanoVDB (``.nvdb``) file.
@@ -7801,12 +8012,17 @@ class HashGrid:
         self.reserved = False
         self.groups = None
 
-    def build(self, points, radius, groups=None):
+    def build(self, points, radius, groups=None, incremental=True, cpu_threads=None):
         """Update the hash grid data structure.
 
         This method rebuilds the underlying datastructure and should be called any time the set
         of points changes.
 
+        On the CPU, a build that reuses the point count, cell width, and grouping of the previous
+        build only re-sorts the points whose cell (or group) changed, which is much cheaper than a full
+        rebuild when most points stay in place between steps, as in particle simulations. If too many
+        points changed cell, the grid is rebuilt from scratch. Both paths produce the same point order.
+
         Args:
             points (:class:`warp.array`): Array of points matching the grid's dtype
                 (vec3h for float16, vec3/vec3f for float32, vec3d for float64)
@@ -7820,6 +8036,11 @@ class HashGrid:
                 :func:`warp.hash_grid_query` preserves the all-points traversal behavior.
                 Group ids may be arbitrary ``int32`` values and are consumed on-device, so group assignments may
                 change between rebuilds, including during CPU and CUDA graph replay.
+            incremental (bool): Allow a CPU build to update the previous build in place rather than
+                rebuilding from scratch. Ignored on CUDA devices.
+            cpu_threads (int | None): Maximum number of host threads used to build a CPU grid.
+                ``0`` uses every hardware thread. If ``None``, :attr:`warp.config.cpu_max_threads`
+                is used. Ignored on CUDA devices.
 
         Raises:
             NotImplementedError: If called during a saveable graph capture
@@ -7864,7 +8085,18 @@ class HashGrid:
             apic_capture.track_array(groups)
 
         self.groups = groups
-        self._native_func("update")(self.id, self._type_id, radius, ctypes.byref(points.__ctype__()), groups_arg)
+        if self.device.is_cpu:
+            self._native_func("update")(
+                self.id,
+                self._type_id,
+                radius,
+                ctypes.byref(points.__ctype__()),
+                groups_arg,
+                warp._src.context._resolve_cpu_threads(cpu_threads),
+                incremental,
+            )
+        else:
+            self._native_func("update")(self.id, self._type_id, radius, ctypes.byref(points.__ctype__()), groups_arg)
         self.reserved = True
 
     def reserve(self, num_points, with_groups=False):
@@ -6,6 +6,7 @@ from __future__ import annotations
 import cProfile
 import gc
 import hashlib
+import json
 import os
 import sys
 import threading
@@ -20,7 +21,14 @@ import warp as wp
 import warp._src.context as context
 import warp._src.types
 from warp._src import logger as _logger_module
-from warp._src.context import Allocator, CaptureMode, DeviceLike, _validate_allocator, timing_result_t
+from warp._src.context import (
+    Allocator,
+    CaptureMode,
+    DeviceLike,
+    _validate_allocator,
+    cpu_timing_result_t,
+    timing_result_t,
+)
 from warp._src.logger import Logger, LoggerBasic, _validate_logger, get_logger, log_debug, set_logger
 from warp._src.types import Array, DType, type_repr, types_equal
 
@@ -142,7 +150,12 @@ def array_scan(in_array: wp.array, out_array: wp.array, inclusive: bool = True)
 
 
 def radix_sort_pairs(
-    keys: wp.array, values: wp.array, count: int, begin_bit: int = 0, end_bit: int | None = None
+    keys: wp.array,
+    values: wp.array,
+    count: int,
+    begin_bit: int = 0,
+    end_bit: int | None = None,
+    cpu_threads: int | None = None,
 ) -> None:
     """Sort key-value pairs using radix sort.
 
@@ -157,6 +170,9 @@ def radix_sort_pairs(
         count: Number of elements to sort.
         begin_bit: The least-significant key bit to start sorting from.
         end_bit: The key bit to stop sorting at. If ``None``, sorts through the full key width.
+        cpu_threads: Maximum number of host threads used to sort arrays on the CPU.
+          ``0`` uses every hardware thread. If ``None``, :attr:`warp.config.cpu_max_threads` is used.
+          Ignored for CUDA arrays.
 
     Raises:
         RuntimeError: If array storage devices don't match, if storage size is insufficient, or if data types are unsupported.
@@ -208,7 +224,7 @@ def radix_sort_pairs(
     if key_bit_width is not None and begin_bit == end_bit:
         return
 
-    from warp._src.context import _get_apic_capture_for_device, runtime  # noqa: PLC0415
+    from warp._src.context import _get_apic_capture_for_device, _resolve_cpu_threads, runtime  # noqa: PLC0415
 
     # Both CPU (record-only) and CUDA (record-and-execute) APIC captures record an
     # APIC_OP_RADIX_SORT op. Track keys/values base regions first so the recorded
@@ -219,18 +235,31 @@ def radix_sort_pairs(
         apic_capture.track_array(values)
 
     if keys.device.is_cpu:
+        cpu_threads = _resolve_cpu_threads(cpu_threads)
         if keys.dtype == wp.int32:
-            runtime.core.wp_radix_sort_pairs_int_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_int_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         elif keys.dtype == wp.uint32:
-            runtime.core.wp_radix_sort_pairs_uint_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_uint_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         elif keys.dtype == wp.float32:
-            runtime.core.wp_radix_sort_pairs_float_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_float_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         elif keys.dtype == wp.float64:
-            runtime.core.wp_radix_sort_pairs_double_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_double_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         elif keys.dtype == wp.int64:
-            runtime.core.wp_radix_sort_pairs_int64_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_int64_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         elif keys.dtype == wp.uint64:
-            runtime.core.wp_radix_sort_pairs_uint64_host(keys.ptr, values.ptr, count, begin_bit, end_bit, value_size)
+            runtime.core.wp_radix_sort_pairs_uint64_host(
+                keys.ptr, values.ptr, count, begin_bit, end_bit, value_size, cpu_threads
+            )
         else:
             raise RuntimeError(
                 f"Unsupported keys and values data types: {type_repr(keys.dtype)}, {type_repr(values.dtype)}"
@@ -260,6 +289,7 @@ def segmented_sort_pairs(
     count: int,
     segment_start_indices: wp.array[wp.int32],
     segment_end_indices: wp.array[wp.int32] = None,
+    cpu_threads: int | None = None,
 ):
     """Sort key-value pairs within segments.
 
@@ -278,6 +308,9 @@ def segmented_sort_pairs(
         segment_end_indices: Optional array containing end index of each segment. Must be of type int32 if provided.
             If None, segment_end_indices will be inferred from segment_start_indices[1:].
             If provided, must have length at least num_segments.
+        cpu_threads: Maximum number of host threads used to sort arrays on the CPU.
+            ``0`` uses every hardware thread. If ``None``, :attr:`warp.config.cpu_max_threads` is used.
+            Ignored for CUDA arrays.
 
     Raises:
         RuntimeError: If array storage devices don't match, if storage size is insufficient,
@@ -292,7 +325,7 @@ def segmented_sort_pairs(
     if keys.size < 2 * count or values.size < 2 * count:
         raise RuntimeError("Array storage must be large enough to contain 2*count elements")
 
-    from warp._src.context import _get_apic_capture_for_device, runtime  # noqa: PLC0415
+    from warp._src.context import _get_apic_capture_for_device, _resolve_cpu_threads, runtime  # noqa: PLC0415
 
     if segment_start_indices.dtype != wp.int32:
         raise RuntimeError("segment_start_indices array must be of type int32")
@@ -325,6 +358,7 @@ def segmented_sort_pairs(
         apic_capture.track_array(segment_end_indices)
 
     if keys.device.is_cpu:
+        cpu_threads = _resolve_cpu_threads(cpu_threads)
         if keys.dtype == wp.int32 and values.dtype == wp.int32:
             runtime.core.wp_segmented_sort_pairs_int_host(
                 keys.ptr,
@@ -333,6 +367,7 @@ def segmented_sort_pairs(
                 segment_start_indices_ptr,
                 segment_end_indices_ptr,
                 num_segments,
+                cpu_threads,
             )
         elif keys.dtype == wp.float32 and values.dtype == wp.int32:
             runtime.core.wp_segmented_sort_pairs_float_host(
@@ -342,6 +377,7 @@ def segmented_sort_pairs(
                 segment_start_indices_ptr,
                 segment_end_indices_ptr,
                 num_segments,
+                cpu_threads,
             )
         else:
             raise RuntimeError(f"Unsupported data type: {type_repr(keys.dtype)}")
@@ -1550,7 +1586,7 @@ TIMING_GRAPH = 16
 """Timing flag for CUDA graph launches."""
 
 TIMING_ALL = 0xFFFFFFFF
-"""Timing flag to capture all CUDA activities."""
+"""Timing flag to capture all activities."""
 
 
 # timer utils
@@ -1579,6 +1615,7 @@ class ScopedTimer:
         cuda_filter: int = 0,
         report_func: Callable[[list[TimingResult], str], None] | None = None,
         skip_tape: bool = False,
+        cpu_filter: int = 0,
     ):
         """Context manager object for a timer
 
@@ -1595,11 +1632,13 @@ class ScopedTimer:
             report_func: A callback function to print the activity report.
               If ``None``,  :func:`warp.timing_print` will be used.
             skip_tape: If true, the timer will not be recorded in the tape
+            cpu_filter: Filter flags for CPU activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
 
         Attributes:
             extra_msg (str): Can be set to a string that will be added to the printout at context exit.
             elapsed (float): The duration of the ``with`` block used with this object
-            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using ``cuda_filter``
+            timing_results (list[TimingResult]): The list of activity timing results, if collection was requested using
+              ``cuda_filter`` or ``cpu_filter``
         """
         self.name = name
         self.active = active and self.enabled
@@ -1612,6 +1651,7 @@ class ScopedTimer:
         self.skip_tape = skip_tape
         self.elapsed = 0.0
         self.cuda_filter = cuda_filter
+        self.cpu_filter = cpu_filter
         self.report_func = report_func or wp.timing_print
         self.extra_msg = ""  # Can be used to add to the message printed at manager exit
 
@@ -1629,9 +1669,9 @@ class ScopedTimer:
             if self.synchronize:
                 wp.synchronize()
 
-            if self.cuda_filter:
-                # begin CUDA activity collection, synchronizing if needed
-                timing_begin(self.cuda_filter, synchronize=not self.synchronize)
+            if self.cuda_filter or self.cpu_filter:
+                # begin activity collection, synchronizing if needed
+                timing_begin(self.cuda_filter, synchronize=not self.synchronize, cpu_filter=self.cpu_filter)
 
             if self.detailed:
                 self.cp = cProfile.Profile()
@@ -1671,8 +1711,8 @@ class ScopedTimer:
                 self.cp.disable()
                 self.cp.print_stats(sort="tottime")
 
-            if self.cuda_filter:
-                # end CUDA activity collection, synchronizing if needed
+            if self.cuda_filter or self.cpu_filter:
+                # end activity collection, synchronizing if needed
                 self.timing_results = timing_end(synchronize=not self.synchronize)
             else:
                 self.timing_results = []
@@ -2056,7 +2096,7 @@ def check_p2p():
 class TimingResult:
     """Timing result for a single activity."""
 
-    def __init__(self, device, name, filter, elapsed):
+    def __init__(self, device, name, filter, elapsed, start=None, dim=None, dispatch=None, thread=None):
         self.device: warp._src.context.Device = device
         """The device where the activity was recorded."""
 
@@ -2069,19 +2109,47 @@ class TimingResult:
         self.elapsed: float = elapsed
         """The elapsed time in milliseconds."""
 
+        self.start: float | None = start
+        """The start time in milliseconds since :func:`timing_begin`, or ``None`` if unknown (CUDA activities)."""
+
+        self.dim: tuple[int, ...] | None = dim
+        """The launch dimensions of a CPU kernel, or ``None``."""
+
+        self.dispatch: float | None = dispatch
+        """The time in milliseconds spent in Python between the launch call and the start of a CPU kernel,
+        or ``None`` if unknown."""
 
-def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True) -> None:
+        self.thread: int | None = thread
+        """An identifier of the host thread that ran a CPU activity, or ``None``."""
+
+
+# CPU filter of each active timing_begin() call, innermost last
+_timing_cpu_filters: list[int] = []
+
+
+def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True, cpu_filter: int = 0) -> None:
     """Begin detailed activity timing.
 
+    CPU activities are timed on the host as they execute: Warp kernel launches (``warp.TIMING_KERNEL``),
+    native utilities such as sorting, scans, sparse matrix operations, hash grid and BVH builds
+    (``warp.TIMING_KERNEL_BUILTIN``), and host memory copies and sets (``warp.TIMING_MEMCPY``, ``warp.TIMING_MEMSET``).
+
     Parameters:
         cuda_filter: Filter flags for CUDA activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
         synchronize: Whether to synchronize all CUDA devices before timing starts
+        cpu_filter: Filter flags for CPU activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
     """
 
     if synchronize:
         warp.synchronize()
 
-    warp._src.context.runtime.core.wp_cuda_timing_begin(cuda_filter)
+    runtime = warp._src.context.runtime
+    runtime.core.wp_cuda_timing_begin(cuda_filter)
+    runtime.core.wp_cpu_timing_begin(cpu_filter)
+
+    _timing_cpu_filters.append(cpu_filter)
+    if cpu_filter:
+        runtime.cpu_timing_depth += 1
 
 
 def timing_end(synchronize: bool = True) -> list[TimingResult]:
@@ -2097,17 +2165,19 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
     if synchronize:
         warp.synchronize()
 
+    runtime = warp._src.context.runtime
+
     # get result count
-    count = warp._src.context.runtime.core.wp_cuda_timing_get_result_count()
+    count = runtime.core.wp_cuda_timing_get_result_count()
 
     # get result array from C++
     result_buffer = (timing_result_t * count)()
-    warp._src.context.runtime.core.wp_cuda_timing_end(result_buffer, count)
+    runtime.core.wp_cuda_timing_end(result_buffer, count)
 
     # prepare Python result list
     results = []
     for r in result_buffer:
-        device = warp._src.context.runtime.context_map.get(r.context)
+        device = runtime.context_map.get(r.context)
         filter = r.flag
         elapsed = r.elapsed
 
@@ -2127,6 +2197,34 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
 
         results.append(TimingResult(device, name, filter, elapsed))
 
+    if _timing_cpu_filters and _timing_cpu_filters.pop():
+        runtime.cpu_timing_depth -= 1
+
+    count = runtime.core.wp_cpu_timing_get_result_count()
+    cpu_buffer = (cpu_timing_result_t * count)()
+    runtime.core.wp_cpu_timing_end(cpu_buffer, count)
+
+    for r in cpu_buffer:
+        if r.func:
+            name = runtime.cpu_kernel_names.get(r.func, "kernel <unknown>")
+        else:
+            name = r.name.decode()
+            if r.flag == TIMING_KERNEL_BUILTIN:
+                name = f"builtin kernel {name}"
+
+        results.append(
+            TimingResult(
+                runtime.cpu_device,
+                name,
+                r.flag,
+                r.elapsed,
+                start=r.start,
+                dim=tuple(r.shape[: r.ndim]) if r.ndim else None,
+                dispatch=r.dispatch if r.dispatch >= 0.0 else None,
+                thread=r.thread_id,
+            )
+        )
+
     return results
 
 
@@ -2158,7 +2256,18 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
     activity_width = max_name_len + 1
     activity_dashes = "-" * activity_width
 
-    print(f"{indent}CUDA timeline:")
+    cpu_count = sum(1 for r in results if r.device.is_cpu)
+    if cpu_count == 0:
+        kind = "CUDA"
+    elif cpu_count == len(results):
+        kind = "CPU"
+    else:
+        kind = "Activity"
+
+    dispatch_count = 0
+    dispatch_total = 0.0
+
+    print(f"{indent}{kind} timeline:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Time            | Device  | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2177,10 +2286,14 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
             activity_agg.count += 1
             activity_agg.elapsed += r.elapsed
 
+        if r.dispatch is not None:
+            dispatch_count += 1
+            dispatch_total += r.dispatch
+
         print(f"{indent}{r.elapsed:12.6f} ms | {r.device.alias:7s} | {r.name}")
 
     print()
-    print(f"{indent}CUDA activity summary:")
+    print(f"{indent}{kind} activity summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2188,13 +2301,98 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {name}")
 
     print()
-    print(f"{indent}CUDA device summary:")
+    print(f"{indent}{kind} device summary:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Device")
     print(f"{indent}----------------+---------+{activity_dashes}")
     for device, agg in device_totals.items():
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {device}")
 
+    if dispatch_count:
+        print()
+        print(f"{indent}CPU launch dispatch: {dispatch_total:.6f} ms over {dispatch_count} launches")
+
+
+_TIMING_CATEGORIES = {
+    TIMING_KERNEL: "kernel",
+    TIMING_KERNEL_BUILTIN: "builtin",
+    TIMING_MEMCPY: "memcpy",
+    TIMING_MEMSET: "memset",
+    TIMING_GRAPH: "graph",
+}
+
+
+def timing_export_chrome_trace(results: list[TimingResult], path: str | os.PathLike) -> None:
+    """Write timing results to a file in the Chrome trace event format.
+
+    The file can be opened with `Perfetto <https://ui.perfetto.dev>`__ or ``chrome://tracing``.
+    Each device is shown as a process and each host thread that ran CPU activities as a thread.
+    The Python dispatch time of CPU kernel launches is shown as a separate ``dispatch`` slice preceding the kernel.
+
+    CUDA activities have no recorded start time, so they are laid out back to back on their device,
+    in the order in which they were issued.
+
+    Parameters:
+        results: List of :class:`TimingResult` objects, as returned by :func:`timing_end`.
+        path: Path of the JSON file to write.
+    """
+
+    events = []
+    pids = {}
+    tids = {}
+    cursors = {}
+
+    for r in results:
+        alias = r.device.alias
+        pid = pids.get(alias)
+        if pid is None:
+            pid = len(pids)
+            pids[alias] = pid
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": alias}})
+
+        tid = tids.get((pid, r.thread))
+        if tid is None:
+            tid = len(tids)
+            tids[(pid, r.thread)] = tid
+            thread_name = alias if r.thread is None else f"thread {tid}"
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}})
+
+        start = r.start if r.start is not None else cursors.get(alias, 0.0)
+        cursors[alias] = max(cursors.get(alias, 0.0), start + r.elapsed)
+
+        args = {}
+        if r.dim is not None:
+            args["dim"] = list(r.dim)
+        if r.dispatch is not None:
+            args["dispatch_ms"] = r.dispatch
+            events.append(
+                {
+                    "name": "dispatch",
+                    "cat": "dispatch",
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": tid,
+                    "ts": (start - r.dispatch) * 1000.0,
+                    "dur": r.dispatch * 1000.0,
+                }
+            )
+
+        events.append(
+            {
+                "name": r.name,
+                "cat": _TIMING_CATEGORIES.get(r.filter, "activity"),
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": start * 1000.0,
+                "dur": r.elapsed * 1000.0,
+                "args": args,
+            }
+        )
+
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
 
 class ScopedMemoryTracker:
     """Context manager that tracks memory allocations across all devices.
@@ -253,6 +253,50 @@ base path to prevent cache collisions between different Warp versions.
 Note: Subdirectories prefixed with ``wp_`` will be created in this location.
 """
 
+kernel_cache_max_size: int | None = None
+"""Maximum total size in bytes of the compiled modules kept in the kernel cache directory.
+
+When building a module pushes the cache past this size, the least recently used
+modules are removed. Module uses are tracked in an index file shared by every process
+using the cache, so eviction follows use across processes. If ``None``, the cache is
+not limited, but :func:`warp.prune_kernel_cache` can still be called to trim it.
+LTO artifacts are not counted. This setting can be changed at runtime.
+"""
+
+kernel_granular_cache: bool = False
+"""Compile and cache each kernel of a module as a separate binary.
+
+By default, a module is the unit of compilation: changing one of its kernels or adding a
+new overload of a generic kernel regenerates and recompiles every kernel in the module.
+When this setting is ``True``, every unique kernel is built into its own entry of the kernel
+cache, keyed by the kernel's content hash and the module options, and is only compiled
+and loaded when it is first launched. Kernels that did not change are loaded from the cache
+instead of being rebuilt. Modules compiled with ``strip_hash`` or loaded from an explicit
+binary path are always compiled as a whole.
+
+This setting can be overridden at the module level by setting the ``"kernel_granular_cache"`` module option.
+"""
+
+module_hash_manifest: bool = False
+"""Remember the hashes of loaded modules in a manifest next to the kernel cache.
+
+Before loading a module from the kernel cache, Warp computes the module hash, which requires
+parsing the source of every kernel and function in the module and of the functions they call.
+When this setting is ``True``, Warp also computes a cheaper fingerprint of the module from the
+declared source of its kernels and reachable functions, the values of the global and closure
+variables their code refers to, the kernel and module options, and the Warp version, and records
+the module hash under it. A later process declaring the same module then takes the hash from
+the manifest and loads the cached binary without parsing. Modules whose code refers to values
+that cannot be fingerprinted, that use code transformers, or whose kernels are cached
+separately (see :attr:`kernel_granular_cache`) are always hashed.
+
+The fingerprint only follows the names that appear in the code of the kernels and functions.
+Modules whose generated code depends on state that is not reachable through those names, for
+example a ``wp.static()`` expression reading a file or an environment variable, should not be
+used with this setting. Clearing the kernel cache with :func:`warp.clear_kernel_cache` also
+clears the manifest.
+"""
+
 cuda_output: str | None = None
 """Preferred CUDA output format for kernel compilation.
 
@@ -457,6 +501,29 @@ the default number of worker threads is determined by this setting. ``0`` means
 If ``None``, Warp determines the behavior (currently equal to ``min(os.cpu_count(), 4)``).
 """
 
+load_module_use_processes: bool = False
+"""Compile modules that are missing from the kernel cache in worker processes instead of threads.
+
+For ``wp.load_module()`` and ``wp.force_load()``, if the ``use_processes`` parameter is not specified,
+this setting determines whether uncached modules are first built into the kernel cache by a pool of
+``max_workers`` forked processes. Code generation holds the global interpreter lock, so worker processes
+scale better than threads when warming many modules. Only available on platforms with the ``fork``
+start method.
+"""
+
+cpu_max_threads: int | None = 1
+"""Default number of host threads used to execute a kernel launch on the CPU.
+
+``1`` runs every task of a launch serially on the calling thread. Larger values split
+the launch into chunks that a native thread pool executes concurrently, and ``0`` or
+``None`` use every hardware thread. The ``cpu_threads`` argument of :func:`warp.launch`
+overrides this setting for a single launch.
+
+Only forward launches of kernels that do not use atomics or tiles (including through the
+functions they call) are split across threads. Other launches always run serially because
+CPU atomics are not thread-safe. This setting can be changed at runtime.
+"""
+
 deterministic: DeterministicMode = DeterministicMode.NOT_GUARANTEED
 """Determinism guarantee for supported atomic operations.
 
@@ -77,6 +77,7 @@ from warp._src.fem.space.dof_mapper import SkewSymmetricTensorMapper as SkewSymm
 from warp._src.fem.space.partition import SpacePartition as SpacePartition
 from warp._src.fem.space.restriction import SpaceRestriction as SpaceRestriction
 from warp._src.fem.space.topology import SpaceTopology as SpaceTopology
+from warp._src.fem.integrate import SparsityPatternCache as SparsityPatternCache
 from warp._src.fem.domain import Subdomain as Subdomain
 from warp._src.fem.space.dof_mapper import SymmetricTensorMapper as SymmetricTensorMapper
 from warp._src.fem.cache import Temporary as Temporary
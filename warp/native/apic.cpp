@@ -1318,7 +1318,7 @@ bool apic_create_meshes(APICGraph* graph)
         if (graph->device_type == APIC_DEVICE_CPU) {
             new_mesh_id = wp_mesh_create_host(
                 points, velocities, indices, rec.num_points, rec.num_tris, rec.support_winding_number,
-                rec.bvh_constructor, nullptr, rec.bvh_leaf_size
+                rec.bvh_constructor, nullptr, rec.bvh_leaf_size, /*num_threads=*/1
             );
         } else {
             new_mesh_id = wp_mesh_create_device(
@@ -2068,7 +2068,8 @@ static void apic_execute_hash_grid_update(const APICHashGridUpdateRecord* rec, v
     groups.strides[0] = rec->groups_stride;
 
     wp_hash_grid_update_host(
-        rec->grid_id, rec->grid_type, rec->cell_width, &points, rec->has_groups ? &groups : nullptr
+        rec->grid_id, rec->grid_type, rec->cell_width, &points, rec->has_groups ? &groups : nullptr,
+        /*num_threads=*/1, /*incremental=*/true
     );
 }
 
@@ -2210,7 +2211,10 @@ static bool apic_cpu_replay_stream(
             // apic_info=nullptr is safe: g_apic_state is null during replay, so
             // the recording branch in wp_cpu_launch_kernel is a no-op and the
             // execute branch fires.
-            wp_cpu_launch_kernel(func, bounds_buf, fwd_buf, adj_buf, /*apic_info=*/nullptr);
+            wp_cpu_launch_kernel(
+                func, bounds_buf, fwd_buf, adj_buf, /*apic_info=*/nullptr, /*range_func=*/nullptr, /*kernel_dim=*/0,
+                /*num_threads=*/1
+            );
             break;
         }
 
@@ -2374,13 +2378,13 @@ static bool apic_cpu_replay_stream(
                 wp_segmented_sort_pairs_int_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
                     reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
-                    static_cast<int>(rec->num_segments)
+                    static_cast<int>(rec->num_segments), /*num_threads=*/1
                 );
             } else {
                 wp_segmented_sort_pairs_float_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
                     reinterpret_cast<uint64_t>(segstart), reinterpret_cast<uint64_t>(segend),
-                    static_cast<int>(rec->num_segments)
+                    static_cast<int>(rec->num_segments), /*num_threads=*/1
                 );
             }
             break;
@@ -2402,32 +2406,32 @@ static bool apic_cpu_replay_stream(
             if (rec->dtype == APIC_TYPE_INT32) {
                 wp_radix_sort_pairs_int_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             } else if (rec->dtype == APIC_TYPE_UINT32) {
                 wp_radix_sort_pairs_uint_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             } else if (rec->dtype == APIC_TYPE_INT64) {
                 wp_radix_sort_pairs_int64_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             } else if (rec->dtype == APIC_TYPE_UINT64) {
                 wp_radix_sort_pairs_uint64_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             } else if (rec->dtype == APIC_TYPE_FLOAT32) {
                 wp_radix_sort_pairs_float_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             } else {
                 wp_radix_sort_pairs_double_host(
                     reinterpret_cast<uint64_t>(keys), reinterpret_cast<uint64_t>(values), static_cast<int>(rec->count),
-                    rec->begin_bit, rec->end_bit, rec->value_size
+                    rec->begin_bit, rec->end_bit, rec->value_size, /*num_threads=*/1
                 );
             }
             break;
@@ -2510,7 +2514,7 @@ static bool apic_cpu_replay_stream(
                 reinterpret_cast<const int*>(tpl_columns), tpl_values, rec->scalar_zero_mask, rec->masked_topology != 0,
                 reinterpret_cast<int*>(summed_block_offsets), reinterpret_cast<int*>(summed_block_indices),
                 reinterpret_cast<int*>(bsr_offsets), reinterpret_cast<const int*>(bsr_row_counts),
-                reinterpret_cast<int*>(bsr_columns), reinterpret_cast<int*>(bsr_nnz), nullptr
+                reinterpret_cast<int*>(bsr_columns), reinterpret_cast<int*>(bsr_nnz), nullptr, /*num_threads=*/1
             );
             break;
         }
@@ -2602,7 +2606,7 @@ static bool apic_cpu_replay_stream(
 
         case APIC_OP_BVH_REBUILD: {
             const APICBvhRecord* rec = reinterpret_cast<const APICBvhRecord*>(ptr);
-            wp_bvh_rebuild_host(remap_handle(rec->bvh_id), rec->constructor_type);
+            wp_bvh_rebuild_host(remap_handle(rec->bvh_id), rec->constructor_type, /*num_threads=*/1);
             break;
         }
 
@@ -6,8 +6,10 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "bvh.h"
+#include "cpu_timing.h"
 #include "cuda_util.h"
 #include "error.h"
+#include "thread_pool.h"
 
 #include <algorithm>
 #include <cassert>
@@ -23,15 +25,60 @@ namespace wp {
 
 /////////////////////////////////////////////////////////////////////////////////////////////
 
+// primitive ranges at least this large compute their bounds and SAH bins on multiple threads
+static const int bvh_parallel_min_binning_size = 1 << 14;
+
+// subtrees over fewer primitives than this are always built by a single task
+static const int bvh_parallel_min_task_size = 1 << 10;
+
 class TopDownBVHBuilder {
 public:
-    void build(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups);
-    void rebuild(BVH& bvh, int in_constructor_type);
+    void build(
+        BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups, int num_threads
+    );
+    void rebuild(BVH& bvh, int in_constructor_type, int num_threads);
 
 private:
+    // node of the upper tree levels that build_parallel() splits before forking subtree tasks
+    struct TopNode {
+        bounds3 bounds;
+        int left = -1;
+        int right = -1;
+        // index into the subtree tasks, or -1 for inner nodes
+        int task = -1;
+    };
+
+    // subtree built by one task into its own node buffers, numbered in local preorder
+    struct SubtreeTask {
+        int start;
+        int end;
+        int depth;
+        std::vector<BVHPackedNodeHalf> node_lowers;
+        std::vector<BVHPackedNodeHalf> node_uppers;
+        std::vector<int> node_parents;
+        int num_nodes = 0;
+        int num_leaf_nodes = 0;
+        int max_depth = 0;
+    };
+
     void initialize_empty(BVH& bvh);
 
     bounds3 calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
+    bounds3 calc_bounds_parallel(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
+    int
+    split_range(BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, const bounds3& b, bool parallel);
+    void build_parallel(BVH& bvh, const vec3* lowers, const vec3* uppers, int n);
+    int build_top_down(
+        BVH& bvh,
+        const vec3* lowers,
+        const vec3* uppers,
+        int start,
+        int end,
+        int depth,
+        int task_size,
+        std::vector<TopNode>& top_nodes,
+        std::vector<SubtreeTask>& tasks
+    );
     int build_recursive(
         BVH& bvh,
         const vec3* lowers,
@@ -53,10 +100,12 @@ private:
         int start,
         int end,
         bounds3 range_bounds,
-        int& split_axis
+        int& split_axis,
+        bool parallel = false
     );
     void build_with_groups(BVH& bvh, const vec3* lowers, const vec3* uppers, const int* groups, int n);
     int constructor_type = -1;
+    int num_threads = 1;
 };
 
 //////////////////////////////////////////////////////////////////////
@@ -214,7 +263,7 @@ void TopDownBVHBuilder::build_with_groups(BVH& bvh, const vec3* lowers, const ve
 
 
 void TopDownBVHBuilder::build(
-    BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups
+    BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups, int in_num_threads
 )
 {
     assert(n >= 0);
@@ -223,6 +272,7 @@ void TopDownBVHBuilder::build(
     }
 
     constructor_type = in_constructor_type;
+    num_threads = in_num_threads == 1 ? 1 : cpu_resolve_num_threads(in_num_threads);
     if (constructor_type != BVH_CONSTRUCTOR_SAH && constructor_type != BVH_CONSTRUCTOR_MEDIAN) {
         fprintf(
             stderr,
@@ -265,12 +315,14 @@ void TopDownBVHBuilder::build(
 
     if (groups) {
         build_with_groups(bvh, lowers, uppers, groups, n);
+    } else if (num_threads > 1) {
+        build_parallel(bvh, lowers, uppers, n);
     } else {
         build_recursive(bvh, lowers, uppers, 0, n, 0, -1);
     }
 }
 
-void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
+void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type, int in_num_threads)
 {
     if (in_constructor_type != BVH_CONSTRUCTOR_SAH && in_constructor_type != BVH_CONSTRUCTOR_MEDIAN) {
         fprintf(
@@ -284,6 +336,7 @@ void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
         return;
 
     constructor_type = in_constructor_type;
+    num_threads = in_num_threads == 1 ? 1 : cpu_resolve_num_threads(in_num_threads);
     for (int i = 0; i < bvh.num_items; ++i)
         bvh.primitive_indices[i] = i;
 
@@ -293,6 +346,8 @@ void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
 
     if (bvh.item_groups) {
         build_with_groups(bvh, bvh.item_lowers, bvh.item_uppers, bvh.item_groups, bvh.num_items);
+    } else if (num_threads > 1) {
+        build_parallel(bvh, bvh.item_lowers, bvh.item_uppers, bvh.num_items);
     } else {
         build_recursive(bvh, bvh.item_lowers, bvh.item_uppers, 0, bvh.num_items, 0, -1);
     }
@@ -310,6 +365,30 @@ bounds3 TopDownBVHBuilder::calc_bounds(const vec3* lowers, const vec3* uppers, c
     return u;
 }
 
+bounds3
+TopDownBVHBuilder::calc_bounds_parallel(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end)
+{
+    // min/max reductions are exact, so the result matches calc_bounds() bit for bit
+    const int num_chunks = num_threads * 4;
+    const int chunk_size = (end - start + num_chunks - 1) / num_chunks;
+    std::vector<bounds3> chunk_bounds(num_chunks);
+
+    parallel_for(num_chunks, num_threads, 1, [&](size_t first, size_t last) {
+        for (size_t c = first; c < last; ++c) {
+            const int chunk_start = start + int(c) * chunk_size;
+            const int chunk_end = std::min(chunk_start + chunk_size, end);
+            if (chunk_start < chunk_end)
+                chunk_bounds[c] = calc_bounds(lowers, uppers, indices, chunk_start, chunk_end);
+        }
+    });
+
+    bounds3 u;
+    for (const bounds3& b : chunk_bounds)
+        u = bounds_union(u, b);
+
+    return u;
+}
+
 struct PartitionPredicateMedian {
     PartitionPredicateMedian(const vec3* lowers, const vec3* uppers, int a)
         : lowers(lowers)
@@ -396,6 +475,51 @@ int TopDownBVHBuilder::partition_midpoint(
     return k;
 }
 
+static bounds3 calc_centroid_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end)
+{
+    bounds3 centroid_bounds;
+    for (int i = start; i < end; ++i) {
+        vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
+        centroid_bounds.add_point(item_center);
+    }
+    return centroid_bounds;
+}
+
+// accumulate the items of [start, end) into SAH_NUM_BUCKETS buckets along split_axis
+static void bin_sah_items(
+    const vec3* lowers,
+    const vec3* uppers,
+    const int* indices,
+    int start,
+    int end,
+    int split_axis,
+    float range_start,
+    float range_end,
+    int* buckets_counts,
+    bounds3* buckets
+)
+{
+    for (int item_idx = start; item_idx < end; item_idx++) {
+        vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
+        int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
+        // clamp into valid range [0, SAH_NUM_BUCKETS-1]
+        if (bucket_idx < 0)
+            bucket_idx = 0;
+        if (bucket_idx >= SAH_NUM_BUCKETS)
+            bucket_idx = SAH_NUM_BUCKETS - 1;
+
+        bounds3 item_bound(lowers[indices[item_idx]], uppers[indices[item_idx]]);
+
+        if (buckets_counts[bucket_idx]) {
+            buckets[bucket_idx] = bounds_union(item_bound, buckets[bucket_idx]);
+        } else {
+            buckets[bucket_idx] = item_bound;
+        }
+
+        buckets_counts[bucket_idx]++;
+    }
+}
+
 float TopDownBVHBuilder::partition_sah_indices(
     const vec3* lowers,
     const vec3* uppers,
@@ -403,7 +527,8 @@ float TopDownBVHBuilder::partition_sah_indices(
     int start,
     int end,
     bounds3 range_bounds,
-    int& split_axis
+    int& split_axis,
+    bool parallel
 )
 {
     int buckets_counts[SAH_NUM_BUCKETS];
@@ -413,12 +538,27 @@ float TopDownBVHBuilder::partition_sah_indices(
 
     assert(end - start >= 2);
 
-    int n = end - start;
+    // the parallel passes reduce per-chunk results with exact min/max and integer sums,
+    // so both paths pick the same split
+    const int num_chunks = parallel ? num_threads * 4 : 1;
+    const int chunk_size = (end - start + num_chunks - 1) / num_chunks;
 
     bounds3 centroid_bounds;
-    for (int i = start; i < end; ++i) {
-        vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
-        centroid_bounds.add_point(item_center);
+    if (parallel) {
+        std::vector<bounds3> chunk_bounds(num_chunks);
+        parallel_for(num_chunks, num_threads, 1, [&](size_t first, size_t last) {
+            for (size_t c = first; c < last; ++c) {
+                const int chunk_start = start + int(c) * chunk_size;
+                const int chunk_end = std::min(chunk_start + chunk_size, end);
+                if (chunk_start < chunk_end)
+                    chunk_bounds[c] = calc_centroid_bounds(lowers, uppers, indices, chunk_start, chunk_end);
+            }
+        });
+
+        for (const bounds3& b : chunk_bounds)
+            centroid_bounds = bounds_union(centroid_bounds, b);
+    } else {
+        centroid_bounds = calc_centroid_bounds(lowers, uppers, indices, start, end);
     }
     vec3 edges = centroid_bounds.edges();
 
@@ -436,24 +576,28 @@ float TopDownBVHBuilder::partition_sah_indices(
     }
 
     std::fill(buckets_counts, buckets_counts + SAH_NUM_BUCKETS, 0);
-    for (int item_idx = start; item_idx < end; item_idx++) {
-        vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
-        int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
-        // clamp into valid range [0, SAH_NUM_BUCKETS-1]
-        if (bucket_idx < 0)
-            bucket_idx = 0;
-        if (bucket_idx >= SAH_NUM_BUCKETS)
-            bucket_idx = SAH_NUM_BUCKETS - 1;
-
-        bounds3 item_bound(lowers[indices[item_idx]], uppers[indices[item_idx]]);
+    if (parallel) {
+        std::vector<int> chunk_counts(size_t(num_chunks) * SAH_NUM_BUCKETS, 0);
+        std::vector<bounds3> chunk_buckets(size_t(num_chunks) * SAH_NUM_BUCKETS);
+        parallel_for(num_chunks, num_threads, 1, [&](size_t first, size_t last) {
+            for (size_t c = first; c < last; ++c) {
+                const int chunk_start = start + int(c) * chunk_size;
+                const int chunk_end = std::min(chunk_start + chunk_size, end);
+                bin_sah_items(
+                    lowers, uppers, indices, chunk_start, chunk_end, split_axis, range_start, range_end,
+                    &chunk_counts[c * SAH_NUM_BUCKETS], &chunk_buckets[c * SAH_NUM_BUCKETS]
+                );
+            }
+        });
 
-        if (buckets_counts[bucket_idx]) {
-            buckets[bucket_idx] = bounds_union(item_bound, buckets[bucket_idx]);
-        } else {
-            buckets[bucket_idx] = item_bound;
+        for (int c = 0; c < num_chunks; ++c) {
+            for (int i = 0; i < SAH_NUM_BUCKETS; ++i) {
+                buckets_counts[i] += chunk_counts[c * SAH_NUM_BUCKETS + i];
+                buckets[i] = bounds_union(buckets[i], chunk_buckets[c * SAH_NUM_BUCKETS + i]);
+            }
         }
-
-        buckets_counts[bucket_idx]++;
+    } else {
+        bin_sah_items(lowers, uppers, indices, start, end, split_axis, range_start, range_end, buckets_counts, buckets);
     }
 
     bounds3 left;
@@ -508,6 +652,197 @@ float TopDownBVHBuilder::partition_sah_indices(
 }
 
 
+int TopDownBVHBuilder::split_range(
+    BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, const bounds3& b, bool parallel
+)
+{
+    // Partition bvh.primitive_indices[start, end) and return the split index, or -1 for an
+    // unknown constructor. Only the SAH binning runs in parallel, the partition itself stays
+    // serial so the resulting tree does not depend on the thread count.
+    int split = -1;
+    if (constructor_type == BVH_CONSTRUCTOR_SAH)
+    // SAH constructor
+    {
+        int split_axis = -1;
+        float split_point
+            = partition_sah_indices(lowers, uppers, bvh.primitive_indices, start, end, b, split_axis, parallel);
+        auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end, [&](int i) {
+            return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
+        });
+
+        split = std::distance(bvh.primitive_indices + start, boundary) + start;
+    } else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
+    // Median constructor
+    {
+        split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, b);
+    } else {
+        printf("Unknown type of BVH constructor: %d!\n", constructor_type);
+        return -1;
+    }
+
+    if (split == start || split == end) {
+        // partitioning failed, split down the middle
+        split = (start + end) / 2;
+    }
+
+    return split;
+}
+
+void TopDownBVHBuilder::build_parallel(BVH& bvh, const vec3* lowers, const vec3* uppers, int n)
+{
+    // Split the upper levels on the calling thread (with multi-threaded bounds and SAH binning),
+    // build the remaining subtrees as independent tasks into private node buffers, then splice
+    // everything into the BVH in depth-first preorder. This reproduces the node numbering of
+    // build_recursive(), so the tree is identical to a single-threaded build.
+    const int task_size = std::max(bvh_parallel_min_task_size, n / (num_threads * 8));
+
+    std::vector<TopNode> top_nodes;
+    std::vector<SubtreeTask> tasks;
+    const int top_root = build_top_down(bvh, lowers, uppers, 0, n, 0, task_size, top_nodes, tasks);
+    if (top_root < 0)
+        return;
+
+    parallel_for(tasks.size(), num_threads, 1, [&](size_t first, size_t last) {
+        for (size_t t = first; t < last; ++t) {
+            SubtreeTask& task = tasks[t];
+
+            const int max_task_nodes = 2 * (task.end - task.start) - 1;
+            task.node_lowers.resize(max_task_nodes);
+            task.node_uppers.resize(max_task_nodes);
+            task.node_parents.resize(max_task_nodes);
+
+            // tasks cover disjoint ranges of the shared primitive indices
+            BVH local = bvh;
+            local.node_lowers = task.node_lowers.data();
+            local.node_uppers = task.node_uppers.data();
+            local.node_parents = task.node_parents.data();
+            local.max_nodes = max_task_nodes;
+            local.num_nodes = 0;
+            local.num_leaf_nodes = 0;
+            local.max_depth = 0;
+
+            build_recursive(local, lowers, uppers, task.start, task.end, task.depth, -1);
+
+            task.num_nodes = local.num_nodes;
+            task.num_leaf_nodes = local.num_leaf_nodes;
+            task.max_depth = local.max_depth;
+        }
+    });
+
+    // assign preorder node indices to the upper levels and task subtrees
+    std::vector<int> top_node_index(top_nodes.size());
+    std::vector<int> task_base(tasks.size());
+    int next_node = 0;
+
+    std::function<void(int)> assign_indices = [&](int top) {
+        const TopNode& node = top_nodes[top];
+        top_node_index[top] = next_node;
+        if (node.task >= 0) {
+            task_base[node.task] = next_node;
+            next_node += tasks[node.task].num_nodes;
+        } else {
+            next_node += 1;
+            assign_indices(node.left);
+            assign_indices(node.right);
+        }
+    };
+    assign_indices(top_root);
+
+    std::function<void(int, int)> write_top_nodes = [&](int top, int parent) {
+        const TopNode& node = top_nodes[top];
+        const int node_index = top_node_index[top];
+        if (node.task >= 0) {
+            // the subtree root is written with the task nodes below, only its parent is known here
+            tasks[node.task].node_parents[0] = parent;
+            return;
+        }
+
+        bvh.node_lowers[node_index] = make_node(node.bounds.lower, top_node_index[node.left], false);
+        bvh.node_uppers[node_index] = make_node(node.bounds.upper, top_node_index[node.right], false);
+        bvh.node_parents[node_index] = parent;
+
+        write_top_nodes(node.left, node_index);
+        write_top_nodes(node.right, node_index);
+    };
+    write_top_nodes(top_root, -1);
+
+    parallel_for(tasks.size(), num_threads, 1, [&](size_t first, size_t last) {
+        for (size_t t = first; t < last; ++t) {
+            const SubtreeTask& task = tasks[t];
+            const int base = task_base[t];
+
+            for (int i = 0; i < task.num_nodes; ++i) {
+                BVHPackedNodeHalf lower = task.node_lowers[i];
+                BVHPackedNodeHalf upper = task.node_uppers[i];
+
+                // inner nodes reference their children by local index, leaves reference primitives
+                if (!lower.b) {
+                    lower.i += base;
+                    upper.i += base;
+                }
+
+                bvh.node_lowers[base + i] = lower;
+                bvh.node_uppers[base + i] = upper;
+                bvh.node_parents[base + i] = i == 0 ? task.node_parents[0] : task.node_parents[i] + base;
+            }
+        }
+    });
+
+    bvh.num_nodes = next_node;
+    for (const SubtreeTask& task : tasks) {
+        bvh.num_leaf_nodes += task.num_leaf_nodes;
+        bvh.max_depth = std::max(bvh.max_depth, task.max_depth);
+    }
+}
+
+int TopDownBVHBuilder::build_top_down(
+    BVH& bvh,
+    const vec3* lowers,
+    const vec3* uppers,
+    int start,
+    int end,
+    int depth,
+    int task_size,
+    std::vector<TopNode>& top_nodes,
+    std::vector<SubtreeTask>& tasks
+)
+{
+    const int n = end - start;
+    const int top = int(top_nodes.size());
+    top_nodes.emplace_back();
+
+    if (depth > bvh.max_depth)
+        bvh.max_depth = depth;
+
+    // small ranges and leaves are handed to build_recursive() in a task
+    if (n <= task_size || n <= bvh.leaf_size || depth >= BVH_QUERY_STACK_SIZE) {
+        top_nodes[top].task = int(tasks.size());
+        tasks.emplace_back();
+        tasks.back().start = start;
+        tasks.back().end = end;
+        tasks.back().depth = depth;
+        return top;
+    }
+
+    const bool parallel = n >= bvh_parallel_min_binning_size;
+    const bounds3 b = parallel ? calc_bounds_parallel(lowers, uppers, bvh.primitive_indices, start, end)
+                               : calc_bounds(lowers, uppers, bvh.primitive_indices, start, end);
+
+    const int split = split_range(bvh, lowers, uppers, start, end, b, parallel);
+    if (split < 0)
+        return -1;
+
+    const int left = build_top_down(bvh, lowers, uppers, start, split, depth + 1, task_size, top_nodes, tasks);
+    const int right = build_top_down(bvh, lowers, uppers, split, end, depth + 1, task_size, top_nodes, tasks);
+    if (left < 0 || right < 0)
+        return -1;
+
+    top_nodes[top].bounds = b;
+    top_nodes[top].left = left;
+    top_nodes[top].right = right;
+    return top;
+}
+
 int TopDownBVHBuilder::build_recursive(
     BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent, int assigned_node
 )
@@ -537,30 +872,9 @@ int TopDownBVHBuilder::build_recursive(
         return node_index;
     }
 
-    int split = -1;
-    if (constructor_type == BVH_CONSTRUCTOR_SAH)
-    // SAH constructor
-    {
-        int split_axis = -1;
-        float split_point = partition_sah_indices(lowers, uppers, bvh.primitive_indices, start, end, b, split_axis);
-        auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end, [&](int i) {
-            return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
-        });
-
-        split = std::distance(bvh.primitive_indices + start, boundary) + start;
-    } else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
-    // Median constructor
-    {
-        split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, b);
-    } else {
-        printf("Unknown type of BVH constructor: %d!\n", constructor_type);
+    int split = split_range(bvh, lowers, uppers, start, end, b, false);
+    if (split < 0)
         return -1;
-    }
-
-    if (split == start || split == end) {
-        // partitioning failed, split down the middle
-        split = (start + end) / 2;
-    }
 
     int left_child = build_recursive(bvh, lowers, uppers, start, split, depth + 1, node_index);
     int right_child = build_recursive(bvh, lowers, uppers, split, end, depth + 1, node_index);
@@ -733,7 +1047,7 @@ void bvh_refit_recursive(BVH& bvh, int index)
 }
 
 void bvh_refit_host(BVH& bvh) { bvh_refit_recursive(bvh, *bvh.root); }
-void bvh_rebuild_host(BVH& bvh, int constructor_type)
+void bvh_rebuild_host(BVH& bvh, int constructor_type, int num_threads)
 {
     if (constructor_type == BVH_CONSTRUCTOR_CUBQL) {
         if (bvh.item_groups) {
@@ -755,7 +1069,7 @@ void bvh_rebuild_host(BVH& bvh, int constructor_type)
     }
 
     TopDownBVHBuilder builder;
-    builder.rebuild(bvh, constructor_type);
+    builder.rebuild(bvh, constructor_type, num_threads);
     bvh.constructor_type = constructor_type;
 }
 
@@ -790,7 +1104,14 @@ void bvh_rem_descriptor(uint64_t id) { g_bvh_descriptors.erase(id); }
 
 // create in-place given existing descriptor
 void bvh_create_host(
-    vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, BVH& bvh
+    vec3* lowers,
+    vec3* uppers,
+    int num_items,
+    int constructor_type,
+    int* groups,
+    int leaf_size,
+    BVH& bvh,
+    int num_threads
 )
 {
     if (constructor_type == BVH_CONSTRUCTOR_CUBQL) {
@@ -814,7 +1135,7 @@ void bvh_create_host(
     bvh.constructor_type = constructor_type;
 
     TopDownBVHBuilder builder;
-    builder.build(bvh, lowers, uppers, num_items, constructor_type, groups);
+    builder.build(bvh, lowers, uppers, num_items, constructor_type, groups, num_threads);
 }
 
 
@@ -839,11 +1160,15 @@ void bvh_destroy_host(BVH& bvh)
 
 }  // namespace wp
 
-uint64_t wp_bvh_create_host(vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size)
+uint64_t wp_bvh_create_host(
+    vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, int num_threads
+)
 {
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bvh_create");
+
     BVH* bvh = static_cast<BVH*>(wp_alloc_host(sizeof(BVH), "(native:bvh)"));
     memset(bvh, 0, sizeof(BVH));
-    wp::bvh_create_host(lowers, uppers, num_items, constructor_type, groups, leaf_size, *bvh);
+    wp::bvh_create_host(lowers, uppers, num_items, constructor_type, groups, leaf_size, *bvh, num_threads);
 
     if (!bvh->node_lowers && num_items > 0) {
         wp_free_host(bvh);
@@ -881,17 +1206,19 @@ void wp_bvh_refit_host(uint64_t id)
     if (apic_capture_bvh_refit_host(id))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bvh_refit");
     BVH* bvh = (BVH*)(id);
     wp::bvh_refit_host(*bvh);
 }
 
-void wp_bvh_rebuild_host(uint64_t id, int constructor_type)
+void wp_bvh_rebuild_host(uint64_t id, int constructor_type, int num_threads)
 {
     if (apic_capture_bvh_rebuild_host(id, constructor_type))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bvh_rebuild");
     BVH* bvh = (BVH*)(id);
-    wp::bvh_rebuild_host(*bvh, constructor_type);
+    wp::bvh_rebuild_host(*bvh, constructor_type, num_threads);
 }
 
 void wp_bvh_destroy_host(uint64_t id)
@@ -0,0 +1,127 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#include "warp.h"
+
+#include "cpu_timing.h"
+
+#include <algorithm>
+#include <chrono>
+#include <functional>
+#include <thread>
+
+std::atomic<CpuTimingState*> g_cpu_timing_state { nullptr };
+
+// depth of nested CpuTimingScope objects on this thread
+static thread_local int g_cpu_timing_depth = 0;
+
+// time of the last wp_cpu_timing_mark_dispatch() on this thread, -1 if consumed
+static thread_local int64_t g_cpu_timing_dispatch_ns = -1;
+
+int64_t cpu_timing_now_ns()
+{
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(
+               std::chrono::steady_clock::now().time_since_epoch()
+    )
+        .count();
+}
+
+static uint64_t cpu_timing_thread_id() { return uint64_t(std::hash<std::thread::id>()(std::this_thread::get_id())); }
+
+void cpu_timing_record(CpuTimingState* state, CpuTimingRange& range, int64_t start_ns, int64_t end_ns)
+{
+    range.thread_id = cpu_timing_thread_id();
+    range.start_ns = start_ns - state->origin_ns;
+    range.end_ns = end_ns - state->origin_ns;
+
+    std::lock_guard<std::mutex> lock(state->mutex);
+    state->ranges.push_back(range);
+}
+
+int64_t cpu_timing_take_dispatch(int64_t now_ns)
+{
+    const int64_t dispatch_ns = g_cpu_timing_dispatch_ns;
+    g_cpu_timing_dispatch_ns = -1;
+    return dispatch_ns < 0 ? -1 : std::max<int64_t>(now_ns - dispatch_ns, 0);
+}
+
+CpuTimingScope::CpuTimingScope(int flag, const char* name)
+    : m_state(nullptr)
+    , m_start_ns(0)
+{
+    if (g_cpu_timing_depth++ > 0)
+        return;
+
+    m_state = cpu_timing_state(flag);
+    if (m_state) {
+        m_range.name = name;
+        m_range.flag = flag;
+        m_start_ns = cpu_timing_now_ns();
+    }
+}
+
+CpuTimingScope::~CpuTimingScope()
+{
+    --g_cpu_timing_depth;
+
+    if (m_state)
+        cpu_timing_record(m_state, m_range, m_start_ns, cpu_timing_now_ns());
+}
+
+void wp_cpu_timing_begin(int flags)
+{
+    CpuTimingState* parent = g_cpu_timing_state.load(std::memory_order_acquire);
+    g_cpu_timing_state.store(new CpuTimingState(flags, cpu_timing_now_ns(), parent), std::memory_order_release);
+}
+
+int wp_cpu_timing_get_result_count()
+{
+    CpuTimingState* state = g_cpu_timing_state.load(std::memory_order_acquire);
+    if (!state)
+        return 0;
+
+    std::lock_guard<std::mutex> lock(state->mutex);
+    return int(state->ranges.size());
+}
+
+void wp_cpu_timing_end(cpu_timing_result_t* results, int size)
+{
+    CpuTimingState* state = g_cpu_timing_state.load(std::memory_order_acquire);
+    if (!state)
+        return;
+
+    // restore previous state before reading the results so that no more ranges are appended
+    g_cpu_timing_state.store(state->parent, std::memory_order_release);
+
+    {
+        std::lock_guard<std::mutex> lock(state->mutex);
+
+        // ranges are appended when activities complete, report them in start order
+        std::stable_sort(
+            state->ranges.begin(), state->ranges.end(),
+            [](const CpuTimingRange& a, const CpuTimingRange& b) { return a.start_ns < b.start_ns; }
+        );
+
+        // number of results to write to the user buffer
+        int count = std::min(int(state->ranges.size()), size);
+
+        for (int i = 0; i < count; i++) {
+            const CpuTimingRange& range = state->ranges[i];
+            cpu_timing_result_t& result = results[i];
+            result.name = range.name;
+            result.func = range.func;
+            result.flag = range.flag;
+            result.ndim = range.ndim;
+            for (int d = 0; d < WP_CPU_TIMING_MAX_DIMS; d++)
+                result.shape[d] = range.shape[d];
+            result.thread_id = range.thread_id;
+            result.start = double(range.start_ns) * 1.0e-6;
+            result.elapsed = double(range.end_ns - range.start_ns) * 1.0e-6;
+            result.dispatch = range.dispatch_ns < 0 ? -1.0 : double(range.dispatch_ns) * 1.0e-6;
+        }
+    }
+
+    delete state;
+}
+
+void wp_cpu_timing_mark_dispatch() { g_cpu_timing_dispatch_ns = cpu_timing_now_ns(); }
@@ -0,0 +1,101 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+#include <mutex>
+#include <vector>
+
+// timing flags, shared by CPU and CUDA activity timing
+constexpr int WP_TIMING_KERNEL = 1;  // Warp kernel
+constexpr int WP_TIMING_KERNEL_BUILTIN = 2;  // internal kernel
+constexpr int WP_TIMING_MEMCPY = 4;  // memcpy operation
+constexpr int WP_TIMING_MEMSET = 8;  // memset operation
+constexpr int WP_TIMING_GRAPH = 16;  // graph launch
+
+constexpr int WP_CPU_TIMING_MAX_DIMS = 4;
+
+// CPU activity recorded between wp_cpu_timing_begin() and wp_cpu_timing_end()
+struct CpuTimingRange {
+    const char* name = nullptr;  // static activity name, nullptr for Warp kernels
+    void* func = nullptr;  // kernel entry point, mapped to a kernel name by Python
+    int flag = 0;
+    int ndim = 0;
+    int shape[WP_CPU_TIMING_MAX_DIMS] = {};
+    uint64_t thread_id = 0;
+    int64_t start_ns = 0;  // relative to the beginning of timing
+    int64_t end_ns = 0;
+    int64_t dispatch_ns = -1;  // time between wp_cpu_timing_mark_dispatch() and the kernel start, -1 if unknown
+};
+
+// Timing result used to pass CPU timings to Python
+struct cpu_timing_result_t {
+    const char* name;
+    void* func;
+    int flag;
+    int ndim;
+    int shape[WP_CPU_TIMING_MAX_DIMS];
+    uint64_t thread_id;
+    double start;  // milliseconds
+    double elapsed;  // milliseconds
+    double dispatch;  // milliseconds, negative if unknown
+};
+
+struct CpuTimingState {
+    int flags;
+    int64_t origin_ns;
+    std::mutex mutex;
+    std::vector<CpuTimingRange> ranges;
+    CpuTimingState* parent;
+
+    CpuTimingState(int flags, int64_t origin_ns, CpuTimingState* parent)
+        : flags(flags)
+        , origin_ns(origin_ns)
+        , parent(parent)
+    {
+    }
+};
+
+// active timing state, or nullptr when CPU timing is disabled
+extern std::atomic<CpuTimingState*> g_cpu_timing_state;
+
+// monotonic clock in nanoseconds
+int64_t cpu_timing_now_ns();
+
+// returns the active timing state if activities of the given type are being recorded
+inline CpuTimingState* cpu_timing_state(int flag)
+{
+    CpuTimingState* state = g_cpu_timing_state.load(std::memory_order_acquire);
+    return (state && (state->flags & flag)) ? state : nullptr;
+}
+
+// append a completed range to the timing state, filling in the thread and relative times
+void cpu_timing_record(CpuTimingState* state, CpuTimingRange& range, int64_t start_ns, int64_t end_ns);
+
+// consume the wp_cpu_timing_mark_dispatch() mark of the calling thread, returns the time elapsed until now_ns or -1
+int64_t cpu_timing_take_dispatch(int64_t now_ns);
+
+// Records the enclosing host operation as a CPU activity when timing is enabled for its type.
+// Scopes nested on the same thread are folded into the outermost one, so that native utilities
+// calling each other are reported once.
+class CpuTimingScope {
+public:
+    CpuTimingScope(int flag, const char* name);
+    ~CpuTimingScope();
+
+    CpuTimingScope(const CpuTimingScope&) = delete;
+    CpuTimingScope& operator=(const CpuTimingScope&) = delete;
+
+private:
+    CpuTimingState* m_state;
+    CpuTimingRange m_range;
+    int64_t m_start_ns;
+};
+
+#define WP_CPU_TIMING_CONCAT_IMPL(a, b) a##b
+#define WP_CPU_TIMING_CONCAT(a, b) WP_CPU_TIMING_CONCAT_IMPL(a, b)
+
+// time the rest of the enclosing block as a CPU activity
+#define cpu_timing_scope(_flag, _name) CpuTimingScope WP_CPU_TIMING_CONCAT(_cpu_timing_scope_, __LINE__)(_flag, _name)
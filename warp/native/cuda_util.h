@@ -4,6 +4,7 @@
 #pragma once
 
 #include "builtin.h"
+#include "cpu_timing.h"
 
 #if WP_ENABLE_CUDA
 
@@ -348,13 +349,6 @@ struct CudaTimingState {
     }
 };
 
-// timing flags
-constexpr int WP_TIMING_KERNEL = 1;  // Warp kernel
-constexpr int WP_TIMING_KERNEL_BUILTIN = 2;  // internal kernel
-constexpr int WP_TIMING_MEMCPY = 4;  // memcpy operation
-constexpr int WP_TIMING_MEMSET = 8;  // memset operation
-constexpr int WP_TIMING_GRAPH = 16;  // graph launch
-
 #define begin_cuda_range(_flag, _stream, _context, _name) \
     CudaTimingRange _timing_range; \
     bool _timing_enabled; \
@@ -5,12 +5,16 @@
 
 #include "apic.h"
 #include "apic_internal.h"
+#include "cpu_timing.h"
 #include "cuda_util.h"
 #include "hashgrid.h"
 #include "sort.h"
 #include "string.h"
+#include "thread_pool.h"
 
+#include <algorithm>
 #include <cstddef>
+#include <vector>
 
 using namespace wp;
 
@@ -117,6 +121,7 @@ template <typename Type> void hash_grid_destroy_host_impl(uint64_t id)
     wp_free_host(grid->point_ids);
     wp_free_host(grid->point_cells);
     wp_free_host(grid->point_keys);
+    wp_free_host(grid->point_last_keys);
     wp_free_host(grid->cell_starts);
     wp_free_host(grid->cell_ends);
 
@@ -131,12 +136,15 @@ template <typename Type> void hash_grid_reserve_host_impl(uint64_t id, int num_p
     if (num_points > grid->max_points) {
         wp_free_host(grid->point_cells);
         wp_free_host(grid->point_ids);
+        wp_free_host(grid->point_last_keys);
 
         const int num_to_alloc = num_points * 3 / 2;
         grid->point_cells = (int*)wp_alloc_host(2 * num_to_alloc * sizeof(int), tag);
         grid->point_ids = (int*)wp_alloc_host(2 * num_to_alloc * sizeof(int), tag);
+        grid->point_last_keys = (uint64_t*)wp_alloc_host(num_to_alloc * sizeof(uint64_t), tag);
 
         grid->max_points = num_to_alloc;
+        grid->num_sorted = 0;
     }
 
     if (with_groups && num_points > grid->max_keys) {
@@ -147,71 +155,292 @@ template <typename Type> void hash_grid_reserve_host_impl(uint64_t id, int num_p
         grid->point_keys = (uint64_t*)wp_alloc_host(2 * num_to_alloc * sizeof(uint64_t), tag);
 
         grid->max_keys = num_to_alloc;
+        grid->num_sorted = 0;
     }
 
     grid->num_points = num_points;
 }
 
+namespace {
+
+// minimum number of points (or cells) handled by one thread in the parallel host passes
+constexpr int hash_grid_parallel_min_size = 1 << 14;
+
+// granularity of the per-block moved point counts used by incremental updates
+constexpr int hash_grid_incremental_block_size = 1 << 12;
+
+// incremental updates fall back to a full rebuild once more than 1/N of the points changed key
+constexpr int hash_grid_incremental_max_moved_ratio = 10;
+
+// spatial cell of a sort key, grouped builds keep the cell in the high bits
+inline int hash_grid_key_cell(int key) { return key; }
+inline int hash_grid_key_cell(uint64_t key) { return int(key >> 32); }
+
+// (key, point id) order of the sorted point arrays, the radix sort is stable and starts
+// from ascending ids, so every build leaves points with equal keys in ascending id order
+template <typename Key> struct HashGridSortEntry {
+    Key key;
+    int id;
+
+    bool operator<(const HashGridSortEntry& other) const
+    {
+        return key < other.key || (key == other.key && id < other.id);
+    }
+};
+
+// number of bits needed to represent every cell index of the grid
+template <typename Type> int hash_grid_cell_bits(const HashGrid_t<Type>& grid)
+{
+    const uint32_t max_cell = uint32_t(hash_grid_num_cells(grid) - 1);
+
+    int bits = 1;
+    while (bits < 32 && (max_cell >> bits) != 0)
+        ++bits;
+    return bits;
+}
+
+// fill the start / end index of every occupied cell from the sorted point cells
+template <typename Type> void hash_grid_scan_cell_ranges(HashGrid_t<Type>& grid, int num_threads)
+{
+    const int num_points = grid.num_points;
+    const int* cells = grid.point_cells;
+
+    wp::parallel_for(num_points, num_threads, hash_grid_parallel_min_size, [&](size_t begin, size_t end) {
+        for (int i = int(begin); i < int(end); ++i) {
+            const int c = cells[i];
+
+            if (i == 0 || cells[i - 1] != c)
+                grid.cell_starts[c] = i;
+
+            if (i == num_points - 1 || cells[i + 1] != c)
+                grid.cell_ends[c] = i + 1;
+        }
+    });
+}
+
+// compute the key of every point from scratch and sort the points by (key, id)
+template <typename Type, typename Key, typename KeyOfPoint>
+void hash_grid_sort_host(
+    HashGrid_t<Type>& grid, Key* keys, int n, int key_bits, int num_threads, KeyOfPoint key_of_point
+)
+{
+    wp::parallel_for(n, num_threads, hash_grid_parallel_min_size, [&](size_t begin, size_t end) {
+        for (int i = int(begin); i < int(end); ++i) {
+            const Key key = key_of_point(i);
+            keys[i] = key;
+            grid.point_ids[i] = i;
+            grid.point_last_keys[i] = uint64_t(key);
+        }
+    });
+
+    // keys are non-negative, so only the bits spanning the grid's cells need to be sorted
+    if constexpr (sizeof(Key) == sizeof(uint32_t))
+        radix_sort_pairs_host(reinterpret_cast<uint32_t*>(keys), grid.point_ids, n, 0, key_bits, num_threads);
+    else
+        radix_sort_pairs_host(keys, grid.point_ids, n, 0, key_bits, num_threads);
+}
+
+// Re-sort only the points whose key changed since the previous build.
+//
+// On entry keys[0, n) and point_ids[0, n) hold the previous build ordered by (key, id),
+// point_last_keys holds the key of each point at that build, and keys[n, 2n) and
+// point_ids[n, 2n) are scratch. Points that kept their key are only read in point or
+// sorted order, moved points are sorted on their own and merged back, which gives exactly
+// the order of a full rebuild. Cells left by moved points are cleared from cell_starts and
+// cell_ends. Returns the number of moved points, or -1 without modifying the grid when
+// too many points moved for the update to beat a full rebuild.
+template <typename Type, typename Key, typename KeyOfPoint>
+int hash_grid_update_sorted_host(HashGrid_t<Type>& grid, Key* keys, int n, int num_threads, KeyOfPoint key_of_point)
+{
+    const int block_size = hash_grid_incremental_block_size;
+    const int num_blocks = (n + block_size - 1) / block_size;
+
+    int* ids = grid.point_ids;
+    Key* merged_keys = keys + n;
+    int* merged_ids = ids + n;
+
+    // current key of every point, staged in the scratch half until the moved points are known
+    Key* current_keys = merged_keys;
+    std::vector<int> block_offsets(num_blocks + 1, 0);
+
+    wp::parallel_for(num_blocks, num_threads, 1, [&](size_t first_block, size_t last_block) {
+        for (size_t block = first_block; block < last_block; ++block) {
+            const int begin = int(block) * block_size;
+            const int end = std::min(begin + block_size, n);
+
+            int num_moved = 0;
+            for (int i = begin; i < end; ++i) {
+                const Key key = key_of_point(i);
+                current_keys[i] = key;
+                num_moved += uint64_t(key) != grid.point_last_keys[i];
+            }
+            block_offsets[block + 1] = num_moved;
+        }
+    });
+
+    for (int block = 0; block < num_blocks; ++block)
+        block_offsets[block + 1] += block_offsets[block];
+
+    const int num_moved = block_offsets[num_blocks];
+    if (num_moved == 0)
+        return 0;
+    if (num_moved > n / hash_grid_incremental_max_moved_ratio)
+        return -1;
+
+    // moved points with their previous and current keys
+    std::vector<HashGridSortEntry<Key>> moved_from(num_moved);
+    std::vector<HashGridSortEntry<Key>> moved_to(num_moved);
+
+    wp::parallel_for(num_blocks, num_threads, 1, [&](size_t first_block, size_t last_block) {
+        for (size_t block = first_block; block < last_block; ++block) {
+            const int begin = int(block) * block_size;
+            const int end = std::min(begin + block_size, n);
+
+            int offset = block_offsets[block];
+            for (int i = begin; i < end; ++i) {
+                const Key key = current_keys[i];
+                if (uint64_t(key) != grid.point_last_keys[i]) {
+                    moved_from[offset] = { Key(grid.point_last_keys[i]), i };
+                    moved_to[offset] = { key, i };
+                    grid.point_last_keys[i] = uint64_t(key);
+                    ++offset;
+                }
+            }
+        }
+    });
+
+    std::sort(moved_from.begin(), moved_from.end());
+    std::sort(moved_to.begin(), moved_to.end());
+
+    // merge the points that kept their key with the moved ones, each block walks its slice of
+    // the previous build alongside the moved entries that fall between its first and last slot
+    auto first_moved_after = [&](const std::vector<HashGridSortEntry<Key>>& moved, int slot) {
+        if (slot == n)
+            return num_moved;
+        const HashGridSortEntry<Key> entry = { keys[slot], ids[slot] };
+        return int(std::lower_bound(moved.begin(), moved.end(), entry) - moved.begin());
+    };
+
+    wp::parallel_for(num_blocks, num_threads, 1, [&](size_t first_block, size_t last_block) {
+        for (size_t block = first_block; block < last_block; ++block) {
+            const int begin = int(block) * block_size;
+            const int end = std::min(begin + block_size, n);
+
+            // number of moved points removed before slot i, and next moved point to insert
+            int removed = first_moved_after(moved_from, begin);
+            int inserted = block == 0 ? 0 : first_moved_after(moved_to, begin);
+            const int inserted_end = first_moved_after(moved_to, end);
+
+            for (int i = begin; i < end; ++i) {
+                const HashGridSortEntry<Key> entry = { keys[i], ids[i] };
+
+                for (; inserted < inserted_end && moved_to[inserted] < entry; ++inserted) {
+                    merged_keys[inserted + i - removed] = moved_to[inserted].key;
+                    merged_ids[inserted + i - removed] = moved_to[inserted].id;
+                }
+
+                if (removed < num_moved && moved_from[removed].id == entry.id) {
+                    ++removed;
+                    continue;
+                }
+
+                merged_keys[i - removed + inserted] = entry.key;
+                merged_ids[i - removed + inserted] = entry.id;
+            }
+
+            for (; inserted < inserted_end; ++inserted) {
+                merged_keys[inserted + end - removed] = moved_to[inserted].key;
+                merged_ids[inserted + end - removed] = moved_to[inserted].id;
+            }
+        }
+    });
+
+    // cells left by moved points may now be empty, occupied cells are rewritten by the range scan
+    for (const HashGridSortEntry<Key>& entry : moved_from) {
+        const int c = hash_grid_key_cell(entry.key);
+        grid.cell_starts[c] = 0;
+        grid.cell_ends[c] = 0;
+    }
+
+    wp::parallel_for(n, num_threads, hash_grid_parallel_min_size, [&](size_t begin, size_t end) {
+        memcpy(keys + begin, merged_keys + begin, sizeof(Key) * (end - begin));
+        memcpy(ids + begin, merged_ids + begin, sizeof(int) * (end - begin));
+    });
+
+    return num_moved;
+}
+
+}  // anonymous namespace
+
 template <typename Type>
 void hash_grid_update_host_impl(
-    uint64_t id, Type cell_width, const wp::array_t<vec_t<3, Type>>* points, const wp::array_t<int>* groups
+    uint64_t id,
+    Type cell_width,
+    const wp::array_t<vec_t<3, Type>>* points,
+    const wp::array_t<int>* groups,
+    int num_threads,
+    bool incremental
 )
 {
     // array dtypes, shapes, and devices are validated by HashGrid.build() before reaching native code
     HashGrid_t<Type>* grid = (HashGrid_t<Type>*)(id);
     const int num_points = points->shape[0];
+    const int has_groups = groups ? 1 : 0;
 
     hash_grid_reserve_host_impl<Type>(id, num_points, groups != nullptr);
 
+    // the previous build seeds an incremental update if it bucketed the same number of points
+    // with the same cell width and grouping, otherwise the grid is rebuilt from scratch
+    const bool can_update = incremental && num_points > 0 && grid->num_sorted == num_points
+        && grid->cell_width == cell_width && grid->has_groups == has_groups;
+
     grid->cell_width = cell_width;
     grid->cell_width_inv = Type(1) / cell_width;
-    grid->has_groups = groups ? 1 : 0;
+    grid->has_groups = has_groups;
+    grid->num_sorted = 0;
+
+    const int cell_bits = hash_grid_cell_bits(*grid);
+    int num_moved = -1;
 
     if (groups) {
         // sort composite (cell, group) keys so each cell's points are contiguous per group
-        for (int i = 0; i < num_points; ++i) {
-            const int cell = hash_grid_index(*grid, wp::index(*points, i));
-            grid->point_keys[i] = hash_grid_point_key(cell, wp::index(*groups, i));
-            grid->point_ids[i] = i;
+        auto key_of_point = [&](int i) {
+            return hash_grid_point_key(hash_grid_index(*grid, wp::index(*points, i)), wp::index(*groups, i));
+        };
+
+        if (can_update)
+            num_moved = hash_grid_update_sorted_host(*grid, grid->point_keys, num_points, num_threads, key_of_point);
+        if (num_moved < 0)
+            hash_grid_sort_host(*grid, grid->point_keys, num_points, 32 + cell_bits, num_threads, key_of_point);
+
+        if (num_moved != 0) {
+            wp::parallel_for(num_points, num_threads, hash_grid_parallel_min_size, [&](size_t begin, size_t end) {
+                for (int i = int(begin); i < int(end); ++i)
+                    grid->point_cells[i] = hash_grid_key_cell(grid->point_keys[i]);
+            });
         }
-
-        radix_sort_pairs_host(grid->point_keys, grid->point_ids, num_points);
-
-        for (int i = 0; i < num_points; ++i)
-            grid->point_cells[i] = (int)(grid->point_keys[i] >> 32);
     } else {
-        for (int i = 0; i < num_points; ++i) {
-            grid->point_cells[i] = hash_grid_index(*grid, wp::index(*points, i));
-            grid->point_ids[i] = i;
-        }
+        auto key_of_point = [&](int i) { return hash_grid_index(*grid, wp::index(*points, i)); };
 
-        radix_sort_pairs_host(grid->point_cells, grid->point_ids, num_points);
+        if (can_update)
+            num_moved = hash_grid_update_sorted_host(*grid, grid->point_cells, num_points, num_threads, key_of_point);
+        if (num_moved < 0)
+            hash_grid_sort_host(*grid, grid->point_cells, num_points, cell_bits, num_threads, key_of_point);
     }
 
-    const int num_cells = hash_grid_num_cells(*grid);
-    memset(grid->cell_starts, 0, sizeof(int) * num_cells);
-    memset(grid->cell_ends, 0, sizeof(int) * num_cells);
-
-    // compute cell start / end
-    for (int i = 0; i < num_points; ++i) {
-        // scan the particle-cell array to find the start and end
-        const int c = grid->point_cells[i];
-
-        if (i == 0)
-            grid->cell_starts[c] = 0;
-        else {
-            const int p = grid->point_cells[i - 1];
-
-            if (c != p) {
-                grid->cell_starts[c] = i;
-                grid->cell_ends[p] = i;
-            }
-        }
-
-        if (i == num_points - 1) {
-            grid->cell_ends[c] = i + 1;
-        }
+    if (num_moved < 0) {
+        const int num_cells = hash_grid_num_cells(*grid);
+        wp::parallel_for(num_cells, num_threads, hash_grid_parallel_min_size, [&](size_t begin, size_t end) {
+            memset(grid->cell_starts + begin, 0, sizeof(int) * (end - begin));
+            memset(grid->cell_ends + begin, 0, sizeof(int) * (end - begin));
+        });
     }
+
+    // an update where no point changed key leaves the sorted points and cell ranges as they were
+    if (num_moved != 0)
+        hash_grid_scan_cell_ranges(*grid, num_threads);
+
+    grid->num_sorted = num_points;
 }
 
 // =============================================================================
@@ -411,7 +640,9 @@ void wp_hash_grid_destroy_host(uint64_t id, int type)
     }
 }
 
-void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const void* points, const void* groups)
+void wp_hash_grid_update_host(
+    uint64_t id, int type, double cell_width, const void* points, const void* groups, int num_threads, bool incremental
+)
 {
     switch (type) {
     case HASH_GRID_TYPE_FLOAT16: {
@@ -419,7 +650,8 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<half>(id, half(cell_width), points_desc, groups_desc);
+        cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "hash_grid_update");
+        hash_grid_update_host_impl<half>(id, half(cell_width), points_desc, groups_desc, num_threads, incremental);
         break;
     }
     case HASH_GRID_TYPE_FLOAT32: {
@@ -427,7 +659,8 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<float>(id, float(cell_width), points_desc, groups_desc);
+        cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "hash_grid_update");
+        hash_grid_update_host_impl<float>(id, float(cell_width), points_desc, groups_desc, num_threads, incremental);
         break;
     }
     case HASH_GRID_TYPE_FLOAT64: {
@@ -435,7 +668,8 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<double>(id, cell_width, points_desc, groups_desc);
+        cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "hash_grid_update");
+        hash_grid_update_host_impl<double>(id, cell_width, points_desc, groups_desc, num_threads, incremental);
         break;
     }
     default:
@@ -36,6 +36,11 @@ template <typename Type> struct HashGrid_t {
     // Type-dependent fields at end (different sizes for half/float/double)
     Type cell_width = {};
     Type cell_width_inv = {};
+
+    // Host-only state for incremental CPU rebuilds, kept last so that the offsets of the
+    // fields read by kernels do not depend on it
+    uint64_t* point_last_keys = nullptr;  // sort key of each point at the last build, by point index
+    int num_sorted = 0;  // number of points ordered by the last build
 };
 
 // Type aliases for backward compatibility and convenience
@@ -4,6 +4,7 @@
 #include "warp.h"
 
 #include "bvh.h"
+#include "cpu_timing.h"
 #include "cuda_util.h"
 #include "error.h"
 #include "mesh.h"
@@ -124,9 +125,12 @@ uint64_t wp_mesh_create_host(
     int support_winding_number,
     int constructor_type,
     int* groups,
-    int bvh_leaf_size
+    int bvh_leaf_size,
+    int num_threads
 )
 {
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "mesh_create");
+
     Mesh* m
         = new (wp_alloc_host(sizeof(Mesh), "(native:mesh)")) Mesh(points, velocities, indices, num_points, num_tris);
     const bool use_cubql = (constructor_type == BVH_CONSTRUCTOR_CUBQL);
@@ -169,7 +173,9 @@ uint64_t wp_mesh_create_host(
     }
 #endif
     {
-        wp::bvh_create_host(m->lowers, m->uppers, num_tris, constructor_type, groups, bvh_leaf_size, m->bvh);
+        wp::bvh_create_host(
+            m->lowers, m->uppers, num_tris, constructor_type, groups, bvh_leaf_size, m->bvh, num_threads
+        );
     }
 
     if (!m->bvh.node_lowers && num_tris > 0) {
@@ -209,6 +215,8 @@ void wp_mesh_destroy_host(uint64_t id)
 
 void wp_mesh_refit_host(uint64_t id)
 {
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "mesh_refit");
+
     Mesh* m = (Mesh*)(id);
 
     float sum = 0.0;
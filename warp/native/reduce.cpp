@@ -5,6 +5,7 @@
 
 #include "apic.h"
 #include "apic_internal.h"
+#include "cpu_timing.h"
 
 namespace {
 
@@ -163,6 +164,8 @@ void wp_array_inner_float_host(
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_inner");
+
     const float* ptr_a = (const float*)(a);
     const float* ptr_b = (const float*)(b);
     float* ptr_out = (float*)(out);
@@ -179,6 +182,8 @@ void wp_array_inner_double_host(
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_inner");
+
     const double* ptr_a = (const double*)(a);
     const double* ptr_b = (const double*)(b);
     double* ptr_out = (double*)(out);
@@ -193,6 +198,8 @@ void wp_array_sum_float_host(uint64_t a, uint64_t out, int count, int byte_strid
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_sum");
+
     const float* ptr_a = (const float*)(a);
     float* ptr_out = (float*)(out);
     array_sum_host(ptr_a, ptr_out, count, byte_stride_a, type_length);
@@ -205,6 +212,8 @@ void wp_array_sum_double_host(uint64_t a, uint64_t out, int count, int byte_stri
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_sum");
+
     const double* ptr_a = (const double*)(a);
     double* ptr_out = (double*)(out);
     array_sum_host(ptr_a, ptr_out, count, byte_stride_a, type_length);
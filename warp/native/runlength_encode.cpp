@@ -6,6 +6,7 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "apic_types.h"
+#include "cpu_timing.h"
 
 #include <cstdint>
 
@@ -75,6 +76,7 @@ void wp_runlength_encode_int_host(uint64_t values, uint64_t run_values, uint64_t
         return;
     if (apic_capture_runlength_encode(values, run_values, run_lengths, run_count, n))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "runlength_encode");
     runlength_encode_host<int>(
         n, reinterpret_cast<const int*>(values), reinterpret_cast<int*>(run_values),
         reinterpret_cast<int*>(run_lengths), reinterpret_cast<int*>(run_count)
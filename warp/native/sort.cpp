@@ -6,12 +6,19 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "apic_types.h"
+#include "cpu_timing.h"
 #include "error.h"
 #include "sort.h"
 #include "string.h"
+#include "thread_pool.h"
 
 #include <cassert>
 #include <cstdint>
+#include <utility>
+#include <vector>
+
+// below this many elements the serial sort is faster than waking the thread pool
+static const int radix_sort_parallel_min_size = 1 << 16;
 
 template <int Size> struct SortPayload {
     uint8_t data[Size];
@@ -170,6 +177,133 @@ void radix_sort_pairs_host(
     }
 }
 
+// Multi-threaded LSD radix sort with the same contract as radix_sort_pairs_host().
+// The input is split into one contiguous block per thread. Each pass builds per-block
+// digit histograms, turns them into per-block scatter offsets (bucket-major, so the
+// sort stays stable), and scatters every block concurrently. Passes where all keys
+// share the same digit are skipped.
+template <typename KeyType, typename ValueType, typename RadixKeyType, typename KeyToRadix>
+void radix_sort_pairs_host_parallel(
+    KeyType* keys,
+    ValueType* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int num_threads,
+    KeyToRadix key_to_radix
+)
+{
+    constexpr int keyWidth = sizeof(RadixKeyType) * 8;
+    constexpr int radixBits = 8;
+    constexpr int bucketCount = 1 << radixBits;
+
+    if (begin_bit < 0 || end_bit <= begin_bit || end_bit > keyWidth) {
+        return;
+    }
+
+    const int numBlocks = wp::cpu_resolve_num_threads(num_threads);
+    const int blockSize = (n + numBlocks - 1) / numBlocks;
+
+    std::vector<int> offsets(size_t(numBlocks) * bucketCount);
+
+    KeyType* readKeys = keys;
+    ValueType* readValues = values;
+    KeyType* writeKeys = keys + offset_to_scratch_memory;
+    ValueType* writeValues = values + offset_to_scratch_memory;
+
+    for (int shift = begin_bit; shift < end_bit; shift += radixBits) {
+        const int passBits = (end_bit - shift) < radixBits ? (end_bit - shift) : radixBits;
+        const RadixKeyType mask = (RadixKeyType(1) << passBits) - 1;
+
+        // per-block histograms
+        wp::parallel_for(numBlocks, numBlocks, 1, [&](size_t firstBlock, size_t lastBlock) {
+            for (size_t block = firstBlock; block < lastBlock; ++block) {
+                int* counts = offsets.data() + block * bucketCount;
+                memset(counts, 0, sizeof(int) * bucketCount);
+
+                const int begin = int(block) * blockSize;
+                const int end = (begin + blockSize) < n ? (begin + blockSize) : n;
+                for (int i = begin; i < end; ++i) {
+                    ++counts[(key_to_radix(readKeys[i]) >> shift) & mask];
+                }
+            }
+        });
+
+        // exclusive prefix sum in (bucket, block) order
+        bool trivialPass = false;
+        int off = 0;
+        for (int b = 0; b < bucketCount; ++b) {
+            const int bucketBegin = off;
+            for (int block = 0; block < numBlocks; ++block) {
+                int& slot = offsets[size_t(block) * bucketCount + b];
+                const int count = slot;
+                slot = off;
+                off += count;
+            }
+
+            if (off - bucketBegin == n) {
+                trivialPass = true;
+                break;
+            }
+        }
+
+        // every key has the same digit, the order is unchanged by this pass
+        if (trivialPass)
+            continue;
+
+        // scatter
+        wp::parallel_for(numBlocks, numBlocks, 1, [&](size_t firstBlock, size_t lastBlock) {
+            for (size_t block = firstBlock; block < lastBlock; ++block) {
+                int* blockOffsets = offsets.data() + block * bucketCount;
+
+                const int begin = int(block) * blockSize;
+                const int end = (begin + blockSize) < n ? (begin + blockSize) : n;
+                for (int i = begin; i < end; ++i) {
+                    const KeyType k = readKeys[i];
+                    const int offset = blockOffsets[(key_to_radix(k) >> shift) & mask]++;
+
+                    writeKeys[offset] = k;
+                    writeValues[offset] = readValues[i];
+                }
+            }
+        });
+
+        std::swap(readKeys, writeKeys);
+        std::swap(readValues, writeValues);
+    }
+
+    if (readKeys != keys) {
+        wp::parallel_for(n, num_threads, radix_sort_parallel_min_size, [&](size_t begin, size_t end) {
+            memcpy(keys + begin, readKeys + begin, sizeof(KeyType) * (end - begin));
+            memcpy(values + begin, readValues + begin, sizeof(ValueType) * (end - begin));
+        });
+    }
+}
+
+template <typename KeyType, typename ValueType, typename RadixKeyType, typename KeyToRadix>
+void radix_sort_pairs_host_dispatch_threads(
+    KeyType* keys,
+    ValueType* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int num_threads,
+    KeyToRadix key_to_radix
+)
+{
+    if (num_threads != 1 && n >= radix_sort_parallel_min_size && wp::cpu_resolve_num_threads(num_threads) > 1) {
+        radix_sort_pairs_host_parallel<KeyType, ValueType, RadixKeyType>(
+            keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, num_threads, key_to_radix
+        );
+    } else {
+        radix_sort_pairs_host<KeyType, ValueType, RadixKeyType>(
+            keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, key_to_radix
+        );
+    }
+}
+
 template <typename KeyType, typename RadixKeyType, typename KeyToRadix>
 void radix_sort_pairs_host_dispatch_value(
     KeyType* keys,
@@ -179,18 +313,19 @@ void radix_sort_pairs_host_dispatch_value(
     int begin_bit,
     int end_bit,
     int value_size,
+    int num_threads,
     KeyToRadix key_to_radix
 )
 {
     if (value_size == 4) {
-        radix_sort_pairs_host<KeyType, SortPayload<4>, RadixKeyType>(
+        radix_sort_pairs_host_dispatch_threads<KeyType, SortPayload<4>, RadixKeyType>(
             keys, reinterpret_cast<SortPayload<4>*>(values), n, offset_to_scratch_memory, begin_bit, end_bit,
-            key_to_radix
+            num_threads, key_to_radix
         );
     } else if (value_size == 8) {
-        radix_sort_pairs_host<KeyType, SortPayload<8>, RadixKeyType>(
+        radix_sort_pairs_host_dispatch_threads<KeyType, SortPayload<8>, RadixKeyType>(
             keys, reinterpret_cast<SortPayload<8>*>(values), n, offset_to_scratch_memory, begin_bit, end_bit,
-            key_to_radix
+            num_threads, key_to_radix
         );
     } else {
         wp::set_error_string("Warp sort error: Unsupported radix sort value size %d", value_size);
@@ -199,61 +334,91 @@ void radix_sort_pairs_host_dispatch_value(
 }
 
 void radix_sort_pairs_host(
-    int* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    int* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<int, uint32_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size,
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
         [](int key) { return static_cast<uint32_t>(key) ^ 0x80000000u; }
     );
 }
 
-void radix_sort_pairs_host(int* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(int* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
 void radix_sort_pairs_host(
-    uint32_t* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    uint32_t* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<uint32_t, uint32_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, [](uint32_t key) { return key; }
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
+        [](uint32_t key) { return key; }
     );
 }
 
-void radix_sort_pairs_host(uint32_t* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(uint32_t* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
 void radix_sort_pairs_host(
-    int64_t* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    int64_t* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<int64_t, uint64_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size,
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
         [](int64_t key) { return static_cast<uint64_t>(key) ^ 0x8000000000000000ull; }
     );
 }
 
-void radix_sort_pairs_host(int64_t* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(int64_t* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
 void radix_sort_pairs_host(
-    uint64_t* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    uint64_t* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<uint64_t, uint64_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, [](uint64_t key) { return key; }
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
+        [](uint64_t key) { return key; }
     );
 }
 
-void radix_sort_pairs_host(uint64_t* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(uint64_t* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
 // http://stereopsis.com/radix.html
@@ -274,55 +439,114 @@ inline uint64_t radix_double_to_int(double f)
 }
 
 void radix_sort_pairs_host(
-    float* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    float* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<float, uint32_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size,
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
         [](float key) { return radix_float_to_int(key); }
     );
 }
 
-void radix_sort_pairs_host(float* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(float* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
 void radix_sort_pairs_host(
-    double* keys, void* values, int n, int offset_to_scratch_memory, int begin_bit, int end_bit, int value_size
+    double* keys,
+    void* values,
+    int n,
+    int offset_to_scratch_memory,
+    int begin_bit,
+    int end_bit,
+    int value_size,
+    int num_threads
 )
 {
     radix_sort_pairs_host_dispatch_value<double, uint64_t>(
-        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size,
+        keys, values, n, offset_to_scratch_memory, begin_bit, end_bit, value_size, num_threads,
         [](double key) { return radix_double_to_int(key); }
     );
 }
 
-void radix_sort_pairs_host(double* keys, int* values, int n, int begin_bit, int end_bit)
+void radix_sort_pairs_host(double* keys, int* values, int n, int begin_bit, int end_bit, int num_threads)
 {
-    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
+    radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int), num_threads);
 }
 
-void segmented_sort_pairs_host(
-    float* keys, int* values, int n, int* segment_start_indices, int* segment_end_indices, int num_segments
+// Segments are independent, so they are distributed dynamically over the thread pool and
+// each one is sorted serially. With fewer segments than threads that would leave threads
+// idle, so the segments are instead sorted one after the other, each with the parallel sort.
+template <typename KeyType>
+void segmented_sort_pairs_host_impl(
+    KeyType* keys,
+    int* values,
+    int n,
+    const int* segment_start_indices,
+    const int* segment_end_indices,
+    int num_segments,
+    int num_threads
 )
 {
-    for (int i = 0; i < num_segments; ++i) {
-        const int start = segment_start_indices[i];
-        const int end = segment_end_indices[i];
-        radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int));
+    if (num_segments <= 0)
+        return;
+
+    const int resolved_threads = num_threads == 1 ? 1 : wp::cpu_resolve_num_threads(num_threads);
+
+    if (resolved_threads == 1 || num_segments < resolved_threads) {
+        for (int i = 0; i < num_segments; ++i) {
+            const int start = segment_start_indices[i];
+            const int end = segment_end_indices[i];
+            radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int), num_threads);
+        }
+        return;
     }
+
+    wp::parallel_for(num_segments, num_threads, 1, [&](size_t first, size_t last) {
+        for (size_t i = first; i < last; ++i) {
+            const int start = segment_start_indices[i];
+            const int end = segment_end_indices[i];
+            radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int), 1);
+        }
+    });
 }
 
 void segmented_sort_pairs_host(
-    int* keys, int* values, int n, int* segment_start_indices, int* segment_end_indices, int num_segments
+    float* keys,
+    int* values,
+    int n,
+    int* segment_start_indices,
+    int* segment_end_indices,
+    int num_segments,
+    int num_threads
 )
 {
-    for (int i = 0; i < num_segments; ++i) {
-        const int start = segment_start_indices[i];
-        const int end = segment_end_indices[i];
-        radix_sort_pairs_host(keys + start, values + start, end - start, n, 0, 32, sizeof(int));
-    }
+    segmented_sort_pairs_host_impl(
+        keys, values, n, segment_start_indices, segment_end_indices, num_segments, num_threads
+    );
+}
+
+void segmented_sort_pairs_host(
+    int* keys,
+    int* values,
+    int n,
+    int* segment_start_indices,
+    int* segment_end_indices,
+    int num_segments,
+    int num_threads
+)
+{
+    segmented_sort_pairs_host_impl(
+        keys, values, n, segment_start_indices, segment_end_indices, num_segments, num_threads
+    );
 }
 
 
@@ -381,57 +605,80 @@ void wp_segmented_sort_pairs_int_device(
 #endif  // !WP_ENABLE_CUDA
 
 
-void wp_radix_sort_pairs_int_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_int_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_INT32, sizeof(int32_t)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<int*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<int*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size, num_threads
     );
 }
 
-void wp_radix_sort_pairs_uint_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_uint_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_UINT32, sizeof(uint32_t)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<uint32_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<uint32_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size,
+        num_threads
     );
 }
 
-void wp_radix_sort_pairs_int64_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_int64_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_INT64, sizeof(int64_t)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<int64_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<int64_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size,
+        num_threads
     );
 }
 
-void wp_radix_sort_pairs_uint64_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_uint64_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_UINT64, sizeof(uint64_t)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<uint64_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<uint64_t*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size,
+        num_threads
     );
 }
 
-void wp_radix_sort_pairs_float_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_float_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_FLOAT32, sizeof(float)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<float*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<float*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size,
+        num_threads
     );
 }
 
-void wp_radix_sort_pairs_double_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size)
+void wp_radix_sort_pairs_double_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+)
 {
     if (apic_capture_radix_sort(keys, values, n, begin_bit, end_bit, value_size, APIC_TYPE_FLOAT64, sizeof(double)))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "radix_sort_pairs");
     radix_sort_pairs_host(
-        reinterpret_cast<double*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size
+        reinterpret_cast<double*>(keys), reinterpret_cast<void*>(values), n, n, begin_bit, end_bit, value_size,
+        num_threads
     );
 }
 
@@ -441,16 +688,19 @@ void wp_segmented_sort_pairs_float_host(
     int n,
     uint64_t segment_start_indices,
     uint64_t segment_end_indices,
-    int num_segments
+    int num_segments,
+    int num_threads
 )
 {
     if (apic_capture_segmented_sort(
             keys, values, n, segment_start_indices, segment_end_indices, num_segments, APIC_TYPE_FLOAT32
         ))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "segmented_sort_pairs");
     segmented_sort_pairs_host(
         reinterpret_cast<float*>(keys), reinterpret_cast<int*>(values), n,
-        reinterpret_cast<int*>(segment_start_indices), reinterpret_cast<int*>(segment_end_indices), num_segments
+        reinterpret_cast<int*>(segment_start_indices), reinterpret_cast<int*>(segment_end_indices), num_segments,
+        num_threads
     );
 }
 
@@ -460,15 +710,17 @@ void wp_segmented_sort_pairs_int_host(
     int n,
     uint64_t segment_start_indices,
     uint64_t segment_end_indices,
-    int num_segments
+    int num_segments,
+    int num_threads
 )
 {
     if (apic_capture_segmented_sort(
             keys, values, n, segment_start_indices, segment_end_indices, num_segments, APIC_TYPE_INT32
         ))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "segmented_sort_pairs");
     segmented_sort_pairs_host(
         reinterpret_cast<int*>(keys), reinterpret_cast<int*>(values), n, reinterpret_cast<int*>(segment_start_indices),
-        reinterpret_cast<int*>(segment_end_indices), num_segments
+        reinterpret_cast<int*>(segment_end_indices), num_segments, num_threads
     );
 }
@@ -6,7 +6,10 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "apic_types.h"
+#include "cpu_timing.h"
+#include "sort.h"
 #include "sparse_util.h"
+#include "thread_pool.h"
 
 #include <algorithm>
 #include <cstddef>
@@ -18,6 +21,44 @@
 
 namespace {
 
+// below this many triplets the serial topology build is faster than waking the host thread pool
+constexpr int bsr_parallel_min_triplets = 1 << 14;
+
+// minimum number of rows per chunk for row-parallel host loops
+constexpr size_t bsr_parallel_min_rows = 64;
+
+// Chunked two-pass scan over [0, n) on up to num_threads host threads. count(begin, end) returns the number of
+// outputs produced by the indices of a chunk, emit(begin, end, first) then writes them starting at output index
+// first. Outputs keep the order of their indices. Returns the total number of outputs.
+template <typename Count, typename Emit> int bsr_parallel_scan(int n, int num_threads, Count count, Emit emit)
+{
+    const int chunk_count = std::max(1, std::min(n, wp::cpu_resolve_num_threads(num_threads)));
+    const int chunk_size = (n + chunk_count - 1) / chunk_count;
+
+    std::vector<int> chunk_offsets(size_t(chunk_count) + 1, 0);
+    wp::parallel_for(size_t(chunk_count), chunk_count, 1, [&](size_t chunk_begin, size_t chunk_end) {
+        for (size_t chunk = chunk_begin; chunk < chunk_end; ++chunk) {
+            const int begin = int(chunk) * chunk_size;
+            const int end = std::min(n, begin + chunk_size);
+            chunk_offsets[chunk + 1] = begin < end ? count(begin, end) : 0;
+        }
+    });
+
+    std::partial_sum(chunk_offsets.begin(), chunk_offsets.end(), chunk_offsets.begin());
+
+    wp::parallel_for(size_t(chunk_count), chunk_count, 1, [&](size_t chunk_begin, size_t chunk_end) {
+        for (size_t chunk = chunk_begin; chunk < chunk_end; ++chunk) {
+            const int begin = int(chunk) * chunk_size;
+            const int end = std::min(n, begin + chunk_size);
+            if (begin < end) {
+                emit(begin, end, chunk_offsets[chunk]);
+            }
+        }
+    });
+
+    return chunk_offsets[chunk_count];
+}
+
 template <typename T>
 bool bsr_block_is_zero(int block_idx, int block_size, const void* values, const uint64_t scalar_zero_mask)
 {
@@ -39,7 +80,8 @@ void bsr_compress_inplace_host_impl(
     int* bsr_columns,
     void* bsr_values,
     uint64_t prune_zero_mask,
-    int* bsr_nnz
+    int* bsr_nnz,
+    int num_threads
 )
 {
     T* values = nullptr;
@@ -57,12 +99,15 @@ void bsr_compress_inplace_host_impl(
         out_row_counts = compact_row_counts.data();
     }
 
-    for (int row = 0; row < row_count; ++row) {
-        bsr_compress_inplace_row<T, CompressValues>(
-            row, block_size, bsr_offsets, bsr_row_counts, out_row_counts, bsr_columns, values, values_to_prune,
-            prune_zero_mask
-        );
-    }
+    // rows are compressed independently within their own storage range
+    wp::parallel_for(size_t(row_count), num_threads, bsr_parallel_min_rows, [&](size_t row_begin, size_t row_end) {
+        for (int row = int(row_begin); row < int(row_end); ++row) {
+            bsr_compress_inplace_row<T, CompressValues>(
+                row, block_size, bsr_offsets, bsr_row_counts, out_row_counts, bsr_columns, values, values_to_prune,
+                prune_zero_mask
+            );
+        }
+    });
 
     if (!make_compact) {
         return;
@@ -100,6 +145,450 @@ void bsr_compress_inplace_host_impl(
     }
 }
 
+// Serial topology build, sorts the valid triplets by (row, col) and sums duplicates
+void bsr_matrix_from_triplets_host_serial(
+    int block_size,
+    int scalar_size_in_bytes,
+    int row_count,
+    int col_count,
+    int nnz,
+    const int* tpl_rows,
+    const int* tpl_columns,
+    const void* tpl_values,
+    uint64_t scalar_zero_mask,
+    bool masked_topology,
+    int* tpl_block_offsets,
+    int* tpl_block_indices,
+    int* bsr_offsets,
+    const int* bsr_row_counts,
+    int* bsr_columns
+)
+{
+    std::iota(tpl_block_indices, tpl_block_indices + nnz, 0);
+
+    // remove invalid indices / indices not in mask
+    auto discard_invalid_block = [&](int i) -> bool {
+        const int row = tpl_rows[i];
+        const int col = tpl_columns[i];
+        if (row < 0 || row >= row_count || col < 0 || col >= col_count) {
+            return true;
+        }
+
+        if (!masked_topology) {
+            return false;
+        }
+
+        const int* beg = bsr_columns + bsr_offsets[row];
+        const int* end = bsr_columns + bsr_active_row_end(bsr_offsets, bsr_row_counts, row);
+        const int* block = std::lower_bound(beg, end, col);
+        return block == end || *block != col;
+    };
+
+    int* valid_indices_end = std::remove_if(tpl_block_indices, tpl_block_indices + nnz, discard_invalid_block);
+
+    // remove zero blocks
+    if (tpl_values != nullptr && scalar_zero_mask != 0) {
+        switch (scalar_size_in_bytes) {
+        case sizeof(uint8_t):
+            valid_indices_end = std::remove_if(
+                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
+                    return bsr_block_is_zero<uint8_t>(i, block_size, tpl_values, scalar_zero_mask);
+                }
+            );
+            break;
+        case sizeof(uint16_t):
+            valid_indices_end = std::remove_if(
+                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
+                    return bsr_block_is_zero<uint16_t>(i, block_size, tpl_values, scalar_zero_mask);
+                }
+            );
+            break;
+        case sizeof(uint32_t):
+            valid_indices_end = std::remove_if(
+                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
+                    return bsr_block_is_zero<uint32_t>(i, block_size, tpl_values, scalar_zero_mask);
+                }
+            );
+            break;
+        case sizeof(uint64_t):
+            valid_indices_end = std::remove_if(
+                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
+                    return bsr_block_is_zero<uint64_t>(i, block_size, tpl_values, scalar_zero_mask);
+                }
+            );
+            break;
+        }
+    }
+
+    // sort block indices according to lexico order
+    std::sort(tpl_block_indices, valid_indices_end, [tpl_rows, tpl_columns](int i, int j) -> bool {
+        return tpl_rows[i] < tpl_rows[j] || (tpl_rows[i] == tpl_rows[j] && tpl_columns[i] < tpl_columns[j]);
+    });
+
+    // accumulate blocks at same locations, count blocks per row
+    std::fill_n(bsr_offsets, row_count + 1, 0);
+
+    int current_row = -1;
+    int current_col = -1;
+    int current_block_idx = -1;
+
+    for (int *block = tpl_block_indices, *block_offset = tpl_block_offsets; block != valid_indices_end; ++block) {
+        int32_t idx = *block;
+        int row = tpl_rows[idx];
+        int col = tpl_columns[idx];
+
+        if (row != current_row || col != current_col) {
+            *(bsr_columns++) = col;
+
+            ++bsr_offsets[row + 1];
+
+            if (current_row == -1) {
+                *block_offset = 0;
+            } else {
+                *(block_offset + 1) = *block_offset;
+                ++block_offset;
+            }
+
+            current_row = row;
+            current_col = col;
+        }
+
+        ++(*block_offset);
+    }
+
+    // build postfix sum of row counts
+    std::partial_sum(bsr_offsets, bsr_offsets + row_count + 1, bsr_offsets);
+}
+
+// Multi-threaded counterpart of the serial topology build in wp_bsr_matrix_from_triplets_host(). Valid triplets are
+// compacted in order, radix-sorted by their linearized (row, col) coordinates, and the runs of equal coordinates are
+// turned into blocks. The radix sort is stable, so duplicate triplets are listed in increasing index order.
+void bsr_matrix_from_triplets_host_parallel(
+    int block_size,
+    int scalar_size_in_bytes,
+    int row_count,
+    int col_count,
+    int nnz,
+    const int* tpl_rows,
+    const int* tpl_columns,
+    const void* tpl_values,
+    uint64_t scalar_zero_mask,
+    bool masked_topology,
+    int* tpl_block_offsets,
+    int* tpl_block_indices,
+    int* bsr_offsets,
+    const int* bsr_row_counts,
+    int* bsr_columns,
+    int num_threads
+)
+{
+    const bool prune_zero_blocks = tpl_values != nullptr && scalar_zero_mask != 0;
+
+    auto keep_triplet = [&](int i) -> bool {
+        const int row = tpl_rows[i];
+        const int col = tpl_columns[i];
+        if (row < 0 || row >= row_count || col < 0 || col >= col_count) {
+            return false;
+        }
+
+        if (masked_topology) {
+            const int* beg = bsr_columns + bsr_offsets[row];
+            const int* end = bsr_columns + bsr_active_row_end(bsr_offsets, bsr_row_counts, row);
+            const int* block = std::lower_bound(beg, end, col);
+            if (block == end || *block != col) {
+                return false;
+            }
+        }
+
+        if (prune_zero_blocks) {
+            switch (scalar_size_in_bytes) {
+            case sizeof(uint8_t):
+                return !bsr_block_is_zero<uint8_t>(i, block_size, tpl_values, scalar_zero_mask);
+            case sizeof(uint16_t):
+                return !bsr_block_is_zero<uint16_t>(i, block_size, tpl_values, scalar_zero_mask);
+            case sizeof(uint32_t):
+                return !bsr_block_is_zero<uint32_t>(i, block_size, tpl_values, scalar_zero_mask);
+            case sizeof(uint64_t):
+                return !bsr_block_is_zero<uint64_t>(i, block_size, tpl_values, scalar_zero_mask);
+            }
+        }
+
+        return true;
+    };
+
+    // sort keys and values need twice the element count for the radix sort scratch space
+    std::vector<uint64_t> keys(2 * size_t(nnz));
+    std::vector<int> indices(2 * size_t(nnz));
+    std::vector<uint8_t> keep(nnz);
+
+    const int valid_count = bsr_parallel_scan(
+        nnz, num_threads,
+        [&](int begin, int end) {
+            int count = 0;
+            for (int i = begin; i < end; ++i) {
+                keep[i] = keep_triplet(i);
+                count += keep[i];
+            }
+            return count;
+        },
+        [&](int begin, int end, int out) {
+            for (int i = begin; i < end; ++i) {
+                if (keep[i]) {
+                    keys[out] = uint64_t(tpl_rows[i]) * uint64_t(col_count) + uint64_t(tpl_columns[i]);
+                    indices[out] = i;
+                    ++out;
+                }
+            }
+        }
+    );
+
+    const uint64_t max_key = uint64_t(row_count) * uint64_t(col_count);
+    int end_bit = 1;
+    while (end_bit < 64 && (max_key >> end_bit) != 0) {
+        ++end_bit;
+    }
+    radix_sort_pairs_host(keys.data(), indices.data(), valid_count, 0, end_bit, num_threads);
+
+    wp::parallel_for(
+        size_t(valid_count), num_threads, size_t(bsr_parallel_min_triplets), [&](size_t begin, size_t end) {
+            std::copy(indices.begin() + begin, indices.begin() + end, tpl_block_indices + begin);
+        }
+    );
+
+    // every run of equal keys starts a block; each block also writes the offsets of the rows it opens, so that
+    // every entry of bsr_offsets is written by exactly one thread
+    const int block_count = bsr_parallel_scan(
+        valid_count, num_threads,
+        [&](int begin, int end) {
+            int count = 0;
+            for (int p = begin; p < end; ++p) {
+                count += p == 0 || keys[p] != keys[p - 1];
+            }
+            return count;
+        },
+        [&](int begin, int end, int block) {
+            for (int p = begin; p < end; ++p) {
+                if (p != 0 && keys[p] == keys[p - 1]) {
+                    continue;
+                }
+
+                const int row = int(keys[p] / uint64_t(col_count));
+                const int prev_row = p == 0 ? -1 : int(keys[p - 1] / uint64_t(col_count));
+
+                bsr_columns[block] = int(keys[p] - uint64_t(row) * uint64_t(col_count));
+                if (block > 0) {
+                    tpl_block_offsets[block - 1] = p;
+                }
+                for (int r = prev_row + 1; r <= row; ++r) {
+                    bsr_offsets[r] = block;
+                }
+                ++block;
+            }
+        }
+    );
+
+    if (block_count > 0) {
+        tpl_block_offsets[block_count - 1] = valid_count;
+    }
+
+    const int last_row = valid_count > 0 ? int(keys[valid_count - 1] / uint64_t(col_count)) : -1;
+    std::fill(bsr_offsets + last_row + 1, bsr_offsets + row_count + 1, block_count);
+}
+
+template <typename T>
+void bsr_mv_host_impl(
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* offsets,
+    const int* row_counts,
+    const int* columns,
+    const T* values,
+    T alpha,
+    const T* x,
+    T beta,
+    T* y,
+    int num_threads
+)
+{
+    const size_t block_size = size_t(block_rows) * size_t(block_cols);
+
+    wp::parallel_for(size_t(row_count), num_threads, bsr_parallel_min_rows, [&](size_t row_begin, size_t row_end) {
+        for (int row = int(row_begin); row < int(row_end); ++row) {
+            const int beg = offsets[row];
+            const int end = bsr_active_row_end(offsets, row_counts, row);
+            T* y_row = y + size_t(row) * block_rows;
+
+            for (int subrow = 0; subrow < block_rows; ++subrow) {
+                T v = T(0);
+
+                if (alpha != T(0)) {
+                    for (int block = beg; block < end; ++block) {
+                        const T* a = values + size_t(block) * block_size + size_t(subrow) * block_cols;
+                        const T* xs = x + size_t(columns[block]) * block_cols;
+                        for (int col = 0; col < block_cols; ++col) {
+                            v += a[col] * xs[col];
+                        }
+                    }
+                    v *= alpha;
+                }
+
+                if (beta != T(0)) {
+                    v += beta * y_row[subrow];
+                }
+
+                y_row[subrow] = v;
+            }
+        }
+    });
+}
+
+// y = alpha * A @ x + beta * y for row-major x and y with rhs_count columns.
+// Each matrix coefficient is loaded once and applied to a whole row of x, so that the innermost
+// loop runs over contiguous right-hand sides.
+template <typename T>
+void bsr_mm_dense_host_impl(
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* offsets,
+    const int* row_counts,
+    const int* columns,
+    const T* values,
+    T alpha,
+    const T* x,
+    T beta,
+    T* y,
+    int rhs_count,
+    int num_threads
+)
+{
+    const size_t block_size = size_t(block_rows) * size_t(block_cols);
+    const size_t rhs = size_t(rhs_count);
+
+    wp::parallel_for(size_t(row_count), num_threads, bsr_parallel_min_rows, [&](size_t row_begin, size_t row_end) {
+        std::vector<T> acc(rhs);
+
+        for (int row = int(row_begin); row < int(row_end); ++row) {
+            const int beg = offsets[row];
+            const int end = bsr_active_row_end(offsets, row_counts, row);
+
+            for (int subrow = 0; subrow < block_rows; ++subrow) {
+                T* y_row = y + (size_t(row) * block_rows + subrow) * rhs;
+
+                std::fill(acc.begin(), acc.end(), T(0));
+
+                if (alpha != T(0)) {
+                    for (int block = beg; block < end; ++block) {
+                        const T* a = values + size_t(block) * block_size + size_t(subrow) * block_cols;
+                        const T* xs = x + size_t(columns[block]) * block_cols * rhs;
+                        for (int col = 0; col < block_cols; ++col) {
+                            const T a_col = a[col];
+                            const T* x_row = xs + size_t(col) * rhs;
+                            for (size_t j = 0; j < rhs; ++j) {
+                                acc[j] += a_col * x_row[j];
+                            }
+                        }
+                    }
+                }
+
+                for (size_t j = 0; j < rhs; ++j) {
+                    T v = alpha * acc[j];
+                    if (beta != T(0)) {
+                        v += beta * y_row[j];
+                    }
+                    y_row[j] = v;
+                }
+            }
+        }
+    });
+}
+
+// z += alpha * x @ y over the existing topology of z, same result as the _bsr_mm_compute_values kernel.
+// Rows are accumulated Gustavson-style: each x block is multiplied with the whole matching row of y and
+// scattered into the z row, so the cost is proportional to the number of block products.
+// Non-zero BlockRows/BlockDepth/BlockCols fix the block shape at compile time for the common square blocks.
+template <typename T, int BlockRows = 0, int BlockDepth = 0, int BlockCols = 0>
+void bsr_mm_values_host_impl(
+    int dyn_block_rows,
+    int dyn_block_depth,
+    int dyn_block_cols,
+    T alpha,
+    const int* x_offsets,
+    const int* x_row_counts,
+    const int* x_columns,
+    const T* x_values,
+    const int* y_offsets,
+    const int* y_row_counts,
+    const int* y_columns,
+    const T* y_values,
+    int z_row_count,
+    const int* z_offsets,
+    const int* z_row_counts,
+    const int* z_columns,
+    T* z_values,
+    int num_threads
+)
+{
+    const int block_rows = BlockRows > 0 ? BlockRows : dyn_block_rows;
+    const int block_depth = BlockDepth > 0 ? BlockDepth : dyn_block_depth;
+    const int block_cols = BlockCols > 0 ? BlockCols : dyn_block_cols;
+
+    const size_t x_block_size = size_t(block_rows) * size_t(block_depth);
+    const size_t y_block_size = size_t(block_depth) * size_t(block_cols);
+    const size_t z_block_size = size_t(block_rows) * size_t(block_cols);
+
+    wp::parallel_for(size_t(z_row_count), num_threads, bsr_parallel_min_rows, [&](size_t row_begin, size_t row_end) {
+        std::vector<T> acc;
+
+        for (int row = int(row_begin); row < int(row_end); ++row) {
+            const int z_beg = z_offsets[row];
+            const int z_end = bsr_active_row_end(z_offsets, z_row_counts, row);
+            if (z_beg == z_end) {
+                continue;
+            }
+
+            acc.assign(size_t(z_end - z_beg) * z_block_size, T(0));
+
+            const int x_end = bsr_active_row_end(x_offsets, x_row_counts, row);
+            for (int x_block = x_offsets[row]; x_block < x_end; ++x_block) {
+                const int x_col = x_columns[x_block];
+                const int y_end = bsr_active_row_end(y_offsets, y_row_counts, x_col);
+                const T* a = x_values + size_t(x_block) * x_block_size;
+
+                // both column lists are sorted, so the search for the next z block resumes from the previous one
+                const int* z_col = z_columns + z_beg;
+                const int* z_col_end = z_columns + z_end;
+                for (int y_block = y_offsets[x_col]; y_block < y_end; ++y_block) {
+                    z_col = std::lower_bound(z_col, z_col_end, y_columns[y_block]);
+                    if (z_col == z_col_end) {
+                        break;
+                    }
+                    if (*z_col != y_columns[y_block]) {
+                        continue;
+                    }
+
+                    const T* b = y_values + size_t(y_block) * y_block_size;
+                    T* c = acc.data() + size_t(z_col - (z_columns + z_beg)) * z_block_size;
+                    for (int i = 0; i < block_rows; ++i) {
+                        for (int k = 0; k < block_depth; ++k) {
+                            const T a_ik = a[size_t(i) * block_depth + k];
+                            for (int j = 0; j < block_cols; ++j) {
+                                c[size_t(i) * block_cols + j] += a_ik * b[size_t(k) * block_cols + j];
+                            }
+                        }
+                    }
+                }
+            }
+
+            T* z = z_values + size_t(z_beg) * z_block_size;
+            for (size_t k = 0; k < acc.size(); ++k) {
+                z[k] += alpha * acc[k];
+            }
+        }
+    });
+}
+
 // Record a host BSR-from-triplets topology build into the active APIC byte
 // stream; returns true if recorded (and therefore should NOT execute now).
 // Mirrors the sort / runlength-encode try-record helpers: under CPU graph
@@ -282,7 +771,8 @@ WP_API void wp_bsr_matrix_from_triplets_host(
     const int* bsr_row_counts,
     int* bsr_columns,
     int* bsr_nnz,
-    void* bsr_nnz_event
+    void* bsr_nnz_event,
+    int num_threads
 )
 {
     // Under CPU graph capture, record the topology build (so it replays with
@@ -295,6 +785,8 @@ WP_API void wp_bsr_matrix_from_triplets_host(
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_matrix_from_triplets");
+
     if (tpl_nnz != nullptr) {
         nnz = *tpl_nnz;
     }
@@ -306,101 +798,20 @@ WP_API void wp_bsr_matrix_from_triplets_host(
         tpl_block_indices = static_cast<int*>(wp_alloc_host(size_t(nnz) * sizeof(int), "(native:sparse)"));
     }
 
-    std::iota(tpl_block_indices, tpl_block_indices + nnz, 0);
-
-    // remove invalid indices / indices not in mask
-    auto discard_invalid_block = [&](int i) -> bool {
-        const int row = tpl_rows[i];
-        const int col = tpl_columns[i];
-        if (row < 0 || row >= row_count || col < 0 || col >= col_count) {
-            return true;
-        }
-
-        if (!masked_topology) {
-            return false;
-        }
-
-        const int* beg = bsr_columns + bsr_offsets[row];
-        const int* end = bsr_columns + bsr_active_row_end(bsr_offsets, bsr_row_counts, row);
-        const int* block = std::lower_bound(beg, end, col);
-        return block == end || *block != col;
-    };
-
-    int* valid_indices_end = std::remove_if(tpl_block_indices, tpl_block_indices + nnz, discard_invalid_block);
-
-    // remove zero blocks
-    if (tpl_values != nullptr && scalar_zero_mask != 0) {
-        switch (scalar_size_in_bytes) {
-        case sizeof(uint8_t):
-            valid_indices_end = std::remove_if(
-                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
-                    return bsr_block_is_zero<uint8_t>(i, block_size, tpl_values, scalar_zero_mask);
-                }
-            );
-            break;
-        case sizeof(uint16_t):
-            valid_indices_end = std::remove_if(
-                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
-                    return bsr_block_is_zero<uint16_t>(i, block_size, tpl_values, scalar_zero_mask);
-                }
-            );
-            break;
-        case sizeof(uint32_t):
-            valid_indices_end = std::remove_if(
-                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
-                    return bsr_block_is_zero<uint32_t>(i, block_size, tpl_values, scalar_zero_mask);
-                }
-            );
-            break;
-        case sizeof(uint64_t):
-            valid_indices_end = std::remove_if(
-                tpl_block_indices, valid_indices_end, [block_size, tpl_values, scalar_zero_mask](uint32_t i) {
-                    return bsr_block_is_zero<uint64_t>(i, block_size, tpl_values, scalar_zero_mask);
-                }
-            );
-            break;
-        }
-    }
-
-    // sort block indices according to lexico order
-    std::sort(tpl_block_indices, valid_indices_end, [tpl_rows, tpl_columns](int i, int j) -> bool {
-        return tpl_rows[i] < tpl_rows[j] || (tpl_rows[i] == tpl_rows[j] && tpl_columns[i] < tpl_columns[j]);
-    });
-
-    // accumulate blocks at same locations, count blocks per row
-    std::fill_n(bsr_offsets, row_count + 1, 0);
-
-    int current_row = -1;
-    int current_col = -1;
-    int current_block_idx = -1;
-
-    for (int *block = tpl_block_indices, *block_offset = tpl_block_offsets; block != valid_indices_end; ++block) {
-        int32_t idx = *block;
-        int row = tpl_rows[idx];
-        int col = tpl_columns[idx];
-
-        if (row != current_row || col != current_col) {
-            *(bsr_columns++) = col;
-
-            ++bsr_offsets[row + 1];
-
-            if (current_row == -1) {
-                *block_offset = 0;
-            } else {
-                *(block_offset + 1) = *block_offset;
-                ++block_offset;
-            }
-
-            current_row = row;
-            current_col = col;
-        }
-
-        ++(*block_offset);
+    if (num_threads != 1 && nnz >= bsr_parallel_min_triplets && wp::cpu_resolve_num_threads(num_threads) > 1) {
+        bsr_matrix_from_triplets_host_parallel(
+            block_size, scalar_size_in_bytes, row_count, col_count, nnz, tpl_rows, tpl_columns, tpl_values,
+            scalar_zero_mask, masked_topology, tpl_block_offsets, tpl_block_indices, bsr_offsets, bsr_row_counts,
+            bsr_columns, num_threads
+        );
+    } else {
+        bsr_matrix_from_triplets_host_serial(
+            block_size, scalar_size_in_bytes, row_count, col_count, nnz, tpl_rows, tpl_columns, tpl_values,
+            scalar_zero_mask, masked_topology, tpl_block_offsets, tpl_block_indices, bsr_offsets, bsr_row_counts,
+            bsr_columns
+        );
     }
 
-    // build postfix sum of row counts
-    std::partial_sum(bsr_offsets, bsr_offsets + row_count + 1, bsr_offsets);
-
     if (!return_summed_blocks) {
         // free our temporary buffers
         wp_free_host(tpl_block_offsets);
@@ -436,6 +847,8 @@ WP_API void wp_bsr_transpose_host(
         ))
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_transpose");
+
     const int capacity = std::min(nnz, bsr_offsets[row_count]);
     const bool padded = transposed_bsr_row_counts != nullptr;
 
@@ -533,11 +946,14 @@ WP_API void wp_bsr_compress_inplace_host(
     void* bsr_values,
     bool compress_values,
     int* bsr_nnz,
-    void* bsr_nnz_event
+    void* bsr_nnz_event,
+    int num_threads
 )
 {
     (void)bsr_nnz_event;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_compress_inplace");
+
     if (row_count <= 0) {
         if (make_compact && bsr_nnz != nullptr) {
             *bsr_nnz = 0;
@@ -551,7 +967,7 @@ WP_API void wp_bsr_compress_inplace_host(
     if (values_to_write == nullptr && !prune_from_input_values) {
         bsr_compress_inplace_host_impl<wp::float32, false>(
             row_count, 0, nnz_upper_bound, false, make_compact, bsr_offsets, bsr_row_counts, bsr_columns, nullptr, 0,
-            bsr_nnz
+            bsr_nnz, num_threads
         );
         return;
     }
@@ -561,25 +977,25 @@ WP_API void wp_bsr_compress_inplace_host(
         case sizeof(uint8_t):
             bsr_compress_inplace_host_impl<uint8_t, false>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz
+                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz, num_threads
             );
             break;
         case sizeof(uint16_t):
             bsr_compress_inplace_host_impl<uint16_t, false>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz
+                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz, num_threads
             );
             break;
         case sizeof(uint32_t):
             bsr_compress_inplace_host_impl<uint32_t, false>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz
+                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz, num_threads
             );
             break;
         case sizeof(uint64_t):
             bsr_compress_inplace_host_impl<uint64_t, false>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz
+                bsr_row_counts, bsr_columns, bsr_values, scalar_zero_mask, bsr_nnz, num_threads
             );
             break;
         }
@@ -591,19 +1007,181 @@ WP_API void wp_bsr_compress_inplace_host(
         if (scalar_size_in_bytes == sizeof(wp::float32))
             bsr_compress_inplace_host_impl<wp::float32, true>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, values_to_write, 0, bsr_nnz
+                bsr_row_counts, bsr_columns, values_to_write, 0, bsr_nnz, num_threads
             );
         break;
     case BSR_SCALAR_FLOAT64:
         if (scalar_size_in_bytes == sizeof(wp::float64))
             bsr_compress_inplace_host_impl<wp::float64, true>(
                 row_count, block_size, nnz_upper_bound, prune_numerical_zeros, make_compact, bsr_offsets,
-                bsr_row_counts, bsr_columns, values_to_write, 0, bsr_nnz
+                bsr_row_counts, bsr_columns, values_to_write, 0, bsr_nnz, num_threads
             );
         break;
     }
 }
 
+WP_API void wp_bsr_mv_host(
+    int scalar_type,
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* bsr_offsets,
+    const int* bsr_row_counts,
+    const int* bsr_columns,
+    const void* bsr_values,
+    double alpha,
+    const void* x,
+    double beta,
+    void* y,
+    int num_threads
+)
+{
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_mv");
+
+    switch (scalar_type) {
+    case BSR_SCALAR_FLOAT32:
+        bsr_mv_host_impl<wp::float32>(
+            row_count, block_rows, block_cols, bsr_offsets, bsr_row_counts, bsr_columns,
+            static_cast<const wp::float32*>(bsr_values), wp::float32(alpha), static_cast<const wp::float32*>(x),
+            wp::float32(beta), static_cast<wp::float32*>(y), num_threads
+        );
+        break;
+    case BSR_SCALAR_FLOAT64:
+        bsr_mv_host_impl<wp::float64>(
+            row_count, block_rows, block_cols, bsr_offsets, bsr_row_counts, bsr_columns,
+            static_cast<const wp::float64*>(bsr_values), wp::float64(alpha), static_cast<const wp::float64*>(x),
+            wp::float64(beta), static_cast<wp::float64*>(y), num_threads
+        );
+        break;
+    }
+}
+
+WP_API void wp_bsr_mm_dense_host(
+    int scalar_type,
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* bsr_offsets,
+    const int* bsr_row_counts,
+    const int* bsr_columns,
+    const void* bsr_values,
+    double alpha,
+    const void* x,
+    double beta,
+    void* y,
+    int rhs_count,
+    int num_threads
+)
+{
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_mm_dense");
+
+    switch (scalar_type) {
+    case BSR_SCALAR_FLOAT32:
+        bsr_mm_dense_host_impl<wp::float32>(
+            row_count, block_rows, block_cols, bsr_offsets, bsr_row_counts, bsr_columns,
+            static_cast<const wp::float32*>(bsr_values), wp::float32(alpha), static_cast<const wp::float32*>(x),
+            wp::float32(beta), static_cast<wp::float32*>(y), rhs_count, num_threads
+        );
+        break;
+    case BSR_SCALAR_FLOAT64:
+        bsr_mm_dense_host_impl<wp::float64>(
+            row_count, block_rows, block_cols, bsr_offsets, bsr_row_counts, bsr_columns,
+            static_cast<const wp::float64*>(bsr_values), wp::float64(alpha), static_cast<const wp::float64*>(x),
+            wp::float64(beta), static_cast<wp::float64*>(y), rhs_count, num_threads
+        );
+        break;
+    }
+}
+
+template <typename T>
+void bsr_mm_values_host_dispatch(
+    int block_rows,
+    int block_depth,
+    int block_cols,
+    T alpha,
+    const int* x_offsets,
+    const int* x_row_counts,
+    const int* x_columns,
+    const void* x_values,
+    const int* y_offsets,
+    const int* y_row_counts,
+    const int* y_columns,
+    const void* y_values,
+    int z_row_count,
+    const int* z_offsets,
+    const int* z_row_counts,
+    const int* z_columns,
+    void* z_values,
+    int num_threads
+)
+{
+    auto run = [&](auto impl) {
+        impl(
+            block_rows, block_depth, block_cols, alpha, x_offsets, x_row_counts, x_columns,
+            static_cast<const T*>(x_values), y_offsets, y_row_counts, y_columns, static_cast<const T*>(y_values),
+            z_row_count, z_offsets, z_row_counts, z_columns, static_cast<T*>(z_values), num_threads
+        );
+    };
+
+    if (block_rows == block_depth && block_depth == block_cols) {
+        switch (block_rows) {
+        case 1:
+            run(bsr_mm_values_host_impl<T, 1, 1, 1>);
+            return;
+        case 2:
+            run(bsr_mm_values_host_impl<T, 2, 2, 2>);
+            return;
+        case 3:
+            run(bsr_mm_values_host_impl<T, 3, 3, 3>);
+            return;
+        }
+    }
+
+    run(bsr_mm_values_host_impl<T>);
+}
+
+WP_API void wp_bsr_mm_values_host(
+    int scalar_type,
+    int block_rows,
+    int block_depth,
+    int block_cols,
+    double alpha,
+    const int* x_offsets,
+    const int* x_row_counts,
+    const int* x_columns,
+    const void* x_values,
+    const int* y_offsets,
+    const int* y_row_counts,
+    const int* y_columns,
+    const void* y_values,
+    int z_row_count,
+    const int* z_offsets,
+    const int* z_row_counts,
+    const int* z_columns,
+    void* z_values,
+    int num_threads
+)
+{
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "bsr_mm_values");
+
+    switch (scalar_type) {
+    case BSR_SCALAR_FLOAT32:
+        bsr_mm_values_host_dispatch<wp::float32>(
+            block_rows, block_depth, block_cols, wp::float32(alpha), x_offsets, x_row_counts, x_columns, x_values,
+            y_offsets, y_row_counts, y_columns, y_values, z_row_count, z_offsets, z_row_counts, z_columns, z_values,
+            num_threads
+        );
+        break;
+    case BSR_SCALAR_FLOAT64:
+        bsr_mm_values_host_dispatch<wp::float64>(
+            block_rows, block_depth, block_cols, wp::float64(alpha), x_offsets, x_row_counts, x_columns, x_values,
+            y_offsets, y_row_counts, y_columns, y_values, z_row_count, z_offsets, z_row_counts, z_columns, z_values,
+            num_threads
+        );
+        break;
+    }
+}
+
 
 #if !WP_ENABLE_CUDA
 WP_API void wp_bsr_matrix_from_triplets_device(
@@ -0,0 +1,175 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#include "thread_pool.h"
+
+#include <atomic>
+#include <cstdint>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace wp {
+
+namespace {
+
+// chunks handed out per participating thread, more chunks balance better at
+// the cost of more contention on the shared counter
+constexpr size_t chunks_per_thread = 4;
+
+// set on pool workers and on a submitting thread while it runs a job so that
+// nested parallel_for() calls execute inline instead of deadlocking the pool
+thread_local bool tl_in_parallel_region = false;
+
+class ThreadPool {
+public:
+    static ThreadPool& instance()
+    {
+        // intentionally leaked: joining workers during static destruction or
+        // library unload can deadlock on some platforms
+        static ThreadPool* pool = new ThreadPool();
+        return *pool;
+    }
+
+    void run(size_t n, int num_threads, size_t chunk, const std::function<void(size_t, size_t)>& body)
+    {
+        // one job at a time, concurrent launches from different Python threads queue up here
+        std::lock_guard<std::mutex> submit_lock(submit_mutex);
+
+        const int num_workers = num_threads - 1;
+        ensure_workers(num_workers);
+
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            job_body = &body;
+            job_size = n;
+            job_chunk = chunk;
+            job_next.store(0, std::memory_order_relaxed);
+            job_participants = num_workers;
+            job_remaining = num_workers;
+            ++job_generation;
+        }
+        work_cv.notify_all();
+
+        tl_in_parallel_region = true;
+        execute_chunks();
+        tl_in_parallel_region = false;
+
+        std::unique_lock<std::mutex> lock(mutex);
+        done_cv.wait(lock, [this] { return job_remaining == 0; });
+        job_body = nullptr;
+    }
+
+private:
+    ThreadPool() = default;
+
+    void ensure_workers(int count)
+    {
+        while (int(workers.size()) < count) {
+            const int worker_index = int(workers.size());
+            workers.emplace_back([this, worker_index] { worker_loop(worker_index); });
+        }
+    }
+
+    void execute_chunks()
+    {
+        const size_t n = job_size;
+        const size_t chunk = job_chunk;
+
+        for (;;) {
+            const size_t begin = job_next.fetch_add(chunk, std::memory_order_relaxed);
+            if (begin >= n)
+                break;
+
+            const size_t end = begin + chunk < n ? begin + chunk : n;
+            (*job_body)(begin, end);
+        }
+    }
+
+    void worker_loop(int worker_index)
+    {
+        tl_in_parallel_region = true;
+
+        uint64_t seen_generation = 0;
+        for (;;) {
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                work_cv.wait(lock, [&] {
+                    return job_generation != seen_generation && worker_index < job_participants;
+                });
+                seen_generation = job_generation;
+            }
+
+            execute_chunks();
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                --job_remaining;
+                if (job_remaining == 0)
+                    done_cv.notify_one();
+            }
+        }
+    }
+
+    std::mutex submit_mutex;
+
+    std::mutex mutex;
+    std::condition_variable work_cv;
+    std::condition_variable done_cv;
+    std::vector<std::thread> workers;
+
+    // current job, written under mutex before the generation is bumped
+    const std::function<void(size_t, size_t)>* job_body = nullptr;
+    size_t job_size = 0;
+    size_t job_chunk = 1;
+    std::atomic<size_t> job_next { 0 };
+    int job_participants = 0;
+    int job_remaining = 0;
+    uint64_t job_generation = 0;
+};
+
+}  // namespace
+
+int cpu_hardware_concurrency()
+{
+    static const int count = [] {
+        const unsigned int hw = std::thread::hardware_concurrency();
+        return hw > 0 ? int(hw) : 1;
+    }();
+    return count;
+}
+
+int cpu_resolve_num_threads(int num_threads)
+{
+    return num_threads > 0 ? num_threads : cpu_hardware_concurrency();
+}
+
+void parallel_for(size_t n, int num_threads, size_t min_chunk, const std::function<void(size_t, size_t)>& body)
+{
+    if (n == 0)
+        return;
+
+    if (min_chunk == 0)
+        min_chunk = 1;
+
+    num_threads = cpu_resolve_num_threads(num_threads);
+
+    // never wake more threads than there are minimum-sized chunks
+    const size_t max_useful_threads = (n + min_chunk - 1) / min_chunk;
+    if (size_t(num_threads) > max_useful_threads)
+        num_threads = int(max_useful_threads);
+
+    if (num_threads <= 1 || tl_in_parallel_region) {
+        body(0, n);
+        return;
+    }
+
+    size_t chunk = (n + size_t(num_threads) * chunks_per_thread - 1) / (size_t(num_threads) * chunks_per_thread);
+    if (chunk < min_chunk)
+        chunk = min_chunk;
+
+    ThreadPool::instance().run(n, num_threads, chunk, body);
+}
+
+}  // namespace wp
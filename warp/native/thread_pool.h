@@ -0,0 +1,28 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#pragma once
+
+#include <functional>
+
+#include <stddef.h>
+
+namespace wp {
+// host-side work distribution shared by CPU kernel launches and native utilities
+
+// number of hardware threads reported by the OS (at least 1)
+int cpu_hardware_concurrency();
+
+// resolve a requested thread count, values <= 0 select cpu_hardware_concurrency()
+int cpu_resolve_num_threads(int num_threads);
+
+// execute body(begin, end) over the index range [0, n) using up to num_threads host threads
+//
+// The range is split into chunks of at least min_chunk indices that the participating
+// threads claim dynamically, so uneven per-index costs are balanced. The calling thread
+// participates and the call returns once every chunk has completed. The body runs
+// inline on the calling thread when num_threads <= 1, when the range fits in a single
+// chunk, or when called from within another parallel_for() body.
+void parallel_for(size_t n, int num_threads, size_t min_chunk, const std::function<void(size_t, size_t)>& body);
+
+}  // namespace wp
@@ -14,11 +14,15 @@
 #include "apic.h"
 #include "apic_internal.h"
 #include "array.h"
+#include "cpu_timing.h"
 #include "error.h"
 #include "exports.h"
 #include "scan.h"
+#include "thread_pool.h"
 #include "version.h"
 
+#include <algorithm>
+
 #include <stdlib.h>
 #include <string.h>
 
@@ -227,6 +231,10 @@ void wp_free_host(void* ptr)
 #endif
 }
 
+// smallest number of consecutive task indices handed to a worker thread by a
+// multi-threaded CPU launch, keeps tiny launches from paying for thread wake-ups
+static const size_t cpu_launch_min_chunk = 64;
+
 // CPU kernel launch with optional APIC recording.
 // During capture (g_apic_state is recording), the kernel is NOT executed —
 // only recorded in the APIC byte stream. This matches CUDA graph capture
@@ -234,19 +242,63 @@ void wp_free_host(void* ptr)
 // replay — either from a live capture (wp_apic_cpu_replay_state) or from a
 // loaded .wrp graph (wp_apic_cpu_replay_graph) — g_apic_state is null, so
 // the launch takes the execute-only branch.
-void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args, const APICLaunchInfo* apic_info)
+//
+// When range_func is the kernel's task-range entry point and num_threads != 1,
+// the forward launch splits [0, dim.size) into chunks executed by the host
+// thread pool (num_threads <= 0 uses all hardware threads). Otherwise func runs
+// every task serially on the calling thread.
+void wp_cpu_launch_kernel(
+    void* func,
+    void* bounds,
+    void* args,
+    void* adj_args,
+    const APICLaunchInfo* apic_info,
+    void* range_func,
+    int kernel_dim,
+    int num_threads
+)
 {
     typedef void (*kernel_fn_forward)(void*, void*);
     typedef void (*kernel_fn_backward)(void*, void*, void*);
+    typedef void (*kernel_fn_forward_range)(void*, void*, size_t, size_t);
 
     // Skip execution during capture (record only). Execute during replay
     // or when called outside capture (apic_info == NULL).
     APICState* recording_state = wp_apic_get_recording_state();
     if (func && !recording_state) {
+        CpuTimingState* timing_state = cpu_timing_state(WP_TIMING_KERNEL);
+        int64_t timing_start_ns = 0;
+        if (timing_state)
+            timing_start_ns = cpu_timing_now_ns();
+
         if (adj_args)
             ((kernel_fn_backward)func)(bounds, args, adj_args);
-        else
+        else if (range_func && num_threads != 1 && bounds && kernel_dim > 0) {
+            const size_t size_offset = apic_detail::launch_bounds_size_offset(kernel_dim);
+            const size_t launch_size = *reinterpret_cast<const size_t*>(static_cast<const uint8_t*>(bounds) + size_offset);
+
+            wp::parallel_for(launch_size, num_threads, cpu_launch_min_chunk, [&](size_t begin, size_t end) {
+                ((kernel_fn_forward_range)range_func)(bounds, args, begin, end);
+            });
+        } else
             ((kernel_fn_forward)func)(bounds, args);
+
+        if (timing_state) {
+            CpuTimingRange range;
+            range.func = func;
+            range.flag = WP_TIMING_KERNEL;
+            range.dispatch_ns = cpu_timing_take_dispatch(timing_start_ns);
+
+            // the APIC replay path does not pass the kernel dimensionality
+            const int ndim = kernel_dim > 0 ? kernel_dim : (apic_info ? apic_info->kernel_dim : 0);
+            if (bounds && ndim > 0) {
+                range.ndim = std::min(ndim, WP_CPU_TIMING_MAX_DIMS);
+                for (int d = 0; d < range.ndim; d++)
+                    range.shape[d] = static_cast<const int*>(bounds)[d];
+            }
+
+            cpu_timing_record(timing_state, range, timing_start_ns, cpu_timing_now_ns());
+        }
     }
 
     // Record to byte stream (for APIC serialization) if capturing
@@ -285,6 +337,56 @@ void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args,
     }
 }
 
+// CPU forward launch from a packed argument buffer.
+// The caller keeps one args buffer per kernel signature and writes scalar fields
+// in place. Fields that already exist as host-side descriptors (arrays, vectors,
+// structs) are passed as patches instead: patch i copies patch_sizes[i] bytes
+// from patch_srcs[i] to args + patch_offsets[i], so the whole launch costs a
+// single call from Python regardless of the number of kernel arguments.
+void wp_cpu_launch_packed(
+    void* func,
+    void* range_func,
+    void* bounds,
+    void* args,
+    const void* const* patch_srcs,
+    const uint32_t* patch_offsets,
+    const uint32_t* patch_sizes,
+    int num_patches,
+    int kernel_dim,
+    int num_threads
+)
+{
+    uint8_t* args_bytes = static_cast<uint8_t*>(args);
+    for (int i = 0; i < num_patches; i++)
+        memcpy(args_bytes + patch_offsets[i], patch_srcs[i], patch_sizes[i]);
+
+    wp_cpu_launch_kernel(func, bounds, args, nullptr, nullptr, range_func, kernel_dim, num_threads);
+}
+
+void wp_cpu_launch_batch(const CPULaunchRecord* launches, int count)
+{
+    for (int i = 0; i < count; i++) {
+        const CPULaunchRecord& launch = launches[i];
+        wp_cpu_launch_kernel(
+            launch.func, launch.bounds, launch.args, launch.adj_args, nullptr, launch.range_func, launch.kernel_dim,
+            launch.num_threads
+        );
+    }
+}
+
+int wp_cuda_launch_batch(void* context, const CUDALaunchRecord* launches, int count, void* stream)
+{
+    for (int i = 0; i < count; i++) {
+        const CUDALaunchRecord& launch = launches[i];
+        if (wp_cuda_launch_kernel(
+                context, launch.kernel, launch.dim, launch.max_blocks, launch.block_dim, launch.grid_stride,
+                launch.cluster_dim, launch.shared_memory_bytes, launch.args, stream, nullptr
+            ))
+            return i + 1;
+    }
+    return 0;
+}
+
 bool wp_memcpy_h2h(void* dest, void* src, size_t n)
 {
     // During capture, record only — don't execute (matches CUDA graph semantics)
@@ -300,6 +402,7 @@ bool wp_memcpy_h2h(void* dest, void* src, size_t n)
         return true;
     }
 
+    cpu_timing_scope(WP_TIMING_MEMCPY, "memcpy HtoH");
     memcpy(dest, src, n);
     return true;
 }
@@ -318,10 +421,22 @@ bool wp_memset_host(void* dest, int value, size_t n)
         return true;
     }
 
+    cpu_timing_scope(WP_TIMING_MEMSET, "memset");
     memset(dest, value, n);
     return true;
 }
 
+bool wp_memset_batch_host(void** dests, size_t* sizes, size_t count, int value)
+{
+    // each memset is recorded separately during capture, and timed as a single batch otherwise
+    cpu_timing_scope(WP_TIMING_MEMSET, "memset batch");
+    for (size_t i = 0; i < count; i++) {
+        if (!wp_memset_host(dests[i], value, sizes[i]))
+            return false;
+    }
+    return true;
+}
+
 // fill memory buffer with a value: this is a faster memtile variant
 // for types bigger than one byte, but requires proper alignment of dst
 template <typename T> void memtile_value_host(T* dst, T value, size_t n)
@@ -348,6 +463,8 @@ void wp_memtile_host(void* dst, const void* src, size_t srcsize, size_t n)
         return;
     }
 
+    cpu_timing_scope(WP_TIMING_MEMSET, "memset");
+
     size_t dst_addr = reinterpret_cast<size_t>(dst);
     size_t src_addr = reinterpret_cast<size_t>(src);
 
@@ -413,6 +530,7 @@ void wp_array_scan_int_host(
 {
     if (apic_capture_array_scan(in, out, len, in_stride, out_stride, type_len, APIC_TYPE_INT32, inclusive))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_scan");
     scan_host((const int*)in, (int*)out, len, in_stride, out_stride, type_len, inclusive);
 }
 
@@ -422,6 +540,7 @@ void wp_array_scan_int64_host(
 {
     if (apic_capture_array_scan(in, out, len, in_stride, out_stride, type_len, APIC_TYPE_INT64, inclusive))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_scan");
     scan_host((const int64_t*)in, (int64_t*)out, len, in_stride, out_stride, type_len, inclusive);
 }
 
@@ -431,6 +550,7 @@ void wp_array_scan_float_host(
 {
     if (apic_capture_array_scan(in, out, len, in_stride, out_stride, type_len, APIC_TYPE_FLOAT32, inclusive))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_scan");
     scan_host((const float*)in, (float*)out, len, in_stride, out_stride, type_len, inclusive);
 }
 
@@ -440,6 +560,7 @@ void wp_array_scan_double_host(
 {
     if (apic_capture_array_scan(in, out, len, in_stride, out_stride, type_len, APIC_TYPE_FLOAT64, inclusive))
         return;
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_scan");
     scan_host((const double*)in, (double*)out, len, in_stride, out_stride, type_len, inclusive);
 }
 
@@ -766,6 +887,8 @@ WP_API bool wp_array_copy_host(void* dst, void* src, int dst_type, int src_type,
     if (!src || !dst)
         return false;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_copy");
+
     const void* src_data = NULL;
     void* dst_data = NULL;
     int src_ndim = 0;
@@ -1005,6 +1128,8 @@ WP_API void wp_array_fill_host(void* arr_ptr, int arr_type, const void* value_pt
     if (!arr_ptr || !value_ptr)
         return;
 
+    cpu_timing_scope(WP_TIMING_KERNEL_BUILTIN, "array_fill");
+
     if (arr_type == wp::ARRAY_TYPE_REGULAR) {
         wp::array_t<void>& arr = *static_cast<wp::array_t<void>*>(arr_ptr);
         array_fill_strided(arr.data, arr.shape.dims, arr.strides, arr.ndim, value_ptr, value_size);
@@ -1059,6 +1184,11 @@ bool wp_memcpy_batch(void* context, void** dsts, void** srcs, size_t* sizes, siz
 
 bool wp_memset_device(void* context, void* dest, int value, size_t n, void* stream) { return false; }
 
+bool wp_memset_batch_device(void* context, void** dests, size_t* sizes, size_t count, int value, void* stream)
+{
+    return false;
+}
+
 void wp_memtile_device(void* context, void* dest, const void* src, size_t srcsize, size_t n) { }
 
 bool wp_array_copy_device(void* context, void* dst, void* src, int dst_type, int src_type, int elem_size)
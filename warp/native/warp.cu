@@ -11,6 +11,7 @@
 #include "scan.h"
 #include "sort.h"
 
+#include <algorithm>
 #include <cstdlib>
 #include <fstream>
 
@@ -1308,6 +1309,97 @@ bool wp_memset_device(void* context, void* dest, int value, size_t n, void* stre
     return result;
 }
 
+// Number of buffers set by one launch of memset_batch_kernel. The destinations are passed by value,
+// like the fill values below, so that the kernel does not need them staged in device memory
+// (the struct stays below the 4 KB kernel parameter limit).
+constexpr int WP_MEMSET_BATCH_SIZE = 192;
+
+struct MemsetBatch {
+    uint8_t* dests[WP_MEMSET_BATCH_SIZE];
+    size_t sizes[WP_MEMSET_BATCH_SIZE];
+};
+
+// blockIdx.y selects the buffer, the blocks along x set its bytes in a grid-stride loop
+__global__ void memset_batch_kernel(MemsetBatch batch, int value)
+{
+    uint8_t* dest = batch.dests[blockIdx.y];
+    const size_t n = batch.sizes[blockIdx.y];
+    const size_t stride = static_cast<size_t>(blockDim.x) * static_cast<size_t>(gridDim.x);
+    const size_t tid
+        = static_cast<size_t>(blockDim.x) * static_cast<size_t>(blockIdx.x) + static_cast<size_t>(threadIdx.x);
+
+    size_t head = 0;
+    if ((reinterpret_cast<uintptr_t>(dest) & 15) == 0) {
+        // 16-byte stores for the aligned part of the buffer
+        uint32_t word = static_cast<uint8_t>(value);
+        word |= word << 8;
+        word |= word << 16;
+        const uint4 value16 = make_uint4(word, word, word, word);
+
+        uint4* dest16 = reinterpret_cast<uint4*>(dest);
+        const size_t n16 = n / 16;
+        for (size_t i = tid; i < n16; i += stride)
+            dest16[i] = value16;
+
+        head = n16 * 16;
+    }
+
+    for (size_t i = head + tid; i < n; i += stride)
+        dest[i] = static_cast<uint8_t>(value);
+}
+
+bool wp_memset_batch_device(void* context, void** dests, size_t* sizes, size_t count, int value, void* stream)
+{
+    ContextGuard guard(context);
+
+    cudaStream_t cuda_stream;
+    if (stream != WP_CURRENT_STREAM)
+        cuda_stream = static_cast<CUstream>(stream);
+    else
+        cuda_stream = get_current_stream();
+
+    begin_cuda_range(WP_TIMING_MEMSET, cuda_stream, context, "memset batch");
+
+    bool result = true;
+    MemsetBatch batch;
+    for (size_t start = 0; start < count && result; start += WP_MEMSET_BATCH_SIZE) {
+        const size_t batch_count = std::min(count - start, static_cast<size_t>(WP_MEMSET_BATCH_SIZE));
+
+        size_t max_size = 0;
+        for (size_t i = 0; i < batch_count; i++) {
+            batch.dests[i] = static_cast<uint8_t*>(dests[start + i]);
+            batch.sizes[i] = sizes[start + i];
+            max_size = std::max(max_size, sizes[start + i]);
+        }
+
+        if (max_size == 0)
+            continue;
+
+        // one 16-byte store per thread for the largest buffer, the grid-stride loop covers the rest
+        const int num_threads = 256;
+        const size_t max_blocks = 4096;
+        const size_t num_blocks = std::min((max_size + num_threads * 16 - 1) / (num_threads * 16), max_blocks);
+
+        memset_batch_kernel<<<dim3(static_cast<unsigned int>(num_blocks), static_cast<unsigned int>(batch_count)),
+                              num_threads, 0, cuda_stream>>>(batch, value);
+        result = check_cuda(cudaGetLastError());
+    }
+
+    end_cuda_range(WP_TIMING_MEMSET, cuda_stream);
+
+    // APIC recording, see wp_memset_device()
+    APICState* apic_state = wp_apic_get_cuda_recording_state();
+    if (apic_state) {
+        for (size_t i = 0; i < count; i++) {
+            if (sizes[i] > 0) {
+                APICAddress addr = apic_resolve_live_ptr(apic_state, (uint64_t)dests[i], sizes[i]);
+                apic_record_memset(apic_state, addr.region_id, addr.offset, sizes[i], value);
+            }
+        }
+    }
+    return result;
+}
+
 // POD value buffer passed by value to fill kernels so they don't need to read the
 // fill bytes from a device pointer (which would otherwise require host->device
 // staging through capturable_tmp_alloc + pause/resume capture, which breaks under
@@ -28,6 +28,7 @@ enum wp_memory_kind {
 };
 
 struct timing_result_t;
+struct cpu_timing_result_t;
 
 // this is the core runtime API exposed on the DLL level
 extern "C" {
@@ -85,15 +86,22 @@ wp_memcpy_batch(void* context, void** dsts, void** srcs, size_t* sizes, size_t c
 WP_API bool wp_memset_host(void* dest, int value, size_t n);
 WP_API bool wp_memset_device(void* context, void* dest, int value, size_t n, void* stream = WP_CURRENT_STREAM);
 
+// sets sizes[i] bytes starting at dests[i] to value for each of the count buffers
+WP_API bool wp_memset_batch_host(void** dests, size_t* sizes, size_t count, int value);
+WP_API bool wp_memset_batch_device(
+    void* context, void** dests, size_t* sizes, size_t count, int value, void* stream = WP_CURRENT_STREAM
+);
+
 // takes srcsize bytes starting at src and repeats them n times at dst (writes srcsize * n bytes in total):
 WP_API void wp_memtile_host(void* dest, const void* src, size_t srcsize, size_t n);
 WP_API void wp_memtile_device(void* context, void* dest, const void* src, size_t srcsize, size_t n);
 
-WP_API uint64_t
-wp_bvh_create_host(wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size);
+WP_API uint64_t wp_bvh_create_host(
+    wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, int num_threads
+);
 WP_API void wp_bvh_destroy_host(uint64_t id);
 WP_API void wp_bvh_refit_host(uint64_t id);
-WP_API void wp_bvh_rebuild_host(uint64_t id, int constructor_type);
+WP_API void wp_bvh_rebuild_host(uint64_t id, int constructor_type, int num_threads);
 
 WP_API uint64_t wp_bvh_create_device(
     void* context, wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size
@@ -113,7 +121,8 @@ WP_API uint64_t wp_mesh_create_host(
     int support_winding_number,
     int constructor_type,
     int* groups,
-    int bvh_leaf_size
+    int bvh_leaf_size,
+    int num_threads
 );
 WP_API void wp_mesh_destroy_host(uint64_t id);
 WP_API void wp_mesh_refit_host(uint64_t id);
@@ -142,7 +151,9 @@ WP_API void wp_mesh_set_velocities_device(uint64_t id, wp::array_t<wp::vec3> vel
 // Hash grid (type: 0=float16, 1=float32, 2=float64)
 WP_API uint64_t wp_hash_grid_create_host(int type, int dim_x, int dim_y, int dim_z);
 WP_API void wp_hash_grid_destroy_host(uint64_t id, int type);
-WP_API void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const void* points, const void* groups);
+WP_API void wp_hash_grid_update_host(
+    uint64_t id, int type, double cell_width, const void* points, const void* groups, int num_threads, bool incremental
+);
 WP_API void wp_hash_grid_reserve_host(uint64_t id, int type, int num_points, bool with_groups);
 
 WP_API uint64_t wp_hash_grid_create_device(void* context, int type, int dim_x, int dim_y, int dim_z);
@@ -459,33 +470,39 @@ WP_API void wp_array_scan_double_device(
     uint64_t in, uint64_t out, int len, int in_stride, int out_stride, int type_len, bool inclusive
 );
 
-WP_API void
-wp_radix_sort_pairs_int_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_int_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_int_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
-WP_API void
-wp_radix_sort_pairs_uint_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_uint_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_uint_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
-WP_API void
-wp_radix_sort_pairs_float_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_float_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_float_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
-WP_API void
-wp_radix_sort_pairs_double_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_double_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_double_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
-WP_API void
-wp_radix_sort_pairs_int64_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_int64_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_int64_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
-WP_API void
-wp_radix_sort_pairs_uint64_host(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
+WP_API void wp_radix_sort_pairs_uint64_host(
+    uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size, int num_threads
+);
 WP_API void
 wp_radix_sort_pairs_uint64_device(uint64_t keys, uint64_t values, int n, int begin_bit, int end_bit, int value_size);
 
@@ -495,7 +512,8 @@ WP_API void wp_segmented_sort_pairs_float_host(
     int n,
     uint64_t segment_start_indices,
     uint64_t segment_end_indices,
-    int num_segments
+    int num_segments,
+    int num_threads
 );
 WP_API void wp_segmented_sort_pairs_float_device(
     uint64_t keys,
@@ -512,7 +530,8 @@ WP_API void wp_segmented_sort_pairs_int_host(
     int n,
     uint64_t segment_start_indices,
     uint64_t segment_end_indices,
-    int num_segments
+    int num_segments,
+    int num_threads
 );
 WP_API void wp_segmented_sort_pairs_int_device(
     uint64_t keys,
@@ -578,7 +597,8 @@ WP_API void wp_bsr_matrix_from_triplets_host(
     const int* bsr_row_counts,
     int* bsr_columns,
     int* bsr_nnz,
-    void* bsr_nnz_event
+    void* bsr_nnz_event,
+    int num_threads
 );
 WP_API void wp_bsr_matrix_from_triplets_device(
     int block_size,
@@ -643,7 +663,8 @@ WP_API void wp_bsr_compress_inplace_host(
     void* bsr_values,
     bool compress_values,
     int* bsr_nnz,
-    void* bsr_nnz_event
+    void* bsr_nnz_event,
+    int num_threads
 );
 WP_API void wp_bsr_compress_inplace_device(
     int row_count,
@@ -663,6 +684,61 @@ WP_API void wp_bsr_compress_inplace_device(
     void* bsr_nnz_event
 );
 
+// host-only sparse products, scalar_type is a BsrScalarType (float32 or float64)
+WP_API void wp_bsr_mv_host(
+    int scalar_type,
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* bsr_offsets,
+    const int* bsr_row_counts,
+    const int* bsr_columns,
+    const void* bsr_values,
+    double alpha,
+    const void* x,
+    double beta,
+    void* y,
+    int num_threads
+);
+// same as wp_bsr_mv_host for rhs_count right-hand sides, x and y are row-major with rhs_count columns
+WP_API void wp_bsr_mm_dense_host(
+    int scalar_type,
+    int row_count,
+    int block_rows,
+    int block_cols,
+    const int* bsr_offsets,
+    const int* bsr_row_counts,
+    const int* bsr_columns,
+    const void* bsr_values,
+    double alpha,
+    const void* x,
+    double beta,
+    void* y,
+    int rhs_count,
+    int num_threads
+);
+WP_API void wp_bsr_mm_values_host(
+    int scalar_type,
+    int block_rows,
+    int block_depth,
+    int block_cols,
+    double alpha,
+    const int* x_offsets,
+    const int* x_row_counts,
+    const int* x_columns,
+    const void* x_values,
+    const int* y_offsets,
+    const int* y_row_counts,
+    const int* y_columns,
+    const void* y_values,
+    int z_row_count,
+    const int* z_offsets,
+    const int* z_row_counts,
+    const int* z_columns,
+    void* z_values,
+    int num_threads
+);
+
 
 WP_API int wp_cuda_driver_version();  // CUDA driver version
 WP_API int wp_cuda_toolkit_version();  // CUDA Toolkit version used to build Warp
@@ -879,8 +955,62 @@ WP_API bool wp_cuda_compile_solver(
     int num_threads
 );
 
-// CPU kernel launch with optional APIC recording
-WP_API void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args, const APICLaunchInfo* apic_info);
+// CPU kernel launch with optional APIC recording and multi-threaded execution
+WP_API void wp_cpu_launch_kernel(
+    void* func,
+    void* bounds,
+    void* args,
+    void* adj_args,
+    const APICLaunchInfo* apic_info,
+    void* range_func,
+    int kernel_dim,
+    int num_threads
+);
+
+// CPU forward launch from a reusable packed argument buffer, copying num_patches
+// descriptors into args before the launch (see wp_cpu_launch_kernel for threading)
+WP_API void wp_cpu_launch_packed(
+    void* func,
+    void* range_func,
+    void* bounds,
+    void* args,
+    const void* const* patch_srcs,
+    const uint32_t* patch_offsets,
+    const uint32_t* patch_sizes,
+    int num_patches,
+    int kernel_dim,
+    int num_threads
+);
+
+// One kernel launch of wp_cpu_launch_batch(), fields as in wp_cpu_launch_kernel()
+struct CPULaunchRecord {
+    void* func;
+    void* range_func;
+    void* bounds;
+    void* args;
+    void* adj_args;
+    int kernel_dim;
+    int num_threads;
+};
+
+// One kernel launch of wp_cuda_launch_batch(), fields as in wp_cuda_launch_kernel()
+struct CUDALaunchRecord {
+    void* kernel;
+    void** args;
+    uint64_t dim;
+    int max_blocks;
+    int block_dim;
+    int grid_stride;
+    int cluster_dim;
+    int shared_memory_bytes;
+};
+
+// execute count CPU kernel launches in order
+WP_API void wp_cpu_launch_batch(const CPULaunchRecord* launches, int count);
+
+// issue count CUDA kernel launches back to back on a stream, returns 0 on success
+// or the 1-based index of the first launch that failed (later launches are skipped)
+WP_API int wp_cuda_launch_batch(void* context, const CUDALaunchRecord* launches, int count, void* stream);
 
 WP_API void* wp_cuda_load_module(void* context, const char* ptx);
 WP_API void wp_cuda_unload_module(void* context, void* module);
@@ -940,6 +1070,13 @@ WP_API void wp_cuda_timing_begin(int flags);
 WP_API int wp_cuda_timing_get_result_count();
 WP_API void wp_cuda_timing_end(timing_result_t* results, int size);
 
+// CPU timing
+WP_API void wp_cpu_timing_begin(int flags);
+WP_API int wp_cpu_timing_get_result_count();
+WP_API void wp_cpu_timing_end(cpu_timing_result_t* results, int size);
+// mark the start of the Python dispatch of the next kernel launched on the calling thread
+WP_API void wp_cpu_timing_mark_dispatch();
+
 // graph coloring
 WP_API int wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::array_t<int> node_colors);
 WP_API float wp_balance_coloring(
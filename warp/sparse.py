@@ -40,6 +40,7 @@ from warp._src.sparse import bsr_get_diag as bsr_get_diag
 from warp._src.sparse import bsr_identity as bsr_identity
 from warp._src.sparse import bsr_matrix_t as bsr_matrix_t
 from warp._src.sparse import bsr_mm as bsr_mm
+from warp._src.sparse import bsr_mm_dense as bsr_mm_dense
 from warp._src.sparse import bsr_mv as bsr_mv
 from warp._src.sparse import bsr_row_index as bsr_row_index
 from warp._src.sparse import bsr_scale as bsr_scale
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+import warp as wp
+import warp.fem as fem
+from warp.tests.unittest_utils import *
+
+
+def test_temporary_store_size_classes(test, device):
+    store = fem.TemporaryStore()
+
+    # 400 and 440 bytes fall in the same size class
+    a = fem.borrow_temporary(store, shape=100, dtype=wp.int32, device=device)
+    test.assertEqual(a.capacity, 448)
+    ptr = a.ptr
+    a.release()
+
+    b = fem.borrow_temporary(store, shape=55, dtype=wp.float64, device=device)
+    test.assertEqual(b.ptr, ptr)
+    b.fill_(2.0)
+    assert_np_equal(b.numpy(), np.full(55, 2.0))
+
+    # a larger size class requires a new allocation
+    c = fem.borrow_temporary(store, shape=(10, 20), dtype=wp.vec3, device=device)
+    test.assertNotEqual(c.ptr, ptr)
+
+    stats = store.get_stats()
+    test.assertEqual(stats.hits, 1)
+    test.assertEqual(stats.misses, 2)
+    test.assertEqual(stats.bytes_held, 448 + c.capacity)
+    test.assertEqual(stats.bytes_idle, 0)
+
+    del b, c
+    stats = store.get_stats()
+    test.assertEqual(stats.bytes_idle, stats.bytes_held)
+    test.assertEqual(stats.peak_bytes_held, stats.bytes_held)
+
+    store.trim()
+    stats = store.get_stats()
+    test.assertEqual(stats.bytes_held, 0)
+    test.assertEqual(stats.evictions, 2)
+
+
+def test_temporary_store_max_bytes(test, device):
+    store = fem.TemporaryStore(max_bytes=1200)
+
+    a = fem.borrow_temporary(store, shape=100, dtype=float, device=device)
+    b = fem.borrow_temporary(store, shape=160, dtype=float, device=device)
+    b_ptr = b.ptr
+    a.release()
+    b.release()
+
+    stats = store.get_stats()
+    test.assertEqual(stats.bytes_held, 448 + 640)
+    test.assertEqual(stats.bytes_idle, 448 + 640)
+    test.assertEqual(stats.evictions, 0)
+
+    # making room for a new allocation frees the least recently used idle buffer
+    c = fem.borrow_temporary(store, shape=128, dtype=float, device=device)
+    stats = store.get_stats()
+    test.assertEqual(stats.evictions, 1)
+    test.assertEqual(stats.bytes_held, 640 + 512)
+
+    b = fem.borrow_temporary(store, shape=160, dtype=float, device=device)
+    test.assertEqual(b.ptr, b_ptr)
+    a = fem.borrow_temporary(store, shape=100, dtype=float, device=device)
+    test.assertEqual(store.get_stats().misses, 4)
+
+    # borrowed temporaries are never freed, so the limit may be exceeded
+    stats = store.get_stats()
+    test.assertEqual(stats.bytes_held, 640 + 512 + 448)
+    test.assertEqual(stats.peak_bytes_held, 640 + 512 + 448)
+
+    # idle buffers are freed as soon as they are returned while over the limit
+    a.release()
+    stats = store.get_stats()
+    test.assertEqual(stats.evictions, 2)
+    test.assertEqual(stats.bytes_held, 640 + 512)
+
+    # detached temporaries are no longer held by the store
+    c.detach()
+    test.assertEqual(store.get_stats().bytes_held, 640)
+
+
+class CountingAllocator:
+    def __init__(self, device):
+        self.allocator = device.get_allocator()
+        self.allocations = 0
+
+    def allocate(self, size_in_bytes):
+        self.allocations += 1
+        return self.allocator.allocate(size_in_bytes)
+
+    def deallocate(self, ptr, size_in_bytes):
+        self.allocator.deallocate(ptr, size_in_bytes)
+
+
+def test_temporary_store_allocator(test, device):
+    allocator = CountingAllocator(device)
+    store = fem.TemporaryStore(allocator=allocator)
+
+    a = fem.borrow_temporary(store, shape=100, dtype=float, device=device)
+    a.release()
+    a = fem.borrow_temporary(store, shape=100, dtype=float, device=device)
+    test.assertEqual(allocator.allocations, 1)
+
+    # without an explicit allocator, the allocator of an enclosing scope is used
+    store = fem.TemporaryStore()
+    with wp.ScopedAllocator(device, allocator):
+        fem.borrow_temporary(store, shape=100, dtype=float, device=device)
+    test.assertEqual(allocator.allocations, 2)
+
+    with test.assertRaises(TypeError):
+        fem.TemporaryStore(allocator=object())
+
+
+devices = get_test_devices()
+cuda_devices = get_selected_cuda_test_devices()
+
+
+class TestFemCache(unittest.TestCase):
+    pass
+
+
+add_function_test(TestFemCache, "test_temporary_store_size_classes", test_temporary_store_size_classes, devices=devices)
+add_function_test(TestFemCache, "test_temporary_store_max_bytes", test_temporary_store_max_bytes, devices=devices)
+add_function_test(TestFemCache, "test_temporary_store_allocator", test_temporary_store_allocator, devices=cuda_devices)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2, failfast=True)
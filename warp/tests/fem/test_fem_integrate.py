@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -666,6 +667,67 @@ def test_padded_sparse_assembly(test, device):
         test.assertAlmostEqual(loss.numpy()[0], scale.grad.numpy()[0], places=4)
 
 
+def test_integrate_pattern_cache(test, device):
+    with wp.ScopedDevice(device):
+        geo = fem.Grid2D(res=(4, 4))
+        space = fem.make_polynomial_space(geo, degree=2)
+        test_field = fem.make_test(space)
+        trial_field = fem.make_trial(space)
+        fields = {"v": test_field, "u": trial_field}
+
+        x = wp.array(np.linspace(1.0, 2.0, space.node_count(), dtype=np.float32), dtype=float)
+
+        for assembly in ("generic", "dispatch", "nodal"):
+            with test.subTest(assembly=assembly):
+                scale = wp.array([2.0], dtype=float)
+                reference = fem.integrate(
+                    scaled_bilinear_form, fields=fields, values={"scale": scale}, assembly=assembly, output_dtype=float
+                )
+                expected = (reference @ x).numpy()
+
+                pattern = fem.SparsityPatternCache()
+                options = {"pattern_cache": pattern}
+                matrix = bsr_zeros(reference.nrow, reference.ncol, block_type=float)
+                fem.integrate(
+                    scaled_bilinear_form,
+                    fields=fields,
+                    values={"scale": scale},
+                    assembly=assembly,
+                    output=matrix,
+                    bsr_options=options,
+                )
+                test.assertTrue(pattern.is_recorded)
+                assert_np_equal((matrix @ x).numpy(), expected, tol=1.0e-5)
+
+                # later assemblies write values in place without rebuilding the topology
+                columns, values = matrix.columns, matrix.values
+                scale.fill_(3.0)
+                with mock.patch(
+                    "warp._src.fem.integrate.bsr_set_from_triplets", side_effect=AssertionError("pattern not reused")
+                ):
+                    fem.integrate(
+                        scaled_bilinear_form,
+                        fields=fields,
+                        values={"scale": scale},
+                        assembly=assembly,
+                        output=matrix,
+                        bsr_options=options,
+                    )
+                test.assertIs(matrix.columns, columns)
+                test.assertIs(matrix.values, values)
+                assert_np_equal((matrix @ x).numpy(), 1.5 * expected, tol=1.0e-5)
+
+        # a different form records a new pattern
+        bilinear = fem.integrate(bilinear_form, fields=fields, output_dtype=float)
+        fem.integrate(bilinear_form, fields=fields, output=matrix, bsr_options=options)
+        assert_np_equal((matrix @ x).numpy(), (bilinear @ x).numpy(), tol=1.0e-5)
+
+        with test.assertRaises(RuntimeError):
+            fem.integrate(bilinear_form, fields=fields, output_dtype=float, bsr_options=options)
+        with test.assertRaises(RuntimeError):
+            fem.integrate(bilinear_form, fields=fields, output=matrix, add=True, bsr_options=options)
+
+
 def test_capturability(test, device):
     A = bsr_zeros(0, 0, block_type=wp.float32, device=device)
 
@@ -766,6 +828,7 @@ add_function_test(TestFemIntegrate, "test_grad_decomposition", test_grad_decompo
 add_function_test(TestFemIntegrate, "test_integrate_high_order", test_integrate_high_order, devices=cuda_devices)
 add_function_test(TestFemIntegrate, "test_padded_sparse_assembly", test_padded_sparse_assembly, devices=cuda_devices)
 add_function_test(TestFemIntegrate, "test_interpolate_reduction", test_interpolate_reduction, devices=devices)
+add_function_test(TestFemIntegrate, "test_integrate_pattern_cache", test_integrate_pattern_cache, devices=devices)
 add_function_test(TestFemIntegrate, "test_capturability", test_capturability, devices=cuda_devices_with_mempool)
 
 if __name__ == "__main__":
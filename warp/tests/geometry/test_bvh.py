@@ -138,6 +138,86 @@ def test_bvh_cubql_constructor(test, device):
         test_bvh(test, "ray", device, leaf_size, constructor="cubql")
 
 
+@wp.kernel
+def bvh_query_aabb_visit_order(
+    bvh_id: wp.uint64,
+    query_lowers: wp.array[wp.vec3],
+    query_uppers: wp.array[wp.vec3],
+    hits: wp.array2d[int],
+    hit_counts: wp.array[int],
+):
+    tid = wp.tid()
+    query = wp.bvh_query_aabb(bvh_id, query_lowers[tid], query_uppers[tid])
+    bounds_nr = int(0)
+    count = int(0)
+
+    while wp.bvh_query_next(query, bounds_nr):
+        if count < hits.shape[1]:
+            hits[tid, count] = bounds_nr
+        count += 1
+
+    hit_counts[tid] = count
+
+
+def test_bvh_cpu_threads(test, device):
+    rng = np.random.default_rng(42)
+
+    # large enough for multi-threaded binning at the top levels and many subtree tasks
+    num_bounds = 40000
+    num_queries = 32
+    max_hits = 2048
+
+    query_lowers_np = rng.random(size=(num_queries, 3)).astype(np.float32) * 9.0
+    query_uppers_np = query_lowers_np + 1.0
+    query_lowers = wp.array(query_lowers_np, dtype=wp.vec3, device=device)
+    query_uppers = wp.array(query_uppers_np, dtype=wp.vec3, device=device)
+
+    def query(bvh, lowers_np, uppers_np):
+        hits = wp.full((num_queries, max_hits), -1, dtype=int, device=device)
+        hit_counts = wp.zeros(num_queries, dtype=int, device=device)
+        wp.launch(
+            bvh_query_aabb_visit_order,
+            dim=num_queries,
+            inputs=[bvh.id, query_lowers, query_uppers, hits, hit_counts],
+            device=device,
+        )
+        hits = hits.numpy()
+        hit_counts = hit_counts.numpy()
+
+        for i in range(num_queries):
+            overlap = np.all(lowers_np <= query_uppers_np[i], axis=1) & np.all(uppers_np >= query_lowers_np[i], axis=1)
+            test.assertLessEqual(hit_counts[i], max_hits)
+            assert_np_equal(np.sort(hits[i, : hit_counts[i]]), np.flatnonzero(overlap))
+
+        return hits
+
+    for constructor in ("sah", "median"):
+        for leaf_size in (1, 4):
+            with test.subTest(constructor=constructor, leaf_size=leaf_size):
+                lowers_np = rng.random(size=(num_bounds, 3)).astype(np.float32) * 10.0
+                uppers_np = lowers_np + rng.random(size=(num_bounds, 3)).astype(np.float32) * 0.2
+                lowers = wp.array(lowers_np, dtype=wp.vec3, device=device)
+                uppers = wp.array(uppers_np, dtype=wp.vec3, device=device)
+
+                serial = wp.Bvh(lowers, uppers, constructor=constructor, leaf_size=leaf_size, cpu_threads=1)
+                expected = query(serial, lowers_np, uppers_np)
+
+                # the multi-threaded build yields the same tree, so the traversal order matches too
+                for cpu_threads in (4, 0):
+                    bvh = wp.Bvh(lowers, uppers, constructor=constructor, leaf_size=leaf_size, cpu_threads=cpu_threads)
+                    assert_np_equal(query(bvh, lowers_np, uppers_np), expected)
+
+                # rebuild in place after moving the bounds
+                lowers_np = rng.random(size=(num_bounds, 3)).astype(np.float32) * 10.0
+                uppers_np = lowers_np + rng.random(size=(num_bounds, 3)).astype(np.float32) * 0.2
+                lowers.assign(lowers_np)
+                uppers.assign(uppers_np)
+
+                serial.rebuild(constructor, cpu_threads=1)
+                bvh.rebuild(constructor, cpu_threads=4)
+                assert_np_equal(query(bvh, lowers_np, uppers_np), query(serial, lowers_np, uppers_np))
+
+
 def test_bvh_ray_query_inside_and_outside_bounds(test, device):
     """Regression test for issue #288: BVH ray queries should detect intersections
     regardless of whether the ray origin is inside or outside the bounding volumes.
@@ -844,6 +924,7 @@ add_function_test(
     test_bvh_ray_query_inside_and_outside_bounds,
     devices=devices,
 )
+add_function_test(TestBvh, "test_bvh_cpu_threads", test_bvh_cpu_threads, devices=[d for d in devices if d.is_cpu])
 add_function_test(TestBvh, "test_bvh_refit_root_leaves", test_bvh_refit_root_leaves, devices=cuda_devices)
 add_function_test(TestBvh, "test_tile_bvh_query_aabb", test_tile_bvh_query, devices=cuda_devices)
 add_function_test(TestBvh, "test_tile_bvh_query_ray", test_tile_bvh_query_ray, devices=cuda_devices)
@@ -299,6 +299,12 @@ def count_neighbors_reference(radius: float, points: wp.array[wp.vec3], counts:
         wp.atomic_add(counts, i, 1)
 
 
+@wp.kernel
+def hashgrid_sorted_point_ids(grid: wp.uint64, ids: wp.array[int]):
+    tid = wp.tid()
+    ids[tid] = wp.hash_grid_point_id(grid, tid)
+
+
 def particle_grid(dim_x, dim_y, dim_z, lower, radius, jitter):
     rng = np.random.default_rng(123)
     points = np.meshgrid(np.linspace(0, dim_x, dim_x), np.linspace(0, dim_y, dim_y), np.linspace(0, dim_z, dim_z))
@@ -969,6 +975,67 @@ def test_hashgrid_negative_wrapping(test, device):
     test.assertEqual(counts_np[1], 2)  # B finds self + A
 
 
+def test_hashgrid_incremental_cpu_threads(test, device):
+    # incremental and multi-threaded CPU builds must match a serial rebuild from scratch
+    rng = np.random.default_rng(42)
+    num_points = 40000
+    radius = 1.0
+    extent = 30.0
+
+    points_np = rng.uniform(0.0, extent, size=(num_points, 3)).astype(np.float32)
+    groups_np = rng.integers(0, 4, size=num_points, dtype=np.int32)
+
+    points = wp.array(points_np, dtype=wp.vec3, device=device)
+    groups = wp.array(groups_np, dtype=int, device=device)
+
+    def sorted_ids(grid):
+        ids = wp.empty(num_points, dtype=int, device=device)
+        wp.launch(hashgrid_sorted_point_ids, dim=num_points, inputs=[grid.id, ids], device=device)
+        return ids.numpy()
+
+    def neighbor_counts(grid):
+        counts = wp.zeros(num_points, dtype=int, device=device)
+        wp.launch(count_neighbors_f32, dim=num_points, inputs=[grid.id, radius, points, counts], device=device)
+        return counts.numpy()
+
+    for grouped in (False, True):
+        build_groups = groups if grouped else None
+        grid = wp.HashGrid(16, 16, 16, device)
+
+        for step in range(6):
+            if step == 3:
+                # most points change cell, the update falls back to a full rebuild
+                points_np = rng.uniform(0.0, extent, size=(num_points, 3)).astype(np.float32)
+            elif step > 0:
+                # a few percent of the points move, some of them into another group
+                moved = rng.choice(num_points, size=num_points // 50, replace=False)
+                points_np[moved] = rng.uniform(0.0, extent, size=(len(moved), 3))
+                groups_np[moved[::2]] = rng.integers(0, 4, size=len(moved[::2]), dtype=np.int32)
+            points.assign(points_np)
+            groups.assign(groups_np)
+
+            grid.build(points, radius, groups=build_groups, incremental=True, cpu_threads=4)
+
+            reference = wp.HashGrid(16, 16, 16, device)
+            reference.build(points, radius, groups=build_groups, incremental=False, cpu_threads=1)
+
+            assert_np_equal(sorted_ids(grid), sorted_ids(reference))
+            assert_np_equal(neighbor_counts(grid), neighbor_counts(reference))
+
+    # a point count change and an all-threads build both start from scratch
+    grid.build(points[: num_points // 2], radius, cpu_threads=0)
+    reference = wp.HashGrid(16, 16, 16, device)
+    reference.build(points[: num_points // 2], radius, cpu_threads=1)
+    ids = wp.empty(num_points // 2, dtype=int, device=device)
+    ref_ids = wp.empty(num_points // 2, dtype=int, device=device)
+    wp.launch(hashgrid_sorted_point_ids, dim=num_points // 2, inputs=[grid.id, ids], device=device)
+    wp.launch(hashgrid_sorted_point_ids, dim=num_points // 2, inputs=[reference.id, ref_ids], device=device)
+    assert_np_equal(ids.numpy(), ref_ids.numpy())
+
+    with test.assertRaises(ValueError):
+        grid.build(points, radius, cpu_threads=-1)
+
+
 devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 
@@ -1252,6 +1319,12 @@ add_function_test(TestHashGrid, "test_hashgrid_cell_count_overflow", test_hashgr
 add_function_test(TestHashGrid, "test_hashgrid_dtype_validation", test_hashgrid_dtype_validation, devices=devices)
 add_function_test(TestHashGrid, "test_hashgrid_edge_cases", test_hashgrid_edge_cases, devices=devices)
 add_function_test(TestHashGrid, "test_hashgrid_negative_wrapping", test_hashgrid_negative_wrapping, devices=devices)
+add_function_test(
+    TestHashGrid,
+    "test_hashgrid_incremental_cpu_threads",
+    test_hashgrid_incremental_cpu_threads,
+    devices=[d for d in devices if d.is_cpu],
+)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
+import io
 import os
+import struct
 import tempfile
 import unittest
 from typing import Any
@@ -1125,6 +1128,121 @@ def test_volume_write(test, device):
             os.remove(file_path)
 
 
+def _make_nvdb_grids(names):
+    """Build a buffer of minimal NanoVDB grids with empty trees, one per name."""
+    grid_size = 736  # sizeof(GridData) + sizeof(TreeData)
+    data = np.zeros(grid_size * len(names), dtype=np.uint8)
+    for grid_index, name in enumerate(names):
+        offset = grid_index * grid_size
+        struct.pack_into(
+            "<QQIIIIQ", data, offset, 0x304244566F6E614E, 0, 32 << 21, 0, grid_index, len(names), grid_size
+        )
+        name_bytes = name.encode("utf-8")
+        data[offset + 40 : offset + 40 + len(name_bytes)] = np.frombuffer(name_bytes, dtype=np.uint8)
+        # mark the tree data so that grids can be told apart
+        data[offset + 672 : offset + grid_size] = grid_index + 1
+    return data, grid_size
+
+
+def test_volume_load_nvdb_grids(test, device):
+    names = ("density", "temperature", "velocity")
+    data, grid_size = _make_nvdb_grids(names)
+    volume = wp.Volume(wp.array(data, dtype=wp.uint8, device=device))
+
+    for codec in ("none", "zip"):
+        with test.subTest(codec=codec):
+            fd, file_path = tempfile.mkstemp(suffix=".nvdb")
+            os.close(fd)
+            try:
+                volume.save_to_nvdb(file_path, codec=codec)
+
+                grids = wp.Volume.get_nvdb_grids(file_path)
+                test.assertEqual([grid.name for grid in grids], list(names))
+                test.assertEqual([grid.grid_index for grid in grids], [0, 1, 2])
+                test.assertTrue(all(grid.size_in_bytes == grid_size and grid.codec == codec for grid in grids))
+
+                # all grids, from a path, a file object, a decompressing stream, or an in-memory buffer
+                with open(file_path, "rb") as f:
+                    file_bytes = f.read()
+                    f.seek(0)
+                    from_file = wp.Volume.load_from_nvdb(f, device=device)
+                with gzip.open(file_path + ".gz", "wb") as f:
+                    f.write(file_bytes)
+                with gzip.open(file_path + ".gz", "rb") as f:
+                    from_gzip = wp.Volume.load_from_nvdb(f, device=device)
+                for loaded in (
+                    wp.Volume.load_from_nvdb(file_path, device=device),
+                    from_file,
+                    from_gzip,
+                    wp.Volume.load_from_nvdb(io.BytesIO(file_bytes), device=device),
+                ):
+                    assert_np_equal(loaded.array().numpy(), data)
+                    test.assertEqual(loaded.load_next_grid().get_grid_info().name, "temperature")
+
+                # a single grid, by index or by name
+                for grid in (1, "temperature", -2):
+                    loaded = wp.Volume.load_from_nvdb(file_path, device=device, grid=grid)
+                    test.assertEqual(loaded.get_grid_info().grid_index, 1)
+                    assert_np_equal(loaded.array().numpy(), data[grid_size : 2 * grid_size])
+                    test.assertIsNone(loaded.load_next_grid())
+
+                with test.assertRaises(ValueError):
+                    wp.Volume.load_from_nvdb(file_path, device=device, grid="pressure")
+                with test.assertRaises(ValueError):
+                    wp.Volume.load_from_nvdb(file_path, device=device, grid=3)
+            finally:
+                os.remove(file_path)
+                if os.path.exists(file_path + ".gz"):
+                    os.remove(file_path + ".gz")
+
+
+def test_volume_load_nvdb_non_ascii_name(test, device):
+    names = ("densité", "température")
+    data, _ = _make_nvdb_grids(names)
+    volume = wp.Volume(wp.array(data, dtype=wp.uint8, device=device))
+
+    fd, file_path = tempfile.mkstemp(suffix=".nvdb")
+    os.close(fd)
+    try:
+        volume.save_to_nvdb(file_path)
+
+        test.assertEqual([grid.name for grid in wp.Volume.get_nvdb_grids(file_path)], list(names))
+        loaded = wp.Volume.load_from_nvdb(file_path, device=device)
+        assert_np_equal(loaded.array().numpy(), data)
+        loaded = wp.Volume.load_from_nvdb(file_path, device=device, grid="température")
+        assert_np_equal(loaded.array().numpy(), data[len(data) // 2 :])
+    finally:
+        os.remove(file_path)
+
+
+def test_volume_load_nvdb_mapped(test, device):
+    # a 31-character name makes the grid data start 32-byte aligned in the file
+    data, _ = _make_nvdb_grids(("a" * 31,))
+    volume = wp.Volume(wp.array(data, dtype=wp.uint8, device=device))
+
+    fd, file_path = tempfile.mkstemp(suffix=".nvdb")
+    os.close(fd)
+    try:
+        volume.save_to_nvdb(file_path)
+        file_data = np.fromfile(file_path, dtype=np.uint8)
+
+        loaded = wp.Volume.load_from_nvdb(file_path, device=device)
+        loaded_array = loaded.array()
+        test.assertEqual(loaded_array.ptr % 32, 0)
+
+        # the volume aliases the file mapping, which is copy-on-write
+        file_offset = len(file_data) - len(data)
+        test.assertEqual(loaded_array.ptr, loaded._grid_data.ctypes.data)
+        loaded_array.numpy()[700] = 42
+        assert_np_equal(np.fromfile(file_path, dtype=np.uint8), file_data)
+        test.assertEqual(loaded.array().numpy()[700], 42)
+        assert_np_equal(file_data[file_offset:], data)
+
+        del loaded, loaded_array
+    finally:
+        os.remove(file_path)
+
+
 class TestVolume(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
@@ -1226,6 +1344,13 @@ add_function_test(TestVolume, "test_volume_multiple_grids", test_volume_multiple
 add_function_test(TestVolume, "test_volume_feature_array", test_volume_feature_array, devices=devices)
 add_function_test(TestVolume, "test_volume_sample_index", test_volume_sample_index, devices=devices)
 add_function_test(TestVolume, "test_volume_write", test_volume_write, devices=[wp.get_device("cpu")])
+add_function_test(TestVolume, "test_volume_load_nvdb_grids", test_volume_load_nvdb_grids, devices=devices)
+add_function_test(
+    TestVolume, "test_volume_load_nvdb_non_ascii_name", test_volume_load_nvdb_non_ascii_name, devices=devices
+)
+add_function_test(
+    TestVolume, "test_volume_load_nvdb_mapped", test_volume_load_nvdb_mapped, devices=[wp.get_device("cpu")]
+)
 
 for device in devices:
     add_kernel_test(
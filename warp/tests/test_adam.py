@@ -197,6 +197,102 @@ def test_adam_set_params_migrates_state(test, device):
     test.assertIs(opt.v[1], unmoved_v)
 
 
+def _make_mixed_dtype_params(rng, device):
+    dtypes = (
+        (wp.float32, (5,)),
+        (wp.vec3, (4,)),
+        (wp.mat22, (3,)),
+        (wp.float32, (3, 4)),
+        (wp.float64, (6,)),
+        (wp.vec2d, (2,)),
+        (wp.float16, (7,)),
+        (wp.types.matrix((3, 3), wp.float16), (2,)),
+    )
+    params = []
+    grads = []
+    for dtype, shape in dtypes:
+        value_shape = shape + getattr(dtype, "_shape_", ())
+        params.append(wp.array(rng.uniform(-1.0, 1.0, size=value_shape), dtype=dtype, device=device))
+        grads.append(wp.array(rng.uniform(-1.0, 1.0, size=value_shape), dtype=dtype, device=device))
+
+    # non-contiguous parameters, updated separately
+    for dtype, shape in ((wp.float32, (8,)), (wp.float64, (8,)), (wp.vec2d, (4, 6)), (wp.mat22h, (6,))):
+        value_shape = shape + getattr(dtype, "_shape_", ())
+        strided = wp.array(rng.uniform(-1.0, 1.0, size=value_shape), dtype=dtype, device=device)[::2]
+        params.append(strided)
+        grads.append(wp.array(rng.uniform(-1.0, 1.0, size=strided.numpy().shape), dtype=dtype, device=device))
+
+    return params, grads
+
+
+def test_adam_multi_tensor(test, device):
+    """Verify the fused update of parameters of many dtypes against a reference implementation."""
+    rng = np.random.default_rng(42)
+    params, grads = _make_mixed_dtype_params(rng, device)
+
+    lr, beta1, beta2, eps = 0.01, 0.8, 0.99, 1.0e-8
+    opt = warp.optim.Adam(params, lr=lr, betas=(beta1, beta2), eps=eps)
+
+    expected = [p.numpy().astype(np.float64) for p in params]
+    m = [np.zeros_like(p) for p in expected]
+    v = [np.zeros_like(p) for p in expected]
+
+    for t in range(1, 4):
+        opt.step(grads)
+        for i, grad in enumerate(grads):
+            g = grad.numpy().astype(np.float64)
+            m[i] = beta1 * m[i] + (1.0 - beta1) * g
+            v[i] = beta2 * v[i] + (1.0 - beta2) * g * g
+            mhat = m[i] / (1.0 - beta1**t)
+            vhat = v[i] / (1.0 - beta2**t)
+            expected[i] -= lr * mhat / (np.sqrt(vhat) + eps)
+
+    test.assertEqual(opt.t, 3)
+    for param, exp in zip(params, expected, strict=True):
+        # double-precision parameters are updated with double-precision hyperparameters
+        tol = {np.float16: 2.0e-3, np.float64: 1.0e-12}.get(param.numpy().dtype.type, 1.0e-5)
+        assert_np_equal(param.numpy().astype(np.float64), exp, tol=tol)
+
+    # contiguous parameters sharing a scalar type are updated by a single launch,
+    # the four non-contiguous ones by one launch each
+    with wp.ScopedTimer(
+        "adam", print=False, cuda_filter=wp.TIMING_KERNEL, cpu_filter=wp.TIMING_KERNEL, synchronize=True
+    ) as timer:
+        opt.step(grads)
+    test.assertEqual(len(timer.timing_results), 8)
+
+    # resetting restarts the bias correction from the first step
+    opt.reset_internal_state()
+    test.assertEqual(opt.t, 0)
+    test.assertEqual(opt._step_counters[device.alias].numpy()[0], 0)
+
+
+def test_adam_graph_capture(test, device):
+    """Verify captured steps advance the device-side step count."""
+    rng = np.random.default_rng(7)
+    params, grads = _make_mixed_dtype_params(rng, device)
+    ref_params = [wp.clone(p) for p in params]
+
+    with wp.ScopedDevice(device):
+        opt = warp.optim.Adam(params, lr=0.01)
+        ref_opt = warp.optim.Adam(ref_params, lr=0.01)
+
+        # the first step uploads the address tables
+        opt.step(grads)
+        ref_opt.step(grads)
+
+        with wp.ScopedCapture() as capture:
+            opt.step(grads)
+
+        for _ in range(3):
+            wp.capture_launch(capture.graph)
+            ref_opt.step(grads)
+
+    test.assertEqual(opt._step_counters[device.alias].numpy()[0], 4)
+    for param, ref in zip(params, ref_params, strict=True):
+        assert_np_equal(param.numpy(), ref.numpy())
+
+
 devices = get_test_devices()
 
 
@@ -216,6 +312,8 @@ add_function_test(
     test_adam_set_params_migrates_state,
     devices=get_cuda_test_devices(),
 )
+add_function_test(TestAdam, "test_adam_multi_tensor", test_adam_multi_tensor, devices=devices)
+add_function_test(TestAdam, "test_adam_graph_capture", test_adam_graph_capture, devices=get_cuda_test_devices())
 
 
 if __name__ == "__main__":
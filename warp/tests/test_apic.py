@@ -2303,6 +2303,34 @@ def test_capture_with_record_cmd_launch(test, device):
     np.testing.assert_allclose(out.numpy(), np.arange(n, dtype=np.float32) + 100.0 + 3.0 * 10.0)
 
 
+def test_capture_with_launch_list(test, device):
+    """A ``wp.LaunchList`` submitted during APIC capture records every launch."""
+    n = 64
+    a = wp.array(np.arange(n, dtype=np.float32), device=device)
+    b = wp.array(np.full(n, 10.0, dtype=np.float32), device=device)
+    out = wp.zeros(n, dtype=float, device=device)
+    out2 = wp.zeros(n, dtype=float, device=device)
+
+    launches = wp.LaunchList(
+        [
+            wp.launch(saxpy_kernel, dim=n, inputs=[a, b, 2.0], outputs=[out], record_cmd=True, device=device),
+            wp.launch(saxpy_kernel, dim=n, inputs=[out, b, 3.0], outputs=[out2], record_cmd=True, device=device),
+        ]
+    )
+
+    wp.load_module(device=device)
+    with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+        launches.launch()
+
+    out.fill_(-999.0)
+    out2.fill_(-999.0)
+    wp.capture_launch(capture.graph)
+    wp.synchronize_device(device)
+    expected = np.arange(n, dtype=np.float32) + 2.0 * 10.0
+    np.testing.assert_allclose(out.numpy(), expected)
+    np.testing.assert_allclose(out2.numpy(), expected + 3.0 * 10.0)
+
+
 def test_record_cmd_raw_array_ctype_rejected_during_apic_capture(test, device):
     """Raw ctypes array descriptors do not provide APIC relocation ownership."""
     n = 4
@@ -3359,6 +3387,12 @@ add_function_test(
     test_capture_with_record_cmd_launch,
     devices=devices_with_cuda_graph_module_load,
 )
+add_function_test(
+    TestApic,
+    "test_capture_with_launch_list",
+    test_capture_with_launch_list,
+    devices=devices_with_cuda_graph_module_load,
+)
 add_function_test(
     TestApic,
     "test_record_cmd_raw_array_ctype_rejected_during_apic_capture",
@@ -1180,6 +1180,32 @@ def test_fill_slices(test, device):
         assert_np_equal(a4a.numpy(), np.full(a4a.shape, fill_a, dtype=nptype))
 
 
+def test_zero_arrays(test, device):
+    # odd sizes exercise the unaligned tail of the batched memset
+    a = wp.full(37, 3.0, dtype=float, device=device)
+    b = wp.full((5, 7), wp.vec3(1.0, 2.0, 3.0), dtype=wp.vec3, device=device)
+    c = wp.full(1001, 7, dtype=wp.uint8, device=device)
+    d = wp.full((4, 6), 5, dtype=int, device=device)
+    empty = wp.empty(0, dtype=float, device=device)
+
+    # non-contiguous views fall back to zero_()
+    d_even = d[::2]
+
+    wp.zero_arrays([a, None, b, c, empty, d_even])
+
+    assert_np_equal(a.numpy(), np.zeros(37))
+    assert_np_equal(b.numpy(), np.zeros((5, 7, 3)))
+    assert_np_equal(c.numpy(), np.zeros(1001))
+    assert_np_equal(d.numpy(), np.array([[0] * 6, [5] * 6, [0] * 6, [5] * 6]))
+
+    # a single array per device
+    e = wp.full(3, 2.0, dtype=float, device=device)
+    wp.zero_arrays([e])
+    assert_np_equal(e.numpy(), np.zeros(3))
+
+    wp.zero_arrays([])
+
+
 def test_full_scalar(test, device):
     dim = 4
 
@@ -4197,6 +4223,7 @@ add_function_test(TestArray, "test_fill_vector", test_fill_vector, devices=devic
 add_function_test(TestArray, "test_fill_matrix", test_fill_matrix, devices=devices)
 add_function_test(TestArray, "test_fill_struct", test_fill_struct, devices=devices)
 add_function_test(TestArray, "test_fill_slices", test_fill_slices, devices=devices)
+add_function_test(TestArray, "test_zero_arrays", test_zero_arrays, devices=devices)
 add_function_test(TestArray, "test_full_scalar", test_full_scalar, devices=devices)
 add_function_test(TestArray, "test_full_vector", test_full_vector, devices=devices)
 add_function_test(TestArray, "test_full_matrix", test_full_matrix, devices=devices)
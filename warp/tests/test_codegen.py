@@ -2178,6 +2178,68 @@ class TestCodeGen(unittest.TestCase):
             self.assertIn("42.25", k_b.adj.source)
             self.assertNotEqual(k_a.module.name, k_b.module.name)
 
+    def test_declaration_defers_source(self):
+        """Declaring a function or kernel does not parse it until it is first needed."""
+        module_name = "test_codegen_deferred_source"
+
+        def scale(x: float):
+            return x * 2.0
+
+        def fill(a: wp.array(dtype=Any), value: Any):
+            a[wp.tid()] = value
+
+        func = wp.func(scale, module=module_name)
+        kernel = wp.kernel(fill, module=module_name)
+        self.assertFalse(func.adj.is_source_loaded())
+        self.assertFalse(kernel.adj.is_source_loaded())
+
+        # an overload shares the source of its generic kernel without loading it
+        ovl = wp.overload(kernel, [wp.array[wp.float32], wp.float32])
+        self.assertFalse(kernel.adj.is_source_loaded())
+        self.assertFalse(ovl.adj.is_source_loaded())
+
+        self.assertIn("a[wp.tid()] = value", ovl.adj.source)
+        self.assertTrue(kernel.adj.is_source_loaded())
+        self.assertEqual(ovl.adj.fun_name, "fill")
+        self.assertEqual(func.adj.source_lines[0], "def scale(x: float):")
+
+    def test_declaration_parses_static_eagerly(self):
+        """``wp.static()`` expressions are evaluated against the scope at declaration time."""
+        value = 1.0
+
+        @wp.kernel(module="unique")
+        def k(a: wp.array[wp.float32]):
+            a[wp.tid()] = wp.static(value)
+
+        value = 2.0
+        self.assertTrue(k.adj.is_source_loaded())
+        self.assertEqual(list(k.adj.resolved_static_expressions.values()), [1.0])
+
+    def test_deferred_source_ignores_later_file_rewrite(self):
+        """The source of a declaration is taken from the file as it was when declared."""
+        v1 = "import warp as wp\n\ndef kf(a: wp.array[wp.float32]):\n    tid = wp.tid()\n    a[tid] = 1.0\n"
+        v2 = v1.replace("1.0", "42.25")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "deferred_source_demo.py")
+            try:
+                with open(path, "w") as f:
+                    f.write(v1)
+                os.utime(path, (1, 1))
+                ns = {}
+                exec(compile(v1, path, "exec"), ns)
+                kernel = wp.kernel(ns["kf"], module="test_codegen_deferred_source_rewrite")
+                self.assertFalse(kernel.adj.is_source_loaded())
+
+                with open(path, "w") as f:
+                    f.write(v2)
+                os.utime(path, (2, 2))
+
+                self.assertIn("1.0", kernel.adj.source)
+                self.assertNotIn("42.25", kernel.adj.source)
+            finally:
+                linecache.cache.pop(path, None)
+
     def test_shared_source_lookup_requires_identity(self):
         # A record planted under another code object's id (the address-reuse case)
         # must be rejected by the weakref identity guard.
@@ -173,6 +173,93 @@ def create_lattice_grid(N):
     return vs, fs
 
 
+def test_coloring_jones_plassmann(test, device):
+    vs, fs = create_lattice_grid(40)
+    trimesh_edge_indices = build_trimesh_edges_from_faces(fs)
+    edges_np = construct_trimesh_graph_edges(trimesh_edge_indices)
+
+    # add an isolated node and a self-loop, which do not constrain the coloring
+    node_count = len(vs) + 1
+    edges_np = np.concatenate((edges_np, [[5, 5]])).astype(np.int32)
+
+    edges = wp.array(edges_np, dtype=wp.int32, device=device)
+    node_colors = wp.empty(node_count, dtype=wp.int32, device=device)
+
+    color_count = wp.utils.graph_coloring_assign(edges, node_colors, wp.utils.GraphColoringAlgorithm.JONES_PLASSMANN)
+
+    colors_np = node_colors.numpy()
+    test.assertEqual(color_count, colors_np.max() + 1)
+    test.assertGreaterEqual(colors_np.min(), 0)
+    test.assertEqual(colors_np[-1], 0)
+    test.assertEqual(validate_graph_coloring(edges_np[:-1], colors_np), 0)
+
+    # the coloring only depends on the graph, not on thread ordering
+    node_colors_2 = wp.empty(node_count, dtype=wp.int32, device=device)
+    wp.utils.graph_coloring_assign(edges, node_colors_2, wp.utils.GraphColoringAlgorithm.JONES_PLASSMANN)
+    assert_np_equal(node_colors_2.numpy(), colors_np)
+
+    # should be in the same ballpark as the sequential algorithms
+    mcs_colors = wp.empty(node_count, dtype=wp.int32, device="cpu")
+    mcs_color_count = wp.utils.graph_coloring_assign(edges.to("cpu"), mcs_colors, wp.utils.GraphColoringAlgorithm.MCS)
+    test.assertLessEqual(color_count, 2 * mcs_color_count)
+
+    color_groups = wp.utils.graph_coloring_get_groups(node_colors.to("cpu"), color_count)
+    test.assertEqual(sum(len(group) for group in color_groups), node_count)
+
+
+def test_coloring_repair(test, device):
+    rng = np.random.default_rng(123)
+
+    node_count = 1000
+    edges_np = rng.integers(0, node_count, size=(4000, 2), dtype=np.int32)
+    edges_np = edges_np[edges_np[:, 0] != edges_np[:, 1]]
+
+    edges = wp.array(edges_np, dtype=wp.int32, device=device)
+    node_colors = wp.empty(node_count + 10, dtype=wp.int32, device=device)
+    wp.utils.graph_coloring_assign(edges, node_colors, wp.utils.GraphColoringAlgorithm.JONES_PLASSMANN)
+
+    # new nodes start uncolored
+    node_colors[node_count:].fill_(-1)
+    colors_before = node_colors.numpy()
+
+    # add edges, some of them to the new nodes
+    added_np = rng.integers(0, node_count + 10, size=(100, 2), dtype=np.int32)
+    added_np = added_np[added_np[:, 0] != added_np[:, 1]]
+    new_edges_np = np.concatenate((edges_np, added_np))
+
+    color_count = wp.utils.graph_coloring_repair(
+        wp.array(new_edges_np, dtype=wp.int32, device=device),
+        node_colors,
+        edited_edges=wp.array(added_np, dtype=wp.int32, device=device),
+    )
+
+    colors_np = node_colors.numpy()
+    test.assertEqual(color_count, colors_np.max() + 1)
+    test.assertGreaterEqual(colors_np.min(), 0)
+    test.assertEqual(validate_graph_coloring(new_edges_np, colors_np), 0)
+
+    # only uncolored nodes and endpoints of conflicting added edges may change color
+    conflicting = colors_before[added_np[:, 0]] == colors_before[added_np[:, 1]]
+    allowed = np.zeros(node_count + 10, dtype=bool)
+    allowed[added_np[conflicting].flatten()] = True
+    allowed[node_count:] = True
+    changed = colors_np != colors_before
+    test.assertFalse(np.any(changed & ~allowed))
+
+    # at most one endpoint per conflicting edge is recolored
+    test.assertLessEqual(np.count_nonzero(changed[:node_count]), np.count_nonzero(conflicting))
+
+    # repairing a valid coloring is a no-op
+    test.assertEqual(
+        wp.utils.graph_coloring_repair(wp.array(new_edges_np, dtype=wp.int32, device=device), node_colors),
+        color_count,
+    )
+    assert_np_equal(node_colors.numpy(), colors_np)
+
+
+devices = get_test_devices()
+
+
 class TestColoring(unittest.TestCase):
     def test_coloring_corner_case(self):
         """Test corner cases: empty graph and simple 2-node graph."""
@@ -395,5 +482,9 @@ class TestColoring(unittest.TestCase):
             self.assertGreater(len(group), 0, f"Color group {i} in graph 2 should not be empty")
 
 
+add_function_test(TestColoring, "test_coloring_jones_plassmann", test_coloring_jones_plassmann, devices=devices)
+add_function_test(TestColoring, "test_coloring_repair", test_coloring_repair, devices=devices)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
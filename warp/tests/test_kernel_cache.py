@@ -4,6 +4,7 @@
 import json
 import os
 import tempfile
+import time
 import unittest
 from unittest.mock import patch
 
@@ -14,11 +15,24 @@ import warp.config
 class TestKernelCache(unittest.TestCase):
     def setUp(self):
         self._original_cache_dir = warp.config.kernel_cache_dir
+        self._original_cache_max_size = warp.config.kernel_cache_max_size
         self._original_resolved_cache_dir = warp._src.build._resolved_kernel_cache_dir
         self._original_env = os.environ.pop("WARP_CACHE_PATH", None)
 
+        # keep module uses recorded by other tests out of the temporary caches
+        self._original_cache_accessed = dict(warp._src.build._kernel_cache_accessed)
+        self._original_cache_built = set(warp._src.build._kernel_cache_built)
+        warp._src.build._kernel_cache_accessed.clear()
+        warp._src.build._kernel_cache_built.clear()
+
     def tearDown(self):
+        warp._src.build._kernel_cache_accessed.clear()
+        warp._src.build._kernel_cache_accessed.update(self._original_cache_accessed)
+        warp._src.build._kernel_cache_built.clear()
+        warp._src.build._kernel_cache_built.update(self._original_cache_built)
+
         warp.config.kernel_cache_dir = self._original_cache_dir
+        warp.config.kernel_cache_max_size = self._original_cache_max_size
         warp._src.build._resolved_kernel_cache_dir = self._original_resolved_cache_dir
         if self._original_env is None:
             os.environ.pop("WARP_CACHE_PATH", None)
@@ -281,6 +295,129 @@ class TestKernelCache(unittest.TestCase):
         self.assertEqual(healed_meta, {lto_symbol: shared_memory_bytes})
         self.assertEqual(healed_lto_data, b"rebuilt")
 
+    def _make_cached_module(self, name, size, last_access=None):
+        module_dir = os.path.join(warp.config.kernel_cache_dir, name)
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, f"{name}.o"), "wb") as f:
+            f.write(b"\0" * size)
+        if last_access is not None:
+            os.utime(module_dir, (last_access, last_access))
+        return module_dir
+
+    def _read_index(self):
+        with open(os.path.join(warp.config.kernel_cache_dir, warp._src.build.KERNEL_CACHE_INDEX_NAME)) as f:
+            return json.load(f)["modules"]
+
+    def test_kernel_cache_index_records_uses(self):
+        """Module uses are batched in memory and written to the index with their size."""
+        with tempfile.TemporaryDirectory() as tmp:
+            warp._src.build.init_kernel_cache(path=tmp)
+            self._make_cached_module("wp_a", 100)
+            self._make_cached_module("wp_b", 200)
+
+            warp._src.build.record_kernel_cache_use("wp_a", built=False)
+            warp._src.build.record_kernel_cache_use("wp_b", built=True)
+            warp._src.build.record_kernel_cache_use("wp_missing", built=False)
+            self.assertFalse(os.path.exists(os.path.join(warp.config.kernel_cache_dir, "cache_index.json")))
+
+            self.assertEqual(warp._src.build._update_kernel_cache_index(), 0)
+
+            index = self._read_index()
+            self.assertEqual(set(index), {"wp_a", "wp_b"})
+            self.assertEqual(index["wp_a"]["size"], 100)
+            self.assertEqual(index["wp_b"]["size"], 200)
+            self.assertGreaterEqual(index["wp_b"]["last_access"], index["wp_a"]["last_access"])
+            self.assertFalse(os.path.exists(os.path.join(warp.config.kernel_cache_dir, "cache_index.lock")))
+
+    def test_kernel_cache_evicts_least_recently_used(self):
+        """Building a module past the size cap evicts the least recently used modules."""
+        with tempfile.TemporaryDirectory() as tmp:
+            warp._src.build.init_kernel_cache(path=tmp)
+            now = time.time()
+            # wp_old is unknown to the index and adopted with its modification time
+            self._make_cached_module("wp_old", 100, last_access=now - 300)
+            self._make_cached_module("wp_used", 100)
+            self._make_cached_module("wp_stale", 100)
+            build_dir = self._make_cached_module(f"wp_other_p{os.getpid() + 1}_t1", 1000)
+
+            warp._src.build.record_kernel_cache_use("wp_stale", built=False)
+            warp._src.build._update_kernel_cache_index()
+            time.sleep(0.01)
+            warp._src.build.record_kernel_cache_use("wp_used", built=False)
+
+            warp.config.kernel_cache_max_size = 250
+            self._make_cached_module("wp_new", 100)
+            warp._src.build.record_kernel_cache_use("wp_new", built=True)
+
+            remaining = sorted(name for name in os.listdir(warp.config.kernel_cache_dir) if name.startswith("wp_"))
+            self.assertEqual(remaining, sorted(["wp_used", "wp_new", os.path.basename(build_dir)]))
+            self.assertEqual(set(self._read_index()), {"wp_used", "wp_new"})
+
+    def test_kernel_cache_keeps_module_larger_than_cap(self):
+        """A freshly built module is never evicted, even when it alone exceeds the cap."""
+        with tempfile.TemporaryDirectory() as tmp:
+            warp._src.build.init_kernel_cache(path=tmp)
+            self._make_cached_module("wp_a", 100)
+            warp.config.kernel_cache_max_size = 10
+
+            warp._src.build.record_kernel_cache_use("wp_a", built=True)
+
+            self.assertTrue(os.path.isdir(os.path.join(warp.config.kernel_cache_dir, "wp_a")))
+
+    def test_prune_kernel_cache(self):
+        """prune_kernel_cache() enforces size and age limits and reports the removed modules."""
+        with tempfile.TemporaryDirectory() as tmp:
+            warp._src.build.init_kernel_cache(path=tmp)
+            now = time.time()
+            self._make_cached_module("wp_a", 100, last_access=now - 3000)
+            self._make_cached_module("wp_b", 100, last_access=now - 2000)
+            self._make_cached_module("wp_c", 100, last_access=now - 1000)
+            self._make_cached_module("wp_d", 100, last_access=now)
+
+            self.assertEqual(warp._src.build.prune_kernel_cache(), 0)
+            self.assertEqual(warp._src.build.prune_kernel_cache(max_age=2500), 1)
+            self.assertEqual(warp._src.build.prune_kernel_cache(max_size=150), 2)
+
+            self.assertEqual(set(self._read_index()), {"wp_d"})
+            self.assertTrue(os.path.isdir(os.path.join(warp.config.kernel_cache_dir, "wp_d")))
+
+            with self.assertRaises(ValueError):
+                warp._src.build.prune_kernel_cache(max_size=-1)
+
+    def test_kernel_cache_index_invalid_json_is_ignored(self):
+        """A corrupt index is rebuilt from the module directories."""
+        with tempfile.TemporaryDirectory() as tmp:
+            warp._src.build.init_kernel_cache(path=tmp)
+            self._make_cached_module("wp_a", 100)
+            with open(os.path.join(warp.config.kernel_cache_dir, "cache_index.json"), "w") as f:
+                f.write("{not json")
+
+            warp._src.build._update_kernel_cache_index(scan=True)
+
+            self.assertEqual(self._read_index()["wp_a"]["size"], 100)
+
+    def test_kernel_cache_lock(self):
+        """The index lock waits for a live holder and breaks a stale one."""
+        with tempfile.TemporaryDirectory() as tmp:
+            lock_dir = os.path.join(tmp, warp._src.build.KERNEL_CACHE_LOCK_NAME)
+            os.makedirs(lock_dir)
+            with open(os.path.join(lock_dir, "owner"), "w") as f:
+                f.write("0\n")
+
+            with self.assertRaises(TimeoutError):
+                with warp._src.build._kernel_cache_lock(tmp, timeout=0.05):
+                    pass
+            self.assertTrue(os.path.isdir(lock_dir))
+
+            stale_time = time.time() - 2 * warp._src.build.KERNEL_CACHE_LOCK_STALE_TIMEOUT
+            os.utime(lock_dir, (stale_time, stale_time))
+
+            with warp._src.build._kernel_cache_lock(tmp, timeout=1.0):
+                with open(os.path.join(lock_dir, "owner")) as f:
+                    self.assertEqual(f.read(), f"{os.getpid()}\n")
+
+            self.assertEqual(os.listdir(tmp), [])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
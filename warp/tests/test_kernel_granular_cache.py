@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for compiling and caching the kernels of a module separately
+(the ``"kernel_granular_cache"`` module option).
+"""
+
+import os
+import unittest
+import uuid
+from typing import Any
+
+import numpy as np
+
+import warp as wp
+import warp._src.context as context
+from warp.tests.unittest_utils import *
+
+
+def _make_granular_module():
+    """Create a fresh module with two kernels, one of them generic."""
+    module = wp.get_module(f"_test_granular_{uuid.uuid4().hex[:12]}")
+    module.options["kernel_granular_cache"] = True
+
+    def scale(a: wp.array(dtype=Any), s: Any):
+        i = wp.tid()
+        a[i] = a[i] * s
+
+    def add_one(a: wp.array(dtype=float)):
+        i = wp.tid()
+        a[i] = a[i] + 1.0
+
+    return module, wp.kernel(scale, module=module.name), wp.kernel(add_one, module=module.name)
+
+
+def _get_exec(module, device):
+    """Return the executable variant loaded by the launches on ``device``."""
+    device = wp.get_device(device)
+    return next(module_exec for (ctx, _), module_exec in module.execs.items() if ctx == device.context)
+
+
+def test_granular_launch(test, device):
+    module, scale, add_one = _make_granular_module()
+
+    a = wp.ones(8, dtype=float, device=device)
+    wp.launch(add_one, dim=8, inputs=[a], device=device)
+    wp.launch(scale, dim=8, inputs=[a, 3.0], device=device)
+    assert_np_equal(a.numpy(), np.full(8, 6.0))
+
+    module_exec = _get_exec(module, device)
+    test.assertIsInstance(module_exec, context.KernelUnitsExec)
+    test.assertEqual(len(module_exec.units), 2)
+
+    # every kernel lives in its own cache entry
+    for unit_name in module_exec.units:
+        test.assertTrue(os.path.isdir(os.path.join(wp.config.kernel_cache_dir, unit_name)))
+
+
+def test_granular_new_overload(test, device):
+    module, scale, add_one = _make_granular_module()
+
+    a = wp.ones(8, dtype=float, device=device)
+    wp.launch(add_one, dim=8, inputs=[a], device=device)
+    wp.launch(scale, dim=8, inputs=[a, 2.0], device=device)
+    units = dict(_get_exec(module, device).units)
+
+    # a new overload changes the module hash but only builds the new kernel
+    loaded = []
+    load_kernel_unit = module._load_kernel_unit
+
+    def record_load(kernel, *args, **kwargs):
+        loaded.append(kernel.key)
+        return load_kernel_unit(kernel, *args, **kwargs)
+
+    module._load_kernel_unit = record_load
+    try:
+        b = wp.ones(8, dtype=wp.float64, device=device)
+        wp.launch(scale, dim=8, inputs=[b, wp.float64(4.0)], device=device)
+        wp.launch(add_one, dim=8, inputs=[a], device=device)
+    finally:
+        del module._load_kernel_unit
+
+    test.assertEqual(loaded, [scale.key])
+    assert_np_equal(a.numpy(), np.full(8, 5.0))
+    assert_np_equal(b.numpy(), np.full(8, 4.0))
+
+    module_exec = _get_exec(module, device)
+    test.assertEqual(len(module_exec.units), 3)
+    for unit_name, unit in units.items():
+        test.assertIs(module_exec.units[unit_name], unit)
+
+
+def test_granular_cached_units(test, device):
+    module, _scale, add_one = _make_granular_module()
+
+    a = wp.ones(8, dtype=float, device=device)
+    wp.launch(add_one, dim=8, inputs=[a], device=device)
+
+    # reloading the module finds the unit in the kernel cache instead of compiling it again
+    module.unload()
+    compile_module = module._compile
+    compiled = []
+
+    def record_compile(*args, **kwargs):
+        result = compile_module(*args, **kwargs)
+        compiled.append(result)
+        return result
+
+    module._compile = record_compile
+    try:
+        wp.launch(add_one, dim=8, inputs=[a], device=device)
+    finally:
+        del module._compile
+
+    test.assertEqual(compiled, [False])
+    assert_np_equal(a.numpy(), np.full(8, 3.0))
+
+
+def test_granular_force_load(test, device):
+    module, scale, _add_one = _make_granular_module()
+
+    # instantiate an overload so that the generic kernel has something to build
+    wp.overload(scale, [wp.array(dtype=float), float])
+
+    wp.force_load(device=device, modules=[module])
+
+    module_exec = _get_exec(module, device)
+    test.assertEqual(len(module_exec.units), 2)
+
+
+devices = get_test_devices()
+
+
+class TestKernelGranularCache(unittest.TestCase):
+    pass
+
+
+add_function_test(TestKernelGranularCache, "test_granular_launch", test_granular_launch, devices=devices)
+add_function_test(TestKernelGranularCache, "test_granular_new_overload", test_granular_new_overload, devices=devices)
+add_function_test(TestKernelGranularCache, "test_granular_cached_units", test_granular_cached_units, devices=devices)
+add_function_test(TestKernelGranularCache, "test_granular_force_load", test_granular_force_load, devices=devices)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
@@ -10,6 +10,7 @@ import numpy as np
 
 import warp as wp
 from warp._src import logger as _logger
+from warp._src.context import ModuleBuilder
 from warp.tests.unittest_utils import *
 
 dim_x = wp.constant(2)
@@ -576,8 +577,328 @@ def test_launch_adjoint_block_dim_failure(test, device):
         )
 
 
+@wp.kernel
+def cpu_threads_fill_kernel(out: wp.array2d[int]):
+    i, j = wp.tid()
+    out[i, j] = i * out.shape[1] + j
+
+
+@wp.kernel
+def cpu_threads_atomic_kernel(counter: wp.array[int]):
+    wp.atomic_add(counter, 0, 1)
+
+
+@wp.func
+def cpu_threads_count(counter: wp.array[int]):
+    counter[0] += 1
+
+
+@wp.kernel
+def cpu_threads_nested_atomic_kernel(counter: wp.array[int]):
+    cpu_threads_count(counter)
+
+
+def test_launch_cpu_threads(test, device):
+    shape = (301, 257)
+    expected = np.arange(shape[0] * shape[1], dtype=np.int32).reshape(shape)
+
+    for cpu_threads in (None, 1, 3, 0):
+        with test.subTest(cpu_threads=cpu_threads):
+            out = wp.full(shape, -1, dtype=int, device=device)
+            wp.launch(cpu_threads_fill_kernel, dim=shape, inputs=[out], device=device, cpu_threads=cpu_threads)
+            assert_np_equal(out.numpy(), expected)
+
+    hooks = cpu_threads_fill_kernel.module.load(device).get_kernel_hooks(cpu_threads_fill_kernel)
+    test.assertIsNotNone(hooks.forward_range)
+
+    # recorded launches keep their thread count
+    out = wp.full(shape, -1, dtype=int, device=device)
+    cmd = wp.launch(cpu_threads_fill_kernel, dim=shape, inputs=[out], device=device, cpu_threads=4, record_cmd=True)
+    test.assertEqual(cmd.cpu_threads, 4)
+    cmd.launch()
+    assert_np_equal(out.numpy(), expected)
+
+    # the config value is used when no per-launch count is given
+    saved_cpu_max_threads = wp.config.cpu_max_threads
+    try:
+        wp.config.cpu_max_threads = 0
+        out = wp.full(shape, -1, dtype=int, device=device)
+        wp.launch(cpu_threads_fill_kernel, dim=shape, inputs=[out], device=device)
+        assert_np_equal(out.numpy(), expected)
+    finally:
+        wp.config.cpu_max_threads = saved_cpu_max_threads
+
+    with test.assertRaisesRegex(ValueError, "must be non-negative"):
+        wp.launch(cpu_threads_fill_kernel, dim=shape, inputs=[out], device=device, cpu_threads=-1)
+
+
+def test_launch_cpu_threads_serial_fallback(test, device):
+    n = 100000
+
+    for kernel in (cpu_threads_atomic_kernel, cpu_threads_nested_atomic_kernel):
+        with test.subTest(kernel=kernel.key):
+            hooks = kernel.module.load(device).get_kernel_hooks(kernel)
+            test.assertIsNone(hooks.forward_range)
+
+            # atomics are not thread-safe on the CPU, so the launch must still count every task
+            counter = wp.zeros(1, dtype=int, device=device)
+            wp.launch(kernel, dim=n, inputs=[counter], device=device, cpu_threads=0)
+            test.assertEqual(counter.numpy()[0], n)
+
+
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 8})
+def cpu_simd_axpy_kernel(a: float, x: wp.array[float], y: wp.array[float], out: wp.array[float]):
+    i = wp.tid()
+    out[i] = a * x[i] + y[i]
+
+
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 8})
+def cpu_simd_fill_kernel(out: wp.array2d[wp.vec2]):
+    i, j = wp.tid()
+    out[i, j] = wp.vec2(float(i), float(j)) * 0.5
+
+
+@wp.func
+def cpu_simd_sum_to(n: int):
+    total = int(0)
+    for k in range(n):
+        total += k
+    return total
+
+
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 8})
+def cpu_simd_loop_kernel(out: wp.array[int]):
+    i = wp.tid()
+    out[i] = cpu_simd_sum_to(i)
+
+
+@wp.kernel(module="unique", module_options={"cpu_simd_width": 8})
+def cpu_simd_atomic_kernel(counter: wp.array[int]):
+    wp.atomic_add(counter, 0, 1)
+
+
+def test_launch_cpu_simd(test, device):
+    n = 1003  # not a multiple of the lane count
+    rng = np.random.default_rng(42)
+    x_np = rng.random(n, dtype=np.float32)
+    y_np = rng.random(n, dtype=np.float32)
+
+    x = wp.array(x_np, dtype=float, device=device)
+    y = wp.array(y_np, dtype=float, device=device)
+    for cpu_threads in (1, 3):
+        with test.subTest(cpu_threads=cpu_threads):
+            out = wp.zeros(n, dtype=float, device=device)
+            wp.launch(cpu_simd_axpy_kernel, dim=n, inputs=[2.0, x, y, out], device=device, cpu_threads=cpu_threads)
+            assert_np_equal(out.numpy(), 2.0 * x_np + y_np, tol=1e-6)
+
+    # strided views take the same entry point
+    out = wp.zeros(2 * n, dtype=float, device=device)
+    wp.launch(cpu_simd_axpy_kernel, dim=n, inputs=[1.0, x, y, out[::2]], device=device)
+    assert_np_equal(out.numpy()[::2], x_np + y_np, tol=1e-6)
+    assert_np_equal(out.numpy()[1::2], np.zeros(n, dtype=np.float32))
+
+    shape = (37, 29)
+    out = wp.zeros(shape, dtype=wp.vec2, device=device)
+    wp.launch(cpu_simd_fill_kernel, dim=shape, inputs=[out], device=device)
+    expected = np.stack(np.meshgrid(np.arange(shape[0]), np.arange(shape[1]), indexing="ij"), axis=-1) * 0.5
+    assert_np_equal(out.numpy(), expected.astype(np.float32))
+
+    out = wp.zeros(n, dtype=int, device=device)
+    wp.launch(cpu_simd_loop_kernel, dim=n, inputs=[out], device=device)
+    assert_np_equal(out.numpy(), np.arange(n) * (np.arange(n) - 1) // 2)
+
+    counter = wp.zeros(1, dtype=int, device=device)
+    wp.launch(cpu_simd_atomic_kernel, dim=n, inputs=[counter], device=device)
+    test.assertEqual(counter.numpy()[0], n)
+
+    # only element-wise kernels are lane-batched, the others keep the scalar entry points
+    for kernel, expected_width in (
+        (cpu_simd_axpy_kernel, 8),
+        (cpu_simd_fill_kernel, 8),
+        (cpu_simd_loop_kernel, 1),
+        (cpu_simd_atomic_kernel, 1),
+    ):
+        with test.subTest(kernel=kernel.key):
+            options = kernel.module.resolve_options(wp.config) | kernel.options
+            ModuleBuilder(kernel.module, options)
+            test.assertEqual(wp._src.codegen.get_cpu_simd_width(kernel, options), expected_width)
+
+            source = wp._src.codegen.codegen_module(kernel, device="cpu", options=options)
+            test.assertEqual("_cpu_forward_lanes" in source, expected_width > 1)
+
+    with test.assertRaisesRegex(ValueError, "power of two"):
+        wp._src.codegen.get_cpu_simd_width(cpu_simd_axpy_kernel, {"cpu_simd_width": 3})
+
+
+@wp.kernel
+def cpu_packed_args_kernel(
+    params: Params,
+    i: int,
+    u: wp.uint8,
+    b: bool,
+    d: wp.float64,
+    h: wp.float16,
+    v: wp.vec3,
+    m: wp.mat22,
+    maybe: wp.array[float],
+    out: wp.array[float],
+):
+    tid = wp.tid()
+
+    total = float(params.i) + params.f + float(i) + float(u) + float(d) + float(h) + v[1] + m[1, 0]
+    if b:
+        total += 1000.0
+    if maybe:
+        total += maybe[tid]
+
+    out[tid] = total + float(params.a[tid])
+
+
+def test_launch_cpu_packed_args(test, device):
+    n = 8
+    params = Params()
+    params.a = wp.array(np.arange(n), dtype=int, device=device)
+    params.i = 3
+    params.f = 0.25
+    maybe = wp.full(n, 100.0, dtype=float, device=device)
+
+    def expected(i, u, b, d, h, v, m, with_maybe):
+        total = params.i + params.f + i + u + d + h + v[1] + m[1, 0] + (1000.0 if b else 0.0)
+        return total + np.arange(n) + (100.0 if with_maybe else 0.0)
+
+    # repeated launches reuse the plan and its buffers, every argument must be refreshed
+    for i, u, b, with_maybe in ((1, 2, True, True), (5, 255, False, False), (-7, 0, True, False)):
+        with test.subTest(i=i, u=u, b=b, with_maybe=with_maybe):
+            v = wp.vec3(0.0, float(u), 0.0)
+            m = wp.mat22(0.0, 0.0, float(i), 0.0)
+            out = wp.zeros(n, dtype=float, device=device)
+            wp.launch(
+                cpu_packed_args_kernel,
+                dim=n,
+                inputs=[params, i, u, b, 0.5, 1.5, v, m, maybe if with_maybe else None, out],
+                device=device,
+            )
+            assert_np_equal(out.numpy(), expected(i, u, b, 0.5, 1.5, v, m, with_maybe))
+
+    hooks = cpu_packed_args_kernel.module.load(device, block_dim=1).get_kernel_hooks(cpu_packed_args_kernel)
+    test.assertTrue(any(plan is not None for plan in hooks.cpu_launch_plans.values()))
+
+    # out-of-range integers wrap exactly as they do when packed through ctypes
+    out = wp.zeros(n, dtype=float, device=device)
+    v = wp.vec3()
+    m = wp.mat22()
+    wp.launch(
+        cpu_packed_args_kernel,
+        dim=n,
+        inputs=[params, 2**32 + 4, 256 + 9, False, 0.0, 0.0, v, m, None, out],
+        device=device,
+    )
+    assert_np_equal(out.numpy(), expected(4, 9, False, 0.0, 0.0, v, m, False))
+
+    # mismatched arrays are still reported after a plan was built for the signature
+    with test.assertRaisesRegex(RuntimeError, "expects an array with dtype"):
+        wp.launch(
+            cpu_packed_args_kernel,
+            dim=n,
+            inputs=[params, 0, 0, False, 0.0, 0.0, v, m, None, wp.zeros(n, dtype=int, device=device)],
+            device=device,
+        )
+
+    # signatures that cannot be planned are only tried once
+    inputs = [params, "1", 0, False, 0.0, 0.0, v, m, None, out]
+    for _ in range(2):
+        with test.assertRaisesRegex(RuntimeError, "unable to pack kernel parameter"):
+            wp.launch(cpu_packed_args_kernel, dim=n, inputs=inputs, device=device)
+        test.assertIsNone(hooks.cpu_launch_plans[tuple(map(type, inputs))])
+
+
+@wp.kernel
+def batch_axpy_kernel(alpha: float, x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+    y[tid] = alpha * x[tid] + y[tid]
+
+
+@wp.kernel
+def batch_square_kernel(x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+    y[tid] = x[tid] * x[tid]
+
+
+def test_launch_batch(test, device):
+    n = 16
+    x = wp.array(np.arange(n, dtype=np.float32), device=device)
+    y = wp.zeros(n, dtype=float, device=device)
+    z = wp.zeros(n, dtype=float, device=device)
+
+    # later launches consume the results of earlier ones, so order matters
+    axpy = wp.launch(batch_axpy_kernel, dim=n, inputs=[2.0, x, y], device=device, record_cmd=True)
+    square = wp.launch(batch_square_kernel, dim=n, inputs=[y, z], device=device, record_cmd=True)
+    launches = wp.LaunchList([axpy, square])
+    test.assertEqual(len(launches), 2)
+    test.assertEqual(launches.device, device)
+
+    launches.launch()
+    expected_y = 2.0 * np.arange(n)
+    assert_np_equal(y.numpy(), expected_y)
+    assert_np_equal(z.numpy(), expected_y**2)
+
+    # parameter and dimension updates are picked up on the next submission
+    axpy.set_param_by_name("alpha", -1.0)
+    square.set_dim(n // 2)
+    z.zero_()
+    launches.launch()
+    expected_y -= np.arange(n)
+    assert_np_equal(y.numpy(), expected_y)
+    expected_z = np.zeros(n)
+    expected_z[: n // 2] = expected_y[: n // 2] ** 2
+    assert_np_equal(z.numpy(), expected_z)
+
+    # a plain list of launches can be submitted directly
+    y.zero_()
+    wp.launch_batch([axpy, axpy, axpy])
+    assert_np_equal(y.numpy(), -3.0 * np.arange(n))
+
+    # adjoint launches run their backward kernels
+    x_grad = wp.zeros(n, dtype=float, device=device)
+    z_grad = wp.ones(n, dtype=float, device=device)
+    adj_square = wp.launch(
+        batch_square_kernel,
+        dim=n,
+        inputs=[x, z],
+        adj_inputs=[x_grad, z_grad],
+        adjoint=True,
+        device=device,
+        record_cmd=True,
+    )
+    wp.launch_batch(wp.LaunchList([adj_square, adj_square]))
+    assert_np_equal(x_grad.numpy(), 4.0 * np.arange(n))
+
+    with test.assertRaises(TypeError):
+        launches.append(batch_axpy_kernel)
+
+
+def test_launch_batch_mixed_devices(test, device):
+    cpu_launch = wp.launch(
+        batch_square_kernel,
+        dim=1,
+        inputs=[wp.zeros(1, device="cpu"), wp.zeros(1, device="cpu")],
+        device="cpu",
+        record_cmd=True,
+    )
+    cuda_launch = wp.launch(
+        batch_square_kernel,
+        dim=1,
+        inputs=[wp.zeros(1, device=device), wp.zeros(1, device=device)],
+        device=device,
+        record_cmd=True,
+    )
+    with test.assertRaisesRegex(ValueError, "same device"):
+        wp.LaunchList([cpu_launch, cuda_launch])
+
+
 devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
+cpu_devices = [d for d in devices if d.is_cpu]
 
 
 class TestLaunch(unittest.TestCase):
@@ -668,6 +989,15 @@ add_function_test(TestLaunch, "test_launch_cmd_composite_defaults", test_launch_
 
 add_function_test(TestLaunch, "test_launch_tuple_args", test_launch_tuple_args, devices=devices)
 
+add_function_test(TestLaunch, "test_launch_cpu_threads", test_launch_cpu_threads, devices=cpu_devices)
+add_function_test(TestLaunch, "test_launch_cpu_simd", test_launch_cpu_simd, devices=cpu_devices)
+add_function_test(TestLaunch, "test_launch_cpu_packed_args", test_launch_cpu_packed_args, devices=cpu_devices)
+add_function_test(TestLaunch, "test_launch_batch", test_launch_batch, devices=devices)
+add_function_test(TestLaunch, "test_launch_batch_mixed_devices", test_launch_batch_mixed_devices, devices=cuda_devices)
+add_function_test(
+    TestLaunch, "test_launch_cpu_threads_serial_fallback", test_launch_cpu_threads_serial_fallback, devices=cpu_devices
+)
+
 add_function_test(TestLaunch, "test_launch_bounds_none", test_launch_bounds_none, devices=devices)
 add_function_test(TestLaunch, "test_launch_bounds_single", test_launch_bounds_single, devices=devices)
 add_function_test(TestLaunch, "test_launch_bounds_tuple", test_launch_bounds_tuple, devices=devices)
@@ -7,7 +7,8 @@ import unittest
 import numpy as np
 
 import warp as wp
-from warp._src.optim.linear import TiledDot, _create_segmented_tiled_dot_kernels, _run_solver_loop
+import warp.sparse as sparse
+from warp._src.optim.linear import TiledDot, _bsr_to_dense, _create_segmented_tiled_dot_kernels, _run_solver_loop
 from warp.optim.linear import CG, CR, GMRES, BiCGSTAB, aslinearoperator, bicgstab, cg, cr, gmres, preconditioner
 from warp.tests.unittest_utils import *
 
@@ -941,6 +942,199 @@ def test_functor_compat_errors(test, device):
             bic_state(M=M2)
 
 
+def _make_block_laplacian(n: int, block_size: int, dtype, device, convection: float = 0.0):
+    """2D grid Laplacian with ``block_size x block_size`` blocks, optionally with an upwind convection term."""
+    rows, cols, coeffs = [], [], []
+    for i in range(n):
+        for j in range(n):
+            row = i * n + j
+            rows.append(row)
+            cols.append(row)
+            coeffs.append(4.0 + convection)
+            for di, dj, c in ((1, 0, -1.0), (-1, 0, -1.0 - convection), (0, 1, -1.0), (0, -1, -1.0)):
+                if 0 <= i + di < n and 0 <= j + dj < n:
+                    rows.append(row)
+                    cols.append((i + di) * n + j + dj)
+                    coeffs.append(c)
+
+    coeffs = np.array(coeffs)
+    if block_size > 1:
+        coupling = np.eye(block_size) + 0.25 * np.ones((block_size, block_size))
+        block_values = coeffs[:, np.newaxis, np.newaxis] * coupling
+        block_type = wp.types.matrix((block_size, block_size), dtype)
+        vec_type = wp.types.vector(block_size, dtype)
+    else:
+        block_values = coeffs
+        block_type = dtype
+        vec_type = dtype
+
+    A = sparse.bsr_from_triplets(
+        n * n,
+        n * n,
+        wp.array(rows, dtype=int, device=device),
+        wp.array(cols, dtype=int, device=device),
+        wp.array(block_values, dtype=block_type, device=device),
+    )
+
+    rng = np.random.default_rng(123)
+    b_shape = (A.nrow, block_size) if block_size > 1 else A.nrow
+    b = wp.array(rng.uniform(low=-1.0, high=1.0, size=b_shape), dtype=vec_type, device=device)
+
+    return A, b
+
+
+def _apply_preconditioner(M, x):
+    z = wp.empty_like(x)
+    M.matvec(x, z, z, 1.0, 0.0)
+    return z.numpy().flatten()
+
+
+def _check_preconditioned_solve(test, A, b, func, M, maxiter):
+    A_dense = _bsr_to_dense(A)
+
+    x = wp.zeros_like(b)
+    with wp.ScopedDevice(A.device):
+        niter, err, atol = func(A, b, x, M=M, tol=1.0e-6, maxiter=maxiter)
+    test.assertLessEqual(err, atol)
+    test.assertLessEqual(np.linalg.norm(A_dense @ x.numpy().flatten() - b.numpy().flatten()), 2.0 * atol)
+
+    # Preconditioner application must be capturable within the solver loop
+    if A.device.is_cuda and wp.is_conditional_graph_supported():
+        x.zero_()
+        with wp.ScopedDevice(A.device):
+            with wp.ScopedCapture() as capture:
+                _, err_sq, atol_sq = func(A, b, x, M=M, tol=1.0e-6, maxiter=maxiter, check_every=0)
+            wp.capture_launch(capture.graph)
+
+        test.assertLessEqual(err_sq.numpy()[0], atol_sq.numpy()[0])
+
+    return niter
+
+
+def test_incomplete_factorization_exact(test, device):
+    # Zero fill-in factorizations of block-tridiagonal matrices are exact
+    for block_size, ptype in itertools.product((1, 3), ("ilu0", "ic0")):
+        with test.subTest(block_size=block_size, ptype=ptype):
+            n = 17
+            rng = np.random.default_rng(block_size)
+            diag = np.eye(block_size) * 4.0 + rng.uniform(-0.1, 0.1, size=(n, block_size, block_size))
+            diag = 0.5 * (diag + np.transpose(diag, (0, 2, 1)))
+            off = rng.uniform(-0.5, 0.5, size=(n - 1, block_size, block_size))
+            rows = np.concatenate((np.arange(n), np.arange(n - 1), np.arange(1, n)))
+            cols = np.concatenate((np.arange(n), np.arange(1, n), np.arange(n - 1)))
+            values = np.concatenate((diag, off, np.transpose(off, (0, 2, 1))))
+            block_type = wp.types.matrix((block_size, block_size), wp.float64) if block_size > 1 else wp.float64
+            A = sparse.bsr_from_triplets(
+                n,
+                n,
+                wp.array(rows, dtype=int, device=device),
+                wp.array(cols, dtype=int, device=device),
+                wp.array(values if block_size > 1 else values.flatten(), dtype=block_type, device=device),
+            )
+            vec_type = wp.types.vector(block_size, wp.float64) if block_size > 1 else wp.float64
+            x = wp.array(rng.uniform(size=(n, block_size)).squeeze(), dtype=vec_type, device=device)
+            y = wp.array(rng.uniform(size=(n, block_size)).squeeze(), dtype=vec_type, device=device)
+
+            M = preconditioner(A, ptype)
+            z = wp.empty_like(x)
+            M.matvec(x, y, z, 2.0, 0.5)
+
+            expected = 2.0 * np.linalg.solve(_bsr_to_dense(A), x.numpy().flatten()) + 0.5 * y.numpy().flatten()
+            assert_np_equal(z.numpy().flatten(), expected, tol=1.0e-10)
+
+
+def test_incomplete_factorization_reference(test, device):
+    A, b = _make_block_laplacian(6, 1, wp.float64, device, convection=0.5)
+    A_dense = _bsr_to_dense(A)
+
+    # Dense IKJ variant of ILU(0), restricted to the sparsity pattern of A
+    LU = A_dense.copy()
+    pattern = A_dense != 0.0
+    n = LU.shape[0]
+    for i in range(1, n):
+        for k in range(i):
+            if pattern[i, k]:
+                LU[i, k] /= LU[k, k]
+                for j in range(k + 1, n):
+                    if pattern[i, j]:
+                        LU[i, j] -= LU[i, k] * LU[k, j]
+    L = np.tril(LU, -1) + np.eye(n)
+    U = np.triu(LU)
+
+    expected = np.linalg.solve(U, np.linalg.solve(L, b.numpy()))
+    assert_np_equal(_apply_preconditioner(preconditioner(A, "ilu0"), b), expected, tol=1.0e-10)
+
+    # IC(0) only reads the lower triangle, and matches ILU(0) on symmetric matrices
+    A, b = _make_block_laplacian(6, 2, wp.float64, device)
+    assert_np_equal(
+        _apply_preconditioner(preconditioner(A, "ic0"), b),
+        _apply_preconditioner(preconditioner(A, "ilu0"), b),
+        tol=1.0e-10,
+    )
+
+
+def test_incomplete_factorization_solve(test, device):
+    for block_size in (1, 3):
+        with test.subTest(block_size=block_size):
+            A, b = _make_block_laplacian(16, block_size, wp.float64, device)
+            niter_diag = _check_preconditioned_solve(test, A, b, cg, preconditioner(A, "diag"), maxiter=1000)
+            niter_ic0 = _check_preconditioned_solve(test, A, b, cg, preconditioner(A, "ic0"), maxiter=1000)
+            test.assertLess(niter_ic0, niter_diag)
+
+            A, b = _make_block_laplacian(16, block_size, wp.float64, device, convection=2.0)
+            niter_diag = _check_preconditioned_solve(test, A, b, bicgstab, preconditioner(A, "diag"), maxiter=1000)
+            niter_ilu0 = _check_preconditioned_solve(test, A, b, bicgstab, preconditioner(A, "ilu0"), maxiter=1000)
+            test.assertLess(niter_ilu0, niter_diag)
+
+    # Structurally missing diagonal blocks and non-sparse operators are rejected
+    A = sparse.bsr_from_triplets(
+        2,
+        2,
+        wp.array([0, 1], dtype=int, device=device),
+        wp.array([1, 0], dtype=int, device=device),
+        wp.array([1.0, 1.0], dtype=float, device=device),
+    )
+    with test.assertRaises(ValueError):
+        preconditioner(A, "ilu0")
+    with test.assertRaises(ValueError):
+        preconditioner(wp.zeros((4, 4), dtype=float, device=device), "ic0")
+
+    # Empty operators
+    A = sparse.bsr_zeros(0, 0, block_type=wp.float64, device=device)
+    b = wp.zeros(0, dtype=wp.float64, device=device)
+    for kind in ("ilu0", "ic0"):
+        with test.subTest(kind=kind):
+            test.assertEqual(_apply_preconditioner(preconditioner(A, kind), b).shape, (0,))
+
+
+def test_amg_preconditioner(test, device):
+    for block_size in (1, 2):
+        with test.subTest(block_size=block_size):
+            A, b = _make_block_laplacian(24, block_size, wp.float64, device)
+            niter_diag = _check_preconditioned_solve(test, A, b, cg, preconditioner(A, "diag"), maxiter=2000)
+            niter_amg = _check_preconditioned_solve(
+                test, A, b, cg, preconditioner(A, "amg", coarse_size=16), maxiter=2000
+            )
+            test.assertLess(niter_amg, niter_diag)
+
+    # Small operators are solved directly on the coarsest level
+    A, b = _make_block_laplacian(4, 1, wp.float64, device)
+    expected = np.linalg.solve(_bsr_to_dense(A), b.numpy())
+    assert_np_equal(_apply_preconditioner(preconditioner(A, "amg"), b), expected, tol=1.0e-10)
+
+    # Coarsening stops on matrices without strong connections, the large coarsest level is only smoothed
+    diag = np.linspace(1.0, 2.0, 500)
+    A = sparse.bsr_diag(wp.array(diag, dtype=wp.float64, device=device))
+    b = wp.ones(500, dtype=wp.float64, device=device)
+    M = preconditioner(A, "amg", coarse_size=16, smoothing_steps=4)
+    assert_np_equal(_apply_preconditioner(M, b), 1.0 / diag, tol=1.0e-3)
+    _check_preconditioned_solve(test, A, b, cg, M, maxiter=20)
+
+    # Same when the hierarchy is cut short by max_levels
+    A, b = _make_block_laplacian(24, 1, wp.float64, device)
+    _check_preconditioned_solve(test, A, b, cg, preconditioner(A, "amg", max_levels=2, coarse_size=16), maxiter=2000)
+
+
 class TestLinearSolvers(unittest.TestCase):
     pass
 
@@ -1038,6 +1232,30 @@ add_function_test(
 )
 add_function_test(TestLinearSolvers, "test_functor_preconditioner", test_functor_preconditioner, devices=devices)
 add_function_test(TestLinearSolvers, "test_functor_compat_errors", test_functor_compat_errors, devices=devices)
+add_function_test(
+    TestLinearSolvers,
+    "test_incomplete_factorization_exact",
+    test_incomplete_factorization_exact,
+    devices=devices,
+)
+add_function_test(
+    TestLinearSolvers,
+    "test_incomplete_factorization_reference",
+    test_incomplete_factorization_reference,
+    devices=devices,
+)
+add_function_test(
+    TestLinearSolvers,
+    "test_incomplete_factorization_solve",
+    test_incomplete_factorization_solve,
+    devices=devices_with_graph_capture_allocation,
+)
+add_function_test(
+    TestLinearSolvers,
+    "test_amg_preconditioner",
+    test_amg_preconditioner,
+    devices=devices_with_graph_capture_allocation,
+)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
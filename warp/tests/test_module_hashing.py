@@ -3,17 +3,24 @@
 
 # TODO: add more tests for kernels and generics
 
+import contextlib
+import io
 import itertools
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
+import uuid
+import warnings
 from collections.abc import Mapping
 from importlib import util
 
+import numpy as np
+
 import warp as wp
-from warp._src.context import ModuleBuilder, ModuleHasher
+from warp._src.context import ModuleBuilder, ModuleHasher, RecordedModuleHasher
 from warp.tests.unittest_utils import *
 
 FUNC_OVERLOAD_1 = """# -*- coding: utf-8 -*-
@@ -284,6 +291,127 @@ def test_module_load(test, device):
     test.assertEqual(hash1, hash2)
 
 
+MANIFEST_MODULE = """# -*- coding: utf-8 -*-
+import warp as wp
+
+SCALE = wp.constant(2.0)
+
+@wp.func
+def scale(x: float):
+    return x * SCALE
+
+@wp.kernel
+def k(a: wp.array[float]):
+    i = wp.tid()
+    a[i] = scale(a[i])
+"""
+
+
+def load_manifest_module():
+    """Load ``MANIFEST_MODULE`` under a fresh name, so that it has no entries in the manifest yet."""
+    m = load_code_as_module(MANIFEST_MODULE, f"manifest_module_{uuid.uuid4().hex[:12]}")
+    return m, m._get_live_kernels()[0]
+
+
+def launch_manifest_kernel(kernel, device):
+    """Launch the kernel of ``MANIFEST_MODULE``, return the result and the block dimension of the loaded module."""
+    a = wp.ones(4, dtype=float, device=device)
+    wp.launch(kernel, dim=4, inputs=[a], device=device)
+    (module_exec,) = kernel.module.execs.values()
+    return a.numpy(), module_exec.block_dim
+
+
+def test_module_hash_manifest(test, device):
+    """Verify that a module is loaded with the hash recorded in the manifest when it is unchanged."""
+    m, k = load_manifest_module()
+
+    saved_module_hash_manifest = wp.config.module_hash_manifest
+    wp.config.module_hash_manifest = True
+    try:
+        result, block_dim = launch_manifest_kernel(k, device)
+        assert_np_equal(result, np.full(4, 2.0))
+        test.assertIs(type(m.hashers[block_dim]), ModuleHasher)
+        module_hash = m.get_module_hash(block_dim)
+
+        entries = wp._src.build.read_module_hash_manifest(m.name)
+        test.assertEqual([entry["module_hash"] for entry in entries.values()], [module_hash.hex()])
+
+        m.mark_modified()
+        m.unload()
+        result, block_dim = launch_manifest_kernel(k, device)
+        assert_np_equal(result, np.full(4, 2.0))
+        test.assertIsInstance(m.hashers[block_dim], RecordedModuleHasher)
+        test.assertEqual(m.get_module_hash(block_dim), module_hash)
+
+        # a changed global constant changes the fingerprint
+        k.func.__globals__["SCALE"] = 3.0
+        m.mark_modified()
+        m.unload()
+        result, block_dim = launch_manifest_kernel(k, device)
+        assert_np_equal(result, np.full(4, 3.0))
+        test.assertIs(type(m.hashers[block_dim]), ModuleHasher)
+        test.assertNotEqual(m.get_module_hash(block_dim), module_hash)
+        test.assertEqual(len(wp._src.build.read_module_hash_manifest(m.name)), 2)
+    finally:
+        wp.config.module_hash_manifest = saved_module_hash_manifest
+
+
+def test_module_hash_manifest_missing_binary(test, device):
+    """Verify that the recorded hash is not used when the cached binary it identifies is missing."""
+    m, k = load_manifest_module()
+
+    saved_module_hash_manifest = wp.config.module_hash_manifest
+    wp.config.module_hash_manifest = True
+    try:
+        result, block_dim = launch_manifest_kernel(k, device)
+        assert_np_equal(result, np.full(4, 2.0))
+        module_dir = os.path.join(wp.config.kernel_cache_dir, m.get_module_identifier(block_dim))
+
+        m.mark_modified()
+        m.unload()
+        shutil.rmtree(module_dir)
+        result, block_dim = launch_manifest_kernel(k, device)
+        assert_np_equal(result, np.full(4, 2.0))
+        test.assertIs(type(m.hashers[block_dim]), ModuleHasher)
+        test.assertTrue(os.path.isdir(module_dir))
+    finally:
+        wp.config.module_hash_manifest = saved_module_hash_manifest
+
+
+def test_module_hash_manifest_stale_hash(test, device):
+    """Verify that a stale recorded hash is replaced, instead of failing the build, when a binary is missing."""
+    m, k = load_manifest_module()
+
+    saved_module_hash_manifest = wp.config.module_hash_manifest
+    wp.config.module_hash_manifest = True
+    try:
+        launch_manifest_kernel(k, device)
+        m.mark_modified()
+        m.unload()
+        _, block_dim = launch_manifest_kernel(k, device)
+        hasher = m.hashers[block_dim]
+        test.assertIsInstance(hasher, RecordedModuleHasher)
+        module_hash = hasher.get_hash()
+
+        # a recorded hash missing state the fingerprint does not cover, loaded on a device
+        # whose cache does not hold a binary for it yet
+        hasher.hash = bytes(len(module_hash))
+        m.execs.clear()
+        with warnings.catch_warnings(), contextlib.redirect_stderr(io.StringIO()) as stderr:
+            warnings.simplefilter("always")
+            result, block_dim = launch_manifest_kernel(k, device)
+
+        assert_np_equal(result, np.full(4, 2.0))
+        test.assertIn("does not match the hash recorded", stderr.getvalue())
+        test.assertIs(type(m.hashers[block_dim]), ModuleHasher)
+        test.assertEqual(m.get_module_hash(block_dim), module_hash)
+
+        entries = wp._src.build.read_module_hash_manifest(m.name)
+        test.assertEqual([entry["module_hash"] for entry in entries.values()], [module_hash.hex()])
+    finally:
+        wp.config.module_hash_manifest = saved_module_hash_manifest
+
+
 class TestOptionResolution(unittest.TestCase):
     """Tests for centralized option resolution."""
 
@@ -434,6 +562,46 @@ class TestModuleHashing(unittest.TestCase):
         self.assertIn("before True True", result.stdout)
         self.assertIn("after False False", result.stdout)
 
+    def test_module_hash_manifest_warm_start(self):
+        """Verify that a warm process loads a cached module without parsing its kernels."""
+        code = (
+            "import sys\n"
+            "import warp as wp\n"
+            "wp.config.module_hash_manifest = True\n"
+            "wp.config.log_level = wp.LOG_WARNING\n"
+            "SCALE = wp.constant(float(sys.argv[1]))\n"
+            "@wp.kernel\n"
+            "def k(a: wp.array[float]):\n"
+            "    i = wp.tid()\n"
+            "    a[i] = a[i] * SCALE\n"
+            "a = wp.ones(4, dtype=float, device='cpu')\n"
+            "wp.launch(k, dim=4, inputs=[a], device='cpu')\n"
+            "(module_exec,) = k.module.execs.values()\n"
+            "hasher = k.module.hashers[module_exec.block_dim]\n"
+            "print(type(hasher).__name__, k.adj.is_source_loaded(), a.numpy()[0])\n"
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_path = os.path.join(temp_dir, "manifest_script.py")
+            with open(script_path, "w") as f:
+                f.write(code)
+
+            # the script is not run from the repository, so point it to the tested package
+            package_dir = os.path.dirname(os.path.dirname(os.path.abspath(wp.__file__)))
+            python_path = os.pathsep.join(filter(None, (package_dir, os.environ.get("PYTHONPATH"))))
+            env = dict(os.environ, PYTHONPATH=python_path, WARP_CACHE_PATH=os.path.join(temp_dir, "cache"))
+            outputs = []
+            for scale in ("2.0", "2.0", "3.0"):
+                result = subprocess.run(
+                    [sys.executable, script_path, scale], capture_output=True, text=True, env=env, check=False
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                outputs.append(result.stdout.split())
+
+        self.assertEqual(outputs[0], ["ModuleHasher", "True", "2.0"])
+        self.assertEqual(outputs[1], ["RecordedModuleHasher", "False", "2.0"])
+        self.assertEqual(outputs[2], ["ModuleHasher", "True", "3.0"])
+
     def test_codegen_is_independent_of_kernel_order(self):
         """Verify that kernel order does not affect hashes, source, or metadata."""
         kernels = (codegen_order_zulu, codegen_order_alpha, codegen_order_mike)
@@ -527,6 +695,19 @@ devices = get_test_devices()
 add_function_test(TestModuleHashing, "test_function_overload_hashing", test_function_overload_hashing)
 add_function_test(TestModuleHashing, "test_function_generic_overload_hashing", test_function_generic_overload_hashing)
 add_function_test(TestModuleHashing, "test_module_load", test_module_load, devices=devices)
+add_function_test(TestModuleHashing, "test_module_hash_manifest", test_module_hash_manifest, devices=devices)
+add_function_test(
+    TestModuleHashing,
+    "test_module_hash_manifest_missing_binary",
+    test_module_hash_manifest_missing_binary,
+    devices=devices,
+)
+add_function_test(
+    TestModuleHashing,
+    "test_module_hash_manifest_stale_hash",
+    test_module_hash_manifest_stale_hash,
+    devices=devices,
+)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@
 wp.force_load() and wp.load_module().
 """
 
+import multiprocessing
 import os
 import subprocess
 import sys
@@ -269,6 +270,81 @@ class TestModuleParallelLoad(unittest.TestCase):
         )
 
 
+_fork_available = "fork" in multiprocessing.get_all_start_methods()
+
+
+def _generate_uncached_modules(count):
+    """Generate modules whose hashes are unique, so that none of them is in the kernel cache yet."""
+    modules = []
+    for i in range(count):
+        code, name = _generate_module_code(i)
+        code = code.replace("x = float(tid) + 1.0", f"x = float(tid) + 1.0 + 0.0 * float({uuid.uuid4().int % 1000000})")
+        modules.append(_load_code_as_module(code, name))
+    return modules
+
+
+@unittest.skipUnless(_fork_available, "Requires the 'fork' start method")
+class TestModuleProcessLoad(unittest.TestCase):
+    def _force_load_recording_compiles(self, **kwargs):
+        """Run wp.force_load() and return the results of the compiles done in this process."""
+        results = []
+        compile_fn = context.Module._compile
+
+        def recording_compile(module, *args, **compile_kwargs):
+            compiled = compile_fn(module, *args, **compile_kwargs)
+            results.append(compiled)
+            return compiled
+
+        with mock.patch.object(context.Module, "_compile", autospec=True, side_effect=recording_compile):
+            wp.force_load(**kwargs)
+
+        return results
+
+    def test_force_load_processes(self):
+        """Verify that worker processes build the modules and the parent only loads cached binaries."""
+        modules = _generate_uncached_modules(4)
+        # CPU launches use block_dim=1, so preload that variant for the launches below
+        results = self._force_load_recording_compiles(
+            device="cpu", modules=modules, block_dim=1, max_workers=2, use_processes=True
+        )
+        _assert_modules_loaded_on_cpu(self, modules)
+        self.assertEqual(results, [False] * len(modules))
+
+        for m in modules:
+            kernel = next(iter(m.kernels.values()))
+            output = wp.zeros(4, dtype=float, device="cpu")
+            wp.launch(kernel, dim=4, inputs=[output], device="cpu")
+            x = np.arange(1, 5, dtype=np.float32)
+            expected = np.sqrt(np.abs(np.sin(x) + np.cos(x)) + 1.0)
+            np.testing.assert_allclose(output.numpy(), expected, rtol=1e-5)
+
+    def test_force_load_processes_config_default(self):
+        """Verify that wp.config.load_module_use_processes is respected when use_processes is not passed."""
+        modules = _generate_uncached_modules(2)
+
+        saved = wp.config.load_module_use_processes
+        try:
+            wp.config.load_module_use_processes = True
+            results = self._force_load_recording_compiles(device="cpu", modules=modules, max_workers=2)
+        finally:
+            wp.config.load_module_use_processes = saved
+
+        _assert_modules_loaded_on_cpu(self, modules)
+        self.assertEqual(results, [False] * len(modules))
+
+    def test_force_load_processes_build_error(self):
+        """Verify that a module failing to build in a worker is rebuilt and recorded as failed by the parent."""
+        modules = _generate_modules(2)
+        code, name = _generate_module_code(2)
+        bad_module = _load_code_as_module(code.replace("output[tid] = x", "output[tid] = undefined_name"), name)
+
+        wp.force_load(device="cpu", modules=[*modules, bad_module], max_workers=2, use_processes=True)
+
+        _assert_modules_loaded_on_cpu(self, modules)
+        self.assertFalse(bad_module.execs)
+        self.assertTrue(bad_module.failed_builds)
+
+
 def _assert_modules_loaded_on_cuda(test, modules, device):
     for m in modules:
         ctx = device.context
@@ -238,6 +238,45 @@ def test_sgd_set_params_migrates_state(test, device):
     test.assertIs(opt.b[1], unmoved_b)
 
 
+def test_sgd_multi_tensor(test, device):
+    """Verify the fused update of parameters of many dtypes against a reference implementation."""
+    rng = np.random.default_rng(42)
+    dtypes = (
+        (wp.float32, (5,)),
+        (wp.vec3, (4,)),
+        (wp.mat22, (3,)),
+        (wp.float64, (6,)),
+        (wp.vec2d, (2,)),
+        (wp.float16, (7,)),
+    )
+
+    for nesterov, dampening in ((False, 0.1), (True, 0.0)):
+        params = []
+        grads = []
+        for dtype, shape in dtypes:
+            value_shape = shape + getattr(dtype, "_shape_", ())
+            params.append(wp.array(rng.uniform(-1.0, 1.0, size=value_shape), dtype=dtype, device=device))
+            grads.append(wp.array(rng.uniform(-1.0, 1.0, size=value_shape), dtype=dtype, device=device))
+
+        lr, momentum, weight_decay = 0.1, 0.9, 0.01
+        opt = warp.optim.SGD(
+            params, lr=lr, momentum=momentum, dampening=dampening, weight_decay=weight_decay, nesterov=nesterov
+        )
+
+        expected = [p.numpy().astype(np.float64) for p in params]
+        b = [None] * len(params)
+        for _ in range(3):
+            opt.step(grads)
+            for i, grad in enumerate(grads):
+                g = grad.numpy().astype(np.float64) + weight_decay * expected[i]
+                b[i] = g if b[i] is None else momentum * b[i] + (1.0 - dampening) * g
+                expected[i] -= lr * (g + momentum * b[i] if nesterov else b[i])
+
+        for param, exp in zip(params, expected, strict=True):
+            tol = 5.0e-3 if param.numpy().dtype == np.float16 else 1.0e-5
+            assert_np_equal(param.numpy().astype(np.float64), exp, tol=tol)
+
+
 devices = get_test_devices()
 
 
@@ -258,6 +297,7 @@ add_function_test(
     test_sgd_set_params_migrates_state,
     devices=get_cuda_test_devices(),
 )
+add_function_test(TestSGD, "test_sgd_multi_tensor", test_sgd_multi_tensor, devices=devices)
 
 
 if __name__ == "__main__":
@@ -21,6 +21,7 @@ from warp.sparse import (
     bsr_get_diag,
     bsr_identity,
     bsr_mm,
+    bsr_mm_dense,
     bsr_mm_work_arrays,
     bsr_mv,
     bsr_scale,
@@ -873,6 +874,72 @@ def make_test_bsr_mv(block_shape, scalar_type):
     return test_bsr_mv
 
 
+def make_test_bsr_mm_dense(block_shape, scalar_type):
+    def test_bsr_mm_dense(test, device):
+        rng = np.random.default_rng(123)
+        tol = 0.05 if scalar_type == wp.float16 else 0.0001
+
+        nrow = 5
+        ncol = 4
+        nnz = 12
+
+        A_rows = wp.array(rng.integers(0, high=nrow, size=nnz, dtype=int), dtype=int, device=device)
+        A_cols = wp.array(rng.integers(0, high=ncol, size=nnz, dtype=int), dtype=int, device=device)
+        A_vals = wp.array(rng.random(size=(nnz, block_shape[0], block_shape[1])), dtype=scalar_type, device=device)
+
+        A = bsr_zeros(nrow, ncol, wp.types.matrix(shape=block_shape, dtype=scalar_type), device=device)
+        bsr_set_from_triplets(A, A_rows, A_cols, A_vals)
+        A_dense = _bsr_to_dense(A)
+
+        for rhs_count in (1, 3, 13):
+            x = wp.array(rng.random(size=(A.shape[1], rhs_count)), dtype=scalar_type, device=device)
+            y = wp.array(rng.random(size=(A.shape[0], rhs_count)), dtype=scalar_type, device=device)
+
+            # result should match independent matrix-vector products
+            ref = np.stack([bsr_mv(A, x[:, j].contiguous()).numpy().flatten() for j in range(rhs_count)], axis=1)
+            assert_np_equal(bsr_mm_dense(A, x).numpy(), ref, tol)
+
+            for tile_size in (-1, 0, 32):
+                for alpha, beta in ((-1.0, 2.0), (0.0, -1.0), (1.0, 0.0)):
+                    res = wp.clone(y)
+                    bsr_mm_dense(A, x, res, alpha=alpha, beta=beta, tile_size=tile_size)
+                    ref = alpha * A_dense @ x.numpy() + beta * y.numpy()
+                    assert_np_equal(res.numpy(), ref, tol)
+
+            # non-contiguous operands
+            x_strided = wp.array(rng.random(size=(A.shape[1], 2 * rhs_count)), dtype=scalar_type, device=device)
+            x_strided = x_strided[:, ::2]
+            res = bsr_mm_dense(A * 2.0, x_strided)
+            assert_np_equal(res.numpy(), 2.0 * A_dense @ x_strided.numpy(), tol)
+
+            # transposed product
+            res = wp.clone(x)
+            bsr_mm_dense(A, y, res, alpha=-1.0, beta=0.5, transpose=True)
+            ref = -(A_dense.T @ y.numpy()) + 0.5 * x.numpy()
+            assert_np_equal(res.numpy(), ref, tol)
+
+        # aliasing
+        AAt = bsr_mm(A, bsr_transposed(A))
+        y = wp.array(rng.random(size=(A.shape[0], 5)), dtype=scalar_type, device=device)
+        ref = 2.0 * _bsr_to_dense(AAt) @ y.numpy() - y.numpy()
+        bsr_mm_dense(AAt, y, y, alpha=2.0, beta=-1.0)
+        assert_np_equal(y.numpy(), ref, tol)
+
+        x = wp.zeros((A.shape[1] + 1, 2), dtype=scalar_type, device=device)
+        with test.assertRaisesRegex(ValueError, "Incompatible 'x'"):
+            bsr_mm_dense(A, x)
+
+        x = wp.zeros((A.shape[1], 2), dtype=scalar_type, device=device)
+        y = wp.zeros((A.shape[0], 3), dtype=scalar_type, device=device)
+        with test.assertRaisesRegex(ValueError, "Incompatible 'y'"):
+            bsr_mm_dense(A, x, y)
+
+        with test.assertRaisesRegex(ValueError, "2D array"):
+            bsr_mm_dense(A, wp.zeros(A.shape[1], dtype=scalar_type, device=device))
+
+    return test_bsr_mm_dense
+
+
 def make_test_bsr_multiply_deep(block_shape, scalar_type):
     def test_bsr_multiply_deep(test, device):
         """Test BSR matrix multiplication with deep matrices (many columns > 256)"""
@@ -1281,6 +1348,52 @@ def test_padded_bsr_capture_per_row_without_nnz_capacity_rejected(test, device):
             bsr_zeros(3, 4, float, device=device, row_capacity=row_capacity)
 
 
+def test_bsr_host_threads(test, device):
+    """Multi-threaded host triplet compression and products match the serial results"""
+    rng = np.random.default_rng(42)
+
+    block_shape = (3, 3)
+    nrow = 500
+    # above the parallel compression threshold
+    n = 20000
+
+    rows = wp.array(rng.integers(0, high=nrow, size=n, dtype=int), dtype=int, device=device)
+    cols = wp.array(rng.integers(0, high=nrow, size=n, dtype=int), dtype=int, device=device)
+    vals = wp.array(rng.random(size=(n, *block_shape)), dtype=wp.float64, device=device)
+    x = wp.array(rng.random(size=(nrow, block_shape[1])), dtype=wp.vec3d, device=device)
+
+    def compute():
+        A = bsr_from_triplets(nrow, nrow, rows, cols, vals)
+        y = bsr_mv(A, x)
+        work_arrays = bsr_mm_work_arrays()
+        C = bsr_mm(A, A, work_arrays=work_arrays)
+        bsr_mm(A, A, C, alpha=0.5, work_arrays=work_arrays, reuse_topology=True)
+        return A, y, C
+
+    saved_cpu_max_threads = wp.config.cpu_max_threads
+    try:
+        wp.config.cpu_max_threads = 1
+        A_ref, y_ref, C_ref = compute()
+        wp.config.cpu_max_threads = 4
+        A, y, C = compute()
+    finally:
+        wp.config.cpu_max_threads = saved_cpu_max_threads
+
+    test.assertEqual(A.nnz_sync(), A_ref.nnz_sync())
+    np.testing.assert_array_equal(A.offsets.numpy(), A_ref.offsets.numpy())
+    np.testing.assert_array_equal(A.columns.numpy()[: A.nnz], A_ref.columns.numpy()[: A_ref.nnz])
+    assert_np_equal(A.values.numpy()[: A.nnz], A_ref.values.numpy()[: A_ref.nnz], 1.0e-12)
+    assert_np_equal(y.numpy(), y_ref.numpy(), 1.0e-10)
+
+    test.assertEqual(C.nnz_sync(), C_ref.nnz_sync())
+    np.testing.assert_array_equal(C.columns.numpy()[: C.nnz], C_ref.columns.numpy()[: C_ref.nnz])
+    assert_np_equal(C.values.numpy()[: C.nnz], C_ref.values.numpy()[: C_ref.nnz], 1.0e-10)
+
+    dense = _triplets_to_dense(A.shape, rows, cols, vals)
+    assert_np_equal(y.numpy().flatten(), dense @ x.numpy().flatten(), 1.0e-10)
+    assert_np_equal(_bsr_to_dense(C), 0.5 * dense @ dense, 1.0e-8)
+
+
 def test_bsr_alloc(test, device):
     rows_of_blocks, cols_of_blocks = 3, 4
 
@@ -1425,6 +1538,9 @@ add_function_test(
 add_function_test(TestSparse, "test_csr_mv", make_test_bsr_mv((1, 1), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_1_3", make_test_bsr_mv((1, 3), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_3_3", make_test_bsr_mv((3, 3), wp.float64), devices=devices)
+add_function_test(TestSparse, "test_csr_mm_dense", make_test_bsr_mm_dense((1, 1), wp.float32), devices=devices)
+add_function_test(TestSparse, "test_bsr_mm_dense_3_2", make_test_bsr_mm_dense((3, 2), wp.float64), devices=devices)
+add_function_test(TestSparse, "test_bsr_mm_dense_2_2_f16", make_test_bsr_mm_dense((2, 2), wp.float16), devices=devices)
 
 add_function_test(TestSparse, "test_capturability", test_capturability, devices=cuda_test_devices_with_mempool)
 add_function_test(
@@ -1478,6 +1594,7 @@ add_function_test(
 add_function_test(TestSparse, "test_bsr_mm_max_new_nnz", test_bsr_mm_max_new_nnz, devices=devices, check_output=False)
 
 add_function_test(TestSparse, "test_bsr_alloc", test_bsr_alloc, devices=devices)
+add_function_test(TestSparse, "test_bsr_host_threads", test_bsr_host_threads, devices=["cpu"])
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
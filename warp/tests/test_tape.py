@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
+import weakref
 
 import numpy as np
 
@@ -723,6 +724,239 @@ devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 
 
+@wp.kernel
+def checkpoint_step(x: wp.array[float], w: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+
+    y[tid] = wp.sin(x[tid]) * w[tid]
+
+
+@wp.kernel
+def checkpoint_loss(x: wp.array[float], loss: wp.array[float]):
+    tid = wp.tid()
+
+    wp.atomic_add(loss, 0, x[tid] * x[tid])
+
+
+def _checkpoint_rollout(device, tape, num_steps, checkpointed, states=None):
+    dim = 8
+    rng = np.random.default_rng(123)
+    x0 = wp.array(rng.random(dim), dtype=float, device=device, requires_grad=True)
+    w = wp.array(rng.random(dim) + 0.5, dtype=float, device=device, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    def step(x, _i):
+        y = wp.empty_like(x, requires_grad=True)
+        wp.launch(checkpoint_step, dim=dim, inputs=[x, w], outputs=[y], device=device)
+        if states is not None:
+            states.append(weakref.ref(y))
+        return y
+
+    with tape:
+        if checkpointed:
+            x = tape.checkpoint_steps(step, x0, num_steps)
+        else:
+            x = x0
+            for i in range(num_steps):
+                x = step(x, i)
+        wp.launch(checkpoint_loss, dim=dim, inputs=[x], outputs=[loss], device=device)
+
+    return x0, w, loss
+
+
+def test_tape_checkpoint_steps(test, device):
+    num_steps = 16
+
+    tape = wp.Tape()
+    x0, w, loss = _checkpoint_rollout(device, tape, num_steps, checkpointed=False)
+    tape.backward(loss)
+
+    checkpoint_tape = wp.Tape()
+    states = []
+    cx0, cw, closs = _checkpoint_rollout(device, checkpoint_tape, num_steps, checkpointed=True, states=states)
+
+    # only the states at the boundaries of the sqrt(16) = 4 segments are kept alive
+    live_states = sum(ref() is not None for ref in states)
+    test.assertEqual(live_states, 4)
+
+    stats = checkpoint_tape.get_checkpoint_stats()
+    test.assertEqual(stats.segments, 4)
+    test.assertEqual(stats.forward_launches, num_steps)
+    test.assertEqual(stats.recomputed_launches, 0)
+    test.assertEqual(stats.boundary_arrays, 5)
+    test.assertEqual(stats.boundary_bytes, 5 * 8 * 4)
+
+    checkpoint_tape.backward(closs)
+
+    assert_np_equal(closs.numpy(), loss.numpy(), tol=1.0e-6)
+    assert_np_equal(cx0.grad.numpy(), x0.grad.numpy(), tol=1.0e-5)
+    assert_np_equal(cw.grad.numpy(), w.grad.numpy(), tol=1.0e-5)
+    test.assertEqual(checkpoint_tape.get_checkpoint_stats().recomputed_launches, num_steps)
+
+    # the gradients of the segment arguments are cleared along with the others
+    test.assertIn(cx0, checkpoint_tape.gradients)
+    checkpoint_tape.zero()
+    assert_np_equal(cx0.grad.numpy(), np.zeros(8))
+    assert_np_equal(cw.grad.numpy(), np.zeros(8))
+
+    with test.assertRaises(ValueError):
+        checkpoint_tape.checkpoint_steps(lambda x, _i: x, cx0, 4, segment_length=0)
+
+
+def test_tape_checkpoint_copy_inputs(test, device):
+    dim = 8
+    x = wp.array(np.linspace(0.0, 1.0, dim), dtype=float, device=device, requires_grad=True)
+    w = wp.full(dim, 2.0, dtype=float, device=device, requires_grad=True)
+    y = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    x_np = x.numpy()
+
+    def segment(x, y):
+        wp.launch(checkpoint_step, dim=dim, inputs=[x, w], outputs=[y], device=device)
+        return y
+
+    tape = wp.Tape()
+    with tape:
+        tape.checkpoint(segment, x, y, copy_inputs=True)
+
+    # overwrite the input of the segment after it was recorded
+    x.fill_(5.0)
+
+    tape.backward(grads={y: wp.ones(dim, dtype=float, device=device)})
+
+    assert_np_equal(x.numpy(), x_np)
+    assert_np_equal(x.grad.numpy(), np.cos(x_np) * 2.0, tol=1.0e-5)
+    assert_np_equal(w.grad.numpy(), np.sin(x_np), tol=1.0e-5)
+
+
+@wp.kernel
+def prune_square(x: wp.array[float], y: wp.array[float]):
+    tid = wp.tid()
+
+    y[tid] = x[tid] * x[tid]
+
+
+@wp.kernel
+def prune_sum(x: wp.array[float], loss: wp.array[float]):
+    tid = wp.tid()
+
+    wp.atomic_add(loss, 0, x[tid])
+
+
+def test_tape_backward_pruning(test, device):
+    dim = 8
+    x = wp.array(np.arange(dim), dtype=float, device=device, requires_grad=True)
+    y = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    z = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    loss_y = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+    loss_z = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    # arrays without gradients
+    a = wp.ones(dim, dtype=float, device=device)
+    b = wp.zeros(dim, dtype=float, device=device)
+
+    tape = wp.Tape()
+    with tape:
+        wp.launch(prune_square, dim=dim, inputs=[x], outputs=[y], device=device)
+        wp.launch(prune_square, dim=dim, inputs=[x], outputs=[z], device=device)
+        wp.launch(prune_square, dim=dim, inputs=[a], outputs=[b], device=device)
+        # write the loss through a view of the second half of y
+        wp.launch(prune_sum, dim=dim // 2, inputs=[y[dim // 2 :]], outputs=[loss_y], device=device)
+        wp.launch(prune_sum, dim=dim, inputs=[z], outputs=[loss_z], device=device)
+
+    # only the launches leading to loss_y run backward
+    schedule = tape._get_backward_schedule([loss_y])
+    test.assertEqual(schedule, [tape.launches[3], tape.launches[0]])
+    test.assertIs(tape._get_backward_schedule([loss_y]), schedule)
+
+    # without seeds every launch runs backward
+    test.assertEqual(tape._get_backward_schedule(None), tape.launches[::-1])
+
+    tape.backward(loss_y, prune=True)
+    expected = np.where(np.arange(dim) >= dim // 2, 2.0 * np.arange(dim), 0.0)
+    assert_np_equal(x.grad.numpy(), expected)
+    assert_np_equal(z.grad.numpy(), np.zeros(dim))
+
+    tape.zero()
+    tape.backward(
+        grads={loss_y: wp.ones(1, dtype=float, device=device), loss_z: wp.ones(1, dtype=float, device=device)},
+        prune=True,
+    )
+    assert_np_equal(x.grad.numpy(), expected + 2.0 * np.arange(dim))
+
+    # gradients seeded by hand on other arrays are propagated unless pruning is requested
+    tape.zero()
+    loss_z.grad.fill_(1.0)
+    tape.backward(loss_y)
+    assert_np_equal(x.grad.numpy(), expected + 2.0 * np.arange(dim))
+
+    # functions recorded with record_func() are pruned by the arrays they use
+    w = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    with tape:
+        wp.copy(w, z)
+
+    test.assertEqual(len(tape._get_backward_schedule([loss_y])), 2)
+    test.assertEqual(len(tape._get_backward_schedule([w])), 4)
+
+    # functions recorded without arrays are always run
+    calls = []
+    tape.record_func(lambda: calls.append(1), [])
+    tape.backward()
+    test.assertEqual(calls, [1])
+    tape.backward(loss_y, prune=True)
+    test.assertEqual(calls, [1, 1])
+
+
+def test_tape_compile_backward(test, device):
+    dim = 8
+    x = wp.array(np.linspace(0.0, 1.0, dim), dtype=float, device=device, requires_grad=True)
+    z = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    w = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+    loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+
+    def forward(tape):
+        with tape:
+            # intermediate allocated on every iteration
+            y = wp.zeros(dim, dtype=float, device=device, requires_grad=True)
+            wp.launch(prune_square, dim=dim, inputs=[x], outputs=[y], device=device)
+            wp.copy(w, y)
+            wp.launch(prune_square, dim=dim, inputs=[w], outputs=[z], device=device)
+            wp.launch(prune_sum, dim=dim, inputs=[z], outputs=[loss], device=device)
+            wp.launch(prune_sum, dim=dim, inputs=[x], outputs=[loss], device=device)
+
+    expected = 4.0 * x.numpy() ** 3 + 1.0
+
+    tape = wp.Tape()
+    tape.compile_backward()
+
+    plan = None
+    for _ in range(3):
+        tape.reset()
+        loss.zero_()
+        forward(tape)
+        tape.backward(loss)
+        assert_np_equal(x.grad.numpy(), expected, tol=1.0e-5)
+
+        if plan is None:
+            plan = tape._backward_plan
+            versions = [command[0]._version for command in plan.commands if command is not None]
+        else:
+            # the plan is reused, and only the array and gradient of the new intermediate are repacked
+            test.assertIs(tape._backward_plan, plan)
+            test.assertEqual(
+                [command[0]._version for command in plan.commands if command is not None],
+                [versions[0], versions[1], versions[2], versions[3] + 2],
+            )
+            versions = [command[0]._version for command in plan.commands if command is not None]
+
+    # a different sequence of launches rebuilds the plan
+    tape.reset()
+    with tape:
+        wp.launch(prune_sum, dim=dim, inputs=[x], outputs=[loss], device=device)
+    tape.backward(loss)
+    test.assertIsNot(tape._backward_plan, plan)
+    assert_np_equal(x.grad.numpy(), np.ones(dim))
+
+
 class TestTape(unittest.TestCase):
     def test_tape_no_nested_tapes(self):
         with self.assertRaises(RuntimeError):
@@ -797,6 +1031,10 @@ add_function_test(
 add_function_test(
     TestTape, "test_tape_backward_cuda_launch_failure", test_tape_backward_cuda_launch_failure, devices=cuda_devices
 )
+add_function_test(TestTape, "test_tape_checkpoint_steps", test_tape_checkpoint_steps, devices=devices)
+add_function_test(TestTape, "test_tape_checkpoint_copy_inputs", test_tape_checkpoint_copy_inputs, devices=devices)
+add_function_test(TestTape, "test_tape_backward_pruning", test_tape_backward_pruning, devices=devices)
+add_function_test(TestTape, "test_tape_compile_backward", test_tape_compile_backward, devices=devices)
 
 
 if __name__ == "__main__":
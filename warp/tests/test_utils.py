@@ -4,9 +4,11 @@
 import contextlib
 import gc
 import io
+import json
 import os
 import subprocess
 import sys
+import tempfile
 import unittest
 import warnings
 
@@ -272,6 +274,85 @@ def test_radix_sort_pairs_64_bit_keys_8_byte_values(test, device):
                 np.testing.assert_array_equal(wp_values.numpy()[:count], values[order])
 
 
+def test_radix_sort_pairs_cpu_threads(test, device):
+    rng = np.random.default_rng(123)
+    # large enough to take the multi-threaded path, with many duplicate keys to check stability
+    count = 200003
+
+    keys_np = {
+        wp.int32: rng.integers(-5000, 5000, size=count, dtype=np.int32),
+        wp.uint32: rng.integers(0, 2**32, size=count, dtype=np.uint32),
+        wp.float32: rng.standard_normal(count).astype(np.float32),
+        wp.int64: rng.integers(-(2**62), 2**62, size=count, dtype=np.int64) // 1024,
+        wp.uint64: rng.integers(0, 2**63, size=count, dtype=np.uint64),
+        wp.float64: rng.integers(-4000, 4000, size=count) / 8.0,
+    }
+
+    for key_type, keys in keys_np.items():
+        for value_type in (wp.int32, wp.int64):
+            for cpu_threads in (1, 4, 0):
+                with test.subTest(key_type=key_type, value_type=value_type, cpu_threads=cpu_threads):
+                    values = np.arange(count, dtype=wp.dtype_to_numpy(value_type))
+                    wp_keys = wp.array(np.concatenate((keys, keys)), dtype=key_type, device=device)
+                    wp_values = wp.array(np.concatenate((values, values)), dtype=value_type, device=device)
+                    wp.utils.radix_sort_pairs(wp_keys, wp_values, count, cpu_threads=cpu_threads)
+
+                    order = np.argsort(keys, kind="stable")
+                    np.testing.assert_array_equal(wp_keys.numpy()[:count], keys[order])
+                    np.testing.assert_array_equal(wp_values.numpy()[:count], values[order])
+
+    # partial bit range, sorts by bits [begin_bit, end_bit) only
+    keys = keys_np[wp.uint64]
+    for begin_bit, end_bit in ((0, 12), (4, 20), (24, 64)):
+        with test.subTest(begin_bit=begin_bit, end_bit=end_bit):
+            values = np.arange(count, dtype=np.int32)
+            wp_keys = wp.array(np.concatenate((keys, keys)), dtype=wp.uint64, device=device)
+            wp_values = wp.array(np.concatenate((values, values)), dtype=wp.int32, device=device)
+            wp.utils.radix_sort_pairs(wp_keys, wp_values, count, begin_bit, end_bit, cpu_threads=0)
+
+            digits = (keys >> np.uint64(begin_bit)) & np.uint64((1 << (end_bit - begin_bit)) - 1)
+            order = np.argsort(digits, kind="stable")
+            np.testing.assert_array_equal(wp_keys.numpy()[:count], keys[order])
+            np.testing.assert_array_equal(wp_values.numpy()[:count], values[order])
+
+
+def test_segmented_sort_pairs_cpu_threads(test, device):
+    rng = np.random.default_rng(42)
+    count = 300000
+
+    # many small segments are spread over threads, a few large ones are each sorted in parallel
+    for num_segments in (1000, 2):
+        bounds = np.sort(rng.choice(np.arange(1, count), size=num_segments - 1, replace=False))
+        segment_start = np.concatenate(([0], bounds)).astype(np.int32)
+        segment_end = np.concatenate((bounds, [count])).astype(np.int32)
+
+        for key_type in (wp.int32, wp.float32):
+            for cpu_threads in (1, 4, 0):
+                with test.subTest(num_segments=num_segments, key_type=key_type, cpu_threads=cpu_threads):
+                    keys = rng.integers(-100, 100, size=count).astype(wp.dtype_to_numpy(key_type))
+                    values = np.arange(count, dtype=np.int32)
+                    wp_keys = wp.array(np.concatenate((keys, keys)), dtype=key_type, device=device)
+                    wp_values = wp.array(np.concatenate((values, values)), dtype=wp.int32, device=device)
+                    wp.utils.segmented_sort_pairs(
+                        wp_keys,
+                        wp_values,
+                        count,
+                        wp.array(segment_start, dtype=wp.int32, device=device),
+                        wp.array(segment_end, dtype=wp.int32, device=device),
+                        cpu_threads=cpu_threads,
+                    )
+
+                    expected_keys = keys.copy()
+                    expected_values = values.copy()
+                    for start, end in zip(segment_start, segment_end, strict=True):
+                        order = np.argsort(keys[start:end], kind="stable")
+                        expected_keys[start:end] = keys[start:end][order]
+                        expected_values[start:end] = values[start:end][order]
+
+                    np.testing.assert_array_equal(wp_keys.numpy()[:count], expected_keys)
+                    np.testing.assert_array_equal(wp_values.numpy()[:count], expected_values)
+
+
 def test_radix_sort_pairs_error_non_contiguous(test, device):
     values = wp.array(tuple(range(16)), dtype=int, device=device)
     keys = wp.array(tuple(range(16)), dtype=int, device=device)[::2]
@@ -903,6 +984,12 @@ def parenthesized_multiline_lambda():
     # fmt: on
 
 
+@wp.kernel
+def timing_scale_kernel(a: wp.array2d(dtype=float)):
+    i, j = wp.tid()
+    a[i, j] = 2.0 * a[i, j]
+
+
 devices = get_test_devices()
 
 
@@ -1114,6 +1201,88 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(result.filter, wp.TIMING_MEMCPY)
         self.assertGreaterEqual(result.elapsed, 0.0)
 
+    def test_scoped_timer_cpu_timing(self):
+        """Verify ``ScopedTimer`` records CPU kernels, native utilities, and host memory operations."""
+        with wp.ScopedDevice("cpu"):
+            a = wp.ones((4, 8), dtype=float, requires_grad=True)
+            keys = wp.array([3, 1, 2, 0, 0, 0, 0, 0], dtype=int)
+            values = wp.array([0, 1, 2, 3, 0, 0, 0, 0], dtype=int)
+            wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a])
+
+            with wp.ScopedTimer("cpu", print=False, cpu_filter=wp.TIMING_ALL) as timer:
+                wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a])
+                wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a], adj_inputs=[a.grad], adjoint=True)
+                wp.utils.radix_sort_pairs(keys, values, 4)
+                a.zero_()
+
+        results = timer.timing_results
+        names = [r.name for r in results]
+        forward_name = f"forward kernel {timing_scale_kernel.get_mangled_name()}"
+        backward_name = f"backward kernel {timing_scale_kernel.get_mangled_name()}"
+        self.assertEqual(names, [forward_name, backward_name, "builtin kernel radix_sort_pairs", "memset"])
+        self.assertEqual(
+            [r.filter for r in results],
+            [wp.TIMING_KERNEL, wp.TIMING_KERNEL, wp.TIMING_KERNEL_BUILTIN, wp.TIMING_MEMSET],
+        )
+
+        for r in results:
+            self.assertEqual(r.device, wp.get_device("cpu"))
+            self.assertGreaterEqual(r.elapsed, 0.0)
+            self.assertGreaterEqual(r.start, 0.0)
+            self.assertIsNotNone(r.thread)
+
+        # activities are reported in start order
+        self.assertEqual([r.start for r in results], sorted(r.start for r in results))
+
+        # kernels report their launch dimensions and the Python dispatch time
+        for r in results[:2]:
+            self.assertEqual(r.dim, (4, 8))
+            self.assertGreaterEqual(r.dispatch, 0.0)
+        self.assertIsNone(results[2].dim)
+        self.assertIsNone(results[2].dispatch)
+
+        # the filter selects the recorded activities and timing stops with the scope
+        with wp.ScopedTimer("cpu", print=False, cpu_filter=wp.TIMING_MEMSET) as timer:
+            wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a], device="cpu")
+            a.zero_()
+        self.assertEqual([r.name for r in timer.timing_results], ["memset"])
+
+        with wp.ScopedTimer("cpu", print=False, cuda_filter=wp.TIMING_ALL) as timer:
+            a.zero_()
+        self.assertEqual(timer.timing_results, [])
+
+    def test_timing_export_chrome_trace(self):
+        """Verify timing results are exported as Chrome trace events."""
+        with wp.ScopedDevice("cpu"):
+            a = wp.ones((4, 8), dtype=float)
+            wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a])
+
+            wp.timing_begin(cpu_filter=wp.TIMING_KERNEL)
+            wp.launch(timing_scale_kernel, dim=a.shape, inputs=[a])
+            results = wp.timing_end()
+
+        self.assertEqual(len(results), 1)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            wp.timing_export_chrome_trace(results, path)
+            with open(path) as f:
+                trace = json.load(f)
+
+        events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in events], ["dispatch", results[0].name])
+
+        dispatch, kernel = events
+        self.assertEqual(kernel["cat"], "kernel")
+        self.assertEqual(kernel["args"]["dim"], [4, 8])
+        self.assertAlmostEqual(kernel["ts"], results[0].start * 1000.0)
+        self.assertAlmostEqual(kernel["dur"], results[0].elapsed * 1000.0)
+        self.assertAlmostEqual(dispatch["ts"] + dispatch["dur"], kernel["ts"])
+        self.assertEqual((dispatch["pid"], dispatch["tid"]), (kernel["pid"], kernel["tid"]))
+
+        metadata = {event["name"]: event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+        self.assertEqual(metadata["process_name"], "cpu")
+
 
 add_function_test(TestUtils, "test_array_scan", test_array_scan, devices=devices)
 add_function_test(TestUtils, "test_array_scan_vector", test_array_scan_vector, devices=devices)
@@ -1187,6 +1356,12 @@ add_function_test(
     devices=devices,
 )
 add_function_test(TestUtils, "test_radix_sort_pairs_empty", test_radix_sort_pairs_empty, devices=devices)
+add_function_test(
+    TestUtils,
+    "test_radix_sort_pairs_cpu_threads",
+    test_radix_sort_pairs_cpu_threads,
+    devices=[d for d in devices if d.is_cpu],
+)
 add_function_test(
     TestUtils,
     "test_radix_sort_pairs_error_insufficient_storage",
@@ -1213,6 +1388,12 @@ add_function_test(
 )
 add_function_test(TestUtils, "test_segmented_sort_pairs", test_segmented_sort_pairs, devices=devices)
 add_function_test(TestUtils, "test_segmented_sort_pairs_empty", test_segmented_sort_pairs, devices=devices)
+add_function_test(
+    TestUtils,
+    "test_segmented_sort_pairs_cpu_threads",
+    test_segmented_sort_pairs_cpu_threads,
+    devices=[d for d in devices if d.is_cpu],
+)
 add_function_test(
     TestUtils,
     "test_segmented_sort_pairs_error_insufficient_storage",
@@ -115,6 +115,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.deterministic.test_deterministic_graph_capture import TestDeterministicGraph
     from warp.tests.deterministic.test_deterministic_options import TestDeterministicOptions
     from warp.tests.deterministic.test_deterministic_scatter import TestDeterministicScatter
+    from warp.tests.fem.test_fem_cache import TestFemCache
     from warp.tests.fem.test_fem_examples import TestFemDiffusionExamples, TestFemExamples
     from warp.tests.fem.test_fem_field import TestFemField
     from warp.tests.fem.test_fem_fp64 import TestFemFp64
@@ -203,6 +204,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.test_intersect import TestIntersect
     from warp.tests.test_iter import TestIter
     from warp.tests.test_kernel_cache import TestKernelCache
+    from warp.tests.test_kernel_granular_cache import TestKernelGranularCache
     from warp.tests.test_large import TestLarge
     from warp.tests.test_launch import TestLaunch
     from warp.tests.test_lerp import TestLerp
@@ -339,6 +341,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestFactoryStyleArrayAnnotations,
         TestFabricArray,
         TestFastMath,
+        TestFemCache,
         TestFemDiffusionExamples,
         TestFemExamples,
         TestFemField,
@@ -366,6 +369,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestIter,
         TestJax,
         TestKernelCache,
+        TestKernelGranularCache,
         TestLarge,
         TestLaunch,
         TestLerp,
@@ -627,6 +631,7 @@ def debug_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader):
     from warp.tests.test_intersect import TestIntersect
     from warp.tests.test_iter import TestIter
     from warp.tests.test_kernel_cache import TestKernelCache
+    from warp.tests.test_kernel_granular_cache import TestKernelGranularCache
     from warp.tests.test_launch import TestLaunch
     from warp.tests.test_lerp import TestLerp
     from warp.tests.test_logger import TestLogger
@@ -859,6 +864,7 @@ def debug_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader):
         TestIntersect,
         TestIter,
         TestKernelCache,
+        TestKernelGranularCache,
         TestLerp,
         TestLogger,
         TestMap,
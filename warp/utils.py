@@ -26,6 +26,7 @@ from warp._src.coloring import GraphColoringAlgorithm as GraphColoringAlgorithm
 from warp._src.coloring import graph_coloring_assign as graph_coloring_assign
 from warp._src.coloring import graph_coloring_balance as graph_coloring_balance
 from warp._src.coloring import graph_coloring_get_groups as graph_coloring_get_groups
+from warp._src.coloring import graph_coloring_repair as graph_coloring_repair
 
 
 # category: Allocators